@@ -0,0 +1,45 @@
+"""Add rate_limit_buckets table for cross-process rate limiting
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-18
+
+Shared token buckets let every worker (threads, processes, containers) draw
+from one per-host request budget. Rows are refilled and consumed atomically
+with UPDATE ... RETURNING in PostgresLedger.acquire_rate_tokens.
+
+  bucket_key  TEXT PRIMARY KEY   e.g. "http:www.bbc.com"
+  tokens      DOUBLE PRECISION   tokens left after the last refill/consume
+  refilled_at DOUBLE PRECISION   epoch seconds of the last refill (DB clock)
+
+The SQLite ledger creates the same table in schema version 3.
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "004"
+down_revision = "003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create rate_limit_buckets."""
+    op.execute(
+        """
+        CREATE TABLE IF NOT EXISTS rate_limit_buckets (
+            bucket_key TEXT PRIMARY KEY,
+            tokens DOUBLE PRECISION NOT NULL,
+            refilled_at DOUBLE PRECISION NOT NULL
+        )
+        """
+    )
+
+    op.execute("INSERT INTO schema_version (version) VALUES (4) ON CONFLICT DO NOTHING")
+
+
+def downgrade() -> None:
+    """Drop rate_limit_buckets."""
+    op.execute("DROP TABLE IF EXISTS rate_limit_buckets")
+    op.execute("DELETE FROM schema_version WHERE version = 4")
@@ -0,0 +1,48 @@
+"""Add lease columns to crawl_ledger for multi-worker URL claiming
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-18
+
+Workers lease batches of frontier URLs with PostgresLedger.claim_urls
+(UPDATE ... FROM (SELECT ... FOR UPDATE SKIP LOCKED) ... RETURNING), extend
+them with heartbeat_urls and drop them with release_urls. A lease that is
+never released expires and the URL becomes claimable again.
+
+  lease_owner       TEXT              worker id holding the lease (NULL = free)
+  lease_expires_at  DOUBLE PRECISION  epoch seconds (DB clock) the lease ends
+
+The SQLite ledger adds the same columns in schema version 4.
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "005"
+down_revision = "004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add lease_owner and lease_expires_at to crawl_ledger."""
+    op.execute("ALTER TABLE crawl_ledger ADD COLUMN IF NOT EXISTS lease_owner TEXT")
+    op.execute(
+        "ALTER TABLE crawl_ledger ADD COLUMN IF NOT EXISTS lease_expires_at DOUBLE PRECISION"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_source_state_lease "
+        "ON crawl_ledger (source, state, lease_expires_at)"
+    )
+    op.execute("CREATE INDEX IF NOT EXISTS idx_lease_owner ON crawl_ledger (lease_owner)")
+
+    op.execute("INSERT INTO schema_version (version) VALUES (5) ON CONFLICT DO NOTHING")
+
+
+def downgrade() -> None:
+    """Drop the lease columns."""
+    op.execute("DROP INDEX IF EXISTS idx_lease_owner")
+    op.execute("DROP INDEX IF EXISTS idx_source_state_lease")
+    op.execute("ALTER TABLE crawl_ledger DROP COLUMN IF EXISTS lease_expires_at")
+    op.execute("ALTER TABLE crawl_ledger DROP COLUMN IF EXISTS lease_owner")
+    op.execute("DELETE FROM schema_version WHERE version = 5")
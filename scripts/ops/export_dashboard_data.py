@@ -147,6 +147,9 @@ def load_all_metrics() -> list[dict[str, Any]]:
             if "fetch_duration_stats" in stats and stats["fetch_duration_stats"]:
                 metric_entry["fetch_duration_stats"] = stats["fetch_duration_stats"]
 
+            if data.get("text_length_histograms"):
+                metric_entry["text_length_histograms"] = data["text_length_histograms"]
+
             # Filter breakdown
             filter_breakdown = quality.get("filter_breakdown", {})
             if filter_breakdown:
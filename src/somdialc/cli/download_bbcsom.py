@@ -12,8 +12,6 @@ import logging
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
 
-from somdialc.ingestion.processors.bbc_somali_processor import BBCSomaliProcessor
-
 
 def _setup_logging() -> None:
     """
@@ -81,17 +79,51 @@ def main() -> None:
     parser.add_argument(
         "--force", action="store_true", help="Force reprocessing even if output files exist"
     )
+    parser.add_argument(
+        "--profile",
+        choices=["cprofile", "sample"],
+        default=None,
+        help="Profile the processing loop: cProfile .pstats or sampled collapsed stacks "
+        "written to SDC_PROFILING__PROFILE_DIR (default: off)",
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=None,
+        help="Serve live Prometheus metrics on http://127.0.0.1:PORT/metrics during the run "
+        "(default: SDC_PROFILING__METRICS_PORT, off when unset)",
+    )
+    parser.add_argument(
+        "--worker-id",
+        default=None,
+        help="Scrape as one of several workers: claim article URLs from the shared crawl "
+        "ledger under this id instead of reading this run's links file ('auto' = "
+        "<hostname>-<pid>; default: off)",
+    )
     args = parser.parse_args()
 
     _setup_logging()
 
+    # Deferred so that --help does not import the pipeline stack
+    from somdialc.ingestion.processors.bbc_somali_processor import BBCSomaliProcessor
+
     try:
         # Initialize with user-specified parameters
+        worker_id = args.worker_id
+        if worker_id == "auto":
+            from somdialc.ingestion.work_queue import default_worker_id
+
+            worker_id = default_worker_id()
         processor = BBCSomaliProcessor(
             max_articles=args.max_articles,
             delay_range=(args.min_delay, args.max_delay),
             force=args.force,
+            worker_id=worker_id,
         )
+        if args.profile:
+            processor.profile_mode = args.profile
+        if args.metrics_port is not None:
+            processor.metrics_port = args.metrics_port
 
         article_links_file = processor.download()
         staging_file = processor.extract()
@@ -19,11 +19,6 @@ import logging
 import sys
 from pathlib import Path
 
-from somdialc.ingestion.processors.huggingface_somali_processor import (
-    HuggingFaceSomaliProcessor,
-    create_mc4_processor,
-)
-
 # Note: Progress bars are ENABLED so users can see download progress
 # To suppress, uncomment: os.environ['HF_DATASETS_DISABLE_PROGRESS_BARS'] = '1'
 
@@ -119,6 +114,21 @@ See docs/decisions/ for details.
         help="Additional metadata fields to include",
     )
 
+    parser.add_argument(
+        "--profile",
+        choices=["cprofile", "sample"],
+        default=None,
+        help="Profile the processing loop: cProfile .pstats or sampled collapsed stacks "
+        "written to SDC_PROFILING__PROFILE_DIR (default: off)",
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=None,
+        help="Serve live Prometheus metrics on http://127.0.0.1:PORT/metrics during the run "
+        "(default: SDC_PROFILING__METRICS_PORT, off when unset)",
+    )
+
     return parser
 
 
@@ -164,6 +174,12 @@ def main():
     # Single dataset processing
     logger.info(f"Starting HuggingFace dataset processing: {args.dataset}")
 
+    # Deferred so that --help does not import the pipeline stack and datasets
+    from somdialc.ingestion.processors.huggingface_somali_processor import (
+        HuggingFaceSomaliProcessor,
+        create_mc4_processor,
+    )
+
     try:
         # Create processor based on dataset type
         if args.dataset == "mc4":
@@ -203,6 +219,11 @@ def main():
             logger.error(f"Unknown dataset: {args.dataset}")
             sys.exit(1)
 
+        if args.profile:
+            processor.profile_mode = args.profile
+        if args.metrics_port is not None:
+            processor.metrics_port = args.metrics_port
+
         # Run pipeline
         logger.info("Step 1/3: Creating manifest...")
         manifest_path = processor.download()
@@ -31,12 +31,6 @@ from typing import Optional
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 
-from somdialc.ingestion.processors.sprakbanken_somali_processor import (
-    CORPUS_INFO,
-    SprakbankenSomaliProcessor,
-    list_available_corpora,
-)
-
 
 def setup_logging(verbose: bool = False):
     """Configure logging."""
@@ -59,6 +53,8 @@ def setup_logging(verbose: bool = False):
 
 def list_corpora():
     """List all available Språkbanken corpora with details."""
+    from somdialc.ingestion.processors.sprakbanken_somali_processor import CORPUS_INFO
+
     print("\n" + "=" * 70)
     print("AVAILABLE SPRÅKBANKEN SOMALI CORPORA")
     print("=" * 70)
@@ -108,6 +104,11 @@ def list_corpora():
 
 def show_corpus_info(corpus_id: str):
     """Show detailed information about a specific corpus."""
+    from somdialc.ingestion.processors.sprakbanken_somali_processor import (
+        CORPUS_INFO,
+        list_available_corpora,
+    )
+
     if corpus_id not in CORPUS_INFO:
         print(f"Error: Unknown corpus ID '{corpus_id}'")
         print(f"Available corpus IDs: {', '.join(list_available_corpora())}")
@@ -147,7 +148,12 @@ def show_corpus_info(corpus_id: str):
 
 
 def download_and_process(
-    corpus_id: str, force: bool = False, batch_size: Optional[int] = None, verbose: bool = False
+    corpus_id: str,
+    force: bool = False,
+    batch_size: Optional[int] = None,
+    verbose: bool = False,
+    profile: Optional[str] = None,
+    metrics_port: Optional[int] = None,
 ):
     """
     Download and process Språkbanken corpus/corpora.
@@ -157,7 +163,16 @@ def download_and_process(
         force: Force reprocessing
         batch_size: Batch size for processing
         verbose: Enable verbose logging
+        profile: Profile the processing loop ("cprofile" or "sample")
+        metrics_port: Serve live Prometheus metrics on this port during the run
     """
+    # Deferred so that --help does not import the pipeline stack
+    from somdialc.ingestion.processors.sprakbanken_somali_processor import (
+        CORPUS_INFO,
+        SprakbankenSomaliProcessor,
+        list_available_corpora,
+    )
+
     setup_logging(verbose)
 
     # Validate corpus_id
@@ -190,6 +205,10 @@ def download_and_process(
             force=force,
             batch_size=batch_size,
         )
+        if profile:
+            processor.profile_mode = profile
+        if metrics_port is not None:
+            processor.metrics_port = metrics_port
 
         # Run full pipeline
         print("Starting pipeline...")
@@ -259,6 +278,20 @@ Examples:
         "--batch-size", type=int, default=5000, help="Batch size for processing (default: 5000)"
     )
     parser.add_argument("--verbose", "-v", action="store_true", help="Enable verbose logging")
+    parser.add_argument(
+        "--profile",
+        choices=["cprofile", "sample"],
+        default=None,
+        help="Profile the processing loop: cProfile .pstats or sampled collapsed stacks "
+        "written to SDC_PROFILING__PROFILE_DIR (default: off)",
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=None,
+        help="Serve live Prometheus metrics on http://127.0.0.1:PORT/metrics during the run "
+        "(default: SDC_PROFILING__METRICS_PORT, off when unset)",
+    )
 
     args = parser.parse_args()
 
@@ -273,6 +306,8 @@ Examples:
             force=args.force,
             batch_size=args.batch_size,
             verbose=args.verbose,
+            profile=args.profile,
+            metrics_port=args.metrics_port,
         )
     else:
         # No action specified, show help
@@ -26,7 +26,6 @@ import sys
 from pathlib import Path
 
 from ..infra.config import get_config
-from ..ingestion.processors.tiktok_somali_processor import TikTokSomaliProcessor
 
 
 def setup_logging(verbose: bool = False):
@@ -164,6 +163,21 @@ def main():
         "-v", "--verbose", action="store_true", help="Enable verbose logging (DEBUG level)"
     )
 
+    parser.add_argument(
+        "--profile",
+        choices=["cprofile", "sample"],
+        default=None,
+        help="Profile the processing loop: cProfile .pstats or sampled collapsed stacks "
+        "written to SDC_PROFILING__PROFILE_DIR (default: off)",
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=None,
+        help="Serve live Prometheus metrics on http://127.0.0.1:PORT/metrics during the run "
+        "(default: SDC_PROFILING__METRICS_PORT, off when unset)",
+    )
+
     args = parser.parse_args()
 
     # Setup logging
@@ -209,8 +223,9 @@ def main():
             logger.info("Aborted by user")
             sys.exit(0)
 
-    # Initialize processor
+    # Initialize processor (imported here so --help stays fast)
     logger.info("Initializing TikTok processor...")
+    from ..ingestion.processors.tiktok_somali_processor import TikTokSomaliProcessor
 
     processor = TikTokSomaliProcessor(
         apify_api_token=api_token,
@@ -220,6 +235,10 @@ def main():
         max_comments_per_video=args.max_per_video,
         max_total_comments=args.max_comments,
     )
+    if args.profile:
+        processor.profile_mode = args.profile
+    if args.metrics_port is not None:
+        processor.metrics_port = args.metrics_port
 
     # Run pipeline: download → extract → process → silver
     try:
@@ -12,10 +12,6 @@ import logging
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
 
-from somdialc.ingestion.processors.wikipedia_somali_processor import (
-    WikipediaSomaliProcessor,
-)
-
 
 def _parse_args() -> argparse.Namespace:
     """Parse command-line arguments.
@@ -33,6 +29,20 @@ def _parse_args() -> argparse.Namespace:
         action="store_true",
         help="Force re-download and reprocessing even if a cached dump or output files exist",
     )
+    parser.add_argument(
+        "--profile",
+        choices=["cprofile", "sample"],
+        default=None,
+        help="Profile the processing loop: cProfile .pstats or sampled collapsed stacks "
+        "written to SDC_PROFILING__PROFILE_DIR (default: off)",
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=None,
+        help="Serve live Prometheus metrics on http://127.0.0.1:PORT/metrics during the run "
+        "(default: SDC_PROFILING__METRICS_PORT, off when unset)",
+    )
     return parser.parse_args()
 
 
@@ -84,8 +94,15 @@ def main() -> None:
 
     _setup_logging()
 
+    # Deferred so that --help does not import the pipeline stack
+    from somdialc.ingestion.processors.wikipedia_somali_processor import WikipediaSomaliProcessor
+
     try:
         processor = WikipediaSomaliProcessor(force=args.force)
+        if args.profile:
+            processor.profile_mode = args.profile
+        if args.metrics_port is not None:
+            processor.metrics_port = args.metrics_port
         dump_file = processor.download()
         if dump_file is None:
             # 304 Not Modified — dump unchanged since last run, nothing to do.
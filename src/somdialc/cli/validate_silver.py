@@ -29,12 +29,6 @@ from pathlib import Path
 
 import click
 
-from somdialc.preprocessing.validator import (
-    ValidationError,
-    validate_silver_directory,
-    validate_silver_parquet,
-)
-
 logger = logging.getLogger(__name__)
 
 
@@ -78,6 +72,13 @@ def main(input_path: str, fail_fast: bool, source: str, verbose: bool, output: s
     This tool validates that all records in silver Parquet files conform to
     the IngestionOutputV1 contract, ensuring data quality before preprocessing.
     """
+    # Deferred so that --help does not import pyarrow
+    from somdialc.preprocessing.validator import (
+        ValidationError,
+        validate_silver_directory,
+        validate_silver_parquet,
+    )
+
     # Configure logging
     log_level = logging.DEBUG if verbose else logging.INFO
     logging.basicConfig(
@@ -133,6 +133,58 @@ class LedgerBackend(ABC):
         """Check if quota is still available."""
         pass
 
+    @abstractmethod
+    def reserve_daily_quota(
+        self,
+        source: str,
+        count: int,
+        quota_limit: Optional[int] = None,
+        date: Optional[str] = None,
+    ) -> int:
+        """Atomically reserve up to count quota units; return how many were granted."""
+        pass
+
+    @abstractmethod
+    def release_daily_quota(self, source: str, count: int, date: Optional[str] = None) -> None:
+        """Return unused reserved quota units."""
+        pass
+
+    @abstractmethod
+    def acquire_rate_tokens(
+        self, bucket_key: str, refill_rate: float, capacity: float, cost: float = 1.0
+    ) -> float:
+        """Atomically take tokens from a shared bucket; return seconds to wait (0 = acquired)."""
+        pass
+
+    @abstractmethod
+    def claim_urls(
+        self,
+        source: str,
+        n: int,
+        worker_id: str,
+        lease_seconds: float = 300,
+        state: CrawlState = CrawlState.DISCOVERED,
+    ) -> list[str]:
+        """Lease up to n unleased (or lease-expired) URLs in ``state`` to worker_id."""
+        pass
+
+    @abstractmethod
+    def heartbeat_urls(
+        self, worker_id: str, lease_seconds: float = 300, urls: Optional[list[str]] = None
+    ) -> int:
+        """Extend worker_id's leases (all, or only ``urls``); return how many were extended."""
+        pass
+
+    @abstractmethod
+    def release_urls(self, worker_id: str, urls: Optional[list[str]] = None) -> int:
+        """Drop worker_id's leases (all, or only ``urls``); return how many were released."""
+        pass
+
+    @abstractmethod
+    def expire_leases(self, source: Optional[str] = None) -> int:
+        """Clear leases past their expiry; return how many were cleared."""
+        pass
+
     @abstractmethod
     def check_file_checksum(self, checksum: str, source: str) -> Optional[dict[str, Any]]:
         """Check if file with checksum already exists in ledger."""
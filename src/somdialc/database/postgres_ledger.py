@@ -622,6 +622,228 @@ class PostgresLedger(LedgerBackend):
 
         return remaining > 0, max(0, remaining)
 
+    def reserve_daily_quota(
+        self,
+        source: str,
+        count: int,
+        quota_limit: int | None = None,
+        date: str | None = None,
+    ) -> int:
+        """
+        Atomically reserve up to ``count`` quota units.
+
+        The row is locked by the ``FOR UPDATE`` sub-select, and the grant is computed
+        and applied in a single ``UPDATE ... RETURNING``, so concurrent workers in
+        any number of containers can never reserve past ``quota_limit``.
+        """
+        if count <= 0:
+            return 0
+        if date is None:
+            date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+
+        now = datetime.now(timezone.utc)
+
+        ensure_row = """
+            INSERT INTO daily_quotas (date, source, records_ingested, quota_limit, updated_at)
+            VALUES (%s, %s, 0, %s, %s)
+            ON CONFLICT (date, source) DO NOTHING
+        """
+        reserve = """
+            UPDATE daily_quotas AS q SET
+                records_ingested = q.records_ingested + CASE
+                    WHEN %(quota_limit)s::integer IS NULL THEN %(count)s
+                    ELSE LEAST(%(count)s, GREATEST(0, %(quota_limit)s - q.records_ingested))
+                END,
+                quota_limit = COALESCE(%(quota_limit)s, q.quota_limit),
+                updated_at = %(now)s
+            FROM (
+                SELECT records_ingested FROM daily_quotas
+                WHERE date = %(date)s AND source = %(source)s
+                FOR UPDATE
+            ) AS prev
+            WHERE q.date = %(date)s AND q.source = %(source)s
+            RETURNING q.records_ingested - prev.records_ingested AS granted
+        """
+        params = {
+            "quota_limit": quota_limit,
+            "count": count,
+            "now": now,
+            "date": date,
+            "source": source,
+        }
+
+        with self.transaction() as conn:
+            with conn.cursor() as cur:
+                cur.execute(ensure_row, (date, source, quota_limit, now))
+                cur.execute(reserve, params)
+                result = cur.fetchone()
+
+        return int(result[0]) if result else 0
+
+    def release_daily_quota(self, source: str, count: int, date: str | None = None) -> None:
+        """Return unused reserved quota units."""
+        if count <= 0:
+            return
+        if date is None:
+            date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+
+        query = """
+            UPDATE daily_quotas SET
+                records_ingested = GREATEST(0, records_ingested - %s),
+                updated_at = %s
+            WHERE date = %s AND source = %s
+        """
+
+        with self.transaction() as conn:
+            with conn.cursor() as cur:
+                cur.execute(query, (count, datetime.now(timezone.utc), date, source))
+
+    def acquire_rate_tokens(
+        self, bucket_key: str, refill_rate: float, capacity: float, cost: float = 1.0
+    ) -> float:
+        """
+        Atomically take tokens from a shared bucket.
+
+        Refill and consume happen in one ``UPDATE ... RETURNING`` guarded by the
+        refilled token count, using the database clock so workers on different
+        hosts agree on elapsed time.
+
+        Returns:
+            0.0 if the tokens were taken, otherwise seconds until enough are available
+        """
+        if refill_rate <= 0 or cost > capacity:
+            raise ValueError(
+                f"Invalid token bucket: refill_rate={refill_rate}, capacity={capacity}, cost={cost}"
+            )
+
+        ensure_row = """
+            INSERT INTO rate_limit_buckets (bucket_key, tokens, refilled_at)
+            VALUES (%s, %s, EXTRACT(EPOCH FROM clock_timestamp()))
+            ON CONFLICT (bucket_key) DO NOTHING
+        """
+        refilled = """
+            LEAST(%(capacity)s, tokens + GREATEST(
+                0, EXTRACT(EPOCH FROM clock_timestamp()) - refilled_at
+            ) * %(rate)s)
+        """
+        consume = f"""
+            UPDATE rate_limit_buckets SET
+                tokens = {refilled} - %(cost)s,
+                refilled_at = EXTRACT(EPOCH FROM clock_timestamp())
+            WHERE bucket_key = %(key)s AND {refilled} >= %(cost)s
+            RETURNING tokens
+        """
+        peek = f"SELECT {refilled} FROM rate_limit_buckets WHERE bucket_key = %(key)s"
+        params = {"capacity": capacity, "rate": refill_rate, "cost": cost, "key": bucket_key}
+
+        with self.transaction() as conn:
+            with conn.cursor() as cur:
+                cur.execute(ensure_row, (bucket_key, capacity))
+                cur.execute(consume, params)
+                if cur.fetchone() is not None:
+                    return 0.0
+                cur.execute(peek, params)
+                row = cur.fetchone()
+
+        tokens = float(row[0]) if row else 0.0
+        return max(0.0, (cost - tokens) / refill_rate)
+
+    def claim_urls(
+        self,
+        source: str,
+        n: int,
+        worker_id: str,
+        lease_seconds: float = 300,
+        state: CrawlState = CrawlState.DISCOVERED,
+    ) -> list[str]:
+        """
+        Lease up to ``n`` URLs in ``state`` to ``worker_id``.
+
+        ``FOR UPDATE SKIP LOCKED`` lets concurrent claimers pass over rows another
+        transaction is leasing instead of waiting on them, so workers on any
+        number of hosts drain one frontier without ever getting the same URL.
+        Expiry uses the database clock, so hosts need not agree on the time.
+        """
+        if n <= 0:
+            return []
+
+        query = """
+            UPDATE crawl_ledger AS c SET
+                lease_owner = %(worker_id)s,
+                lease_expires_at = EXTRACT(EPOCH FROM clock_timestamp()) + %(lease_seconds)s,
+                updated_at = NOW()
+            FROM (
+                SELECT id FROM crawl_ledger
+                WHERE source = %(source)s AND state = %(state)s
+                  AND (lease_expires_at IS NULL
+                       OR lease_expires_at <= EXTRACT(EPOCH FROM clock_timestamp()))
+                ORDER BY discovered_at ASC
+                LIMIT %(n)s
+                FOR UPDATE SKIP LOCKED
+            ) AS picked
+            WHERE c.id = picked.id
+            RETURNING c.url
+        """
+        params = {
+            "worker_id": worker_id,
+            "lease_seconds": lease_seconds,
+            "source": source,
+            "state": state.value,
+            "n": n,
+        }
+
+        with self.transaction() as conn:
+            with conn.cursor() as cur:
+                cur.execute(query, params)
+                return [row[0] for row in cur.fetchall()]
+
+    def heartbeat_urls(
+        self, worker_id: str, lease_seconds: float = 300, urls: list[str] | None = None
+    ) -> int:
+        """Extend ``worker_id``'s unexpired leases; returns how many were extended."""
+        query = """
+            UPDATE crawl_ledger SET
+                lease_expires_at = EXTRACT(EPOCH FROM clock_timestamp()) + %(lease_seconds)s
+            WHERE lease_owner = %(worker_id)s
+              AND lease_expires_at > EXTRACT(EPOCH FROM clock_timestamp())
+        """
+        if urls is not None:
+            query += " AND url = ANY(%(urls)s)"
+        params = {"worker_id": worker_id, "lease_seconds": lease_seconds, "urls": urls}
+
+        with self.transaction() as conn:
+            with conn.cursor() as cur:
+                cur.execute(query, params)
+                return cur.rowcount
+
+    def release_urls(self, worker_id: str, urls: list[str] | None = None) -> int:
+        """Drop ``worker_id``'s leases; returns how many were released."""
+        query = """
+            UPDATE crawl_ledger SET lease_owner = NULL, lease_expires_at = NULL
+            WHERE lease_owner = %(worker_id)s
+        """
+        if urls is not None:
+            query += " AND url = ANY(%(urls)s)"
+
+        with self.transaction() as conn:
+            with conn.cursor() as cur:
+                cur.execute(query, {"worker_id": worker_id, "urls": urls})
+                return cur.rowcount
+
+    def expire_leases(self, source: str | None = None) -> int:
+        """Clear leases past their expiry; returns how many were cleared."""
+        query = """
+            UPDATE crawl_ledger SET lease_owner = NULL, lease_expires_at = NULL
+            WHERE lease_expires_at <= EXTRACT(EPOCH FROM clock_timestamp())
+        """
+        if source is not None:
+            query += " AND source = %(source)s"
+
+        with self.transaction() as conn:
+            with conn.cursor() as cur:
+                cur.execute(query, {"source": source})
+                return cur.rowcount
+
     def check_file_checksum(self, checksum: str, source: str) -> dict[str, Any] | None:
         """
         Check if file with checksum exists in ledger (PostgreSQL).
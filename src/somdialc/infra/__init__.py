@@ -26,9 +26,25 @@ Submodules are imported directly (most are function-based):
     from somdialc.infra.aggregation import calculate_volume_weighted_quality
     from somdialc.infra.filter_analysis import FilterAnalyzer
     from somdialc.infra.logging_utils import generate_run_id
+
+The package-level re-exports are resolved lazily (PEP 562), so
+``from somdialc.infra.config import get_config`` does not import pandas via
+``data_manager``.
 """
 
-from .config import get_config
-from .data_manager import DataManager
+from typing import TYPE_CHECKING
+
+from .lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .config import get_config
+    from .data_manager import DataManager
+
+_LAZY_EXPORTS = {
+    "get_config": ".config",
+    "DataManager": ".data_manager",
+}
 
 __all__ = ["get_config", "DataManager"]
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS)
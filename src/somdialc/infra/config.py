@@ -126,6 +126,29 @@ class BBCScrapingConfig(BaseSettings):
         default=300.0, description="Maximum backoff time in seconds (5 minutes)"
     )
     jitter: bool = Field(default=True, description="Add random jitter to delays")
+    max_concurrent_requests: int = Field(
+        default=10, ge=1, description="Upper bound on in-flight async requests per host"
+    )
+    target_latency_ms: float = Field(
+        default=1000.0,
+        gt=0,
+        description="Response latency above which async concurrency is reduced (AIMD)",
+    )
+    shared_rate_limit: bool = Field(
+        default=True,
+        description=(
+            "Enforce max_requests_per_hour across all processes via a ledger-backed "
+            "token bucket instead of per-process buckets"
+        ),
+    )
+    claim_batch_size: int = Field(
+        default=25, ge=1, description="URLs leased per claim in worker mode (--worker-id)"
+    )
+    lease_seconds: float = Field(
+        default=300.0,
+        gt=0,
+        description="Lease length of claimed URLs; an expired lease makes them claimable again",
+    )
 
 
 class WikipediaScrapingConfig(BaseSettings):
@@ -276,6 +299,19 @@ class TikTokScrapingConfig(BaseSettings):
         default=3600, description="Maximum wait time for actor completion (seconds)"
     )
     batch_size: int = Field(default=1000, description="Items per batch when fetching dataset")
+    dataset_concurrency: int = Field(
+        default=4,
+        description="Dataset pages fetched concurrently (bounded window, yielded in order)",
+        ge=1,
+        le=32,
+    )
+    dataset_clean: bool = Field(
+        default=False,
+        description=(
+            "Ask Apify for cleaned dataset pages (no empty items or hidden '#' fields). "
+            "Off keeps the raw dump verbatim; the staging transform cleans items either way."
+        ),
+    )
 
 
 class RunConfig(BaseSettings):
@@ -402,6 +438,8 @@ class HTTPConfig(BaseSettings):
     Environment Variables:
         SDC_HTTP__REQUEST_TIMEOUT: Total request timeout in seconds (default: 30)
         SDC_HTTP__CONNECT_TIMEOUT: Connection timeout in seconds (default: 10)
+        SDC_HTTP__CACHE_MODE: Response cache mode: off, readwrite, replay (default: off)
+        SDC_HTTP__CACHE_DIR: Response cache directory (default: data/cache/http)
 
     Examples:
         >>> config = HTTPConfig()
@@ -430,6 +468,17 @@ class HTTPConfig(BaseSettings):
         ge=1,
         le=60,
     )
+    cache_mode: Literal["off", "readwrite", "replay"] = Field(
+        default="off",
+        description=(
+            "HTTP response cache mode: 'readwrite' revalidates and stores responses, "
+            "'replay' serves scraping requests entirely from the cache"
+        ),
+    )
+    cache_dir: Path = Field(
+        default=Path("data/cache/http"),
+        description="Directory for the content-addressed HTTP response cache",
+    )
 
 
 class DiskConfig(BaseSettings):
@@ -485,6 +534,14 @@ class DedupSettings(BaseSettings):
         SDC_DEDUP__SIMILARITY_THRESHOLD: Jaccard similarity threshold (default: 0.85)
         SDC_DEDUP__CACHE_SIZE: LRU cache size for hash storage (default: 100000)
         SDC_DEDUP__NUM_SHARDS: Number of LSH shards for performance (default: 10)
+        SDC_DEDUP__SERVER_SOCKET: Use the dedup server on this Unix socket (default: None)
+        SDC_DEDUP__SHARED_SERVER: Share one dedup server across run_all_pipelines sources
+            (default: false)
+        SDC_DEDUP__PROCESSING_NEAR_DUP: Per-source near-duplicate check on cleaned text,
+            e.g. '{"bbc": true}' (default: {})
+        SDC_DEDUP__PROCESSING_NEAR_DUP_DEFAULT: Near-duplicate check for unlisted sources
+            (default: false)
+        SDC_DEDUP__PROCESSING_NEAR_DUP_BATCH_SIZE: Records per near-duplicate batch (default: 256)
 
     Examples:
         >>> config = DedupSettings()
@@ -525,6 +582,106 @@ class DedupSettings(BaseSettings):
         ge=1,
         le=100,
     )
+    server_socket: Optional[str] = Field(
+        default=None,
+        description=(
+            "Unix socket of a running dedup server (somali-tools data dedup-server); "
+            "pipelines query it instead of building their own index"
+        ),
+    )
+    shared_server: bool = Field(
+        default=False,
+        description=(
+            "Start one dedup server process for run_all_pipelines so concurrent sources "
+            "detect cross-source duplicates at ingest time"
+        ),
+    )
+    processing_near_dup: dict[str, bool] = Field(
+        default_factory=dict,
+        description=(
+            "Per-source switch for the MinHash near-duplicate check on cleaned text in the "
+            "processing stage (keys: bbc, wikipedia, huggingface, sprakbanken, tiktok)"
+        ),
+    )
+    processing_near_dup_default: bool = Field(
+        default=False,
+        description="Processing-stage near-duplicate check for sources not listed above",
+    )
+    processing_near_dup_batch_size: int = Field(
+        default=256,
+        ge=1,
+        description="Cleaned records signed and looked up per near-duplicate batch",
+    )
+
+    def near_dup_enabled(self, source: str) -> bool:
+        """
+        Whether the processing-stage near-duplicate check runs for a source.
+
+        Args:
+            source: Source name or pipeline source id (e.g., 'bbc', 'bbc-somali')
+
+        Examples:
+            >>> config = DedupSettings(processing_near_dup={"bbc": True})
+            >>> config.near_dup_enabled("bbc-somali")
+            True
+            >>> config.near_dup_enabled("wikipedia")
+            False
+        """
+        source_normalized = source.lower().strip()
+        for key in (source_normalized, source_normalized.split("-")[0]):
+            if key in self.processing_near_dup:
+                return self.processing_near_dup[key]
+        return self.processing_near_dup_default
+
+
+class FilterConfig(BaseSettings):
+    """
+    Quality filter execution.
+
+    Environment Variables:
+        SDC_FILTERS__ADAPTIVE_ORDER: Reorder rejecting filters by measured cost (default: false)
+        SDC_FILTERS__ADAPTIVE_WARMUP_RECORDS: Records measured before reordering (default: 1000)
+        SDC_FILTERS__BATCH_SIZE: Clean and filter records in chunks of this size (default: 0, off)
+        SDC_FILTERS__RESULT_CACHE: Reuse cleaning/filter verdicts across runs (default: false)
+        SDC_FILTERS__RESULT_CACHE_PATH: Verdict cache database (default: data/cache/screening.db)
+    """
+
+    model_config = SettingsConfigDict(
+        env_prefix="SDC_FILTERS__",
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+    )
+
+    adaptive_order: bool = Field(
+        default=False,
+        description=(
+            "Measure filter cost and rejection rate over a warm-up window, then run "
+            "cheap selective filters first (enrichment filters still run for passing records)"
+        ),
+    )
+    adaptive_warmup_records: int = Field(
+        default=1000, ge=10, description="Records measured before the filter order is chosen"
+    )
+    batch_size: int = Field(
+        default=0,
+        ge=0,
+        description=(
+            "Clean and filter records in chunks through FilterEngine.apply_filters_batch "
+            "(0 or 1 filters one record at a time)"
+        ),
+    )
+    result_cache: bool = Field(
+        default=False,
+        description=(
+            "Cache cleaning and filter verdicts keyed by raw-text hash and a fingerprint "
+            "of the cleaner and filter configuration, so unchanged records skip re-screening"
+        ),
+    )
+    result_cache_path: Path = Field(
+        default=Path("data/cache/screening.db"),
+        description="SQLite database for the cross-run screening cache",
+    )
 
 
 class OrchestrationConfig(BaseSettings):
@@ -539,6 +696,9 @@ class OrchestrationConfig(BaseSettings):
         SDC_ORCHESTRATION__DEFAULT_CADENCE_DAYS: Default refresh cadence (1-365)
         SDC_ORCHESTRATION__CADENCE_DAYS__<SOURCE>: Per-source cadence override
         SDC_ORCHESTRATION__QUOTA_LIMITS__<SOURCE>: Daily quota per source (records/day)
+        SDC_ORCHESTRATION__EXECUTOR: auto, prefect, local or sequential
+        SDC_ORCHESTRATION__CPU_SLOTS: Concurrent CPU-bound stages (default: core count)
+        SDC_ORCHESTRATION__NETWORK_SLOTS: Concurrent network-bound stages
 
     Examples:
         >>> config = OrchestrationConfig()
@@ -599,6 +759,26 @@ class OrchestrationConfig(BaseSettings):
         description="Daily quota limits per source (None = unlimited)",
     )
 
+    # run_all_pipelines executor
+    executor: Literal["auto", "prefect", "local", "sequential"] = Field(
+        default="auto",
+        description=(
+            "How run_all_pipelines runs sources: prefect, local (resource-aware stage "
+            "scheduler), sequential, or auto (prefect if installed, else local)"
+        ),
+    )
+    cpu_slots: int = Field(
+        default=1,
+        ge=1,
+        description=(
+            "Concurrent CPU-bound stages in the local scheduler; stages are threads "
+            "sharing the GIL, so more slots add contention rather than parallelism"
+        ),
+    )
+    network_slots: int = Field(
+        default=4, ge=1, description="Concurrent network-bound stages in the local scheduler"
+    )
+
     def get_cadence(self, source: str) -> int:
         """
         Get refresh cadence for a specific source.
@@ -667,6 +847,110 @@ class LoggingConfig(BaseSettings):
         default="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
         description="Log message format",
     )
+    async_handlers: bool = Field(
+        default=False,
+        description="Format, redact and write pipeline logs on a listener thread (QueueHandler)",
+    )
+    queue_size: int = Field(default=10000, ge=1, description="Capacity of the async log queue")
+    queue_overflow: Literal["drop", "block"] = Field(
+        default="drop",
+        description="When the async queue is full: drop records below WARNING, or block",
+    )
+    debug_sample_every: int = Field(
+        default=100,
+        ge=1,
+        description="Per-record debug messages (filter rejections): log the first 10, then "
+        "every Nth",
+    )
+
+
+class ProfilingConfig(BaseSettings):
+    """
+    Processing-loop instrumentation.
+
+    Environment Variables:
+        SDC_PROFILING__STAGE_TIMING: Per-stage/per-filter timers (default: true)
+        SDC_PROFILING__PROFILE: Run profiler: off, cprofile, sample (default: off)
+        SDC_PROFILING__PROFILE_DIR: Output directory for profiles (default: data/profiles)
+        SDC_PROFILING__SAMPLE_INTERVAL_MS: Sampling profiler interval (default: 5)
+        SDC_PROFILING__RESOURCE_SAMPLING: RSS/CPU/IO sampler per run (default: true)
+        SDC_PROFILING__RESOURCE_INTERVAL_SECONDS: Resource sample interval (default: 5)
+        SDC_PROFILING__METRICS_PORT: Serve live Prometheus metrics on this port (default: off)
+        SDC_PROFILING__METRICS_HOST: Interface for the live endpoint (default: 127.0.0.1)
+    """
+
+    model_config = SettingsConfigDict(
+        env_prefix="SDC_PROFILING__",
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+    )
+
+    stage_timing: bool = Field(
+        default=True,
+        description="Record per-stage and per-filter wall time in the processing loop",
+    )
+    profile: Literal["off", "cprofile", "sample"] = Field(
+        default="off",
+        description=(
+            "Profile the processing loop: 'cprofile' writes <run_id>.pstats, "
+            "'sample' writes <run_id>.collapsed (flamegraph input)"
+        ),
+    )
+    profile_dir: Path = Field(
+        default=Path("data/profiles"), description="Directory for profile output files"
+    )
+    sample_interval_ms: float = Field(
+        default=5.0, gt=0, description="Sampling interval for the 'sample' profiler"
+    )
+    resource_sampling: bool = Field(
+        default=True,
+        description="Sample RSS, CPU, I/O bytes, open fds and WAL size during each run",
+    )
+    resource_interval_seconds: float = Field(
+        default=5.0, gt=0, description="Seconds between resource samples"
+    )
+    metrics_port: Optional[int] = Field(
+        default=None,
+        ge=0,
+        le=65535,
+        description="Serve live Prometheus metrics on http://<host>:<port>/metrics during runs",
+    )
+    metrics_host: str = Field(default="127.0.0.1", description="Interface for live metrics")
+
+
+class TrackingConfig(BaseSettings):
+    """
+    MLflow experiment tracking.
+
+    Environment Variables:
+        SDC_TRACKING__ENABLED: Log runs to MLflow when it is installed (default: true)
+        SDC_TRACKING__ASYNC_LOGGING: Batch calls on a background thread (default: true)
+        SDC_TRACKING__FLUSH_INTERVAL_SECONDS: Max delay before queued calls are sent (default: 5)
+        SDC_TRACKING__STEP_METRICS_INTERVAL_SECONDS: In-run step metrics period (default: 60)
+    """
+
+    model_config = SettingsConfigDict(
+        env_prefix="SDC_TRACKING__",
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+    )
+
+    enabled: bool = Field(default=True, description="Log pipeline runs to MLflow")
+    async_logging: bool = Field(
+        default=True,
+        description="Queue params/metrics/tags/artifacts and send them as log_batch calls "
+        "from a background thread",
+    )
+    flush_interval_seconds: float = Field(
+        default=5.0, gt=0, description="Max seconds queued tracking calls wait before sending"
+    )
+    step_metrics_interval_seconds: float = Field(
+        default=60.0,
+        ge=0,
+        description="Seconds between in-run step metrics (records/sec, filter rates); 0 = off",
+    )
 
 
 class Config(BaseSettings):
@@ -681,11 +965,14 @@ class Config(BaseSettings):
     logging: LoggingConfig = Field(default_factory=LoggingConfig)
     orchestration: OrchestrationConfig = Field(default_factory=OrchestrationConfig)
     dedup: DedupSettings = Field(default_factory=DedupSettings)
+    filters: FilterConfig = Field(default_factory=FilterConfig)
     http: HTTPConfig = Field(default_factory=HTTPConfig)
     disk: DiskConfig = Field(default_factory=DiskConfig)
     database: DatabaseConfig = Field(default_factory=DatabaseConfig)
     run: RunConfig = Field(default_factory=RunConfig)
     campaign: CampaignConfig = Field(default_factory=CampaignConfig)
+    profiling: ProfilingConfig = Field(default_factory=ProfilingConfig)
+    tracking: TrackingConfig = Field(default_factory=TrackingConfig)
 
 
 # Singleton instance
@@ -0,0 +1,552 @@
+"""
+Resumable, parallel HTTP downloads for large dumps and corpora.
+
+Bytes land in ``<dest>.part`` and progress is tracked in ``<dest>.part.json``,
+so an interrupted download resumes with HTTP ``Range`` requests instead of
+starting from zero. Range requests carry ``If-Range`` with the original
+validator, so a file that changed on the server is fetched again in full
+rather than spliced. When the server supports ranges and the file is large,
+it is split into segments fetched concurrently. The ``.part`` file replaces
+``dest`` only after size (and optional SHA-256) verification.
+
+Example:
+    >>> downloader = RangedDownloader(session, metrics=metrics)
+    >>> result = downloader.download(dump_url, raw_dir / "sowiki.xml.bz2")
+    >>> result.throughput_bytes_per_sec
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+
+import requests
+from tqdm import tqdm
+
+logger = logging.getLogger(__name__)
+
+
+class DownloadError(Exception):
+    """Raised when a download cannot be completed or fails verification."""
+
+
+class _RangeNotHonouredError(Exception):
+    """Server answered a range request with the full (possibly changed) resource."""
+
+
+@dataclass
+class _Segment:
+    """Byte range [start, end] of the target file; ``pos`` is the next byte to write."""
+
+    start: int
+    end: Optional[int]
+    pos: int
+
+    @property
+    def done(self) -> bool:
+        return self.end is not None and self.pos > self.end
+
+
+@dataclass
+class DownloadResult:
+    """Outcome of a completed download."""
+
+    url: str
+    path: Path
+    bytes_total: int
+    bytes_downloaded: int
+    resumed_from: int
+    elapsed_seconds: float
+    segments: int
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    sha256: Optional[str] = None
+
+    @property
+    def throughput_bytes_per_sec(self) -> float:
+        """Bytes transferred in this run per wall-clock second."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.bytes_downloaded / self.elapsed_seconds
+
+    def to_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        data["path"] = str(self.path)
+        data["throughput_bytes_per_sec"] = round(self.throughput_bytes_per_sec, 1)
+        return data
+
+
+@dataclass
+class _DownloadState:
+    """Persisted progress of a partial download (``<dest>.part.json``)."""
+
+    url: str
+    total: Optional[int]
+    etag: Optional[str]
+    last_modified: Optional[str]
+    segments: list[_Segment] = field(default_factory=list)
+
+    @property
+    def validator(self) -> Optional[str]:
+        # Weak ETags are not allowed in If-Range (RFC 9110 13.1.5)
+        if self.etag and not self.etag.startswith("W/"):
+            return self.etag
+        return self.last_modified
+
+    @property
+    def completed_bytes(self) -> int:
+        return sum(seg.pos - seg.start for seg in self.segments)
+
+
+class RangedDownloader:
+    """
+    Download files with resume, parallel byte ranges and verification.
+
+    Uses a ``requests`` session (e.g. from ``HTTPSessionFactory``), so retry,
+    timeout and User-Agent policy stay in one place. Network errors
+    mid-transfer are retried from the last written byte.
+    """
+
+    def __init__(
+        self,
+        session: requests.Session,
+        max_workers: int = 4,
+        min_segment_size: int = 64 * 1024 * 1024,
+        chunk_size: int = 1024 * 1024,
+        max_retries: int = 5,
+        backoff_factor: float = 1.0,
+        timeout: int = 30,
+        metrics: Optional[Any] = None,
+        show_progress: bool = True,
+    ):
+        """
+        Initialize downloader.
+
+        Args:
+            session: HTTP session used for all requests
+            max_workers: Maximum concurrent range requests per file
+            min_segment_size: Files smaller than two segments are fetched in one stream
+            chunk_size: Read/write chunk size in bytes
+            max_retries: Retries per segment after a network error or short read
+            backoff_factor: Exponential backoff base (seconds) between retries
+            timeout: Per-request timeout in seconds
+            metrics: Optional MetricsCollector for bytes and throughput
+            show_progress: Show a tqdm progress bar
+        """
+        self.session = session
+        self.max_workers = max(1, max_workers)
+        self.min_segment_size = max(1, min_segment_size)
+        self.chunk_size = chunk_size
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.timeout = timeout
+        self.metrics = metrics
+        self.show_progress = show_progress
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def download(
+        self,
+        url: str,
+        dest: Path,
+        expected_size: Optional[int] = None,
+        sha256: Optional[str] = None,
+        headers: Optional[dict[str, str]] = None,
+    ) -> DownloadResult:
+        """
+        Download ``url`` to ``dest``, resuming a previous partial download.
+
+        Args:
+            url: URL to fetch
+            dest: Final file path (written atomically on success)
+            expected_size: Expected size in bytes (verified if given)
+            sha256: Expected SHA-256 hex digest (verified if given)
+            headers: Extra request headers
+
+        Returns:
+            DownloadResult
+
+        Raises:
+            requests.HTTPError: If the server rejects the initial request (e.g. 404)
+            DownloadError: If retries are exhausted or verification fails
+        """
+        return self._download(url, Path(dest), expected_size, sha256, headers, allow_ranges=True)
+
+    def _download(
+        self,
+        url: str,
+        dest: Path,
+        expected_size: Optional[int],
+        sha256: Optional[str],
+        headers: Optional[dict[str, str]],
+        allow_ranges: bool,
+    ) -> DownloadResult:
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        part_path = dest.with_name(dest.name + ".part")
+        state_path = dest.with_name(dest.name + ".part.json")
+        base_headers = {**(headers or {}), "Accept-Encoding": "identity"}
+
+        start_time = time.monotonic()
+        state = self._load_state(state_path, part_path, url)
+        resumed_from = state.completed_bytes if state else 0
+        first_response = None
+
+        if state is None:
+            first_response = self.session.get(
+                url, headers=base_headers, stream=True, timeout=self.timeout
+            )
+            first_response.raise_for_status()
+            state = self._plan(url, first_response, allow_ranges)
+            if len(state.segments) > 1:
+                first_response.close()
+                first_response = None
+            with open(part_path, "wb") as handle:
+                if state.total is not None and len(state.segments) > 1:
+                    handle.truncate(state.total)
+            self._save_state(state_path, state)
+        else:
+            logger.info(
+                f"Resuming {dest.name} from {resumed_from:,} bytes "
+                f"({len(state.segments)} segment(s))"
+            )
+
+        progress = tqdm(
+            total=state.total,
+            initial=state.completed_bytes,
+            unit="B",
+            unit_scale=True,
+            desc=f"Downloading {dest.name}",
+            disable=not self.show_progress,
+        )
+        restart = False
+        try:
+            self._run_segments(
+                url, part_path, state_path, state, base_headers, first_response, progress
+            )
+        except _RangeNotHonouredError:
+            restart = True
+        finally:
+            progress.close()
+            if not restart:
+                self._save_state(state_path, state)
+
+        if restart:
+            # The resource changed (If-Range mismatch) or ranges are not supported
+            # after all: start over once with a single fresh stream.
+            part_path.unlink(missing_ok=True)
+            state_path.unlink(missing_ok=True)
+            if not allow_ranges:
+                raise DownloadError(f"Server does not honour range requests for {url}")
+            logger.warning(f"Server did not honour range request for {url}; restarting download")
+            return self._download(url, dest, expected_size, sha256, headers, allow_ranges=False)
+
+        result = self._finalize(
+            url,
+            dest,
+            part_path,
+            state_path,
+            state,
+            expected_size,
+            sha256,
+            resumed_from,
+            time.monotonic() - start_time,
+        )
+        self._report(result)
+        return result
+
+    # ------------------------------------------------------------------
+    # Planning and state
+    # ------------------------------------------------------------------
+
+    def _plan(self, url: str, response: requests.Response, allow_ranges: bool) -> _DownloadState:
+        total = None
+        content_length = response.headers.get("Content-Length")
+        if content_length is not None and not response.headers.get("Content-Encoding"):
+            total = int(content_length)
+
+        state = _DownloadState(
+            url=url,
+            total=total,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+
+        accepts_ranges = response.headers.get("Accept-Ranges", "").lower() == "bytes"
+        if (
+            allow_ranges
+            and accepts_ranges
+            and total is not None
+            and self.max_workers > 1
+            and total >= 2 * self.min_segment_size
+        ):
+            count = min(self.max_workers, total // self.min_segment_size)
+            size = -(-total // count)
+            state.segments = [
+                _Segment(start=offset, end=min(offset + size, total) - 1, pos=offset)
+                for offset in range(0, total, size)
+            ]
+        else:
+            end = total - 1 if total is not None else None
+            state.segments = [_Segment(start=0, end=end, pos=0)]
+        return state
+
+    @staticmethod
+    def _load_state(state_path: Path, part_path: Path, url: str) -> Optional[_DownloadState]:
+        if not state_path.exists() or not part_path.exists():
+            # A .part without progress state cannot be trusted to resume from
+            part_path.unlink(missing_ok=True)
+            state_path.unlink(missing_ok=True)
+            return None
+        try:
+            data = json.loads(state_path.read_text(encoding="utf-8"))
+            state = _DownloadState(
+                url=data["url"],
+                total=data["total"],
+                etag=data.get("etag"),
+                last_modified=data.get("last_modified"),
+                segments=[_Segment(*seg) for seg in data["segments"]],
+            )
+        except (ValueError, KeyError, TypeError) as err:
+            logger.warning(f"Discarding unreadable download state {state_path}: {err}")
+            state = None
+
+        if state is None or state.url != url or state.validator is None:
+            # Without a validator a resumed range could splice two versions
+            part_path.unlink(missing_ok=True)
+            state_path.unlink(missing_ok=True)
+            return None
+        return state
+
+    def _save_state(self, state_path: Path, state: _DownloadState) -> None:
+        with self._lock:
+            payload = {
+                "url": state.url,
+                "total": state.total,
+                "etag": state.etag,
+                "last_modified": state.last_modified,
+                "segments": [[seg.start, seg.end, seg.pos] for seg in state.segments],
+            }
+        fd, tmp_path = tempfile.mkstemp(dir=state_path.parent, prefix=".tmp_", suffix=".json")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(payload, handle)
+            os.replace(tmp_path, state_path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    # ------------------------------------------------------------------
+    # Transfer
+    # ------------------------------------------------------------------
+
+    def _run_segments(
+        self,
+        url: str,
+        part_path: Path,
+        state_path: Path,
+        state: _DownloadState,
+        headers: dict[str, str],
+        first_response: Optional[requests.Response],
+        progress: tqdm,
+    ) -> None:
+        pending = [seg for seg in state.segments if not seg.done]
+        if len(pending) <= 1:
+            for seg in pending:
+                self._fetch_segment(
+                    url, part_path, state_path, state, seg, headers, first_response, progress
+                )
+            return
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(pending))) as pool:
+            futures = [
+                pool.submit(
+                    self._fetch_segment,
+                    url,
+                    part_path,
+                    state_path,
+                    state,
+                    seg,
+                    headers,
+                    None,
+                    progress,
+                )
+                for seg in pending
+            ]
+            for future in futures:
+                future.result()
+
+    def _fetch_segment(
+        self,
+        url: str,
+        part_path: Path,
+        state_path: Path,
+        state: _DownloadState,
+        seg: _Segment,
+        headers: dict[str, str],
+        response: Optional[requests.Response],
+        progress: tqdm,
+    ) -> None:
+        attempt = 0
+        last_saved = seg.pos
+
+        while not seg.done:
+            try:
+                if response is None:
+                    response = self._request_range(url, state, seg, headers)
+
+                with open(part_path, "r+b") as handle:
+                    handle.seek(seg.pos)
+                    for chunk in response.iter_content(chunk_size=self.chunk_size):
+                        if not chunk:
+                            continue
+                        if seg.end is not None:
+                            chunk = chunk[: seg.end + 1 - seg.pos]
+                        handle.write(chunk)
+                        with self._lock:
+                            seg.pos += len(chunk)
+                        progress.update(len(chunk))
+                        if seg.pos - last_saved >= 16 * self.chunk_size:
+                            self._save_state(state_path, state)
+                            last_saved = seg.pos
+                        if seg.done:
+                            break
+
+                    if seg.end is None:
+                        # Unknown length: a clean end of stream completes the file
+                        handle.truncate(seg.pos)
+                        with self._lock:
+                            seg.end = seg.pos - 1
+                            state.total = seg.pos
+
+                if not seg.done:
+                    raise DownloadError(
+                        f"Short read for {url}: segment ended at byte {seg.pos}, "
+                        f"expected {seg.end + 1}"
+                    )
+            except (requests.RequestException, DownloadError, OSError) as err:
+                attempt += 1
+                if attempt > self.max_retries:
+                    raise DownloadError(
+                        f"Download of {url} failed after {self.max_retries} retries: {err}"
+                    ) from err
+                delay = self.backoff_factor * (2 ** (attempt - 1))
+                logger.warning(
+                    f"Download interrupted at byte {seg.pos:,} ({err}); "
+                    f"retry {attempt}/{self.max_retries} in {delay:.1f}s"
+                )
+                if state.validator is None and seg.pos > seg.start:
+                    # No validator to send with If-Range: resuming could splice two
+                    # versions of the file, so the (single) stream starts over.
+                    progress.update(seg.start - seg.pos)
+                    with self._lock:
+                        seg.pos = seg.start
+                self._save_state(state_path, state)
+                time.sleep(delay)
+            finally:
+                if response is not None:
+                    response.close()
+                    response = None
+
+    def _request_range(
+        self, url: str, state: _DownloadState, seg: _Segment, headers: dict[str, str]
+    ) -> requests.Response:
+        end = "" if seg.end is None else str(seg.end)
+        range_headers = {**headers, "Range": f"bytes={seg.pos}-{end}"}
+        if state.validator:
+            range_headers["If-Range"] = state.validator
+
+        response = self.session.get(url, headers=range_headers, stream=True, timeout=self.timeout)
+        if response.status_code == 206 or (response.status_code == 200 and seg.pos == 0):
+            return response
+        if response.status_code == 200:
+            response.close()
+            raise _RangeNotHonouredError(url)
+        response.raise_for_status()
+        response.close()
+        raise DownloadError(f"Unexpected HTTP {response.status_code} for range request to {url}")
+
+    # ------------------------------------------------------------------
+    # Verification and reporting
+    # ------------------------------------------------------------------
+
+    def _finalize(
+        self,
+        url: str,
+        dest: Path,
+        part_path: Path,
+        state_path: Path,
+        state: _DownloadState,
+        expected_size: Optional[int],
+        sha256: Optional[str],
+        resumed_from: int,
+        elapsed: float,
+    ) -> DownloadResult:
+        size = part_path.stat().st_size
+        for label, expected in (("server", state.total), ("expected", expected_size)):
+            if expected is not None and size != expected:
+                part_path.unlink(missing_ok=True)
+                state_path.unlink(missing_ok=True)
+                raise DownloadError(
+                    f"Size mismatch for {dest.name}: got {size:,} bytes, {label} size {expected:,}"
+                )
+
+        digest = None
+        if sha256 is not None:
+            digest = _sha256_file(part_path, self.chunk_size)
+            if digest.lower() != sha256.lower():
+                part_path.unlink(missing_ok=True)
+                state_path.unlink(missing_ok=True)
+                raise DownloadError(
+                    f"Checksum mismatch for {dest.name}: got {digest}, expected {sha256}"
+                )
+
+        os.replace(part_path, dest)
+        state_path.unlink(missing_ok=True)
+
+        return DownloadResult(
+            url=url,
+            path=dest,
+            bytes_total=size,
+            bytes_downloaded=size - resumed_from,
+            resumed_from=resumed_from,
+            elapsed_seconds=elapsed,
+            segments=len(state.segments),
+            etag=state.etag,
+            last_modified=state.last_modified,
+            sha256=digest,
+        )
+
+    def _report(self, result: DownloadResult) -> None:
+        logger.info(
+            f"Downloaded {result.path.name}: {result.bytes_total:,} bytes "
+            f"({result.throughput_bytes_per_sec / 1e6:.2f} MB/s, {result.segments} segment(s)"
+            + (f", resumed from {result.resumed_from:,}" if result.resumed_from else "")
+            + ")"
+        )
+        if self.metrics is None:
+            return
+        self.metrics.increment("bytes_downloaded", result.bytes_downloaded)
+        self.metrics.record_fetch_duration(result.elapsed_seconds * 1000)
+        downloads = self.metrics.custom_metrics.get("downloads")
+        if not isinstance(downloads, list):
+            downloads = []
+        downloads.append(result.to_dict())
+        self.metrics.add_custom_metric("downloads", downloads)
+
+
+def _sha256_file(path: Path, chunk_size: int) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for block in iter(lambda: handle.read(chunk_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
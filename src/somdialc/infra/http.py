@@ -1,12 +1,15 @@
 """HTTP utilities for web scraping processors."""
 
 import time
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+if TYPE_CHECKING:
+    from somdialc.infra.http_cache import HTTPResponseCache
+
 
 class TimeoutHTTPSession(requests.Session):
     """
@@ -50,6 +53,8 @@ class HTTPSessionFactory:
         user_agent: Optional[str] = None,
         timeout: Optional[int] = None,
         allowed_methods: Optional[list[str]] = None,
+        cache: Optional["HTTPResponseCache"] = None,
+        cache_mode: Optional[str] = None,
     ) -> TimeoutHTTPSession:
         """
         Create HTTP session with retry logic, proper headers, and timeout enforcement.
@@ -61,6 +66,8 @@ class HTTPSessionFactory:
             user_agent: Custom user agent string (uses default if None)
             timeout: Request timeout in seconds (loads from config if None)
             allowed_methods: List of HTTP methods to retry (default: GET, POST, HEAD, OPTIONS)
+            cache: HTTP response cache (opened from config.http.cache_dir if None)
+            cache_mode: "off", "readwrite" or "replay" (loads from config if None)
 
         Returns:
             Configured TimeoutHTTPSession with retry logic and automatic timeout
@@ -71,12 +78,15 @@ class HTTPSessionFactory:
         if allowed_methods is None:
             allowed_methods = frozenset({"GET", "HEAD", "OPTIONS"})
 
-        # Load timeout from config if not provided
-        if timeout is None:
+        # Load timeout and cache mode from config if not provided
+        if timeout is None or cache_mode is None:
             from somdialc.infra.config import get_config
 
             config = get_config()
-            timeout = config.http.request_timeout
+            if timeout is None:
+                timeout = config.http.request_timeout
+            if cache_mode is None:
+                cache_mode = config.http.cache_mode
 
         session = TimeoutHTTPSession(default_timeout=timeout)
 
@@ -88,8 +98,17 @@ class HTTPSessionFactory:
             allowed_methods=allowed_methods,
         )
 
-        # Mount adapter with retries
-        adapter = HTTPAdapter(max_retries=retries)
+        # Mount adapter with retries (serving GETs from the response cache if enabled)
+        if cache_mode in ("readwrite", "replay"):
+            from somdialc.infra.http_cache import CachingHTTPAdapter, get_http_cache
+
+            adapter = CachingHTTPAdapter(
+                cache if cache is not None else get_http_cache(),
+                mode=cache_mode,
+                max_retries=retries,
+            )
+        else:
+            adapter = HTTPAdapter(max_retries=retries)
         session.mount("http://", adapter)
         session.mount("https://", adapter)
 
@@ -0,0 +1,621 @@
+"""
+Content-addressed HTTP response cache for scraping and offline replay.
+
+Response bodies are stored once per SHA-256 digest as compressed blob files
+(zstd when ``zstandard`` is installed, gzip otherwise); a SQLite index maps
+``METHOD URL`` to status, headers, validators and the body digest.
+
+Modes:
+- ``off``: no caching (default)
+- ``readwrite``: revalidate with ETag/Last-Modified, store fresh 200 bodies,
+  serve a 304 from the cached body
+- ``replay``: never touch the network; serve from cache, 504 on a miss
+  (the RFC 9111 ``only-if-cached`` convention)
+
+The cache mounts on ``requests`` sessions through ``CachingHTTPAdapter`` (see
+``HTTPSessionFactory.create_session``) and wraps aiohttp sessions through
+``CachingClientSession``, so re-parsing raw HTML after a parser change becomes
+a local CPU job.
+
+Example:
+    >>> cache = HTTPResponseCache(Path("data/cache/http"))
+    >>> session = HTTPSessionFactory.create_session(cache=cache, cache_mode="replay")
+    >>> session.get("https://www.bbc.com/somali/articles/x").headers["X-Cache"]
+    'HIT'
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None
+    ZSTD_AVAILABLE = False
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+logger = logging.getLogger(__name__)
+
+CACHE_MODES = ("off", "readwrite", "replay")
+
+# Hop-by-hop / transfer headers that no longer describe the stored (decoded) body
+_UNCACHED_HEADERS = {
+    "connection",
+    "content-encoding",
+    "content-length",
+    "keep-alive",
+    "set-cookie",
+    "transfer-encoding",
+}
+_CONDITIONAL_HEADERS = ("If-None-Match", "If-Modified-Since")
+_CACHEABLE_STATUSES = {200, 203}
+
+
+@dataclass
+class CachedResponse:
+    """A response served from the cache."""
+
+    url: str
+    status: int
+    headers: dict[str, str]
+    body: bytes
+    stored_at: float
+
+    @property
+    def etag(self) -> Optional[str]:
+        return CaseInsensitiveDict(self.headers).get("ETag")
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        return CaseInsensitiveDict(self.headers).get("Last-Modified")
+
+    def validator_headers(self) -> dict[str, str]:
+        """Conditional request headers that revalidate this entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HTTPResponseCache:
+    """
+    SQLite-indexed, content-addressed store of HTTP response bodies.
+
+    Thread-safe: each thread gets its own SQLite connection (WAL mode), and
+    blob files are written atomically, so several processes can share a
+    cache directory.
+    """
+
+    def __init__(self, cache_dir: Path, compression: Optional[str] = None):
+        """
+        Initialize cache.
+
+        Args:
+            cache_dir: Directory holding ``index.db`` and ``blobs/``
+            compression: "zstd" or "gzip" (default: zstd if available, else gzip)
+
+        Raises:
+            ValueError: If compression is unknown or zstd was requested but is not installed
+        """
+        if compression is None:
+            compression = "zstd" if ZSTD_AVAILABLE else "gzip"
+        if compression not in ("zstd", "gzip"):
+            raise ValueError(f"Unknown compression: {compression}")
+        if compression == "zstd" and not ZSTD_AVAILABLE:
+            raise ValueError("zstd compression requires zstandard: pip install zstandard")
+
+        self.cache_dir = Path(cache_dir)
+        self.blob_dir = self.cache_dir / "blobs"
+        self.blob_dir.mkdir(parents=True, exist_ok=True)
+        self.index_path = self.cache_dir / "index.db"
+        self.compression = compression
+
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+        self.stats: Counter = Counter()
+
+        self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                cache_key TEXT PRIMARY KEY,
+                method TEXT NOT NULL,
+                url TEXT NOT NULL,
+                status INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                body_sha256 TEXT NOT NULL,
+                body_size INTEGER NOT NULL,
+                stored_at REAL NOT NULL,
+                validated_at REAL NOT NULL
+            )
+        """)
+        self.connection.execute("CREATE INDEX IF NOT EXISTS idx_responses_url ON responses(url)")
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Get thread-local index connection."""
+        if not hasattr(self._local, "conn"):
+            conn = sqlite3.connect(str(self.index_path), timeout=60.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            conn.row_factory = sqlite3.Row
+            self._local.conn = conn
+        return self._local.conn
+
+    @staticmethod
+    def cache_key(url: str, method: str = "GET") -> str:
+        """Index key for a request."""
+        return hashlib.sha256(f"{method.upper()} {url}".encode()).hexdigest()
+
+    def _count(self, event: str) -> None:
+        with self._stats_lock:
+            self.stats[event] += 1
+
+    # ------------------------------------------------------------------
+    # Blob storage
+    # ------------------------------------------------------------------
+
+    def _blob_path(self, digest: str, compression: Optional[str] = None) -> Path:
+        ext = ".zst" if (compression or self.compression) == "zstd" else ".gz"
+        return self.blob_dir / digest[:2] / f"{digest}{ext}"
+
+    def _write_blob(self, digest: str, body: bytes) -> None:
+        path = self._blob_path(digest)
+        if path.exists():
+            return  # Content-addressed: identical bodies are stored once
+
+        if self.compression == "zstd":
+            data = zstandard.ZstdCompressor(level=10).compress(body)
+        else:
+            data = gzip.compress(body, compresslevel=6, mtime=0)
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp_", suffix=path.suffix)
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    def _read_blob(self, digest: str) -> Optional[bytes]:
+        for compression in ("zstd", "gzip"):
+            path = self._blob_path(digest, compression)
+            if not path.exists():
+                continue
+            data = path.read_bytes()
+            if compression == "zstd":
+                if not ZSTD_AVAILABLE:
+                    logger.warning(f"Cached blob {path.name} needs zstandard to decompress")
+                    return None
+                return zstandard.ZstdDecompressor().decompress(data)
+            return gzip.decompress(data)
+        return None
+
+    # ------------------------------------------------------------------
+    # Index operations
+    # ------------------------------------------------------------------
+
+    def get(self, url: str, method: str = "GET") -> Optional[CachedResponse]:
+        """
+        Look up a cached response.
+
+        Returns:
+            CachedResponse, or None if absent (or its blob is missing)
+        """
+        row = self.connection.execute(
+            "SELECT * FROM responses WHERE cache_key = ?", (self.cache_key(url, method),)
+        ).fetchone()
+        if row is None:
+            return None
+
+        body = self._read_blob(row["body_sha256"])
+        if body is None:
+            logger.warning(f"Cache index entry without blob for {url}; ignoring")
+            return None
+
+        return CachedResponse(
+            url=row["url"],
+            status=row["status"],
+            headers=json.loads(row["headers"]),
+            body=body,
+            stored_at=row["stored_at"],
+        )
+
+    def put(
+        self,
+        url: str,
+        status: int,
+        headers: Any,
+        body: bytes,
+        method: str = "GET",
+    ) -> str:
+        """
+        Store a response body and its metadata.
+
+        Args:
+            url: Request URL
+            status: HTTP status code
+            headers: Response headers (mapping)
+            body: Decoded response body
+            method: HTTP method
+
+        Returns:
+            SHA-256 digest of the body
+        """
+        digest = hashlib.sha256(body).hexdigest()
+        self._write_blob(digest, body)
+
+        stored_headers = {k: v for k, v in headers.items() if k.lower() not in _UNCACHED_HEADERS}
+        lookup = CaseInsensitiveDict(stored_headers)
+        now = time.time()
+        self.connection.execute(
+            """
+            INSERT INTO responses (
+                cache_key, method, url, status, headers, etag, last_modified,
+                body_sha256, body_size, stored_at, validated_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(cache_key) DO UPDATE SET
+                status = excluded.status,
+                headers = excluded.headers,
+                etag = excluded.etag,
+                last_modified = excluded.last_modified,
+                body_sha256 = excluded.body_sha256,
+                body_size = excluded.body_size,
+                stored_at = excluded.stored_at,
+                validated_at = excluded.validated_at
+            """,
+            (
+                self.cache_key(url, method),
+                method.upper(),
+                url,
+                status,
+                json.dumps(stored_headers),
+                lookup.get("ETag"),
+                lookup.get("Last-Modified"),
+                digest,
+                len(body),
+                now,
+                now,
+            ),
+        )
+        self._count("stores")
+        return digest
+
+    def mark_revalidated(self, url: str, headers: Any = None, method: str = "GET") -> None:
+        """Record a 304: refresh validators that the server re-sent."""
+        lookup = CaseInsensitiveDict(dict(headers or {}))
+        self.connection.execute(
+            """
+            UPDATE responses SET
+                etag = COALESCE(?, etag),
+                last_modified = COALESCE(?, last_modified),
+                validated_at = ?
+            WHERE cache_key = ?
+            """,
+            (
+                lookup.get("ETag"),
+                lookup.get("Last-Modified"),
+                time.time(),
+                self.cache_key(url, method),
+            ),
+        )
+        self._count("revalidated")
+
+    def statistics(self) -> dict[str, Any]:
+        """Get cache statistics (entries, stored bytes, hit/miss counters)."""
+        row = self.connection.execute(
+            "SELECT COUNT(*) AS entries, COALESCE(SUM(body_size), 0) AS body_bytes FROM responses"
+        ).fetchone()
+        blob_bytes = sum(p.stat().st_size for p in self.blob_dir.rglob("*") if p.is_file())
+        with self._stats_lock:
+            counters = dict(self.stats)
+        return {
+            "entries": row["entries"],
+            "body_bytes": row["body_bytes"],
+            "blob_bytes": blob_bytes,
+            "compression": self.compression,
+            **counters,
+        }
+
+    def close(self) -> None:
+        """Close this thread's index connection."""
+        if hasattr(self._local, "conn"):
+            self._local.conn.close()
+            del self._local.conn
+
+
+def get_http_cache(cache_dir: Optional[Path] = None) -> HTTPResponseCache:
+    """
+    Open the HTTP response cache configured in ``config.http``.
+
+    Args:
+        cache_dir: Override for ``config.http.cache_dir``
+    """
+    if cache_dir is None:
+        from .config import get_config
+
+        cache_dir = get_config().http.cache_dir
+    return HTTPResponseCache(cache_dir)
+
+
+def _has_conditional_headers(headers: Any) -> bool:
+    return any(name in headers for name in _CONDITIONAL_HEADERS)
+
+
+# ----------------------------------------------------------------------
+# requests integration
+# ----------------------------------------------------------------------
+
+
+class CachingHTTPAdapter(HTTPAdapter):
+    """
+    ``requests`` transport adapter that serves and stores GETs via HTTPResponseCache.
+
+    If the caller sends its own conditional headers (e.g. from the crawl
+    ledger), a 304 is passed through unchanged so existing "not modified"
+    handling keeps working. Otherwise the adapter revalidates transparently
+    and turns a 304 into the cached 200. Streamed requests (large downloads)
+    bypass the cache except in replay mode.
+    """
+
+    def __init__(self, cache: HTTPResponseCache, mode: str = "readwrite", **kwargs):
+        """
+        Initialize adapter.
+
+        Args:
+            cache: Response cache
+            mode: "readwrite" or "replay" ("off" makes the adapter a plain HTTPAdapter)
+            **kwargs: Passed to HTTPAdapter (e.g. max_retries)
+        """
+        if mode not in CACHE_MODES:
+            raise ValueError(f"Unknown cache mode: {mode}. Use one of {CACHE_MODES}")
+        super().__init__(**kwargs)
+        self.cache = cache
+        self.mode = mode
+
+    def send(self, request, stream=False, **kwargs):
+        if self.mode == "off" or request.method != "GET":
+            return super().send(request, stream=stream, **kwargs)
+
+        cached = self.cache.get(request.url)
+
+        if self.mode == "replay":
+            if cached is None:
+                self.cache._count("misses")
+                return self._miss_response(request)
+            self.cache._count("hits")
+            return self._cached_response(request, cached)
+
+        if stream:
+            return super().send(request, stream=stream, **kwargs)
+
+        caller_conditional = _has_conditional_headers(request.headers)
+        if cached is not None and not caller_conditional:
+            request.headers.update(cached.validator_headers())
+
+        response = super().send(request, stream=stream, **kwargs)
+
+        if response.status_code == 304 and cached is not None:
+            self.cache.mark_revalidated(request.url, response.headers)
+            if not caller_conditional:
+                self.cache._count("hits")
+                return self._cached_response(request, cached)
+        elif response.status_code in _CACHEABLE_STATUSES:
+            cache_control = response.headers.get("Cache-Control", "").lower()
+            if "no-store" not in cache_control:
+                self.cache.put(
+                    request.url, response.status_code, response.headers, response.content
+                )
+            self.cache._count("misses")
+
+        return response
+
+    @staticmethod
+    def _cached_response(request, cached: CachedResponse) -> requests.Response:
+        response = requests.Response()
+        response.status_code = cached.status
+        response.reason = "OK"
+        response.headers = CaseInsensitiveDict(cached.headers)
+        response.headers["X-Cache"] = "HIT"
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = cached.body
+        response._content_consumed = True
+        response.url = request.url
+        response.request = request
+        return response
+
+    @staticmethod
+    def _miss_response(request) -> requests.Response:
+        response = requests.Response()
+        response.status_code = 504
+        response.reason = "Gateway Timeout (not in replay cache)"
+        response.headers = CaseInsensitiveDict({"X-Cache": "MISS"})
+        response._content = b""
+        response._content_consumed = True
+        response.url = request.url
+        response.request = request
+        return response
+
+
+# ----------------------------------------------------------------------
+# aiohttp integration
+# ----------------------------------------------------------------------
+
+
+def is_replay_miss(response) -> bool:
+    """True for the 504 stand-in replay mode returns for a URL missing from the cache."""
+    return response.headers.get("X-Cache") == "MISS"
+
+
+class CachedClientResponse:
+    """Minimal aiohttp ``ClientResponse`` stand-in for cache hits and replay misses."""
+
+    def __init__(
+        self,
+        url: str,
+        status: int,
+        headers: dict[str, str],
+        body: bytes,
+        reason: str,
+        request_headers: Optional[dict] = None,
+    ):
+        self.url = url
+        self.status = status
+        self.reason = reason
+        self.headers = CaseInsensitiveDict(headers)
+        self._body = body
+        self._request_headers = request_headers or {}
+
+    @property
+    def request_info(self) -> "aiohttp.RequestInfo":
+        """The GET this response answers, as aiohttp errors expect it."""
+        from multidict import CIMultiDict, CIMultiDictProxy
+        from yarl import URL
+
+        url = URL(self.url)
+        headers = CIMultiDictProxy(CIMultiDict(self._request_headers))
+        return aiohttp.RequestInfo(url, "GET", headers, url)
+
+    async def read(self) -> bytes:
+        return self._body
+
+    async def text(self, encoding: Optional[str] = None, errors: str = "strict") -> str:
+        encoding = encoding or get_encoding_from_headers(self.headers) or "utf-8"
+        return self._body.decode(encoding, errors=errors)
+
+    def raise_for_status(self) -> None:
+        if self.status >= 400:
+            raise aiohttp.ClientResponseError(
+                self.request_info, (), status=self.status, message=self.reason, headers=None
+            )
+
+    def release(self) -> None:
+        pass
+
+
+class _CachedRequestContext:
+    def __init__(self, owner: "CachingClientSession", url: str, headers, kwargs):
+        self._owner = owner
+        self._url = url
+        self._headers = headers
+        self._kwargs = kwargs
+        self._response = None
+
+    async def __aenter__(self):
+        self._response = await self._owner._get(self._url, self._headers, self._kwargs)
+        return self._response
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self._response is not None:
+            self._response.release()
+
+
+class CachingClientSession:
+    """
+    Wrap an ``aiohttp.ClientSession`` so ``get()`` goes through HTTPResponseCache.
+
+    Same semantics as CachingHTTPAdapter. Only ``get`` is cached; everything
+    else is delegated to the wrapped session.
+    """
+
+    def __init__(self, session: "aiohttp.ClientSession", cache: HTTPResponseCache, mode: str):
+        """
+        Initialize wrapper.
+
+        Args:
+            session: Underlying aiohttp session (owned by the caller)
+            cache: Response cache
+            mode: "readwrite" or "replay"
+        """
+        if mode not in CACHE_MODES:
+            raise ValueError(f"Unknown cache mode: {mode}. Use one of {CACHE_MODES}")
+        self.session = session
+        self.cache = cache
+        self.mode = mode
+
+    def __getattr__(self, name):
+        return getattr(self.session, name)
+
+    def get(self, url, headers: Optional[dict] = None, **kwargs) -> _CachedRequestContext:
+        return _CachedRequestContext(self, str(url), headers, kwargs)
+
+    async def _get(self, url: str, headers: Optional[dict], kwargs: dict):
+        if self.mode == "off":
+            return await self.session.get(url, headers=headers, **kwargs)
+
+        cached = self.cache.get(url)
+
+        if self.mode == "replay":
+            if cached is None:
+                self.cache._count("misses")
+                return CachedClientResponse(
+                    url,
+                    504,
+                    {"X-Cache": "MISS"},
+                    b"",
+                    "Gateway Timeout (not in replay cache)",
+                    request_headers=headers,
+                )
+            self.cache._count("hits")
+            return CachedClientResponse(
+                url,
+                cached.status,
+                {**cached.headers, "X-Cache": "HIT"},
+                cached.body,
+                "OK",
+                request_headers=headers,
+            )
+
+        request_headers = dict(headers or {})
+        caller_conditional = _has_conditional_headers(request_headers)
+        if cached is not None and not caller_conditional:
+            request_headers.update(cached.validator_headers())
+
+        response = await self.session.get(url, headers=request_headers, **kwargs)
+
+        if response.status == 304 and cached is not None:
+            self.cache.mark_revalidated(url, response.headers)
+            if not caller_conditional:
+                response.release()
+                self.cache._count("hits")
+                return CachedClientResponse(
+                    url,
+                    cached.status,
+                    {**cached.headers, "X-Cache": "HIT"},
+                    cached.body,
+                    "OK",
+                    request_headers=request_headers,
+                )
+        elif response.status in _CACHEABLE_STATUSES:
+            body = await response.read()  # aiohttp keeps the body for later .text()
+            if "no-store" not in response.headers.get("Cache-Control", "").lower():
+                self.cache.put(url, response.status, response.headers, body)
+            self.cache._count("misses")
+
+        return response
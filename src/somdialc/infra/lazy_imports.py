@@ -0,0 +1,49 @@
+"""
+Lazy module attributes (PEP 562) for fast console-script start-up.
+
+Package ``__init__`` modules re-export classes whose modules pull in
+pyarrow, pandas, datasketch, aiohttp or datasets. Importing those eagerly
+makes every entry point -- even ``--help`` or ``somali-lock-status`` -- pay
+for them. ``lazy_exports`` builds a module-level ``__getattr__``/``__dir__``
+pair that imports the defining module on first attribute access instead and
+caches the result in the module namespace.
+
+Example:
+    >>> __getattr__, __dir__ = lazy_exports(__name__, {"BasePipeline": ".base_pipeline"})
+"""
+
+import importlib
+import sys
+from collections.abc import Callable
+from typing import Any
+
+
+def lazy_exports(
+    module_name: str, exports: dict[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Build ``__getattr__`` and ``__dir__`` for a module with lazy attributes.
+
+    Args:
+        module_name: ``__name__`` of the module defining the attributes
+        exports: Attribute name -> module to import it from (absolute, or
+            relative to ``module_name``'s package)
+
+    Returns:
+        ``(__getattr__, __dir__)`` to assign at module level
+    """
+
+    def module_getattr(name: str) -> Any:
+        if name not in exports:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        module = sys.modules[module_name]
+        # Relative names resolve against the package (the module itself for __init__)
+        anchor = module_name if hasattr(module, "__path__") else module_name.rpartition(".")[0]
+        value = getattr(importlib.import_module(exports[name], anchor), name)
+        setattr(module, name, value)
+        return value
+
+    def module_dir() -> list[str]:
+        return sorted(set(vars(sys.modules[module_name])) | set(exports))
+
+    return module_getattr, module_dir
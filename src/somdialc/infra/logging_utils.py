@@ -8,16 +8,23 @@ Provides:
 - Human-readable console output for development
 - Log rotation and compression
 - Secret redaction for security
+- Optional non-blocking handlers (QueueHandler/QueueListener): formatting,
+  redaction and I/O run on a listener thread instead of the emitting thread
+- Sampled debug logging for per-record messages
 """
 
+import atexit
+import copy
 import json
 import logging
 import logging.handlers
+import queue
 import socket
 import sys
 import threading
 import traceback
 import uuid
+from collections import Counter
 from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
@@ -70,7 +77,7 @@ class StructuredFormatter(logging.Formatter):
 
         # Add context variables (with redaction)
         if self.include_context:
-            context = get_context()
+            context = _record_context(record)
             if context:
                 # Redact secrets from context before adding to log
                 redacted_context = redact_secrets(context)
@@ -136,7 +143,7 @@ class ColoredFormatter(logging.Formatter):
             record.levelname = f"{self.COLORS.get(levelname, '')}{levelname}{self.COLORS['RESET']}"
 
         # Add context to message (with redaction)
-        context = get_context()
+        context = _record_context(record)
         if context:
             # Redact secrets from context before displaying
             redacted_context = redact_secrets(context)
@@ -151,6 +158,68 @@ class ColoredFormatter(logging.Formatter):
         return formatted
 
 
+def _record_context(record: logging.LogRecord) -> dict[str, Any]:
+    """Context captured when the record was queued, else the current thread's."""
+    context = getattr(record, "log_context", None)
+    return context if context is not None else get_context()
+
+
+class ContextQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that keeps thread-local context and never formats.
+
+    The stdlib handler formats the record on the emitting thread; this one
+    only merges ``msg % args`` and snapshots ``get_context()``, leaving JSON
+    serialization, redaction and I/O to the listener thread.
+
+    When the bounded queue is full, records below WARNING are dropped (and
+    counted in ``dropped``) under the "drop" policy; WARNING and above, and
+    every record under "block", wait for space (backpressure).
+    """
+
+    def __init__(self, log_queue: queue.Queue, overflow: str = "drop"):
+        """
+        Initialize handler.
+
+        Args:
+            log_queue: Bounded queue shared with the QueueListener
+            overflow: "drop" (discard low-severity records when full) or "block"
+        """
+        super().__init__(log_queue)
+        if overflow not in ("drop", "block"):
+            raise ValueError(f"overflow must be 'drop' or 'block', got {overflow!r}")
+        self.overflow = overflow
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Copy: other handlers (e.g. the root logger's) still see the original
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        record.log_context = dict(get_context())
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.overflow == "block" or record.levelno >= logging.WARNING:
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+# Listener per logger name, so re-creating a StructuredLogger stops the old thread
+_listeners: dict[str, logging.handlers.QueueListener] = {}
+
+
+@atexit.register
+def _stop_listeners() -> None:
+    for listener in list(_listeners.values()):
+        listener.stop()
+    _listeners.clear()
+
+
 class StructuredLogger:
     """
     High-level structured logger with context management.
@@ -164,6 +233,9 @@ class StructuredLogger:
         console: bool = True,
         json_format: bool = True,
         rotation_config: Optional[dict[str, Any]] = None,
+        async_handlers: bool = False,
+        queue_size: int = 10000,
+        overflow: str = "drop",
     ):
         """
         Initialize structured logger.
@@ -175,8 +247,16 @@ class StructuredLogger:
             console: Enable console output
             json_format: Use JSON format (False = human-readable)
             rotation_config: Log rotation settings
+            async_handlers: Route records through a bounded queue to a listener
+                thread that owns the file/console handlers
+            queue_size: Capacity of that queue
+            overflow: Policy when the queue is full ("drop" or "block"),
+                see ContextQueueHandler
         """
         self.logger = logging.getLogger(name)
+        self.handlers: list[logging.Handler] = []
+        self.queue_handler: Optional[ContextQueueHandler] = None
+        self.listener: Optional[logging.handlers.QueueListener] = None
 
         # Set level
         if isinstance(level, str):
@@ -184,6 +264,9 @@ class StructuredLogger:
         self.logger.setLevel(level)
 
         # Clear existing handlers
+        previous = _listeners.pop(name, None)
+        if previous is not None:
+            previous.stop()
         self.logger.handlers.clear()
 
         # Add file handler with rotation
@@ -194,6 +277,23 @@ class StructuredLogger:
         if console:
             self._add_console_handler(json_format)
 
+        if async_handlers and self.handlers:
+            self.queue_handler = ContextQueueHandler(queue.Queue(queue_size), overflow)
+            self.listener = logging.handlers.QueueListener(
+                self.queue_handler.queue, *self.handlers, respect_handler_level=True
+            )
+            self.logger.handlers = [self.queue_handler]
+            self.listener.start()
+            _listeners[name] = self.listener
+
+    def stop(self) -> None:
+        """Drain the queue and stop the listener thread (no-op for sync handlers)."""
+        if self.listener is not None:
+            self.listener.stop()
+            if _listeners.get(self.logger.name) is self.listener:
+                del _listeners[self.logger.name]
+            self.listener = None
+
     def _add_file_handler(
         self, log_file: Path, json_format: bool, rotation_config: Optional[dict[str, Any]] = None
     ):
@@ -224,6 +324,7 @@ class StructuredLogger:
                 logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
             )
 
+        self.handlers.append(handler)
         self.logger.addHandler(handler)
 
     def _add_console_handler(self, json_format: bool):
@@ -235,6 +336,7 @@ class StructuredLogger:
         else:
             handler.setFormatter(ColoredFormatter())
 
+        self.handlers.append(handler)
         self.logger.addHandler(handler)
 
     def get_logger(self) -> logging.Logger:
@@ -391,6 +493,32 @@ def log_event(logger: logging.Logger, event: str, level: int = logging.INFO, **k
 # Performance timing utilities
 
 
+class LogSampler:
+    """
+    Decide which occurrences of a per-record log message to emit.
+
+    Lets through the first ``first`` occurrences per key, then every
+    ``every``-th, so hot loops can keep debug messages (filter rejections,
+    skipped records) without one log call per record.
+
+    Example:
+        >>> sampler = LogSampler(every=100)
+        >>> if logger.isEnabledFor(logging.DEBUG) and (n := sampler("min_length")):
+        ...     logger.debug(f"Rejected by min_length (occurrence {n})")
+    """
+
+    def __init__(self, every: int = 100, first: int = 10):
+        self.every = max(every, 1)
+        self.first = first
+        self.counts: Counter = Counter()
+
+    def __call__(self, key: str) -> int:
+        """Count an occurrence; return its number if it should be logged, else 0."""
+        self.counts[key] += 1
+        count = self.counts[key]
+        return count if count <= self.first or count % self.every == 0 else 0
+
+
 class Timer:
     """Simple timer for measuring durations."""
 
@@ -447,6 +575,8 @@ def setup_logging(config_path: Optional[Path] = None, environment: str = "develo
         }
 
     log_config = config.get("logging", {})
+    # Optional section: {"async": {"enabled": true, "queue_size": 10000, "overflow": "drop"}}
+    async_config = log_config.get("async", {})
 
     # Create logger
     logger = StructuredLogger(
@@ -457,6 +587,9 @@ def setup_logging(config_path: Optional[Path] = None, environment: str = "develo
         else None,
         console=log_config.get("console", {}).get("enabled", True),
         json_format=log_config.get("format") == "json",
+        async_handlers=async_config.get("enabled", False),
+        queue_size=async_config.get("queue_size", 10000),
+        overflow=async_config.get("overflow", "drop"),
     )
 
     return logger
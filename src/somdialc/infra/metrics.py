@@ -14,13 +14,16 @@ import json
 import logging
 import statistics
 import time
-from collections import Counter, defaultdict
+from collections import Counter, defaultdict, deque
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
 from typing import Any, Optional, Union
 
+from .metrics_sketches import HyperLogLog, LogHistogram, QuantileSketch
+from .profiling import StageTimer
+
 logger = logging.getLogger(__name__)
 
 
@@ -532,6 +535,10 @@ class MetricSnapshot:
     duplicate_hashes: int = 0
     near_duplicates: int = 0
 
+    # Whole-run summaries from the collector's sketches; preferred over the
+    # sample lists above, which only hold the most recent values
+    summary_stats: dict[str, dict[str, float]] = field(default_factory=dict)
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
         return asdict(self)
@@ -662,28 +669,26 @@ class MetricSnapshot:
                 stats["quality_pass_rate"] = 0
 
         # Timing statistics
-        if self.fetch_durations_ms:
-            stats["fetch_duration_stats"] = {
-                "min": min(self.fetch_durations_ms),
-                "max": max(self.fetch_durations_ms),
-                "mean": statistics.mean(self.fetch_durations_ms),
-                "median": statistics.median(self.fetch_durations_ms),
-                "p95": self._percentile(self.fetch_durations_ms, 95),
-                "p99": self._percentile(self.fetch_durations_ms, 99),
-            }
-
-        if self.process_durations_ms:
-            stats["process_duration_stats"] = {
-                "min": min(self.process_durations_ms),
-                "max": max(self.process_durations_ms),
-                "mean": statistics.mean(self.process_durations_ms),
-                "median": statistics.median(self.process_durations_ms),
-                "p95": self._percentile(self.process_durations_ms, 95),
-                "p99": self._percentile(self.process_durations_ms, 99),
-            }
+        for key, samples in (
+            ("fetch_duration_stats", self.fetch_durations_ms),
+            ("process_duration_stats", self.process_durations_ms),
+        ):
+            if key in self.summary_stats:
+                stats[key] = dict(self.summary_stats[key])
+            elif samples:
+                stats[key] = {
+                    "min": min(samples),
+                    "max": max(samples),
+                    "mean": statistics.mean(samples),
+                    "median": statistics.median(samples),
+                    "p95": self._percentile(samples, 95),
+                    "p99": self._percentile(samples, 99),
+                }
 
         # Text length statistics
-        if self.text_lengths:
+        if "text_length_stats" in self.summary_stats:
+            stats["text_length_stats"] = dict(self.summary_stats["text_length_stats"])
+        elif self.text_lengths:
             stats["text_length_stats"] = {
                 "min": min(self.text_lengths),
                 "max": max(self.text_lengths),
@@ -760,9 +765,17 @@ class MetricSnapshot:
         return sorted_data[min(index, len(sorted_data) - 1)]
 
 
+RECENT_SAMPLE_SIZE = 1000
+
+
 class MetricsCollector:
     """
     Collects and tracks metrics during pipeline execution.
+
+    Durations, text lengths and text hashes are summarised in fixed-memory
+    sketches (see metrics_sketches), so memory stays flat however many records
+    a run processes. Collectors are mergeable: ``merge()`` folds in another
+    collector, e.g. one per worker or per source.
     """
 
     def __init__(self, run_id: str, source: str, pipeline_type: Optional[PipelineType] = None):
@@ -789,15 +802,37 @@ class MetricsCollector:
             "error_types": Counter(),
         }
 
-        # Initialize timing lists
-        self.timings = {"fetch_durations_ms": [], "process_durations_ms": []}
+        # Timing sketches (whole-run percentiles in bounded memory)
+        self.timings = {
+            "fetch_durations_ms": QuantileSketch(),
+            "process_durations_ms": QuantileSketch(),
+        }
+        self.first_fetch_duration_ms: Optional[float] = None
+
+        # Text statistics
+        self.text_lengths = QuantileSketch()
+        self.text_length_histogram = LogHistogram()
+
+        # Length histograms per filter outcome ("passed", "filtered", "duplicate"),
+        # measured on cleaned text: {"chars": {outcome: LogHistogram}, "tokens": {...}}
+        self.length_histograms: dict[str, dict[str, LogHistogram]] = {"chars": {}, "tokens": {}}
 
-        # Initialize text statistics
-        self.text_lengths = []
+        # Processing-loop stage timings (filled in by BasePipeline)
+        self.stage_timer = StageTimer()
+
+        # Process resource telemetry ({"interval_seconds", "summary", "samples"}),
+        # attached by BasePipeline from its ResourceSampler
+        self.resource_usage: Optional[dict[str, Any]] = None
+
+        # Most recent raw samples, exported in snapshots
+        self.recent_samples = {
+            name: deque(maxlen=RECENT_SAMPLE_SIZE)
+            for name in ("fetch_durations_ms", "process_durations_ms", "text_lengths")
+        }
 
         # Unique hash tracking for deduplication
-        self.unique_hashes = set()
-        self.duplicate_count = 0
+        self.unique_hashes = HyperLogLog()
+        self.hashes_recorded = 0
         self.near_duplicate_count = 0
 
         # Custom metrics storage
@@ -831,41 +866,180 @@ class MetricsCollector:
 
     def record_fetch_duration(self, duration_ms: float):
         """Record fetch duration in milliseconds."""
-        self.timings["fetch_durations_ms"].append(duration_ms)
+        if self.first_fetch_duration_ms is None:
+            self.first_fetch_duration_ms = duration_ms
+        self.timings["fetch_durations_ms"].add(duration_ms)
+        self.recent_samples["fetch_durations_ms"].append(duration_ms)
 
     def record_process_duration(self, duration_ms: float):
         """Record processing duration in milliseconds."""
-        self.timings["process_durations_ms"].append(duration_ms)
+        self.timings["process_durations_ms"].add(duration_ms)
+        self.recent_samples["process_durations_ms"].append(duration_ms)
 
     def record_text_length(self, length: int):
         """Record text length in characters."""
-        self.text_lengths.append(length)
+        self.text_lengths.add(length)
+        self.text_length_histogram.add(length)
+        self.recent_samples["text_lengths"].append(length)
+
+    def record_length_outcome(self, char_count: int, token_count: int, outcome: str):
+        """
+        Record the cleaned length of a record under its filter outcome.
+
+        Args:
+            char_count: Length in characters
+            token_count: Length in whitespace tokens
+            outcome: Filter outcome, e.g. "passed", "filtered" or "duplicate"
+        """
+        for unit, value in (("chars", char_count), ("tokens", token_count)):
+            histograms = self.length_histograms[unit]
+            if outcome not in histograms:
+                histograms[outcome] = LogHistogram()
+            histograms[outcome].add(value)
+
+    def get_length_histograms(self) -> dict[str, Any]:
+        """
+        Length histograms in their exported form.
+
+        Returns:
+            ``{"bins_per_octave": int, "chars": {outcome: bins}, "tokens": {outcome: bins}}``
+            where bins are ``LogHistogram.bins()`` lists, or an empty dict if
+            nothing was recorded
+        """
+        if not self.length_histograms["chars"]:
+            return {}
+        first = next(iter(self.length_histograms["chars"].values()))
+        return {
+            "bins_per_octave": first.bins_per_octave,
+            **{
+                unit: {
+                    outcome: histogram.bins() for outcome, histogram in sorted(by_outcome.items())
+                }
+                for unit, by_outcome in self.length_histograms.items()
+            },
+        }
 
-    def record_hash(self, text_hash: str) -> bool:
+    def record_hash(self, text_hash: Union[str, int]) -> bool:
         """
         Record text hash for deduplication tracking.
 
+        Exact up to ~10k distinct hashes; beyond that uniqueness is estimated
+        (HyperLogLog), so use the pipeline's dedup engine for actual filtering.
+        Pass either hex hashes or ``RecordDigests.fingerprint`` ints
+        consistently within a run; the two are counted as different values.
+
+        Unique and duplicate counts are derived from the sketch's cardinality
+        (see ``duplicate_count``) rather than counted per call: once the
+        sketch is dense, ``add`` reports False whenever no register grows,
+        which would count most new hashes as duplicates.
+
         Returns:
-            True if unique, False if duplicate
+            True if the hash is newly seen by the sketch. Exact while the
+            sketch is exact; afterwards False only means "probably seen"
         """
-        if text_hash in self.unique_hashes:
-            self.duplicate_count += 1
-            self.increment("duplicate_hashes")
-            self.increment("urls_deduplicated")  # Backward compatibility
-            return False
-        else:
-            self.unique_hashes.add(text_hash)
-            self.increment("unique_hashes")
-            return True
+        self.hashes_recorded += 1
+        return self.unique_hashes.add(text_hash)
+
+    @property
+    def duplicate_count(self) -> int:
+        """Recorded hashes that were not unique."""
+        return max(self.hashes_recorded - self.unique_hashes.cardinality(), 0)
 
     def record_near_duplicate(self):
         """Record near-duplicate found."""
         self.near_duplicate_count += 1
         self.increment("near_duplicates")
 
+    def merge(self, other: "MetricsCollector") -> None:
+        """
+        Fold another collector's measurements into this one.
+
+        Counters, distributions and sketches combine exactly as if this
+        collector had recorded everything itself; recent samples are appended
+        and custom metrics already present here are kept.
+
+        Args:
+            other: Collector to merge (e.g. from a worker or another source)
+        """
+        for name, value in other.counters.items():
+            self.counters[name] += value
+        for name, distribution in other.distributions.items():
+            self.distributions.setdefault(name, Counter()).update(distribution)
+        for name, sketch in other.timings.items():
+            self.timings[name].merge(sketch)
+        if self.first_fetch_duration_ms is None:
+            self.first_fetch_duration_ms = other.first_fetch_duration_ms
+        self.text_lengths.merge(other.text_lengths)
+        self.text_length_histogram.merge(other.text_length_histogram)
+        for unit, by_outcome in other.length_histograms.items():
+            for outcome, histogram in by_outcome.items():
+                self.length_histograms[unit].setdefault(outcome, LogHistogram()).merge(histogram)
+        for name, samples in other.recent_samples.items():
+            self.recent_samples[name].extend(samples)
+        self.stage_timer.merge(other.stage_timer)
+        self.unique_hashes.merge(other.unique_hashes)
+        self.hashes_recorded += other.hashes_recorded
+        self.near_duplicate_count += other.near_duplicate_count
+        self.start_time = min(self.start_time, other.start_time)
+        for name, value in other.custom_metrics.items():
+            self.custom_metrics.setdefault(name, value)
+
+    def get_sketch_state(self) -> dict[str, Any]:
+        """
+        Serialize the mergeable sketch state (JSON-safe).
+
+        Lets collectors in other processes ship their summaries back for
+        ``merge_sketch_state()``.
+        """
+        return {
+            "timings": {name: sketch.to_dict() for name, sketch in self.timings.items()},
+            "text_lengths": self.text_lengths.to_dict(),
+            "text_length_histogram": self.text_length_histogram.to_dict(),
+            "length_histograms": {
+                unit: {outcome: histogram.to_dict() for outcome, histogram in by_outcome.items()}
+                for unit, by_outcome in self.length_histograms.items()
+            },
+            "unique_hashes": self.unique_hashes.to_dict(),
+            "hashes_recorded": self.hashes_recorded,
+        }
+
+    def merge_sketch_state(self, state: dict[str, Any]) -> None:
+        """Merge sketch state produced by ``get_sketch_state()``."""
+        for name, data in state["timings"].items():
+            self.timings[name].merge(QuantileSketch.from_dict(data))
+        self.text_lengths.merge(QuantileSketch.from_dict(state["text_lengths"]))
+        self.text_length_histogram.merge(LogHistogram.from_dict(state["text_length_histogram"]))
+        for unit, by_outcome in state.get("length_histograms", {}).items():
+            for outcome, data in by_outcome.items():
+                self.length_histograms[unit].setdefault(outcome, LogHistogram()).merge(
+                    LogHistogram.from_dict(data)
+                )
+        self.unique_hashes.merge(HyperLogLog.from_dict(state["unique_hashes"]))
+        self.hashes_recorded += state["hashes_recorded"]
+
+    def _summary_stats(self) -> dict[str, dict[str, float]]:
+        summary = {}
+        for key, name in (
+            ("fetch_duration_stats", "fetch_durations_ms"),
+            ("process_duration_stats", "process_durations_ms"),
+        ):
+            if self.timings[name].count:
+                summary[key] = self.timings[name].summary()
+        if self.text_lengths.count:
+            summary["text_length_stats"] = {
+                "min": self.text_lengths.min,
+                "max": self.text_lengths.max,
+                "mean": self.text_lengths.mean,
+                "median": self.text_lengths.quantile(0.5),
+                "total_chars": int(self.text_lengths.sum),
+            }
+        return summary
+
     def get_snapshot(self) -> MetricSnapshot:
         """Get current metrics snapshot."""
         duration = time.time() - self.start_time
+        unique_hashes = self.unique_hashes.cardinality()
+        duplicate_hashes = max(self.hashes_recorded - unique_hashes, 0)
 
         return MetricSnapshot(
             timestamp=datetime.now(timezone.utc).isoformat(),
@@ -879,7 +1053,8 @@ class MetricsCollector:
             urls_processed=self.counters["urls_processed"],
             urls_failed=self.counters["urls_failed"],
             urls_skipped=self.counters["urls_skipped"],
-            urls_deduplicated=self.counters["urls_deduplicated"],
+            # Backward compatibility: exact-hash duplicates count as deduplicated URLs
+            urls_deduplicated=self.counters["urls_deduplicated"] + duplicate_hashes,
             # File processing counters
             files_discovered=self.counters["files_discovered"],
             files_processed=self.counters["files_processed"],
@@ -896,12 +1071,13 @@ class MetricsCollector:
             http_status_codes=dict(self.distributions["http_status_codes"]),
             filter_reasons=dict(self.distributions["filter_reasons"]),
             error_types=dict(self.distributions["error_types"]),
-            fetch_durations_ms=self.timings["fetch_durations_ms"][-1000:],  # Last 1000
-            process_durations_ms=self.timings["process_durations_ms"][-1000:],
-            text_lengths=self.text_lengths[-1000:],  # Last 1000
-            unique_hashes=len(self.unique_hashes),
-            duplicate_hashes=self.duplicate_count,
+            fetch_durations_ms=list(self.recent_samples["fetch_durations_ms"]),
+            process_durations_ms=list(self.recent_samples["process_durations_ms"]),
+            text_lengths=list(self.recent_samples["text_lengths"]),
+            unique_hashes=unique_hashes,
+            duplicate_hashes=duplicate_hashes,
             near_duplicates=self.near_duplicate_count,
+            summary_stats=self._summary_stats(),
         )
 
     def get_layered_metrics(self) -> dict[str, Any]:
@@ -929,13 +1105,7 @@ class MetricsCollector:
 
         # Layer 1: Connectivity
         # Calculate connection duration from fetch durations if available
-        conn_duration_ms = 0.0
-        if self.timings["fetch_durations_ms"]:
-            conn_duration_ms = (
-                self.timings["fetch_durations_ms"][0]
-                if len(self.timings["fetch_durations_ms"]) > 0
-                else 0.0
-            )
+        conn_duration_ms = self.first_fetch_duration_ms or 0.0
 
         connectivity = ConnectivityMetrics(
             connection_attempted=True,  # If we have any data, connection was attempted
@@ -1043,7 +1213,7 @@ class MetricsCollector:
         )
 
         # Layer 4: Volume
-        total_chars = sum(snapshot.text_lengths) if snapshot.text_lengths else 0
+        total_chars = int(self.text_lengths.sum)
 
         volume = VolumeMetrics(
             records_written=snapshot.records_written,
@@ -1070,6 +1240,9 @@ class MetricsCollector:
         - Schema version for backward compatibility tracking
         - Pipeline type metadata
         - Layered metrics (Phase 2) - optional
+        - Text length histograms per filter outcome, if recorded
+        - Per-stage/per-filter timings of the processing loop, if recorded
+        - Resource usage time series and summary, if sampled
         - Legacy flat metrics (Phase 1) - for backward compatibility
         - Validation warnings if metrics are inconsistent
         """
@@ -1113,6 +1286,20 @@ class MetricsCollector:
 
         # Add legacy metrics for backward compatibility
 
+        # Cleaned-length histograms per filter outcome (dashboard Ridge plot)
+        length_histograms = self.get_length_histograms()
+        if length_histograms:
+            metrics_data["text_length_histograms"] = length_histograms
+
+        # Wall time per processing stage and per filter
+        stage_timings = self.stage_timer.summary()
+        if stage_timings:
+            metrics_data["stage_timings"] = stage_timings
+
+        # RSS / CPU / I/O / fd / WAL samples for the run
+        if self.resource_usage:
+            metrics_data["resources"] = self.resource_usage
+
         # Add custom metrics if any
         if self.custom_metrics:
             metrics_data["custom_metrics"] = self.custom_metrics
@@ -1395,6 +1582,30 @@ class MetricsCollector:
                 ]
             )
 
+        stage_timings = self.stage_timer.summary()
+        if stage_timings:
+            lines.extend(
+                [
+                    "# HELP pipeline_stage_seconds_total Wall time spent per processing stage",
+                    "# TYPE pipeline_stage_seconds_total counter",
+                ]
+            )
+            for stage, timing in stage_timings["stages"].items():
+                seconds = timing["total_ms"] / 1000
+                lines.append(f'pipeline_stage_seconds_total{{{labels},stage="{stage}"}} {seconds}')
+            lines.extend(
+                [
+                    "",
+                    "# HELP pipeline_stage_calls_total Timed intervals per processing stage",
+                    "# TYPE pipeline_stage_calls_total counter",
+                ]
+            )
+            for stage, timing in stage_timings["stages"].items():
+                lines.append(
+                    f'pipeline_stage_calls_total{{{labels},stage="{stage}"}} {timing["calls"]}'
+                )
+            lines.append("")
+
         if "throughput" in stats:
             throughput = stats["throughput"]
             lines.extend(
@@ -1461,6 +1672,9 @@ class QualityReporter:
         # Performance Metrics
         report_lines.extend(self._generate_performance_metrics())
 
+        # Resource Usage
+        report_lines.extend(self._generate_resource_usage())
+
         # Data Quality Metrics
         report_lines.extend(self._generate_quality_metrics())
 
@@ -1671,6 +1885,36 @@ class QualityReporter:
 
         return lines
 
+    def _generate_resource_usage(self) -> list[str]:
+        """Generate resource usage section from the run's resource samples."""
+        summary = (self.collector.resource_usage or {}).get("summary")
+        if not summary:
+            return []
+
+        lines = ["## Resource Usage", ""]
+        if summary.get("peak_rss_bytes") is not None:
+            lines.append(f"- **Peak RSS:** {self._format_bytes(summary['peak_rss_bytes'])}")
+        lines.append(f"- **CPU Time:** {summary['cpu_seconds']:.1f} s")
+        if summary.get("mean_cpu_percent") is not None:
+            lines.append(
+                f"- **CPU Utilisation:** {summary['mean_cpu_percent']:.0f}% mean, "
+                f"{summary.get('max_cpu_percent') or 0:.0f}% max"
+            )
+        for key, label in (
+            ("read_bytes", "Disk Read"),
+            ("write_bytes", "Disk Written"),
+            ("rchar", "Total Read (incl. network)"),
+            ("wchar", "Total Written (incl. network)"),
+            ("max_wal_bytes", "Peak SQLite WAL"),
+        ):
+            if summary.get(key) is not None:
+                lines.append(f"- **{label}:** {self._format_bytes(summary[key])}")
+        if summary.get("max_open_fds") is not None:
+            lines.append(f"- **Max Open File Descriptors:** {summary['max_open_fds']}")
+        lines.append(f"- **Samples:** {summary['samples']}")
+        lines.extend(["", "---", ""])
+        return lines
+
     def _generate_quality_metrics(self) -> list[str]:
         """Generate data quality metrics section."""
         lines = ["## Data Quality Metrics", ""]
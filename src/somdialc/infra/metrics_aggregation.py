@@ -208,6 +208,8 @@ def extract_consolidated_metric(data: dict[str, Any], source_file: str) -> Optio
             metric["text_length_stats"] = stats["text_length_stats"]
         if stats.get("fetch_duration_stats"):
             metric["fetch_duration_stats"] = stats["fetch_duration_stats"]
+        if data.get("text_length_histograms"):
+            metric["text_length_histograms"] = data["text_length_histograms"]
 
         # Filter breakdown — surface from layered_metrics.quality (Phase-3)
         # OR legacy filter_reasons (older snapshots).
@@ -0,0 +1,212 @@
+"""
+Live Prometheus exposition endpoint for long pipeline runs.
+
+``MetricsCollector.export_prometheus`` writes a ``.prom`` file when a stage
+finishes. LiveMetricsExporter instead serves the *current* values over HTTP
+from a stdlib ``ThreadingHTTPServer`` thread, so a local Prometheus can
+scrape progress of multi-hour runs (MC4, Språkbanken) while they are going.
+
+The hot loop is never touched: metrics are registered as read callables
+that run on the server thread at scrape time. Callables should return plain
+numbers or shallow ``dict(...)`` copies of counters (a C-level copy that
+holds the GIL, so no lock is needed on the writer side).
+
+Example:
+    >>> timer = StageTimer()
+    >>> exporter = LiveMetricsExporter(port=9108, labels={"source": "mc4"})
+    >>> exporter.add_metric("pipeline_records_read_total", "counter",
+    ...                     "Records read", lambda: timer.calls["extract"])
+    >>> exporter.track_rate(lambda: timer.calls["extract"])
+    >>> exporter.start()   # curl http://127.0.0.1:9108/metrics
+    >>> exporter.stop()
+"""
+
+import logging
+import math
+import threading
+import time
+from collections.abc import Callable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+MetricValue = Union[int, float, dict[str, Union[int, float]]]
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape_label(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class LiveMetricsExporter:
+    """
+    Serve registered metrics in Prometheus text format on ``/metrics``.
+
+    Besides the registered metrics, every scrape reports
+    ``pipeline_records_per_second`` (run average) and
+    ``pipeline_records_per_second_ewma`` (exponentially weighted over
+    ``ewma_window_seconds``) for the counter given to ``track_rate``.
+    """
+
+    def __init__(
+        self,
+        port: int,
+        host: str = "127.0.0.1",
+        labels: Optional[dict[str, str]] = None,
+        ewma_window_seconds: float = 30.0,
+    ):
+        """
+        Initialize exporter.
+
+        Args:
+            port: TCP port to listen on (0 picks a free port)
+            host: Interface to bind (loopback by default)
+            labels: Labels attached to every sample (e.g. source, run_id)
+            ewma_window_seconds: Time constant of the records/sec EWMA
+        """
+        self.host = host
+        self.port = port
+        self.labels = dict(labels or {})
+        self.ewma_window_seconds = ewma_window_seconds
+        self._metrics: list[tuple[str, str, str, Callable[[], MetricValue], Optional[str]]] = []
+        self._rate_source: Optional[Callable[[], int]] = None
+        self._rate_lock = threading.Lock()
+        self._started_at = time.monotonic()
+        self._initial_count = 0
+        self._last_count = 0
+        self._last_time = self._started_at
+        self._ewma: Optional[float] = None
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}/metrics"
+
+    def add_metric(
+        self,
+        name: str,
+        metric_type: str,
+        help_text: str,
+        read: Callable[[], MetricValue],
+        label: Optional[str] = None,
+    ) -> None:
+        """
+        Register a metric read at scrape time.
+
+        Args:
+            name: Metric name
+            metric_type: "counter" or "gauge"
+            help_text: HELP line text
+            read: Returns a number, or ``{label_value: number}`` when ``label`` is set
+            label: Label name for dict-valued reads
+        """
+        self._metrics.append((name, metric_type, help_text, read, label))
+
+    def track_rate(self, read_count: Callable[[], int]) -> None:
+        """Use ``read_count`` (a monotonically increasing record count) for the rate gauges."""
+        self._rate_source = read_count
+        self._initial_count = self._last_count = read_count()
+        self._started_at = self._last_time = time.monotonic()
+
+    def _update_rate(self) -> tuple[float, float]:
+        """Advance the EWMA to now; returns (average rate, EWMA rate)."""
+        count = self._rate_source()
+        now = time.monotonic()
+        with self._rate_lock:
+            elapsed = now - self._last_time
+            if elapsed > 0:
+                instant = (count - self._last_count) / elapsed
+                if self._ewma is None:
+                    self._ewma = instant
+                else:
+                    # Irregular-interval EWMA: weight decays with the real time elapsed
+                    alpha = 1 - math.exp(-elapsed / self.ewma_window_seconds)
+                    self._ewma += alpha * (instant - self._ewma)
+                self._last_count = count
+                self._last_time = now
+            total_elapsed = now - self._started_at
+            average = (count - self._initial_count) / total_elapsed if total_elapsed > 0 else 0.0
+            return average, self._ewma or 0.0
+
+    def _format_labels(self, extra: Optional[tuple[str, Any]] = None) -> str:
+        pairs = [f'{key}="{_escape_label(value)}"' for key, value in self.labels.items()]
+        if extra is not None:
+            pairs.append(f'{extra[0]}="{_escape_label(extra[1])}"')
+        return "{" + ",".join(pairs) + "}" if pairs else ""
+
+    def render(self) -> str:
+        """Render all metrics in Prometheus text exposition format."""
+        lines = []
+        for name, metric_type, help_text, read, label in self._metrics:
+            try:
+                value = read()
+            except Exception as e:  # A broken gauge must not take down the scrape
+                logger.debug(f"Live metric {name} failed: {e}")
+                continue
+            if value is None:
+                continue
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            if isinstance(value, dict):
+                for label_value, sample in sorted(value.items()):
+                    lines.append(f"{name}{self._format_labels((label, label_value))} {sample}")
+            else:
+                lines.append(f"{name}{self._format_labels()} {value}")
+
+        if self._rate_source is not None:
+            average, ewma = self._update_rate()
+            lines.extend(
+                [
+                    "# HELP pipeline_records_per_second Records per second since the run started",
+                    "# TYPE pipeline_records_per_second gauge",
+                    f"pipeline_records_per_second{self._format_labels()} {average:.3f}",
+                    "# HELP pipeline_records_per_second_ewma Records per second, "
+                    f"EWMA over {self.ewma_window_seconds:g}s",
+                    "# TYPE pipeline_records_per_second_ewma gauge",
+                    f"pipeline_records_per_second_ewma{self._format_labels()} {ewma:.3f}",
+                ]
+            )
+        return "\n".join(lines) + "\n"
+
+    def start(self) -> None:
+        """Bind the port and serve in a daemon thread."""
+        if self._server is not None:
+            return
+        exporter = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?", 1)[0] not in ("/metrics", "/"):
+                    self.send_error(404)
+                    return
+                body = exporter.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((self.host, self.port), _Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="metrics-exporter", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"Live metrics at {self.url}")
+
+    def stop(self) -> None:
+        """Stop serving and release the port."""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._server = None
+        self._thread = None
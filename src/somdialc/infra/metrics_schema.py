@@ -201,6 +201,16 @@ class CustomMetrics(BaseModel):
     model_config = ConfigDict(extra="allow")
 
 
+class TextLengthHistograms(BaseModel):
+    """Log-spaced cleaned-length histograms per filter outcome."""
+
+    bins_per_octave: int = Field(ge=1)
+    chars: dict[str, list[dict[str, float]]]
+    tokens: dict[str, list[dict[str, float]]]
+
+    model_config = ConfigDict(extra="forbid")
+
+
 class Phase3MetricsSchema(BaseModel):
     """
     Complete Phase 3 metrics schema for *_processing.json files.
@@ -217,6 +227,12 @@ class Phase3MetricsSchema(BaseModel):
 
     layered_metrics: LayeredMetrics
 
+    text_length_histograms: Optional[TextLengthHistograms] = None
+
+    stage_timings: Optional[dict[str, Any]] = None
+
+    resources: Optional[dict[str, Any]] = None
+
     custom_metrics: Optional[CustomMetrics] = None
 
     model_config = ConfigDict(extra="forbid", populate_by_name=True)
@@ -267,6 +283,7 @@ class ConsolidatedMetric(BaseModel):
 
     # Statistical metrics (optional)
     text_length_stats: Optional[dict[str, Any]] = None
+    text_length_histograms: Optional[dict[str, Any]] = None
     fetch_duration_stats: Optional[dict[str, Any]] = None
     filter_breakdown: Optional[dict[str, int]] = None
 
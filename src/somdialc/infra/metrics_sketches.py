@@ -0,0 +1,389 @@
+"""
+Fixed-memory streaming summaries for pipeline metrics.
+
+MetricsCollector used to keep every duration, text length and text hash in
+Python lists/sets, which grows without bound on multi-million-record runs.
+These sketches summarise a stream in bounded memory and are mergeable, so
+per-worker or per-source collectors can be combined exactly as if one
+collector had seen every value:
+
+- QuantileSketch: DDSketch-style log-bucketed quantiles with bounded
+  relative error (default 1%), plus exact count/sum/min/max
+- HyperLogLog: distinct-count estimate (exact while small, ~0.8% error
+  at precision 14 once it switches to registers)
+- LogHistogram: counts in log2-spaced bins, for length distributions
+
+All sketches round-trip through ``to_dict``/``from_dict`` (JSON-safe).
+"""
+
+import base64
+import hashlib
+import math
+from typing import Any, Optional, Union
+
+
+class QuantileSketch:
+    """
+    Streaming quantile sketch with relative-error guarantees (DDSketch).
+
+    Positive values are counted in buckets whose bounds grow geometrically
+    by ``gamma = (1 + a) / (1 - a)``, so any quantile is returned within
+    relative accuracy ``a``. Values <= 0 share a zero bucket. When more than
+    ``max_buckets`` buckets exist the lowest ones are collapsed, which only
+    affects the accuracy of the smallest quantiles.
+
+    Example:
+        >>> sketch = QuantileSketch()
+        >>> for ms in (120.0, 80.0, 95.0):
+        ...     sketch.add(ms)
+        >>> round(sketch.quantile(0.5))
+        95
+    """
+
+    _MIN_POSITIVE = 1e-9
+
+    def __init__(self, relative_accuracy: float = 0.01, max_buckets: int = 2048):
+        """
+        Initialize sketch.
+
+        Args:
+            relative_accuracy: Relative error bound for quantiles (0 < a < 1)
+            max_buckets: Bucket cap (bounds memory)
+
+        Raises:
+            ValueError: If relative_accuracy is outside (0, 1)
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError(f"relative_accuracy must be in (0, 1), got {relative_accuracy}")
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+
+        self.buckets: dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def __len__(self) -> int:
+        return self.count
+
+    def add(self, value: float, weight: int = 1) -> None:
+        """Add ``value`` (``weight`` times)."""
+        self.count += weight
+        self.sum += value * weight
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+        if value <= self._MIN_POSITIVE:
+            self.zero_count += weight
+            return
+        key = math.ceil(math.log(value) / self._log_gamma)
+        self.buckets[key] = self.buckets.get(key, 0) + weight
+        if len(self.buckets) > self.max_buckets:
+            self._collapse()
+
+    def _collapse(self) -> None:
+        keys = sorted(self.buckets)
+        excess = len(keys) - self.max_buckets
+        carried = sum(self.buckets.pop(key) for key in keys[:excess])
+        target = keys[excess]
+        self.buckets[target] += carried
+
+    def _bucket_value(self, key: int) -> float:
+        return 2 * self._gamma**key / (self._gamma + 1)
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate the ``q``-quantile (0 <= q <= 1).
+
+        Returns:
+            Estimated value clamped to [min, max], or 0.0 for an empty sketch
+        """
+        if self.count == 0:
+            return 0.0
+        rank = q * (self.count - 1)
+
+        running = self.zero_count
+        value = self.max
+        if rank < running:
+            return min(max(0.0, self.min), self.max)
+        for key in sorted(self.buckets):
+            running += self.buckets[key]
+            if running > rank:
+                value = self._bucket_value(key)
+                break
+        return min(max(value, self.min), self.max)
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+    def summary(self) -> dict[str, float]:
+        """Summary with the keys used in exported ``*_duration_stats``."""
+        return {
+            "min": self.min,
+            "max": self.max,
+            "mean": self.mean,
+            "median": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+        }
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """
+        Fold ``other`` into this sketch.
+
+        Raises:
+            ValueError: If the sketches use different relative accuracies
+        """
+        if not math.isclose(self.relative_accuracy, other.relative_accuracy):
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        if other.count == 0:
+            return
+        for key, count in other.buckets.items():
+            self.buckets[key] = self.buckets.get(key, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        if len(self.buckets) > self.max_buckets:
+            self._collapse()
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "max_buckets": self.max_buckets,
+            "buckets": {str(key): count for key, count in self.buckets.items()},
+            "zero_count": self.zero_count,
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "QuantileSketch":
+        sketch = cls(data["relative_accuracy"], data.get("max_buckets", 2048))
+        sketch.buckets = {int(key): count for key, count in data["buckets"].items()}
+        sketch.zero_count = data["zero_count"]
+        sketch.count = data["count"]
+        sketch.sum = data["sum"]
+        if sketch.count:
+            sketch.min = data["min"]
+            sketch.max = data["max"]
+        return sketch
+
+
+class HyperLogLog:
+    """
+    Distinct-count sketch.
+
+    Keeps exact 64-bit hashes until ``sparse_limit`` distinct values have been
+    seen, then switches to ``2**precision`` one-byte registers (16 KiB at the
+    default precision 14, standard error ~0.8%).
+
+    Strings are hashed with BLAKE2b; ints are taken as already-uniform 64-bit
+    hashes (e.g. ``RecordDigests.fingerprint``) and used as is.
+    """
+
+    def __init__(self, precision: int = 14, sparse_limit: int = 10_000):
+        """
+        Initialize sketch.
+
+        Args:
+            precision: Register index bits (4-18)
+            sparse_limit: Distinct values tracked exactly before switching to registers
+
+        Raises:
+            ValueError: If precision is out of range
+        """
+        if not 4 <= precision <= 18:
+            raise ValueError(f"precision must be between 4 and 18, got {precision}")
+        self.precision = precision
+        self.sparse_limit = sparse_limit
+        self._sparse: Optional[set[int]] = set()
+        self._registers: Optional[bytearray] = None
+
+    @staticmethod
+    def _hash(value: Union[str, int]) -> int:
+        if isinstance(value, int):
+            return value & 0xFFFFFFFFFFFFFFFF
+        digest = hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest()
+        return int.from_bytes(digest, "big")
+
+    @property
+    def is_exact(self) -> bool:
+        """True while the sketch still counts exactly."""
+        return self._sparse is not None
+
+    def add(self, value: Union[str, int]) -> bool:
+        """
+        Add ``value``.
+
+        Returns:
+            True if the value is new. Exact while ``is_exact``; afterwards True
+            means a register changed (definitely new), False means probably seen.
+        """
+        hashed = self._hash(value)
+        if self._sparse is not None:
+            if hashed in self._sparse:
+                return False
+            self._sparse.add(hashed)
+            if len(self._sparse) > self.sparse_limit:
+                self._densify()
+            return True
+        return self._add_dense(hashed)
+
+    def _add_dense(self, hashed: int) -> bool:
+        index = hashed >> (64 - self.precision)
+        remaining_bits = 64 - self.precision
+        rest = hashed & ((1 << remaining_bits) - 1)
+        rank = remaining_bits - rest.bit_length() + 1
+        if rank > self._registers[index]:
+            self._registers[index] = rank
+            return True
+        return False
+
+    def _densify(self) -> None:
+        self._registers = bytearray(1 << self.precision)
+        sparse, self._sparse = self._sparse, None
+        for hashed in sparse:
+            self._add_dense(hashed)
+
+    def cardinality(self) -> int:
+        """Estimated number of distinct values."""
+        if self._sparse is not None:
+            return len(self._sparse)
+
+        m = len(self._registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / sum(2.0**-register for register in self._registers)
+        zeros = self._registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros)  # Linear counting for small cardinalities
+        return int(round(estimate))
+
+    def __len__(self) -> int:
+        return self.cardinality()
+
+    def merge(self, other: "HyperLogLog") -> None:
+        """
+        Fold ``other`` into this sketch (union of the two value sets).
+
+        Raises:
+            ValueError: If the sketches use different precisions
+        """
+        if self.precision != other.precision:
+            raise ValueError("Cannot merge HyperLogLog sketches with different precision")
+
+        if self._sparse is not None and other._sparse is not None:
+            self._sparse |= other._sparse
+            if len(self._sparse) > self.sparse_limit:
+                self._densify()
+            return
+
+        if self._sparse is not None:
+            self._densify()
+        if other._sparse is not None:
+            for hashed in other._sparse:
+                self._add_dense(hashed)
+        else:
+            for index, register in enumerate(other._registers):
+                if register > self._registers[index]:
+                    self._registers[index] = register
+
+    def to_dict(self) -> dict[str, Any]:
+        data: dict[str, Any] = {"precision": self.precision, "sparse_limit": self.sparse_limit}
+        if self._sparse is not None:
+            data["sparse"] = sorted(self._sparse)
+        else:
+            data["registers"] = base64.b64encode(bytes(self._registers)).decode("ascii")
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "HyperLogLog":
+        sketch = cls(data["precision"], data.get("sparse_limit", 10_000))
+        if "registers" in data:
+            sketch._sparse = None
+            sketch._registers = bytearray(base64.b64decode(data["registers"]))
+        else:
+            sketch._sparse = set(data["sparse"])
+        return sketch
+
+
+class LogHistogram:
+    """
+    Histogram with log2-spaced bins.
+
+    Bin 0 holds values below 1; bin ``k >= 1`` holds
+    ``[2**((k-1)/b), 2**(k/b))`` with ``b = bins_per_octave``. Memory is
+    proportional to the number of occupied bins (a few dozen for text lengths).
+    """
+
+    def __init__(self, bins_per_octave: int = 4):
+        """
+        Initialize histogram.
+
+        Args:
+            bins_per_octave: Bins per doubling of the value
+        """
+        if bins_per_octave < 1:
+            raise ValueError(f"bins_per_octave must be >= 1, got {bins_per_octave}")
+        self.bins_per_octave = bins_per_octave
+        self.counts: dict[int, int] = {}
+
+    def _index(self, value: float) -> int:
+        if value < 1:
+            return 0
+        return int(math.floor(math.log2(value) * self.bins_per_octave)) + 1
+
+    def _lower_bound(self, index: int) -> float:
+        return 0.0 if index == 0 else 2.0 ** ((index - 1) / self.bins_per_octave)
+
+    def add(self, value: float, weight: int = 1) -> None:
+        """Add ``value`` (``weight`` times)."""
+        index = self._index(value)
+        self.counts[index] = self.counts.get(index, 0) + weight
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    def bins(self) -> list[dict[str, float]]:
+        """Occupied bins in ascending order as ``{"lower", "upper", "count"}``."""
+        return [
+            {
+                "lower": round(self._lower_bound(index), 3),
+                "upper": round(self._lower_bound(index + 1), 3),
+                "count": self.counts[index],
+            }
+            for index in sorted(self.counts)
+        ]
+
+    def merge(self, other: "LogHistogram") -> None:
+        """
+        Fold ``other`` into this histogram.
+
+        Raises:
+            ValueError: If the histograms use different bin widths
+        """
+        if self.bins_per_octave != other.bins_per_octave:
+            raise ValueError("Cannot merge histograms with different bins_per_octave")
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "bins_per_octave": self.bins_per_octave,
+            "counts": {str(index): count for index, count in self.counts.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "LogHistogram":
+        histogram = cls(data["bins_per_octave"])
+        histogram.counts = {int(index): count for index, count in data["counts"].items()}
+        return histogram
@@ -0,0 +1,228 @@
+"""
+Hot-path stage timing and optional run profiling.
+
+StageTimer accumulates monotonic nanosecond totals per named stage with one
+``perf_counter_ns()`` call per stage boundary, cheap enough to leave on in
+production runs (the measured cost per boundary is exported alongside the
+timings so the overhead is visible, not assumed). Dotted names such as
+``filter.min_length_filter`` are sub-stages of ``filter`` and are excluded
+from the run total.
+
+``profile_run()`` wraps a block in either cProfile (deterministic, writes a
+``.pstats`` file) or a stdlib sampling profiler (writes collapsed stacks, the
+input format for flamegraph.pl / speedscope).
+
+Example:
+    >>> timer = StageTimer()
+    >>> mark = time.perf_counter_ns()
+    >>> cleaned = " Maqaal ".strip()
+    >>> mark = timer.lap("clean", mark)
+    >>> timer.calls["clean"]
+    1
+"""
+
+import cProfile
+import logging
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+PROFILE_MODES = ("cprofile", "sample")
+
+_lap_cost_ns: Optional[float] = None
+
+
+def _measure_lap_cost_ns(iterations: int = 20_000) -> float:
+    """Measure the cost of one ``StageTimer.lap`` call on this interpreter (cached)."""
+    global _lap_cost_ns
+    if _lap_cost_ns is None:
+        timer = StageTimer()
+        start = time.perf_counter_ns()
+        mark = start
+        for _ in range(iterations):
+            mark = timer.lap("calibration", mark)
+        _lap_cost_ns = (time.perf_counter_ns() - start) / iterations
+    return _lap_cost_ns
+
+
+class StageTimer:
+    """
+    Per-stage wall-time accumulator for the record processing loop.
+
+    Attributes:
+        enabled: When False, ``lap``/``add`` only return timestamps
+        total_ns: Accumulated nanoseconds per stage
+        calls: Number of timed intervals per stage
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.total_ns: defaultdict[str, int] = defaultdict(int)
+        self.calls: defaultdict[str, int] = defaultdict(int)
+
+    def add(self, stage: str, elapsed_ns: int, calls: int = 1) -> None:
+        """Add an externally measured interval to ``stage``."""
+        if self.enabled:
+            self.total_ns[stage] += elapsed_ns
+            self.calls[stage] += calls
+
+    def lap(self, stage: str, start_ns: int) -> int:
+        """
+        Charge the time since ``start_ns`` to ``stage``.
+
+        Returns:
+            The current ``perf_counter_ns()``, to pass as the next stage's start
+        """
+        now = time.perf_counter_ns()
+        if self.enabled:
+            self.total_ns[stage] += now - start_ns
+            self.calls[stage] += 1
+        return now
+
+    def timed_iter(self, iterable: Iterable[T], stage: str) -> Iterator[T]:
+        """Yield from ``iterable``, charging the time spent producing each item to ``stage``."""
+        iterator = iter(iterable)
+        now = time.perf_counter_ns
+        while True:
+            start = now()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            if self.enabled:
+                self.total_ns[stage] += now() - start
+                self.calls[stage] += 1
+            yield item
+
+    def merge(self, other: "StageTimer") -> None:
+        """Fold another timer's totals into this one."""
+        for stage, elapsed in other.total_ns.items():
+            self.total_ns[stage] += elapsed
+            self.calls[stage] += other.calls[stage]
+
+    def summary(self) -> dict[str, Any]:
+        """
+        Timings in their exported form.
+
+        Returns:
+            ``{"total_ms", "timer_overhead_ms", "timer_overhead_pct", "stages"}``
+            where ``stages`` maps each stage to ``{"calls", "total_ms",
+            "mean_us", "share"}`` (share of the top-level total), or an empty
+            dict if nothing was timed
+        """
+        if not self.total_ns:
+            return {}
+        top_level_ns = sum(ns for stage, ns in self.total_ns.items() if "." not in stage)
+        overhead_ns = sum(self.calls.values()) * _measure_lap_cost_ns()
+        stages = {}
+        for stage in sorted(self.total_ns, key=self.total_ns.get, reverse=True):
+            elapsed = self.total_ns[stage]
+            calls = self.calls[stage]
+            stages[stage] = {
+                "calls": calls,
+                "total_ms": round(elapsed / 1e6, 3),
+                "mean_us": round(elapsed / calls / 1e3, 3) if calls else 0.0,
+                "share": round(elapsed / top_level_ns, 4) if top_level_ns else 0.0,
+            }
+        return {
+            "total_ms": round(top_level_ns / 1e6, 3),
+            "timer_overhead_ms": round(overhead_ns / 1e6, 3),
+            "timer_overhead_pct": round(100 * overhead_ns / top_level_ns, 3)
+            if top_level_ns
+            else 0.0,
+            "stages": stages,
+        }
+
+
+class SamplingProfiler:
+    """
+    Stdlib sampling profiler for one thread.
+
+    A daemon thread reads the target thread's current frame every
+    ``interval`` seconds and counts the call stack, so the profiled code runs
+    without tracing hooks.
+    """
+
+    def __init__(self, interval: float = 0.005, thread_id: Optional[int] = None):
+        self.interval = interval
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self.stacks: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{Path(code.co_filename).name}:{code.co_name}")
+                frame = frame.f_back
+            self.stacks[";".join(reversed(stack))] += 1
+
+    def write_collapsed(self, output_path: Path) -> None:
+        """Write ``stack count`` lines (Brendan Gregg's collapsed-stack format)."""
+        with open(output_path, "w", encoding="utf-8") as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+@contextmanager
+def profile_run(mode: str, output_dir: Path, run_id: str, sample_interval_ms: float = 5.0):
+    """
+    Profile the enclosed block and write the result under ``output_dir``.
+
+    Args:
+        mode: "cprofile" (writes ``<run_id>.pstats``) or "sample" (writes
+            ``<run_id>.collapsed``)
+        output_dir: Directory for the profile file
+        run_id: Run identifier used as the file stem
+        sample_interval_ms: Sampling interval for "sample" mode
+
+    Raises:
+        ValueError: If mode is not a known profile mode
+    """
+    if mode not in PROFILE_MODES:
+        raise ValueError(f"Unknown profile mode {mode!r} (expected one of {PROFILE_MODES})")
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    if mode == "cprofile":
+        profiler = cProfile.Profile()
+        output_path = output_dir / f"{run_id}.pstats"
+        profiler.enable()
+        try:
+            yield output_path
+        finally:
+            profiler.disable()
+            profiler.dump_stats(output_path)
+            logger.info(f"cProfile stats written: {output_path}")
+    else:
+        sampler = SamplingProfiler(interval=sample_interval_ms / 1000)
+        output_path = output_dir / f"{run_id}.collapsed"
+        sampler.start()
+        try:
+            yield output_path
+        finally:
+            sampler.stop()
+            sampler.write_collapsed(output_path)
+            logger.info(f"Collapsed stacks written: {output_path}")
@@ -6,16 +6,26 @@ Provides:
 - Adaptive rate limiting based on response times
 - Token bucket algorithm for rate limiting
 - Respect for HTTP 429 (Too Many Requests) and Retry-After headers
+- Asyncio-native per-host limiter with AIMD concurrency control
+- Token buckets shared across processes via the crawl ledger database
 """
 
+import asyncio
 import logging
 import random
 import threading
 import time
 from collections import deque
-from dataclasses import dataclass
-from datetime import datetime
-from typing import Optional
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Optional
+from urllib.parse import urlsplit
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +55,121 @@ class RateLimitConfig:
     requests_per_hour: Optional[int] = None  # Maximum requests per hour
     requests_per_minute: Optional[int] = None  # Maximum requests per minute
 
+    # Concurrency settings (AsyncAdaptiveRateLimiter only)
+    min_concurrency: int = 1  # Concurrency floor per host
+    max_concurrency: int = 10  # Concurrency ceiling per host
+    concurrency_decrease_factor: float = 0.5  # Multiplicative decrease on slow/failed requests
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header value.
+
+    Args:
+        value: Header value, either delta-seconds or an HTTP date
+
+    Returns:
+        Seconds to wait (never negative), or None if missing/unparseable
+    """
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        from email.utils import parsedate_to_datetime
+
+        retry_date = parsedate_to_datetime(value)
+        if retry_date.tzinfo is None:
+            retry_date = retry_date.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_date - datetime.now(timezone.utc)).total_seconds())
+    except Exception as e:
+        logger.warning(f"Could not parse Retry-After header: {e}")
+        return None
+
+
+class LedgerTokenBucket:
+    """
+    Token bucket whose state lives in the crawl ledger database.
+
+    Every process (and container) pointing at the same ledger draws from the
+    same per-key budget, so ``requests_per_hour`` is enforced globally rather
+    than per worker. The refill-and-take step is a single atomic ledger call
+    (``BEGIN IMMEDIATE`` on SQLite, ``UPDATE ... RETURNING`` on Postgres).
+
+    Example:
+        >>> bucket = LedgerTokenBucket(get_ledger(), requests_per_hour=60)
+        >>> bucket.wait("www.bbc.com")
+    """
+
+    def __init__(
+        self,
+        ledger,
+        requests_per_hour: Optional[int] = None,
+        requests_per_minute: Optional[int] = None,
+        namespace: str = "http",
+    ):
+        """
+        Initialize shared bucket.
+
+        Args:
+            ledger: CrawlLedger (or backend) providing ``acquire_rate_tokens``
+            requests_per_hour: Global hourly request budget per key
+            requests_per_minute: Global per-minute budget (used if hourly is unset)
+            namespace: Prefix for bucket keys in the ledger table
+
+        Raises:
+            ValueError: If neither rate is given
+        """
+        if requests_per_hour:
+            self.refill_rate = requests_per_hour / 3600.0
+            self.capacity = max(1.0, self.refill_rate * 60)  # 1 minute worth
+        elif requests_per_minute:
+            self.refill_rate = requests_per_minute / 60.0
+            self.capacity = float(requests_per_minute)
+        else:
+            raise ValueError("LedgerTokenBucket requires requests_per_hour or requests_per_minute")
+
+        self.ledger = ledger
+        self.namespace = namespace
+
+    def try_acquire(self, key: str) -> float:
+        """
+        Try to take one token for a key.
+
+        Returns:
+            0.0 if acquired, otherwise seconds until a token should be available
+        """
+        return self.ledger.acquire_rate_tokens(
+            f"{self.namespace}:{key}", self.refill_rate, self.capacity
+        )
+
+    def wait(self, key: str) -> None:
+        """Block until a token for ``key`` has been taken."""
+        while True:
+            delay = self.try_acquire(key)
+            if delay <= 0:
+                return
+            logger.debug(f"Shared rate limit for {key}: sleeping for {delay:.2f}s")
+            time.sleep(delay)
+
+    async def wait_async(self, key: str) -> None:
+        """
+        Asyncio variant of ``wait``.
+
+        The ledger call is blocking I/O (it may wait on the database lock), so
+        it runs in the default executor rather than on the event loop.
+        """
+        while True:
+            delay = await asyncio.to_thread(self.try_acquire, key)
+            if delay <= 0:
+                return
+            logger.debug(f"Shared rate limit for {key}: sleeping for {delay:.2f}s")
+            await asyncio.sleep(delay)
+
 
 class AdaptiveRateLimiter:
     """
@@ -58,14 +183,23 @@ class AdaptiveRateLimiter:
     - Respect for HTTP Retry-After headers
     """
 
-    def __init__(self, config: Optional[RateLimitConfig] = None):
+    def __init__(
+        self,
+        config: Optional[RateLimitConfig] = None,
+        shared_bucket: Optional[LedgerTokenBucket] = None,
+        bucket_key: str = "default",
+    ):
         """
         Initialize rate limiter.
 
         Args:
             config: Rate limit configuration
+            shared_bucket: Cross-process bucket replacing the in-memory token bucket
+            bucket_key: Key (usually the host) used with ``shared_bucket``
         """
         self.config = config or RateLimitConfig()
+        self.shared_bucket = shared_bucket
+        self.bucket_key = bucket_key
 
         # Current state
         self.current_delay = self.config.min_delay
@@ -187,8 +321,11 @@ class AdaptiveRateLimiter:
         4. Ensures minimum time between requests
         """
         # Wait for token availability
-        while not self._consume_token():
-            time.sleep(0.1)  # Check every 100ms
+        if self.shared_bucket is not None:
+            self.shared_bucket.wait(self.bucket_key)
+        else:
+            while not self._consume_token():
+                time.sleep(0.1)  # Check every 100ms
 
         # Calculate adaptive delay
         if self.config.adaptive:
@@ -262,22 +399,8 @@ class AdaptiveRateLimiter:
         Args:
             retry_after: Retry-After header value (seconds or HTTP date)
         """
-        # Parse Retry-After header
-        retry_seconds = None
-
-        if retry_after:
-            try:
-                # Try as integer (seconds)
-                retry_seconds = int(retry_after)
-            except ValueError:
-                # Try as HTTP date
-                try:
-                    from email.utils import parsedate_to_datetime
-
-                    retry_date = parsedate_to_datetime(retry_after)
-                    retry_seconds = (retry_date - datetime.now()).total_seconds()
-                except Exception as e:
-                    logger.warning(f"Could not parse Retry-After header: {e}")
+        # Parse Retry-After header (seconds or HTTP date)
+        retry_seconds = parse_retry_after(retry_after)
 
         # Default to exponential backoff if no valid Retry-After
         if not retry_seconds:
@@ -358,6 +481,373 @@ class TimedRequest:
         return self.elapsed_ms or 0
 
 
+# Asyncio-native limiter
+
+
+@dataclass
+class _HostState:
+    """Mutable per-host state for AsyncAdaptiveRateLimiter."""
+
+    concurrency: float
+    current_delay: float
+    tokens: float
+    last_refill: float
+    next_request_at: float = 0.0
+    blocked_until: float = 0.0
+    last_decrease_at: float = 0.0
+    in_flight: int = 0
+    consecutive_errors: int = 0
+    total_requests: int = 0
+    total_responses: int = 0
+    total_errors: int = 0
+    latencies: deque = field(default_factory=lambda: deque(maxlen=100))
+    waiters: deque = field(default_factory=deque)
+
+
+class AsyncAdaptiveRateLimiter:
+    """
+    Asyncio-native adaptive rate limiter shared by coroutines, keyed per host.
+
+    Every host gets its own token bucket, minimum spacing between requests and
+    concurrency window. The window follows AIMD: it grows additively while
+    responses come back under ``target_latency_ms`` and shrinks multiplicatively
+    (at most once per latency window) on slow responses, 5xx and 429. Retry-After
+    blocks the host until the server-requested time has passed.
+
+    All state is mutated from the event loop thread only, so no locks are needed;
+    waiters are futures created on the running loop, which keeps a single
+    instance reusable across ``asyncio.run`` calls.
+
+    Example:
+        >>> limiter = AsyncAdaptiveRateLimiter(RateLimitConfig(requests_per_minute=30))
+        >>> async with limiter.limit("https://www.bbc.com/somali/articles/x"):
+        ...     ...
+    """
+
+    def __init__(
+        self,
+        config: Optional[RateLimitConfig] = None,
+        shared_bucket: Optional[LedgerTokenBucket] = None,
+    ):
+        """
+        Initialize async rate limiter.
+
+        Args:
+            config: Rate limit configuration (shared with AdaptiveRateLimiter)
+            shared_bucket: Cross-process bucket replacing the in-memory per-host buckets
+        """
+        self.config = config or RateLimitConfig()
+        self.shared_bucket = shared_bucket
+        self._hosts: dict[str, _HostState] = {}
+
+        if shared_bucket is not None:
+            self.refill_rate = None
+            self.max_tokens = None
+        elif self.config.requests_per_hour:
+            self.refill_rate = self.config.requests_per_hour / 3600.0
+            self.max_tokens = max(1.0, self.refill_rate * 60)  # 1 minute worth
+        elif self.config.requests_per_minute:
+            self.refill_rate = self.config.requests_per_minute / 60.0
+            self.max_tokens = float(self.config.requests_per_minute)
+        else:
+            self.refill_rate = None
+            self.max_tokens = None
+
+    @staticmethod
+    def host_key(url: str) -> str:
+        """Return the limiter key (lower-cased host) for a URL or bare host."""
+        host = urlsplit(url).hostname if "//" in url else url
+        return (host or url).lower()
+
+    def _state(self, host: str) -> _HostState:
+        state = self._hosts.get(host)
+        if state is None:
+            state = _HostState(
+                concurrency=float(max(1, self.config.min_concurrency)),
+                current_delay=self.config.min_delay,
+                tokens=1.0,  # First request to a host is never delayed by the bucket
+                last_refill=time.monotonic(),
+            )
+            self._hosts[host] = state
+        return state
+
+    def _add_jitter(self, delay: float) -> float:
+        if not self.config.jitter or delay <= 0:
+            return delay
+        jitter_amount = delay * self.config.jitter_range
+        return delay + random.uniform(-jitter_amount, jitter_amount)
+
+    def _reserve(self, state: _HostState) -> float:
+        """
+        Try to reserve the next request slot in time for a host.
+
+        Returns:
+            0.0 if reserved, otherwise seconds to sleep before trying again
+        """
+        now = time.monotonic()
+
+        if now < state.blocked_until:
+            return state.blocked_until - now
+
+        if self.refill_rate is not None:
+            elapsed = now - state.last_refill
+            state.tokens = min(self.max_tokens, state.tokens + elapsed * self.refill_rate)
+            state.last_refill = now
+            if state.tokens < 1.0:
+                return (1.0 - state.tokens) / self.refill_rate
+
+        if now < state.next_request_at:
+            return state.next_request_at - now
+
+        if self.refill_rate is not None:
+            state.tokens -= 1.0
+        state.next_request_at = now + self._add_jitter(state.current_delay)
+        state.total_requests += 1
+        return 0.0
+
+    def _wake_waiters(self, state: _HostState) -> None:
+        """Wake as many queued coroutines as the concurrency window allows."""
+        free = int(state.concurrency) - state.in_flight
+        while free > 0 and state.waiters:
+            waiter = state.waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+
+    async def acquire(self, url: str) -> str:
+        """
+        Wait for a concurrency slot and a paced start time for a URL's host.
+
+        Every successful ``acquire`` must be paired with ``release``.
+
+        Args:
+            url: Request URL (or host)
+
+        Returns:
+            Host key to pass to ``release``/``record_response``
+        """
+        host = self.host_key(url)
+        state = self._state(host)
+        loop = asyncio.get_running_loop()
+
+        while state.in_flight >= int(state.concurrency):
+            waiter = loop.create_future()
+            state.waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter in state.waiters:
+                    state.waiters.remove(waiter)
+                raise
+
+        state.in_flight += 1
+        try:
+            while True:
+                delay = self._reserve(state)
+                if delay <= 0:
+                    break
+                logger.debug(f"Rate limiting {host}: sleeping for {delay:.2f}s")
+                await asyncio.sleep(delay)
+            if self.shared_bucket is not None:
+                await self.shared_bucket.wait_async(host)
+        except BaseException:
+            self.release(host)
+            raise
+
+        return host
+
+    def release(self, host: str) -> None:
+        """Release a concurrency slot obtained via ``acquire``."""
+        state = self._state(self.host_key(host))
+        state.in_flight = max(0, state.in_flight - 1)
+        self._wake_waiters(state)
+
+    def _decrease(self, state: _HostState, now: float) -> None:
+        """Multiplicative decrease, applied at most once per latency window."""
+        if now - state.last_decrease_at < self.config.target_latency_ms / 1000.0:
+            return
+        state.concurrency = max(
+            float(self.config.min_concurrency),
+            state.concurrency * self.config.concurrency_decrease_factor,
+        )
+        state.last_decrease_at = now
+
+    def record_success(self, host: str, response_time_ms: float) -> None:
+        """
+        Record a successful response and adjust the host's concurrency window.
+
+        Args:
+            host: Host key or URL
+            response_time_ms: Time to response headers in milliseconds
+        """
+        state = self._state(self.host_key(host))
+        state.consecutive_errors = 0
+        state.total_responses += 1
+        state.latencies.append(response_time_ms)
+
+        if state.current_delay > self.config.min_delay:
+            state.current_delay = max(
+                self.config.min_delay,
+                state.current_delay * (1.0 - self.config.adaptation_rate),
+            )
+
+        if self.config.adaptive:
+            if response_time_ms <= self.config.target_latency_ms:
+                state.concurrency = min(
+                    float(self.config.max_concurrency),
+                    state.concurrency + 1.0 / state.concurrency,
+                )
+            else:
+                self._decrease(state, time.monotonic())
+
+        self._wake_waiters(state)
+
+    def record_error(
+        self,
+        host: str,
+        http_status: Optional[int] = None,
+        retry_after: Optional[float] = None,
+    ) -> None:
+        """
+        Record a failed request: back off spacing and shrink the window.
+
+        Args:
+            host: Host key or URL
+            http_status: HTTP status code (if applicable)
+            retry_after: Seconds requested by a Retry-After header
+        """
+        state = self._state(self.host_key(host))
+        now = time.monotonic()
+        state.consecutive_errors += 1
+        state.total_errors += 1
+
+        backoff = min(
+            self.config.min_delay * (self.config.backoff_multiplier**state.consecutive_errors),
+            self.config.max_backoff,
+        )
+        if retry_after is not None:
+            backoff = min(max(backoff, retry_after), self.config.max_backoff)
+            logger.info(f"Server requested retry after {retry_after:.0f}s for {host}")
+
+        state.current_delay = max(state.current_delay, min(backoff, self.config.max_delay))
+        if http_status in (429, 503) or retry_after is not None:
+            state.blocked_until = max(state.blocked_until, now + backoff)
+        self._decrease(state, now)
+
+        logger.warning(
+            f"Request to {host} failed (status: {http_status}, "
+            f"errors: {state.consecutive_errors}, backoff: {backoff:.2f}s)"
+        )
+
+    def record_response(
+        self,
+        host: str,
+        http_status: int,
+        response_time_ms: float,
+        retry_after: Optional[str] = None,
+    ) -> None:
+        """
+        Feed a completed response back into the limiter.
+
+        429 and 5xx count as errors (honouring Retry-After); everything else is
+        a latency sample for the AIMD window.
+        """
+        if http_status == 429 or http_status >= 500:
+            self.record_error(host, http_status, parse_retry_after(retry_after))
+        else:
+            self.record_success(host, response_time_ms)
+
+    @asynccontextmanager
+    async def limit(self, url: str):
+        """
+        Pace a request and record its outcome.
+
+        Exceptions raised inside the block are recorded as errors; callers
+        that see an HTTP status should call ``record_response`` themselves,
+        in which case the block's exit does not record a second sample.
+        """
+        host = await self.acquire(url)
+        state = self._state(host)
+        samples_before = state.total_errors + state.total_responses
+        start = time.perf_counter()
+        try:
+            yield host
+        except Exception:
+            self.record_error(host)
+            raise
+        else:
+            if state.total_errors + state.total_responses == samples_before:
+                self.record_success(host, (time.perf_counter() - start) * 1000)
+        finally:
+            self.release(host)
+
+    def trace_config(self) -> "aiohttp.TraceConfig":
+        """
+        Build an aiohttp TraceConfig that paces and times every session request.
+
+        The slot is acquired in ``on_request_start`` and released once headers
+        arrive (or the request fails). aiohttp starts its ``total`` timeout
+        before trace hooks run, so sessions using this should bound requests
+        with ``sock_connect``/``sock_read`` rather than ``total``.
+
+        Raises:
+            ImportError: If aiohttp is not installed
+        """
+        if aiohttp is None:
+            raise ImportError("aiohttp is required for trace_config(): pip install aiohttp")
+
+        async def on_request_start(session, ctx, params):
+            ctx.limiter_host = await self.acquire(str(params.url))
+            ctx.limiter_start = time.perf_counter()
+
+        async def on_request_end(session, ctx, params):
+            host = getattr(ctx, "limiter_host", None)
+            if host is None:
+                return
+            elapsed_ms = (time.perf_counter() - ctx.limiter_start) * 1000
+            response = params.response
+            self.record_response(
+                host, response.status, elapsed_ms, response.headers.get("Retry-After")
+            )
+            ctx.limiter_host = None
+            self.release(host)
+
+        async def on_request_exception(session, ctx, params):
+            host = getattr(ctx, "limiter_host", None)
+            if host is None:
+                return
+            if not isinstance(params.exception, asyncio.CancelledError):
+                self.record_error(host)
+            ctx.limiter_host = None
+            self.release(host)
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_request_end.append(on_request_end)
+        trace_config.on_request_exception.append(on_request_exception)
+        return trace_config
+
+    def get_statistics(self) -> dict[str, Any]:
+        """Get per-host limiter statistics."""
+        hosts = {}
+        for host, state in self._hosts.items():
+            stats = {
+                "concurrency_limit": round(state.concurrency, 2),
+                "in_flight": state.in_flight,
+                "waiting": len(state.waiters),
+                "current_delay": state.current_delay,
+                "consecutive_errors": state.consecutive_errors,
+                "total_requests": state.total_requests,
+                "total_errors": state.total_errors,
+                "tokens_available": state.tokens if self.refill_rate else None,
+            }
+            if state.latencies:
+                stats["avg_latency_ms"] = sum(state.latencies) / len(state.latencies)
+                stats["max_latency_ms"] = max(state.latencies)
+            hosts[host] = stats
+        return {"refill_rate": self.refill_rate, "hosts": hosts}
+
+
 # Example usage
 if __name__ == "__main__":
     # Configure rate limiter for BBC scraping
@@ -0,0 +1,247 @@
+"""
+Background resource telemetry for pipeline runs.
+
+ResourceSampler runs a daemon thread that periodically records what the
+process is costing: resident memory, CPU time and utilisation, bytes read
+and written, open file descriptors and SQLite WAL size. This is what
+machines are sized on, so every BasePipeline run records it.
+
+Readings come from ``/proc/self`` (Linux). Elsewhere RSS falls back to
+``resource.getrusage`` and the I/O and descriptor fields are None.
+
+Samples are kept in fixed memory: when ``max_samples`` is reached every
+other sample is dropped and the effective interval doubles, so a long run
+still has a time series that covers the whole run.
+"""
+
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+_PROC_SELF = Path("/proc/self")
+
+
+def _read_proc_status() -> dict[str, int]:
+    """VmRSS / VmHWM from /proc/self/status, in bytes."""
+    values = {}
+    try:
+        with open(_PROC_SELF / "status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith(("VmRSS:", "VmHWM:")):
+                    key, amount = line.split(":", 1)
+                    values[key] = int(amount.split()[0]) * 1024
+    except OSError:
+        pass
+    return values
+
+
+def _read_proc_io() -> dict[str, int]:
+    """read_bytes / write_bytes (storage) and rchar / wchar (all I/O incl. network)."""
+    values = {}
+    try:
+        with open(_PROC_SELF / "io", encoding="ascii") as f:
+            for line in f:
+                key, amount = line.split(":", 1)
+                values[key] = int(amount)
+    except OSError:
+        pass
+    return values
+
+
+def _count_open_fds() -> Optional[int]:
+    try:
+        return len(os.listdir(_PROC_SELF / "fd"))
+    except OSError:
+        return None
+
+
+def read_resource_usage(wal_paths: tuple[Path, ...] = ()) -> dict[str, Any]:
+    """
+    Read the current process resource counters.
+
+    Args:
+        wal_paths: SQLite ``-wal`` files whose combined size is reported
+
+    Returns:
+        Dict with rss_bytes, peak_rss_bytes, cpu_seconds, read_bytes,
+        write_bytes, rchar, wchar, open_fds and wal_bytes (None when unavailable)
+    """
+    status = _read_proc_status()
+    io = _read_proc_io()
+    rss = status.get("VmRSS")
+    peak_rss = status.get("VmHWM")
+    if peak_rss is None and resource is not None:
+        peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024  # KiB on Linux
+
+    wal_bytes = 0
+    for wal_path in wal_paths:
+        try:
+            wal_bytes += wal_path.stat().st_size
+        except OSError:
+            pass
+
+    return {
+        "rss_bytes": rss,
+        "peak_rss_bytes": peak_rss,
+        "cpu_seconds": round(time.process_time(), 3),
+        "read_bytes": io.get("read_bytes"),
+        "write_bytes": io.get("write_bytes"),
+        "rchar": io.get("rchar"),
+        "wchar": io.get("wchar"),
+        "open_fds": _count_open_fds(),
+        "wal_bytes": wal_bytes if wal_paths else None,
+    }
+
+
+class ResourceSampler:
+    """
+    Periodic resource sampler running in a daemon thread.
+
+    Example:
+        >>> sampler = ResourceSampler(interval=1.0)
+        >>> sampler.start()
+        >>> ...  # run the pipeline
+        >>> sampler.stop()
+        >>> sampler.export()["summary"]["peak_rss_bytes"]
+    """
+
+    def __init__(
+        self,
+        interval: float = 5.0,
+        wal_paths: tuple[Path, ...] = (),
+        max_samples: int = 1000,
+    ):
+        """
+        Initialize sampler.
+
+        Args:
+            interval: Seconds between samples
+            wal_paths: SQLite ``-wal`` files to include in wal_bytes
+            max_samples: Sample cap; older samples are thinned when reached
+        """
+        self.interval = interval
+        self.wal_paths = tuple(wal_paths)
+        self.max_samples = max(max_samples, 2)
+        self.samples: list[dict[str, Any]] = []
+        self._stride = 1
+        self._ticks = 0
+        self._start_wall: Optional[float] = None
+        self._baseline: dict[str, Any] = {}
+        self._last: Optional[dict[str, Any]] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def latest(self) -> Optional[dict[str, Any]]:
+        """Most recent sample (also between retained samples), or None before start."""
+        return self._last
+
+    def start(self) -> None:
+        """Take a baseline sample and start the sampling thread."""
+        if self.running:
+            return
+        self._start_wall = time.monotonic()
+        self._baseline = read_resource_usage(self.wal_paths)
+        self._stop.clear()
+        self.sample_now()
+        self._thread = threading.Thread(target=self._run, name="resource-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the thread and take a final sample."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._start_wall is not None:
+            self.sample_now()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.sample_now()
+            except Exception as e:  # Telemetry must never break a run
+                logger.debug(f"Resource sample failed: {e}")
+
+    def sample_now(self) -> dict[str, Any]:
+        """Take one sample immediately and append it to the time series."""
+        usage = read_resource_usage(self.wal_paths)
+        now = time.monotonic()
+        elapsed = now - (self._start_wall or now)
+
+        with self._lock:
+            cpu_percent = None
+            if self._last is not None and elapsed > self._last["t"]:
+                cpu_delta = usage["cpu_seconds"] - self._last["cpu_seconds"]
+                cpu_percent = round(100 * cpu_delta / (elapsed - self._last["t"]), 1)
+            sample = {"t": round(elapsed, 3), "cpu_percent": cpu_percent, **usage}
+            self._last = sample
+
+            self._ticks += 1
+            if self._ticks % self._stride == 0 or not self.samples:
+                self.samples.append(sample)
+                if len(self.samples) >= self.max_samples:
+                    self.samples = self.samples[::2]
+                    self._stride *= 2
+        return sample
+
+    def summary(self) -> dict[str, Any]:
+        """Whole-run summary (peaks, totals and means)."""
+        with self._lock:
+            samples = list(self.samples)
+            last = self._last
+        if not samples or last is None:
+            return {}
+
+        def _peak(key: str) -> Optional[int]:
+            values = [s[key] for s in samples if s.get(key) is not None]
+            return max(values) if values else None
+
+        def _delta(key: str) -> Optional[int]:
+            if last.get(key) is None or self._baseline.get(key) is None:
+                return None
+            return last[key] - self._baseline[key]
+
+        duration = last["t"]
+        cpu_seconds = last["cpu_seconds"] - self._baseline.get("cpu_seconds", 0.0)
+        cpu_values = [s["cpu_percent"] for s in samples if s.get("cpu_percent") is not None]
+        return {
+            "duration_seconds": round(duration, 3),
+            "samples": len(samples),
+            "peak_rss_bytes": _peak("peak_rss_bytes") or _peak("rss_bytes"),
+            "final_rss_bytes": last.get("rss_bytes"),
+            "cpu_seconds": round(cpu_seconds, 3),
+            "mean_cpu_percent": round(100 * cpu_seconds / duration, 1) if duration > 0 else None,
+            "max_cpu_percent": max(cpu_values) if cpu_values else None,
+            "read_bytes": _delta("read_bytes"),
+            "write_bytes": _delta("write_bytes"),
+            "rchar": _delta("rchar"),
+            "wchar": _delta("wchar"),
+            "max_open_fds": _peak("open_fds"),
+            "max_wal_bytes": _peak("wal_bytes"),
+        }
+
+    def export(self) -> dict[str, Any]:
+        """Summary plus time series, in the processing-metrics ``resources`` shape."""
+        with self._lock:
+            samples = list(self.samples)
+        return {
+            "interval_seconds": self.interval * self._stride,
+            "summary": self.summary(),
+            "samples": samples,
+        }
@@ -1,4 +1,29 @@
+"""
+MLflow experiment tracking for pipeline runs.
+
+With a file or SQLite tracking store every ``mlflow.log_*`` call is a
+filesystem or database write. MLFlowTracker therefore (by default) only
+queues params, metrics, tags and artifacts on the calling thread; a worker
+thread coalesces them into ``MlflowClient.log_batch`` calls every
+``flush_interval`` seconds, copies artifacts, and ``end_run`` drains the
+queue before closing the run.
+
+When MLflow is not installed or tracking is disabled, every method returns
+immediately (no queue, no thread).
+
+Example:
+    >>> tracker = MLFlowTracker()
+    >>> tracker.start_run(run_name="20250101_wikipedia")
+    >>> tracker.log_metrics({"records_processed": 1200})
+    >>> tracker.start_step_metrics(lambda: {"records_per_second": 850.0}, interval=30)
+    >>> tracker.end_run()   # flushes everything
+"""
+
 import logging
+import queue
+import threading
+import time
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any, Optional
 
@@ -9,64 +34,288 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# MLflow's log_batch limits
+MAX_BATCH_METRICS = 1000
+MAX_BATCH_PARAMS = 100
+MAX_BATCH_TAGS = 100
+MAX_PARAM_VALUE_LENGTH = 6000
+
+_FLUSH = object()
+_STOP = object()
+
 
 class MLFlowTracker:
     """
     Wrapper for MLFlow tracking to standardize experiment logging.
+
+    Calls are asynchronous when ``async_logging`` is set: failures are
+    logged rather than raised, since tracking must never fail a pipeline run.
     """
 
-    def __init__(self, experiment_name: str = "somdialc"):
+    def __init__(
+        self,
+        experiment_name: str = "somdialc",
+        enabled: bool = True,
+        async_logging: bool = True,
+        flush_interval: float = 5.0,
+    ):
+        """
+        Initialize tracker.
+
+        Args:
+            experiment_name: MLflow experiment to log runs under
+            enabled: False turns every call into a no-op
+            async_logging: Queue calls and send them as batches from a worker thread
+            flush_interval: Max seconds a queued call waits before it is sent
+        """
         self.experiment_name = experiment_name
-        if mlflow is not None:
-            mlflow.set_experiment(experiment_name)
-        else:
+        self.enabled = enabled and mlflow is not None
+        self.async_logging = async_logging
+        self.flush_interval = flush_interval
+        self.run_id: Optional[str] = None
+        self.stats = {"batches": 0, "metrics": 0, "params": 0, "tags": 0, "artifacts": 0}
+        self.errors = 0
+
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._worker: Optional[threading.Thread] = None
+        self._step_thread: Optional[threading.Thread] = None
+        self._step_stop = threading.Event()
+
+        if mlflow is None:
             logger.warning("mlflow not installed; tracking disabled")
+        elif self.enabled:
+            mlflow.set_experiment(experiment_name)
+
+    @classmethod
+    def from_config(cls, experiment_name: str = "somdialc") -> "MLFlowTracker":
+        """Create a tracker from ``config.tracking`` (SDC_TRACKING__*)."""
+        from .config import get_config
+
+        tracking = get_config().tracking
+        return cls(
+            experiment_name=experiment_name,
+            enabled=tracking.enabled,
+            async_logging=tracking.async_logging,
+            flush_interval=tracking.flush_interval_seconds,
+        )
+
+    @property
+    def _queued(self) -> bool:
+        return self._worker is not None
 
     def start_run(self, run_name: Optional[str] = None):
-        """Start a new MLFlow run."""
-        if mlflow is not None:
-            return mlflow.start_run(run_name=run_name)
-        return None
+        """Start a new MLFlow run (and the batching worker)."""
+        if not self.enabled:
+            return None
+        run = mlflow.start_run(run_name=run_name)
+        self.run_id = run.info.run_id if run is not None else None
+        if self.async_logging and self.run_id is not None and self._worker is None:
+            self._worker = threading.Thread(target=self._drain, name="mlflow-tracker", daemon=True)
+            self._worker.start()
+        return run
 
     def log_params(self, params: dict[str, Any]):
         """Log configuration parameters."""
-        if mlflow is not None:
+        if not self.enabled:
+            return
+        if self._queued:
+            for key, value in params.items():
+                self._queue.put(("param", key, value))
+        else:
             mlflow.log_params(params)
 
     def log_param(self, key: str, value: Any):
         """Log a single configuration parameter."""
-        if mlflow is not None:
+        if not self.enabled:
+            return
+        if self._queued:
+            self._queue.put(("param", key, value))
+        else:
             mlflow.log_param(key, value)
 
     def log_metrics(self, metrics: dict[str, float], step: Optional[int] = None):
         """Log operational metrics."""
-        if mlflow is not None:
+        if not self.enabled:
+            return
+        if self._queued:
+            timestamp = int(time.time() * 1000)
+            for key, value in metrics.items():
+                self._queue.put(("metric", key, value, step, timestamp))
+        else:
             mlflow.log_metrics(metrics, step=step)
 
     def log_metric(self, key: str, value: float, step: Optional[int] = None):
         """Log a single operational metric."""
-        if mlflow is not None:
+        if not self.enabled:
+            return
+        if self._queued:
+            self._queue.put(("metric", key, value, step, int(time.time() * 1000)))
+        else:
             mlflow.log_metric(key, value, step=step)
 
     def log_artifact(self, local_path: str, artifact_path: Optional[str] = None):
-        """Log a local file as an artifact."""
-        if mlflow is not None:
-            if Path(local_path).exists():
-                mlflow.log_artifact(local_path, artifact_path)
-            else:
-                logger.warning(f"Artifact not found: {local_path}")
+        """Log a local file as an artifact (copied by the worker when queued)."""
+        if not self.enabled:
+            return
+        if not Path(local_path).exists():
+            logger.warning(f"Artifact not found: {local_path}")
+        elif self._queued:
+            self._queue.put(("artifact", local_path, artifact_path))
+        else:
+            mlflow.log_artifact(local_path, artifact_path)
 
     def set_tags(self, tags: dict[str, Any]):
         """Log a batch of tags."""
-        if mlflow is not None:
+        if not self.enabled:
+            return
+        if self._queued:
+            for key, value in tags.items():
+                self._queue.put(("tag", key, value))
+        else:
             mlflow.set_tags(tags)
 
     def set_tag(self, key: str, value: Any):
         """Log a single tag."""
-        if mlflow is not None:
+        if not self.enabled:
+            return
+        if self._queued:
+            self._queue.put(("tag", key, value))
+        else:
             mlflow.set_tag(key, value)
 
+    def start_step_metrics(
+        self, read: Callable[[], dict[str, float]], interval: float = 60.0
+    ) -> None:
+        """
+        Log ``read()`` as step metrics every ``interval`` seconds until ``end_run``.
+
+        ``read`` runs on a background thread and should only copy counters the
+        pipeline already maintains (see LiveMetricsExporter), so the record
+        loop does no extra work.
+        """
+        if not self.enabled or interval <= 0 or self._step_thread is not None:
+            return
+        self._step_stop.clear()
+
+        def emit() -> None:
+            step = 0
+            while not self._step_stop.wait(interval):
+                step += 1
+                try:
+                    metrics = read()
+                except Exception as e:  # A broken reader must not kill the thread
+                    logger.debug(f"Step metrics read failed: {e}")
+                    continue
+                if metrics:
+                    self.log_metrics(metrics, step=step)
+
+        self._step_thread = threading.Thread(target=emit, name="mlflow-step-metrics", daemon=True)
+        self._step_thread.start()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Send everything queued so far.
+
+        Returns:
+            True if the worker confirmed the flush within ``timeout``
+        """
+        if not self._queued:
+            return True
+        done = threading.Event()
+        self._queue.put((_FLUSH, done))
+        return done.wait(timeout)
+
     def end_run(self, status: str = "FINISHED"):
-        """End the current run."""
-        if mlflow is not None:
-            mlflow.end_run(status=status)
+        """Stop step metrics, flush queued calls and end the current run."""
+        if not self.enabled:
+            return
+        if self._step_thread is not None:
+            self._step_stop.set()
+            self._step_thread.join()
+            self._step_thread = None
+        if self._worker is not None:
+            self._queue.put((_STOP,))
+            self._worker.join()
+            self._worker = None
+        mlflow.end_run(status=status)
+        self.run_id = None
+
+    def _drain(self) -> None:
+        """Worker loop: collect queued calls and send them in batches."""
+        params: dict[str, Any] = {}
+        tags: dict[str, Any] = {}
+        metrics: dict[tuple[str, Optional[int]], tuple[float, int]] = {}
+        artifacts: list[tuple[str, Optional[str]]] = []
+        deadline = time.monotonic() + self.flush_interval
+
+        while True:
+            try:
+                item = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                item = None
+
+            kind = item[0] if item is not None else None
+            if kind == "param":
+                params[item[1]] = item[2]
+            elif kind == "tag":
+                tags[item[1]] = item[2]
+            elif kind == "metric":
+                # Repeated (key, step) within a batch: the latest value wins
+                metrics[(item[1], item[3])] = (item[2], item[4])
+            elif kind == "artifact":
+                artifacts.append((item[1], item[2]))
+
+            full = (
+                len(metrics) >= MAX_BATCH_METRICS
+                or len(params) >= MAX_BATCH_PARAMS
+                or len(tags) >= MAX_BATCH_TAGS
+            )
+            due = time.monotonic() >= deadline  # Also when items never stop arriving
+            if item is None or full or due or kind in (_FLUSH, _STOP):
+                self._send(params, tags, metrics, artifacts)
+                params, tags, metrics, artifacts = {}, {}, {}, []
+                deadline = time.monotonic() + self.flush_interval
+            if kind is _FLUSH:
+                item[1].set()
+            elif kind is _STOP:
+                return
+
+    def _send(
+        self,
+        params: dict[str, Any],
+        tags: dict[str, Any],
+        metrics: dict[tuple[str, Optional[int]], tuple[float, int]],
+        artifacts: list[tuple[str, Optional[str]]],
+    ) -> None:
+        """Write one coalesced batch (plus artifacts) to the tracking store."""
+        if params or tags or metrics:
+            from mlflow.entities import Metric, Param, RunTag
+
+            try:
+                mlflow.tracking.MlflowClient().log_batch(
+                    self.run_id,
+                    metrics=[
+                        Metric(key, float(value), timestamp, step or 0)
+                        for (key, step), (value, timestamp) in metrics.items()
+                    ],
+                    params=[
+                        Param(key, str(value)[:MAX_PARAM_VALUE_LENGTH])
+                        for key, value in params.items()
+                    ],
+                    tags=[RunTag(key, str(value)) for key, value in tags.items()],
+                )
+                self.stats["batches"] += 1
+                self.stats["metrics"] += len(metrics)
+                self.stats["params"] += len(params)
+                self.stats["tags"] += len(tags)
+            except Exception as e:
+                self.errors += 1
+                logger.warning(f"MLflow batch logging failed: {e}")
+
+        for local_path, artifact_path in artifacts:
+            try:
+                mlflow.tracking.MlflowClient().log_artifact(self.run_id, local_path, artifact_path)
+                self.stats["artifacts"] += 1
+            except Exception as e:
+                self.errors += 1
+                logger.warning(f"MLflow artifact logging failed for {local_path}: {e}")
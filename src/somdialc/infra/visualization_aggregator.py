@@ -11,8 +11,10 @@ All functions work with Phase 3 metrics schema and export to JSON format
 compatible with static hosting (GitHub Pages).
 """
 
+import bisect
 import json
 import logging
+import math
 import statistics
 from collections import defaultdict
 from datetime import datetime
@@ -189,6 +191,23 @@ def calculate_pipeline_flow(metrics: list[dict[str, Any]]) -> dict[str, Any]:
 # ============================================================================
 
 
+def _bin_midpoint(stored_bin: dict[str, float]) -> float:
+    """Geometric midpoint of a stored log-spaced bin (arithmetic for the [0, 1) bin)."""
+    lower, upper = stored_bin["lower"], stored_bin["upper"]
+    return math.sqrt(lower * upper) if lower > 0 else upper / 2
+
+
+def _histogram_median(stored_bins: list[dict[str, float]]) -> float:
+    """Median estimate from stored bins (midpoint of the bin holding the middle record)."""
+    total = sum(b["count"] for b in stored_bins)
+    running = 0
+    for stored_bin in sorted(stored_bins, key=lambda b: b["lower"]):
+        running += stored_bin["count"]
+        if running * 2 >= total:
+            return _bin_midpoint(stored_bin)
+    return 0.0
+
+
 def calculate_text_length_distribution(
     metrics: list[dict[str, Any]], num_bins: int = 10
 ) -> dict[str, Any]:
@@ -196,10 +215,14 @@ def calculate_text_length_distribution(
     Calculate text length distribution data for Ridge plot visualization.
 
     Creates logarithmic bins for text lengths and calculates density
-    for each data source.
+    for each data source. Metrics that carry ``text_length_histograms``
+    (recorded at ingest time) are re-binned from their stored bins in
+    O(bins); older metrics fall back to an estimate from
+    ``text_length_stats``.
 
     Args:
-        metrics: List of consolidated metrics with text_length_stats
+        metrics: List of consolidated metrics with text_length_histograms
+            and/or text_length_stats
         num_bins: Number of logarithmic bins (default: 10)
 
     Returns:
@@ -226,23 +249,40 @@ def calculate_text_length_distribution(
     bins = [10 ** (min_log + i * (max_log - min_log) / num_bins) for i in range(num_bins + 1)]
     bins = [int(b) for b in bins]
 
+    def _bin_index(value: float) -> int:
+        # Values outside the range go to the first/last bin
+        return min(max(bisect.bisect_right(bins, value) - 1, 0), num_bins - 1)
+
     # Organize by source
     sources_data = defaultdict(
-        lambda: {"counts": [0] * num_bins, "text_lengths": [], "total_records": 0}
+        lambda: {
+            "counts": [0] * num_bins,
+            "text_lengths": [],
+            "stored_bins": [],
+            "total_records": 0,
+        }
     )
 
     for metric in metrics:
         source = metric.get("source", "Unknown")
+        histograms = (metric.get("text_length_histograms") or {}).get("chars", {})
+        stored_bins = histograms.get("passed")
+
+        # Exact path: re-bin the ingest-time histogram of records written
+        if stored_bins:
+            for stored_bin in stored_bins:
+                count = int(stored_bin["count"])
+                sources_data[source]["counts"][_bin_index(_bin_midpoint(stored_bin))] += count
+                sources_data[source]["total_records"] += count
+            sources_data[source]["stored_bins"].extend(stored_bins)
+            continue
+
         text_stats = metric.get("text_length_stats", {})
 
         # Try to reconstruct distribution from stats
         if text_stats:
             mean = text_stats.get("mean", 0)
             median = text_stats.get("median", 0)
-            text_stats.get("min", 0)
-            text_stats.get("max", 0)
-            text_stats.get("total_chars", 0)
-
             records_written = metric.get("records_written", 0)
 
             if records_written > 0:
@@ -251,16 +291,7 @@ def calculate_text_length_distribution(
                 # Estimate which bin this metric's data falls into
                 # Use mean as representative value
                 if mean > 0:
-                    for i in range(num_bins):
-                        if bins[i] <= mean < bins[i + 1]:
-                            sources_data[source]["counts"][i] += records_written
-                            break
-                    else:
-                        # If mean is outside bins, add to last bin
-                        if mean >= bins[-1]:
-                            sources_data[source]["counts"][-1] += records_written
-                        else:
-                            sources_data[source]["counts"][0] += records_written
+                    sources_data[source]["counts"][_bin_index(mean)] += records_written
 
                 # Store representative lengths
                 sources_data[source]["text_lengths"].extend([mean, median])
@@ -273,11 +304,21 @@ def calculate_text_length_distribution(
         if total > 0:
             densities = [count / total for count in data["counts"]]
 
+            if data["stored_bins"] and not data["text_lengths"]:
+                stored = data["stored_bins"]
+                stored_total = sum(b["count"] for b in stored)
+                mean = sum(_bin_midpoint(b) * b["count"] for b in stored) / stored_total
+                median = _histogram_median(stored)
+            else:
+                lengths = data["text_lengths"]
+                mean = statistics.mean(lengths) if lengths else 0
+                median = statistics.median(lengths) if lengths else 0
+
             result_sources[source] = {
                 "densities": densities,
                 "counts": data["counts"],
-                "mean": statistics.mean(data["text_lengths"]) if data["text_lengths"] else 0,
-                "median": statistics.median(data["text_lengths"]) if data["text_lengths"] else 0,
+                "mean": mean,
+                "median": median,
                 "total_records": total,
             }
 
@@ -2,10 +2,27 @@
 Ingestion package for Somali Dialect Classifier.
 
 This package handles data collection from various sources.
+
+The re-exports below are resolved lazily (PEP 562): importing a light
+submodule such as ``somdialc.ingestion.crawl_ledger`` does not pull in
+``base_pipeline`` and its pyarrow/pandas/datasketch dependencies.
 """
 
-from .base_pipeline import BasePipeline
-from .crawl_ledger import CrawlLedger
-from .dedup import DedupEngine
+from typing import TYPE_CHECKING
+
+from ..infra.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .base_pipeline import BasePipeline
+    from .crawl_ledger import CrawlLedger
+    from .dedup import DedupEngine
+
+_LAZY_EXPORTS = {
+    "BasePipeline": ".base_pipeline",
+    "CrawlLedger": ".crawl_ledger",
+    "DedupEngine": ".dedup",
+}
 
 __all__ = ["BasePipeline", "CrawlLedger", "DedupEngine"]
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS)
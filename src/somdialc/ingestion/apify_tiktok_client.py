@@ -9,7 +9,9 @@ Apify Actor: https://apify.com/clockworks/tiktok-comments-scraper
 
 import logging
 import time
+from collections import deque
 from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Any, Optional
 
@@ -301,8 +303,24 @@ class ApifyTikTokClient:
             # Wait before next poll
             time.sleep(poll_interval)
 
+    def get_dataset_info(self, dataset_id: str) -> dict[str, Any]:
+        """
+        Get dataset metadata (including ``itemCount``).
+
+        Args:
+            dataset_id: Dataset ID
+
+        Returns:
+            Dataset object from the Apify API
+        """
+        url = f"{self.BASE_URL}/datasets/{dataset_id}"
+        response = self.session.get(url, headers=self._get_headers(), timeout=self.timeout)
+        response.raise_for_status()
+
+        return response.json()["data"]
+
     def get_dataset_items(
-        self, dataset_id: str, offset: int = 0, limit: int = 1000
+        self, dataset_id: str, offset: int = 0, limit: int = 1000, clean: bool = False
     ) -> list[dict[str, Any]]:
         """
         Get items from dataset.
@@ -311,29 +329,43 @@ class ApifyTikTokClient:
             dataset_id: Dataset ID
             offset: Number of items to skip
             limit: Maximum number of items to return
+            clean: Ask Apify to drop empty items and hidden (``#``-prefixed) fields
 
         Returns:
             List of dataset items
         """
         url = f"{self.BASE_URL}/datasets/{dataset_id}/items"
         params = {"offset": offset, "limit": limit, "format": "json"}
+        if clean:
+            params["clean"] = "true"
 
-        response = self.session.get(
-            url, headers=self._get_headers(), params=params, timeout=self.timeout
-        )
+        # Item pages are large, highly repetitive JSON: request gzip explicitly
+        headers = {**self._get_headers(), "Accept-Encoding": "gzip"}
+        response = self.session.get(url, headers=headers, params=params, timeout=self.timeout)
         response.raise_for_status()
 
         return response.json()
 
     def iter_dataset_items(
-        self, dataset_id: str, batch_size: int = 1000
+        self,
+        dataset_id: str,
+        batch_size: int = 1000,
+        max_concurrency: int = 1,
+        clean: bool = False,
     ) -> Iterator[dict[str, Any]]:
         """
         Iterate over all items in dataset with automatic pagination.
 
+        With ``max_concurrency > 1`` the dataset size is read first and up to
+        ``max_concurrency`` pages are fetched ahead concurrently; items are
+        still yielded in dataset order. Pages past the reported size are then
+        fetched sequentially, so an understated ``itemCount`` loses nothing.
+
         Args:
             dataset_id: Dataset ID
             batch_size: Number of items per batch
+            max_concurrency: Maximum pages in flight (1 = strictly sequential)
+            clean: Passed to get_dataset_items
 
         Yields:
             Individual dataset items
@@ -343,8 +375,30 @@ class ApifyTikTokClient:
 
         self.logger.info(f"Fetching dataset items from {dataset_id}...")
 
+        if max_concurrency > 1:
+            try:
+                item_count = int(self.get_dataset_info(dataset_id).get("itemCount") or 0)
+            except (requests.RequestException, KeyError, ValueError) as e:
+                self.logger.warning(f"Could not read dataset size ({e}); fetching sequentially")
+                item_count = 0
+
+            if item_count > batch_size:
+                last_page_size = batch_size
+                for items in self._iter_pages_concurrently(
+                    dataset_id, item_count, batch_size, max_concurrency, clean
+                ):
+                    yield from items
+                    total_items += len(items)
+                    last_page_size = len(items)
+                    self.logger.debug(f"Fetched {total_items} items so far...")
+
+                if last_page_size < batch_size:
+                    self.logger.info(f"Total items fetched: {total_items}")
+                    return
+                offset = -(-item_count // batch_size) * batch_size
+
         while True:
-            items = self.get_dataset_items(dataset_id, offset=offset, limit=batch_size)
+            items = self.get_dataset_items(dataset_id, offset=offset, limit=batch_size, clean=clean)
 
             if not items:
                 break
@@ -363,6 +417,43 @@ class ApifyTikTokClient:
 
         self.logger.info(f"Total items fetched: {total_items}")
 
+    def _iter_pages_concurrently(
+        self,
+        dataset_id: str,
+        item_count: int,
+        batch_size: int,
+        max_concurrency: int,
+        clean: bool,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Yield pages covering ``item_count`` items in order, keeping a bounded window in flight."""
+        offsets = iter(range(0, item_count, batch_size))
+        with ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="apify-pages"
+        ) as pool:
+            window: deque = deque()
+            for offset in offsets:
+                window.append(
+                    pool.submit(self.get_dataset_items, dataset_id, offset, batch_size, clean)
+                )
+                if len(window) >= max_concurrency:
+                    break
+
+            try:
+                while window:
+                    items = window.popleft().result()
+                    next_offset = next(offsets, None)
+                    if next_offset is not None:
+                        window.append(
+                            pool.submit(
+                                self.get_dataset_items, dataset_id, next_offset, batch_size, clean
+                            )
+                        )
+                    yield items
+            finally:
+                # Consumer stopped early or a page failed: drop queued pages
+                for future in window:
+                    future.cancel()
+
     def scrape_comments(
         self,
         video_urls: list[str],
@@ -5,10 +5,13 @@ Injects: DataManager, FilterEngine, RecordBuilder, ValidationService.
 Subclasses implement source-specific logic (download, extract, _extract_records, _create_cleaner).
 """
 
+import contextlib
+import inspect
 import json
 import tempfile
+import time
 from abc import ABC, abstractmethod
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Optional
@@ -17,9 +20,19 @@ from ..infra.config import get_config
 from ..infra.data_manager import DataManager
 from ..infra.disk_utils import estimate_required_space
 from ..infra.logging_utils import generate_run_id
+from ..infra.metrics_exporter import LiveMetricsExporter
+from ..infra.profiling import PROFILE_MODES, StageTimer, profile_run
+from ..infra.resource_sampler import ResourceSampler
 from ..infra.tracking import MLFlowTracker
 from ..quality.filter_engine import FilterEngine
 from ..quality.record_builder import RecordBuilder
+from ..quality.record_utils import RecordDigests
+from ..quality.screening_cache import (
+    ScreeningCache,
+    ScreeningResult,
+    get_screening_cache,
+    screening_fingerprint,
+)
 from ..quality.script_detection import compute_cs_ratio, detect_scripts
 from ..quality.silver_writer import SilverDatasetWriter
 from ..quality.text_cleaners import TextCleaningPipeline
@@ -96,7 +109,36 @@ class BasePipeline(DataProcessor, ABC):
 
         self.text_cleaner = self._create_cleaner()
         self.silver_writer = SilverDatasetWriter()
-        self.mlflow = MLFlowTracker()
+        self.mlflow = MLFlowTracker.from_config()
+
+        # Hot-path instrumentation (SDC_PROFILING__*); CLIs may override profile_mode
+        profiling = get_config().profiling
+        self.stage_timer = StageTimer(enabled=profiling.stage_timing)
+        self.filter_engine.timing_enabled = self.stage_timer.enabled
+        filters = get_config().filters
+        if filters.adaptive_order:
+            self.filter_engine.enable_adaptive_ordering(filters.adaptive_warmup_records)
+        self.filter_batch_size = filters.batch_size
+        # Cross-run verdict cache (SDC_FILTERS__RESULT_CACHE); fingerprinted per process() run
+        self.screening_cache: Optional[ScreeningCache] = (
+            get_screening_cache(filters.result_cache_path) if filters.result_cache else None
+        )
+        self._screening_fingerprint = ""
+        # MinHash check on cleaned text (SDC_DEDUP__PROCESSING_NEAR_DUP); None when off
+        self.near_dedup = PipelineSetup.create_near_deduplicator(self.source)
+        self.near_dup_batch_size = get_config().dedup.processing_near_dup_batch_size
+        self.profile_mode: Optional[str] = (
+            profiling.profile if profiling.profile in PROFILE_MODES else None
+        )
+        self.resource_sampler: Optional[ResourceSampler] = None
+        # Live /metrics endpoint (SDC_PROFILING__METRICS_PORT; CLIs may set metrics_port)
+        self.metrics_port: Optional[int] = None
+        self.metrics_exporter: Optional[LiveMetricsExporter] = None
+        self._write_buffer: list[dict] = []
+        # Live counters for the endpoint and step metrics; kept even without stage timing
+        self.records_read = 0
+        self.records_accepted = 0
+        self._telemetry_active = False
 
         self.staging_file: Optional[Path] = None
         self.processed_file: Optional[Path] = None
@@ -205,8 +247,15 @@ class BasePipeline(DataProcessor, ABC):
         pass
 
     @abstractmethod
-    def _extract_records(self) -> Iterator[RawRecord]:
-        """Extract records from staging format. Yield RawRecord objects."""
+    def _extract_records(self, resume_from: Optional[dict[str, Any]] = None) -> Iterator[RawRecord]:
+        """
+        Extract records from staging format. Yield RawRecord objects.
+
+        Processors that set ``RawRecord.position`` should accept
+        ``resume_from`` (a position from a checkpoint) and start right after
+        it, raising ValueError if it no longer matches the staging data.
+        Processors without the parameter are resumed by skipping records.
+        """
         pass
 
     @abstractmethod
@@ -245,23 +294,32 @@ class BasePipeline(DataProcessor, ABC):
 
     def _load_checkpoint(self, checkpoint_path: Path) -> int:
         """Load last processed index from checkpoint file."""
+        return self._load_checkpoint_state(checkpoint_path)[0]
+
+    def _load_checkpoint_state(self, checkpoint_path: Path) -> tuple[int, Optional[dict[str, Any]]]:
+        """Load last processed index and resume position (None if absent) from checkpoint file."""
         if checkpoint_path.exists():
             try:
                 data = json.loads(checkpoint_path.read_text())
                 self.logger.info(f"Resuming from checkpoint: record {data['last_index']}")
-                return data["last_index"]
+                position = data.get("position")
+                return data["last_index"], position if isinstance(position, dict) else None
             except (json.JSONDecodeError, KeyError) as e:
                 self.logger.warning(f"Corrupt checkpoint file, starting fresh: {e}")
-                return 0
-        return 0
+                return 0, None
+        return 0, None
 
-    def _save_checkpoint(self, checkpoint_path: Path, index: int) -> None:
-        """Save checkpoint with current progress using atomic write."""
+    def _save_checkpoint(
+        self, checkpoint_path: Path, index: int, position: Optional[dict[str, Any]] = None
+    ) -> None:
+        """Save checkpoint with current progress (and resume position) using atomic write."""
         checkpoint_data = {
             "last_index": index,
             "run_id": self.run_id,
             "timestamp": datetime.now(timezone.utc).isoformat(),
         }
+        if position is not None:
+            checkpoint_data["position"] = position
 
         # Atomic write: write to temp file, then rename
         try:
@@ -352,14 +410,20 @@ class BasePipeline(DataProcessor, ABC):
         self.logger.info("PHASE 3: Text Processing & Silver Dataset Creation")
         self.logger.info("=" * 60)
 
-        checkpoint_path, last_processed_index = self._prepare_process_run()
+        checkpoint_path, last_processed_index, resume_from = self._prepare_process_run()
+        owns_telemetry = self._start_run_telemetry()
+        self._start_step_metrics()
 
         try:
-            with open(self.processed_file, "w", encoding="utf-8") as fout:
+            with (
+                open(self.processed_file, "w", encoding="utf-8") as fout,
+                self._profile_process_loop(),
+            ):
                 records_processed, records_filtered, records = self._process_record_stream(
                     last_processed_index=last_processed_index,
                     checkpoint_path=checkpoint_path,
                     fout=fout,
+                    resume_from=resume_from,
                 )
             self._finalize_process_run(
                 records=records,
@@ -377,11 +441,26 @@ class BasePipeline(DataProcessor, ABC):
         finally:
             # End MLFlow run
             self.mlflow.end_run()
+            if owns_telemetry:
+                self._stop_run_telemetry()
+            self._flush_shared_dedup()
 
         return self.silver_path if self.silver_path else self.processed_file
 
-    def _prepare_process_run(self) -> tuple[Path, int]:
-        """Start tracking and load the process checkpoint."""
+    def _flush_shared_dedup(self) -> None:
+        """Send hashes a shared-index DedupClient still buffers to its server."""
+        from .dedup.service import DedupClient
+
+        dedup = getattr(self, "dedup", None)
+        if not isinstance(dedup, DedupClient):
+            return
+        try:
+            dedup.flush()
+        except Exception as e:
+            self.logger.warning(f"Could not flush known hashes to the dedup server: {e}")
+
+    def _prepare_process_run(self) -> tuple[Path, int, Optional[dict[str, Any]]]:
+        """Start tracking and load the process checkpoint (index and resume position)."""
         self.mlflow.start_run(run_name=self.run_id)
 
         tags = {
@@ -403,43 +482,261 @@ class BasePipeline(DataProcessor, ABC):
         )
 
         checkpoint_path = self.processed_dir / f"{self.run_id}_checkpoint.json"
-        last_processed_index = self._load_checkpoint(checkpoint_path)
-        return checkpoint_path, last_processed_index
+        last_processed_index, resume_from = self._load_checkpoint_state(checkpoint_path)
+        return checkpoint_path, last_processed_index, resume_from
+
+    def _start_run_telemetry(self) -> bool:
+        """
+        Start resource sampling and the live metrics endpoint, unless already running.
+
+        Returns:
+            True if this call started them (the caller must stop them)
+        """
+        if self._telemetry_active:
+            return False
+        self._telemetry_active = True
+        profiling = get_config().profiling
+        if profiling.resource_sampling:
+            self.resource_sampler = ResourceSampler(
+                interval=profiling.resource_interval_seconds,
+                wal_paths=self._resource_wal_paths(),
+            )
+            self.resource_sampler.start()
+
+        port = self.metrics_port if self.metrics_port is not None else profiling.metrics_port
+        if port is not None and self.metrics_exporter is None:
+            try:
+                self.metrics_exporter = self._create_metrics_exporter(port, profiling.metrics_host)
+                self.metrics_exporter.start()
+            except OSError as e:
+                self.logger.warning(f"Live metrics endpoint disabled: {e}")
+                self.metrics_exporter = None
+        return True
+
+    def _start_step_metrics(self) -> None:
+        """
+        Log in-run step metrics to MLflow every SDC_TRACKING__STEP_METRICS_INTERVAL_SECONDS.
+
+        Like the live endpoint, the reader runs on the tracker's thread and
+        only copies counters the record loop already keeps.
+        """
+        interval = get_config().tracking.step_metrics_interval_seconds
+        if interval <= 0:
+            return
+        last = {"read": self.records_read, "at": time.monotonic()}
+
+        def read() -> dict[str, float]:
+            records_read = self.records_read
+            now = time.monotonic()
+            elapsed = now - last["at"]
+            metrics = {
+                "records_per_second": (records_read - last["read"]) / elapsed if elapsed else 0.0
+            }
+            last.update(read=records_read, at=now)
+            if records_read:
+                metrics["filter_pass_rate"] = self.records_accepted / records_read
+                for key, count in self.filter_engine.get_filter_stats().items():
+                    metrics[f"{key}_rate"] = count / records_read
+            return metrics
+
+        self.mlflow.start_step_metrics(read, interval)
+
+    def _stop_run_telemetry(self) -> None:
+        self._telemetry_active = False
+        if self.resource_sampler is not None:
+            self.resource_sampler.stop()
+        if self.metrics_exporter is not None:
+            self.metrics_exporter.stop()
+            self.metrics_exporter = None
+
+    def _create_metrics_exporter(self, port: int, host: str) -> LiveMetricsExporter:
+        """
+        Build the live endpoint over this pipeline's counters.
+
+        Everything is read on the server thread at scrape time from state the
+        record loop already maintains (integer counters, stage timings), so
+        the loop does no extra work per scrape.
+        """
+        exporter = LiveMetricsExporter(
+            port=port, host=host, labels={"source": self.source, "run_id": self.run_id}
+        )
+        timer = self.stage_timer
+        exporter.add_metric(
+            "pipeline_records_read_total",
+            "counter",
+            "Records read from staging by the processing loop",
+            lambda: self.records_read,
+        )
+        exporter.add_metric(
+            "pipeline_records_accepted_total",
+            "counter",
+            "Records that passed filters, validation and dedup",
+            lambda: self.records_accepted,
+        )
+        exporter.add_metric(
+            "pipeline_write_buffer_records",
+            "gauge",
+            "Records buffered for the next silver write",
+            lambda: len(self._write_buffer),
+        )
+        exporter.add_metric(
+            "pipeline_stage_seconds_total",
+            "counter",
+            "Wall time spent per processing stage",
+            lambda: {stage: ns / 1e9 for stage, ns in dict(timer.total_ns).items()},
+            label="stage",
+        )
+        exporter.add_metric(
+            "pipeline_stage_calls_total",
+            "counter",
+            "Timed intervals per processing stage",
+            lambda: dict(timer.calls),
+            label="stage",
+        )
+        exporter.add_metric(
+            "pipeline_filter_seconds_total",
+            "counter",
+            "Wall time spent per quality filter",
+            lambda: {
+                name: ns / 1e9 for name, (ns, _) in self.filter_engine.get_filter_timings().items()
+            },
+            label="filter",
+        )
+        exporter.add_metric(
+            "pipeline_events_total",
+            "counter",
+            "MetricsCollector counters",
+            lambda: dict(self.metrics.counters) if self.metrics is not None else None,
+            label="event",
+        )
+        exporter.add_metric(
+            "pipeline_filter_rejections_total",
+            "counter",
+            "Records rejected per filter reason",
+            lambda: (
+                dict(self.metrics.distributions["filter_reasons"])
+                if self.metrics is not None
+                else None
+            ),
+            label="reason",
+        )
+
+        def _resource(key: str):
+            latest = self.resource_sampler.latest if self.resource_sampler else None
+            return latest.get(key) if latest else None
+
+        exporter.add_metric(
+            "process_resident_memory_bytes",
+            "gauge",
+            "Resident memory at the last resource sample",
+            lambda: _resource("rss_bytes"),
+        )
+        exporter.add_metric(
+            "process_cpu_seconds_total",
+            "counter",
+            "CPU time at the last resource sample",
+            lambda: _resource("cpu_seconds"),
+        )
+        exporter.track_rate(lambda: self.records_read)
+        return exporter
+
+    def _resource_wal_paths(self) -> tuple[Path, ...]:
+        """WAL files to watch: the SQLite ledger's, when the ledger is SQLite-backed."""
+        backend = getattr(getattr(self, "ledger", None), "backend", None)
+        db_path = getattr(backend, "db_path", None)
+        if isinstance(db_path, Path):
+            return (db_path.with_name(db_path.name + "-wal"),)
+        return ()
+
+    def _profile_process_loop(self):
+        """Profiler context for the record loop, or a no-op when profiling is off."""
+        if self.profile_mode is None:
+            return contextlib.nullcontext()
+        profiling = get_config().profiling
+        return profile_run(
+            self.profile_mode,
+            Path(profiling.profile_dir),
+            self.run_id,
+            sample_interval_ms=profiling.sample_interval_ms,
+        )
 
     def _process_record_stream(
         self,
         last_processed_index: int,
         checkpoint_path: Path,
         fout,
+        resume_from: Optional[dict[str, Any]] = None,
     ) -> tuple[int, int, list[dict]]:
-        """Stream, clean, filter, validate, and batch records for writing."""
+        """Stream, clean, filter, validate, and batch records for writing.
+
+        Each stage boundary charges the elapsed time to ``self.stage_timer``
+        (one ``perf_counter_ns`` call per boundary). ``resume_from`` is the
+        checkpointed position of record ``last_processed_index``.
+
+        With ``self.near_dedup`` set, records that pass the exact-duplicate
+        guard are held back and checked for near-duplicates
+        ``near_dup_batch_size`` at a time; the survivors are then accepted
+        in staging order.
+        """
         records_processed = 0
         records_filtered = 0
         records: list[dict] = []
-        current_index = 0
+        self._write_buffer = records
+        timer = self.stage_timer
+        near_pending: list[tuple[int, RawRecord, str, dict]] = []
 
-        for raw_record in self._extract_records():
-            if current_index < last_processed_index:
-                current_index += 1
-                continue
+        def accept(current_index: int, raw_record: RawRecord, cleaned: str, record: dict) -> None:
+            nonlocal records, records_processed
+            mark = time.perf_counter_ns()
+            records.append(record)
+            records_processed += 1
+            self.records_accepted += 1
+            self._record_length_outcome(cleaned, "passed")
+            self._mark_url_processed(raw_record, record)
+            mark = timer.lap("ledger_mark", mark)
 
-            current_index += 1
-            cleaned = self.text_cleaner.clean(raw_record.text)
-            if not cleaned:
-                records_filtered += 1
-                self._record_filter_metric("empty_after_cleaning")
-                continue
+            if records_processed % self.log_frequency == 0:
+                self.logger.info(f"Progress: {records_processed} records processed...")
 
-            passed, failed_filter, filter_metadata = self.filter_engine.apply_filters(
-                cleaned, raw_record.title
-            )
+            if current_index % CHECKPOINT_INTERVAL == 0:
+                self._save_checkpoint(checkpoint_path, current_index, raw_record.position)
+                mark = timer.lap("checkpoint", mark)
+
+            if self.batch_size and len(records) >= self.batch_size:
+                self._write_batch(records)
+                records = self._write_buffer = []
+                timer.lap("write", mark)
+
+        def flush_near_pending() -> None:
+            nonlocal records_filtered
+            duplicates = self._check_near_duplicates(near_pending)
+            for candidate, is_duplicate in zip(near_pending, duplicates):
+                if is_duplicate:
+                    records_filtered += 1
+                else:
+                    accept(*candidate)
+            near_pending.clear()
+
+        for (
+            current_index,
+            raw_record,
+            cleaned,
+            passed,
+            failed_filter,
+            filter_metadata,
+        ) in self._screen_records(last_processed_index, resume_from):
+            mark = time.perf_counter_ns()
             if not passed:
                 records_filtered += 1
                 self._record_filter_metric(failed_filter)
+                if cleaned is not None:  # None: cached rejection, lengths already recorded
+                    self._record_length_outcome(cleaned, "filtered")
                 continue
 
             fout.write(f"=== {raw_record.title} ===\n{cleaned}\n\n")
+            mark = timer.lap("write", mark)
             script_info = detect_scripts(cleaned)
+            mark = timer.lap("script_detection", mark)
             base_meta = self._get_source_metadata()
             # Provenance: stamp run_purpose and campaign_id into every silver
             # record's source_metadata.  campaign_id is None for non-production
@@ -453,6 +750,7 @@ class BasePipeline(DataProcessor, ABC):
                         _provenance_campaign_id = _row.get("campaign_id")
             except Exception:
                 pass
+            mark = timer.lap("provenance_lookup", mark)
             augmented_meta = {
                 **base_meta,
                 "scripts": script_info["scripts"],
@@ -461,6 +759,7 @@ class BasePipeline(DataProcessor, ABC):
                 "run_purpose": self._get_run_purpose(),
                 "campaign_id": _provenance_campaign_id,
             }
+            digests = RecordDigests.of(cleaned)
             record = self.record_builder.build_silver_record(
                 raw_record=raw_record,
                 cleaned_text=cleaned,
@@ -471,11 +770,15 @@ class BasePipeline(DataProcessor, ABC):
                 register=self._get_register(),
                 language=self._get_language(),
                 source_metadata=augmented_meta,
+                digests=digests,
             )
+            mark = timer.lap("record_build", mark)
             metrics = self.metrics
             is_valid, errors = self.validation_service.validate_record(record, self.source, metrics)
+            mark = timer.lap("validation", mark)
             if not is_valid:
                 records_filtered += 1
+                self._record_length_outcome(cleaned, "filtered")
                 continue
 
             # Text-hash exact-duplicate guard (TD-021).
@@ -483,33 +786,282 @@ class BasePipeline(DataProcessor, ABC):
             # (same hash) even when URLs and titles differ.  The check must
             # happen here — after cleaning — so that hash values match
             # regardless of how whitespace or markup varies in the raw source.
+            # Uses the digest computed for the record (no re-hash of the text).
             if hasattr(self, "dedup") and self.dedup is not None:
-                text_hash = record.get("text_hash", "")
-                if text_hash and self.dedup.is_duplicate_hash(text_hash):
+                if self.dedup.is_duplicate_hash(digests.fingerprint):
+                    timer.lap("dedup", mark)
                     records_filtered += 1
                     self._record_filter_metric("exact_text_duplicate")
+                    self._record_length_outcome(cleaned, "duplicate")
                     if metrics is not None:
                         metrics.increment("urls_deduplicated")
                     continue
-                if text_hash:
-                    self.dedup.add_known_hash(text_hash, raw_record.url)
+                self.dedup.add_known_hash(digests.fingerprint, raw_record.url)
+                timer.lap("dedup", mark)
 
-            records.append(record)
-            records_processed += 1
-            self._mark_url_processed(raw_record, record)
-
-            if records_processed % self.log_frequency == 0:
-                self.logger.info(f"Progress: {records_processed} records processed...")
+            if self.near_dedup is None:
+                accept(current_index, raw_record, cleaned, record)
+                continue
 
-            if current_index % CHECKPOINT_INTERVAL == 0:
-                self._save_checkpoint(checkpoint_path, current_index)
+            near_pending.append((current_index, raw_record, cleaned, record))
+            if len(near_pending) >= self.near_dup_batch_size:
+                flush_near_pending()
 
-            if self.batch_size and len(records) >= self.batch_size:
-                self._write_batch(records)
-                records = []
+        if near_pending:
+            flush_near_pending()
 
         return records_processed, records_filtered, records
 
+    def _check_near_duplicates(
+        self, candidates: list[tuple[int, RawRecord, str, dict]]
+    ) -> list[bool]:
+        """
+        Check a batch of ``(index, raw_record, cleaned, record)`` for near-duplicates.
+
+        Signatures for the batch are computed in one call and looked up in
+        (and added to) ``self.near_dedup``. A near-duplicate is counted as
+        ``near_duplicate`` in the filter breakdown and marked DUPLICATE in
+        the ledger with ``duplicate_of`` (the URL of the record it matched).
+
+        Returns:
+            For each candidate, whether it is a near-duplicate
+        """
+        mark = time.perf_counter_ns()
+        keys = [raw_record.url or record["id"] for _, raw_record, _, record in candidates]
+        matches = self.near_dedup.check_and_add_batch(
+            keys, [cleaned for _, _, cleaned, _ in candidates]
+        )
+
+        ledger = getattr(self, "ledger", None)
+        for (_, raw_record, cleaned, _), match in zip(candidates, matches):
+            if match is None:
+                continue
+            duplicate_of, similarity = match
+            self._record_filter_metric("near_duplicate")
+            self._record_length_outcome(cleaned, "duplicate")
+            if self.metrics is not None:
+                self.metrics.record_near_duplicate()
+            if ledger is not None and raw_record.url:
+                ledger.mark_duplicate(raw_record.url, duplicate_of, source=self.source)
+            self.logger.debug(
+                f"Near-duplicate {raw_record.url or raw_record.title!r} "
+                f"(duplicate_of={duplicate_of}, jaccard={similarity:.2f})"
+            )
+        # One near_dedup interval per batch, ledger marks included: the
+        # ledger_mark stage counts accepted records only
+        self.stage_timer.lap("near_dedup", mark)
+        return [match is not None for match in matches]
+
+    def _screen_records(
+        self, last_processed_index: int, resume_from: Optional[dict[str, Any]] = None
+    ) -> Iterator[tuple]:
+        """
+        Clean and filter staged records, skipping those before the checkpoint.
+
+        Yields ``(index, raw_record, cleaned, passed, failed_filter,
+        filter_metadata)`` in staging order, where ``index`` is the 1-based
+        position in the staging file. With ``filter_batch_size > 1`` records
+        are cleaned and filtered in chunks through
+        ``FilterEngine.apply_filters_batch``; outcomes are identical.
+
+        With a screening cache, ``cleaned`` is None for a rejection served
+        from the cache (its lengths are recorded here, since the text was
+        never cleaned).
+        """
+        timer = self.stage_timer
+        batch_size = self.filter_batch_size
+        cache = self.screening_cache
+        if cache is not None:
+            self._screening_fingerprint = screening_fingerprint(
+                self.text_cleaner, self.filter_engine
+            )
+        pending: list[tuple[int, RawRecord]] = []
+        current_index = last_processed_index
+        staged = self._staged_records(last_processed_index, resume_from)
+
+        try:
+            for raw_record in timer.timed_iter(staged, "extract"):
+                current_index += 1
+                self.records_read += 1
+
+                if batch_size > 1:
+                    pending.append((current_index, raw_record))
+                    if len(pending) >= batch_size:
+                        yield from self._screen_batch(pending)
+                        pending = []
+                    continue
+
+                mark = time.perf_counter_ns()
+                cache_key = cached = None
+                if cache is not None:
+                    cache_key, cached = self._lookup_screening(raw_record)
+                    mark = timer.lap("screening_cache", mark)
+                    if cached is not None and not cached.passed:
+                        yield current_index, raw_record, None, False, cached.failed_filter, {}
+                        continue
+
+                cleaned = self.text_cleaner.clean(raw_record.text)
+                mark = timer.lap("clean", mark)
+                if cached is not None and self._cached_verdict_holds(cached, cleaned):
+                    yield current_index, raw_record, cleaned, True, None, cached.metadata
+                    continue
+                if not cleaned:
+                    cleaned = ""
+                    passed, failed_filter, filter_metadata = False, "empty_after_cleaning", {}
+                else:
+                    errors = self.filter_engine.error_count
+                    passed, failed_filter, filter_metadata = self.filter_engine.apply_filters(
+                        cleaned, raw_record.title
+                    )
+                    mark = timer.lap("filter", mark)
+                    if self.filter_engine.error_count != errors:
+                        cache_key = None  # Filter errors may be transient; never cache them
+                if cache_key is not None:
+                    cache.put(
+                        cache_key,
+                        self._screening_fingerprint,
+                        cleaned,
+                        passed,
+                        failed_filter,
+                        filter_metadata,
+                    )
+                    timer.lap("screening_cache", mark)
+                yield current_index, raw_record, cleaned, passed, failed_filter, filter_metadata
+
+            if pending:
+                yield from self._screen_batch(pending)
+        finally:
+            if cache is not None:
+                cache.flush()
+
+    def _staged_records(
+        self, last_processed_index: int, resume_from: Optional[dict[str, Any]]
+    ) -> Iterator[RawRecord]:
+        """
+        Staged records after the checkpoint.
+
+        Seeks to ``resume_from`` when the processor's ``_extract_records``
+        accepts it; otherwise (or if the position is stale) re-reads the
+        staging data and skips the first ``last_processed_index`` records.
+        """
+        if (
+            resume_from is not None
+            and last_processed_index
+            and "resume_from" in inspect.signature(self._extract_records).parameters
+        ):
+            records = self._extract_records(resume_from=resume_from)
+            try:
+                first = next(records)
+            except StopIteration:
+                return
+            except ValueError as e:
+                self.logger.warning(f"Cannot seek to checkpoint position ({e}); re-reading")
+            else:
+                self.logger.info(
+                    f"Seeking to checkpoint position {resume_from} (record {last_processed_index})"
+                )
+                yield first
+                yield from records
+                return
+
+        for index, raw_record in enumerate(self._extract_records(), start=1):
+            if index > last_processed_index:
+                yield raw_record
+
+    def _screen_batch(self, pending: list[tuple[int, RawRecord]]) -> Iterator[tuple]:
+        """Clean and filter one chunk of records (see ``_screen_records``)."""
+        timer = self.stage_timer
+        cache = self.screening_cache
+        keys: list[Optional[str]] = [None] * len(pending)
+        outcomes: list[Optional[tuple]] = [None] * len(pending)
+        cached: list[Optional[ScreeningResult]] = [None] * len(pending)
+        mark = time.perf_counter_ns()
+        if cache is not None:
+            for position, (_, raw_record) in enumerate(pending):
+                keys[position], cached[position] = self._lookup_screening(raw_record)
+                if cached[position] is not None and not cached[position].passed:
+                    outcomes[position] = (None, False, cached[position].failed_filter, {})
+            now = time.perf_counter_ns()
+            timer.add("screening_cache", now - mark, calls=len(pending))
+            mark = now
+
+        cleaned_count = 0
+        to_filter: list[int] = []
+        texts: list[str] = []
+        for position, (_, raw_record) in enumerate(pending):
+            if outcomes[position] is not None:
+                continue
+            cleaned = self.text_cleaner.clean(raw_record.text) or ""
+            cleaned_count += 1
+            hit = cached[position]
+            if hit is not None and self._cached_verdict_holds(hit, cleaned):
+                outcomes[position] = (cleaned, True, None, hit.metadata)
+                continue
+            to_filter.append(position)
+            texts.append(cleaned)
+        now = time.perf_counter_ns()
+        timer.add("clean", now - mark, calls=cleaned_count)
+
+        if to_filter:
+            errors = self.filter_engine.error_count
+            result = self.filter_engine.apply_filters_batch(
+                texts, [pending[position][1].title for position in to_filter]
+            )
+            mark = time.perf_counter_ns()
+            timer.add("filter", mark - now, calls=len(to_filter))
+            store = cache is not None and self.filter_engine.error_count == errors
+            for position, cleaned, passed, reason, metadata in zip(
+                to_filter, texts, result.passed.tolist(), result.reasons.tolist(), result.metadata
+            ):
+                outcomes[position] = (cleaned, passed, reason, metadata)
+                if store:
+                    cache.put(
+                        keys[position],
+                        self._screening_fingerprint,
+                        cleaned,
+                        passed,
+                        reason,
+                        metadata,
+                    )
+            if store:
+                timer.lap("screening_cache", mark)
+
+        for (index, raw_record), (cleaned, passed, reason, metadata) in zip(pending, outcomes):
+            yield index, raw_record, cleaned, passed, reason, metadata
+
+    def _lookup_screening(self, raw_record: RawRecord) -> tuple[str, Optional[ScreeningResult]]:
+        """
+        Look up a record's cached screening verdict.
+
+        A cached rejection is accounted for here (filter statistics and the
+        filtered length distribution), because its text is never cleaned.
+
+        Returns:
+            (cache key, cached result or None)
+        """
+        cache = self.screening_cache
+        cache_key = cache.key(raw_record.text, self._screening_fingerprint)
+        cached = cache.get(cache_key)
+        if cached is None:
+            cache.count("misses")
+        elif not cached.passed:
+            cache.count("rejections_reused")
+            if cached.failed_filter != "empty_after_cleaning":
+                self.filter_engine.record_rejection(cached.failed_filter)
+            if self.metrics is not None:
+                self.metrics.record_length_outcome(
+                    cached.char_count, cached.token_count, "filtered"
+                )
+        return cache_key, cached
+
+    def _cached_verdict_holds(self, cached: ScreeningResult, cleaned: Optional[str]) -> bool:
+        """Whether a cached pass still applies to this cleaned text."""
+        if cleaned and ScreeningCache.text_digest(cleaned) == cached.cleaned_sha256:
+            self.screening_cache.count("passes_reused")
+            return True
+        self.screening_cache.count("stale")
+        return False
+
     def _finalize_process_run(
         self,
         records: list[dict],
@@ -519,7 +1071,12 @@ class BasePipeline(DataProcessor, ABC):
     ) -> None:
         """Flush final outputs, export metrics, and mark the run successful."""
         self._log_processing_summary(records_processed, records_filtered)
+        mark = time.perf_counter_ns()
         self._write_final_batch(records)
+        self.stage_timer.lap("write", mark)
+        stage_timings = self._collect_stage_timings()
+        self._record_filter_ordering()
+        self._record_screening_cache()
         self._export_metrics(records_processed, records_filtered)
 
         quality_pass_rate = 0.0
@@ -532,17 +1089,66 @@ class BasePipeline(DataProcessor, ABC):
                 "records_written": records_processed,
                 "records_filtered": records_filtered,
                 "quality_pass_rate": quality_pass_rate,
+                **{
+                    f"stage_{stage.replace('.', '_')}_ms": timing["total_ms"]
+                    for stage, timing in stage_timings.get("stages", {}).items()
+                },
             }
         )
         self.mlflow.set_tag("status", "success")
         checkpoint_path.unlink(missing_ok=True)
         self.logger.info("Pipeline completed successfully, checkpoint removed")
 
+    def _collect_stage_timings(self) -> dict[str, Any]:
+        """Fold per-filter timings into the stage timer, hand them to metrics, and log a summary."""
+        for name, (elapsed_ns, calls) in self.filter_engine.get_filter_timings().items():
+            self.stage_timer.add(f"filter.{name}", elapsed_ns, calls)
+        if self.metrics is not None:
+            self.metrics.stage_timer.merge(self.stage_timer)
+
+        summary = self.stage_timer.summary()
+        if summary:
+            top = ", ".join(
+                f"{stage} {timing['share']:.0%}"
+                for stage, timing in list(summary["stages"].items())[:5]
+                if "." not in stage
+            )
+            self.logger.info(
+                f"Stage timings ({summary['total_ms']:.0f} ms, "
+                f"timer overhead {summary['timer_overhead_pct']:.2f}%): {top}"
+            )
+        return summary
+
+    def _record_filter_ordering(self) -> None:
+        """Hand the adaptive filter order and its estimated savings to metrics."""
+        ordering = self.filter_engine.get_ordering_stats()
+        if ordering and self.metrics is not None:
+            self.metrics.add_custom_metric("filter_ordering", ordering)
+
+    def _record_screening_cache(self) -> None:
+        """Log screening cache reuse and hand its counters to metrics."""
+        if self.screening_cache is None:
+            return
+        stats = self.screening_cache.statistics()
+        reused = stats.get("rejections_reused", 0) + stats.get("passes_reused", 0)
+        looked_up = reused + stats.get("misses", 0) + stats.get("stale", 0)
+        self.logger.info(
+            f"Screening cache: reused {reused}/{looked_up} verdicts "
+            f"({stats.get('stale', 0)} stale, {stats['entries']} entries)"
+        )
+        if self.metrics is not None:
+            self.metrics.add_custom_metric("screening_cache", stats)
+
     def _record_filter_metric(self, filter_reason: str) -> None:
         """Record filter reason in metrics if available."""
         if self.metrics is not None:
             self.metrics.record_filter_reason(filter_reason)
 
+    def _record_length_outcome(self, cleaned: str, outcome: str) -> None:
+        """Record cleaned char/token length under a filter outcome if metrics are available."""
+        if self.metrics is not None:
+            self.metrics.record_length_outcome(len(cleaned), len(cleaned.split()), outcome)
+
     def _mark_url_processed(self, raw_record: RawRecord, record: dict) -> None:
         """Mark URL as processed in ledger if available."""
         if hasattr(self, "ledger") and self.ledger is not None:
@@ -591,6 +1197,9 @@ class BasePipeline(DataProcessor, ABC):
             self.metrics.increment("urls_processed", records_processed)
             self.metrics.increment("records_written", records_processed)
             self.metrics.increment("records_filtered", records_filtered)
+            if self.resource_sampler is not None:
+                self.resource_sampler.sample_now()
+                self.metrics.resource_usage = self.resource_sampler.export()
 
             # Export final metrics after processing
             metrics_path = Path("data/metrics") / f"{self.run_id}_processing.json"
@@ -982,7 +1591,9 @@ class BasePipeline(DataProcessor, ABC):
             pass
         return 0
 
-    def run(self) -> Optional[Path]:
+    def run(
+        self, stage_runner: Optional[Callable[[str, Callable[[], Any]], Any]] = None
+    ) -> Optional[Path]:
         """
         Template method: download → extract → process.
 
@@ -998,25 +1609,33 @@ class BasePipeline(DataProcessor, ABC):
         even if the CLI never reaches process().  The orchestrator path owns its
         own subsequent status updates after run() returns; finalising here is
         safe because ledger.update_pipeline_run is an idempotent SET.
+
+        ``stage_runner(name, fn)`` wraps each phase call; the orchestration
+        LocalScheduler uses it to take a CPU or network slot per stage.
         """
+        run_stage = stage_runner or (lambda name, fn: fn())
         # Lazy registration: register at first stage entry (idempotent; no-op
         # if the orchestrator already registered this run_id).
         self._ensure_pipeline_run_registered()
+        owns_telemetry = self._start_run_telemetry()
         try:
-            if self.download() is None:
+            if run_stage("download", self.download) is None:
                 self.logger.info("Pipeline short-circuit at download (no work to do)")
                 self._finalise_pipeline_run(status="COMPLETED", records_processed=0)
                 return None
-            if self.extract() is None:
+            if run_stage("extract", self.extract) is None:
                 self.logger.info("Pipeline short-circuit at extract (no work to do)")
                 self._finalise_pipeline_run(status="COMPLETED", records_processed=0)
                 return None
-            result = self.process()
+            result = run_stage("process", self.process)
             self._finalise_pipeline_run(status="COMPLETED")
             return result
         except Exception as exc:
             self._finalise_pipeline_run(status="FAILED", error=str(exc))
             raise
+        finally:
+            if owns_telemetry:
+                self._stop_run_telemetry()
 
     def _cleanup_old_raw_files(self):
         """Clean up old raw files, keeping only recent N files (config: raw_files_to_keep)."""
@@ -28,12 +28,25 @@ from filelock import FileLock
 
 from ..database.ledger_interfaces import CrawlState, LedgerBackend
 from .lock_manager import LockManager
-from .sqlite_ledger_mixins import SQLiteCampaignMixin, SQLitePipelineRunsMixin, SQLiteQuotaMixin
+from .sqlite_ledger_mixins import (
+    SQLiteCampaignMixin,
+    SQLitePipelineRunsMixin,
+    SQLiteQuotaMixin,
+    SQLiteRateLimitMixin,
+    SQLiteWorkQueueMixin,
+)
 
 logger = logging.getLogger(__name__)
 
 
-class SQLiteLedger(SQLiteCampaignMixin, SQLiteQuotaMixin, SQLitePipelineRunsMixin, LedgerBackend):
+class SQLiteLedger(
+    SQLiteCampaignMixin,
+    SQLiteQuotaMixin,
+    SQLiteRateLimitMixin,
+    SQLiteWorkQueueMixin,
+    SQLitePipelineRunsMixin,
+    LedgerBackend,
+):
     """
     SQLite implementation of crawl ledger.
 
@@ -123,6 +136,16 @@ class SQLiteLedger(SQLiteCampaignMixin, SQLiteQuotaMixin, SQLitePipelineRunsMixi
                 conn.execute("INSERT OR IGNORE INTO schema_version (version) VALUES (2)")
                 logger.info("Applied schema version 2: run_purpose + campaign_id on pipeline_runs")
 
+            if current_version < 3:
+                self._apply_schema_v3(conn)
+                conn.execute("INSERT OR IGNORE INTO schema_version (version) VALUES (3)")
+                logger.info("Applied schema version 3: rate_limit_buckets")
+
+            if current_version < 4:
+                self._apply_schema_v4(conn)
+                conn.execute("INSERT OR IGNORE INTO schema_version (version) VALUES (4)")
+                logger.info("Applied schema version 4: URL work-queue leases")
+
     def _apply_schema_v1(self, conn: sqlite3.Connection) -> None:
         """
         Apply version 1 schema (SQLite only - for development).
@@ -278,6 +301,46 @@ class SQLiteLedger(SQLiteCampaignMixin, SQLiteQuotaMixin, SQLitePipelineRunsMixi
                 else:
                     raise
 
+    def _apply_schema_v3(self, conn: sqlite3.Connection) -> None:
+        """
+        Apply version 3 schema: shared token buckets for cross-process rate limiting.
+
+        Mirrors migrations/database/alembic/versions/004_rate_limit_buckets.py.
+        refilled_at is epoch seconds so both backends can do the refill arithmetic
+        without timestamp parsing.
+        """
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS rate_limit_buckets (
+                bucket_key TEXT PRIMARY KEY,
+                tokens REAL NOT NULL,
+                refilled_at REAL NOT NULL
+            )
+        """)
+
+    def _apply_schema_v4(self, conn: sqlite3.Connection) -> None:
+        """
+        Apply version 4 schema: lease columns for claim_urls work queues.
+
+        Mirrors migrations/database/alembic/versions/005_url_leases.py.
+        lease_expires_at is epoch seconds, like rate_limit_buckets.refilled_at.
+        """
+        for statement in [
+            "ALTER TABLE crawl_ledger ADD COLUMN lease_owner TEXT",
+            "ALTER TABLE crawl_ledger ADD COLUMN lease_expires_at REAL",
+        ]:
+            try:
+                conn.execute(statement)
+            except Exception as exc:
+                if "duplicate column" in str(exc).lower():
+                    logger.debug("Column already present, skipping: %s", exc)
+                else:
+                    raise
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_source_state_lease "
+            "ON crawl_ledger(source, state, lease_expires_at)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_lease_owner ON crawl_ledger(lease_owner)")
+
     def upsert_url(
         self,
         url: str,
@@ -867,6 +930,54 @@ class CrawlLedger:
         urls = [r["url"] for r in discovered] + [r["url"] for r in fetched]
         return urls
 
+    def claim_urls(
+        self,
+        source: str,
+        n: int,
+        worker_id: str,
+        lease_seconds: float = 300,
+        state: CrawlState = CrawlState.DISCOVERED,
+    ) -> list[str]:
+        """
+        Lease up to ``n`` pending URLs to one worker.
+
+        Unlike ``get_pending_urls``, claimed URLs are invisible to other
+        claimers until the lease is released or expires, so any number of
+        workers (processes or hosts sharing the ledger) can drain one
+        frontier without fetching a URL twice. Keep long batches alive with
+        ``heartbeat_urls`` and call ``release_urls`` once their state is
+        updated (see ``work_queue.claimed_batches``).
+
+        Args:
+            source: Source identifier the URLs were discovered under
+            n: Maximum URLs to claim
+            worker_id: Stable identifier of the claiming worker
+            lease_seconds: Seconds until the lease expires without a heartbeat
+            state: Crawl state to claim from (default: discovered)
+
+        Returns:
+            Claimed URLs, oldest discovery first (empty when the frontier is drained)
+
+        Example:
+            >>> ledger = CrawlLedger()
+            >>> urls = ledger.claim_urls("bbc-somali", 25, worker_id="host-a-1234")
+        """
+        return self.backend.claim_urls(source, n, worker_id, lease_seconds, state)
+
+    def heartbeat_urls(
+        self, worker_id: str, lease_seconds: float = 300, urls: Optional[list[str]] = None
+    ) -> int:
+        """Extend the worker's unexpired leases (all, or only ``urls``); return the count."""
+        return self.backend.heartbeat_urls(worker_id, lease_seconds, urls)
+
+    def release_urls(self, worker_id: str, urls: Optional[list[str]] = None) -> int:
+        """Drop the worker's leases (all, or only ``urls``); return the count."""
+        return self.backend.release_urls(worker_id, urls)
+
+    def expire_leases(self, source: Optional[str] = None) -> int:
+        """Clear leases of crashed or stalled workers; return how many were cleared."""
+        return self.backend.expire_leases(source)
+
     def get_last_processing_time(self, source: str) -> Optional[datetime]:
         """
         Get timestamp of last successful processing for a source.
@@ -1083,6 +1194,65 @@ class CrawlLedger:
         # Validation happens in backend
         return self.backend.check_quota_available(source, quota_limit, date)
 
+    def reserve_daily_quota(
+        self,
+        source: str,
+        count: int,
+        quota_limit: Optional[int] = None,
+        date: Optional[str] = None,
+    ) -> int:
+        """
+        Atomically reserve daily quota before fetching.
+
+        Unlike ``check_quota_available`` followed by ``increment_daily_quota``,
+        the check and the increment happen in one transaction, so concurrent
+        pipeline runs (threads, processes or containers sharing the ledger)
+        cannot jointly exceed ``quota_limit``.
+
+        Args:
+            source: Source identifier
+            count: Number of units wanted
+            quota_limit: Daily quota limit (None = unlimited, grants everything)
+            date: Date string in YYYY-MM-DD format (None = today UTC)
+
+        Returns:
+            Number of units granted (0..count)
+
+        Example:
+            >>> ledger = CrawlLedger()
+            >>> granted = ledger.reserve_daily_quota("bbc", 100, quota_limit=350)
+            >>> links = links[:granted]
+        """
+        return self.backend.reserve_daily_quota(source, count, quota_limit, date)
+
+    def release_daily_quota(self, source: str, count: int, date: Optional[str] = None) -> None:
+        """
+        Return reserved quota units that were not used (failures, duplicates).
+
+        Args:
+            source: Source identifier
+            count: Number of units to give back
+            date: Date string in YYYY-MM-DD format (None = today UTC)
+        """
+        self.backend.release_daily_quota(source, count, date)
+
+    def acquire_rate_tokens(
+        self, bucket_key: str, refill_rate: float, capacity: float, cost: float = 1.0
+    ) -> float:
+        """
+        Take tokens from a token bucket shared by every process using this ledger.
+
+        Args:
+            bucket_key: Bucket identifier (e.g. "http:www.bbc.com")
+            refill_rate: Tokens added per second
+            capacity: Maximum tokens the bucket holds (burst size)
+            cost: Tokens needed for this request
+
+        Returns:
+            0.0 if the tokens were taken, otherwise seconds to wait before retrying
+        """
+        return self.backend.acquire_rate_tokens(bucket_key, refill_rate, capacity, cost)
+
     def register_pipeline_run(
         self,
         run_id: str,
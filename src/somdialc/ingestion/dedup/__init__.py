@@ -3,14 +3,19 @@
 from .engine import DedupConfig, DedupEngine, deduplicate_batch
 from .hash import LRUHashSet, TextHasher
 from .lsh import DATASKETCH_AVAILABLE, MinHashDeduplicator, ShardedLSH
+from .service import DedupClient, DedupServer, DedupServiceError, shared_dedup_server
 
 __all__ = [
     "DATASKETCH_AVAILABLE",
+    "DedupClient",
     "DedupConfig",
     "DedupEngine",
+    "DedupServer",
+    "DedupServiceError",
     "LRUHashSet",
     "MinHashDeduplicator",
     "ShardedLSH",
     "TextHasher",
     "deduplicate_batch",
+    "shared_dedup_server",
 ]
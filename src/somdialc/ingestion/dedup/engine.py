@@ -2,10 +2,12 @@
 
 import logging
 import os
+from collections.abc import Sequence
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 
+from ...quality.record_utils import hash_fingerprint
 from .hash import LRUHashSet, TextHasher
 from .lsh import DATASKETCH_AVAILABLE, MinHashDeduplicator
 
@@ -34,7 +36,13 @@ class DedupConfig:
 
 
 class DedupEngine:
-    """Unified deduplication engine combining exact and near-duplicate detection."""
+    """
+    Unified deduplication engine combining exact and near-duplicate detection.
+
+    Exact-match state (``seen_hashes``, ``hash_to_url``) is keyed by 64-bit
+    fingerprints. Methods taking a ``text_hash`` accept the hex digest or
+    ``RecordDigests.fingerprint``; both address the same entry.
+    """
 
     def __init__(self, config: Optional[DedupConfig] = None):
         self.config = config or DedupConfig()
@@ -70,10 +78,11 @@ class DedupEngine:
     def process_document(
         self, text: str, url: str, **kwargs: object
     ) -> tuple[bool, Optional[str], Optional[str], str, Optional[str]]:
-        text_hash = self.hasher.compute_hash(text=text, url=url, **kwargs)
+        digests = self.hasher.compute_digests(text=text, url=url, **kwargs)
+        text_hash, fingerprint = digests.text_hash, digests.fingerprint
 
-        if text_hash in self.seen_hashes:
-            canonical_url = self.hash_to_url.get(text_hash, url)
+        if fingerprint in self.seen_hashes:
+            canonical_url = self.hash_to_url.get(fingerprint, url)
             logger.debug(
                 f"Exact duplicate found: {url} matches {canonical_url} (hash: {text_hash[:16]}...)"
             )
@@ -91,28 +100,38 @@ class DedupEngine:
 
             minhash_signature = self.minhash.add_document(url, text)
 
-        self.seen_hashes.add(text_hash)
+        self.seen_hashes.add(fingerprint)
         if len(self.hash_to_url) >= self._hash_to_url_maxsize:
             oldest_key = next(iter(self.hash_to_url))
             del self.hash_to_url[oldest_key]
             logger.debug(
-                f"Evicted hash_to_url entry: {oldest_key[:16]}... "
+                f"Evicted hash_to_url entry: {oldest_key:016x}... "
                 f"(dict size: {len(self.hash_to_url)}/{self._hash_to_url_maxsize})"
             )
 
-        self.hash_to_url[text_hash] = url
+        self.hash_to_url[fingerprint] = url
         return False, None, None, text_hash, minhash_signature
 
-    def is_duplicate_hash(self, text_hash: str) -> bool:
+    def process_documents(
+        self, documents: Sequence[tuple[str, str]], **kwargs: object
+    ) -> list[tuple[bool, Optional[str], Optional[str], str, Optional[str]]]:
+        """``process_document`` for each (text, url), in order (one round trip on DedupClient)."""
+        return [self.process_document(text, url, **kwargs) for text, url in documents]
+
+    def is_duplicate_hash(self, text_hash: Union[str, int]) -> bool:
         return text_hash in self.seen_hashes
 
-    def get_canonical_url(self, text_hash: str) -> Optional[str]:
-        return self.hash_to_url.get(text_hash)
+    def are_duplicate_hashes(self, text_hashes: Sequence[Union[str, int]]) -> list[bool]:
+        return [text_hash in self.seen_hashes for text_hash in text_hashes]
 
-    def add_known_hash(self, text_hash: str, url: Optional[str] = None) -> None:
-        self.seen_hashes.add(text_hash)
+    def get_canonical_url(self, text_hash: Union[str, int]) -> Optional[str]:
+        return self.hash_to_url.get(hash_fingerprint(text_hash))
+
+    def add_known_hash(self, text_hash: Union[str, int], url: Optional[str] = None) -> None:
+        fingerprint = hash_fingerprint(text_hash)
+        self.seen_hashes.add(fingerprint)
         if url:
-            self.hash_to_url[text_hash] = url
+            self.hash_to_url[fingerprint] = url
 
     def get_statistics(self) -> dict:
         stats = {
@@ -171,12 +190,11 @@ def deduplicate_batch(
     unique = []
     duplicates = []
 
-    for record in records:
-        text = record.get(text_field, "")
-        url = record.get(url_field, "")
-        is_dup, dup_type, similar_url, text_hash, minhash_sig = dedup_engine.process_document(
-            text, url
-        )
+    results = dedup_engine.process_documents(
+        [(record.get(text_field, ""), record.get(url_field, "")) for record in records]
+    )
+    for record, result in zip(records, results):
+        is_dup, dup_type, similar_url, text_hash, minhash_sig = result
 
         record["text_hash"] = text_hash
         if minhash_sig:
@@ -3,7 +3,9 @@
 import hashlib
 import logging
 from collections import OrderedDict
-from typing import Optional
+from typing import Optional, Union
+
+from ...quality.record_utils import RecordDigests, hash_fingerprint
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +17,10 @@ class LRUHashSet:
     Uses OrderedDict to maintain insertion/access order. When at capacity,
     evicts the least recently accessed entry. This bounds memory usage
     regardless of document count while accepting false negatives.
+
+    Entries are stored as 64-bit fingerprints (``hash_fingerprint``): hex
+    digests and ``RecordDigests.fingerprint`` ints address the same entry,
+    and each entry costs an int rather than a 64-character string.
     """
 
     def __init__(self, maxsize: int = 100_000):
@@ -24,8 +30,9 @@ class LRUHashSet:
         self.maxsize = maxsize
         self._store = OrderedDict()
 
-    def add(self, hash_value: str) -> None:
+    def add(self, hash_value: Union[str, int]) -> None:
         """Add hash to set, evicting the oldest item when at capacity."""
+        hash_value = hash_fingerprint(hash_value)
         if hash_value in self._store:
             self._store.move_to_end(hash_value)
             return
@@ -34,13 +41,14 @@ class LRUHashSet:
             oldest_key = next(iter(self._store))
             del self._store[oldest_key]
             logger.debug(
-                f"LRU eviction: removed {oldest_key[:16]}... "
+                f"LRU eviction: removed {oldest_key:016x}... "
                 f"(cache size: {len(self._store)}/{self.maxsize})"
             )
 
         self._store[hash_value] = True
 
-    def __contains__(self, hash_value: str) -> bool:
+    def __contains__(self, hash_value: Union[str, int]) -> bool:
+        hash_value = hash_fingerprint(hash_value)
         if hash_value in self._store:
             self._store.move_to_end(hash_value)
             return True
@@ -65,6 +73,12 @@ class TextHasher:
 
     def compute_hash(self, text: str, url: Optional[str] = None, **kwargs: object) -> str:
         """Compute a stable hash from configured fields."""
+        return self.compute_digests(text, url, **kwargs).text_hash
+
+    def compute_digests(
+        self, text: str, url: Optional[str] = None, **kwargs: object
+    ) -> RecordDigests:
+        """Compute the hash from configured fields once, as hex and 64-bit fingerprint."""
         components = []
 
         for field in self.fields:
@@ -78,7 +92,7 @@ class TextHasher:
         combined = self.separator.join(components)
         hasher = hashlib.new(self.algorithm)
         hasher.update(combined.encode("utf-8"))
-        return hasher.hexdigest()
+        return RecordDigests.from_digest(hasher.digest())
 
     def compute_batch(self, records: list[dict]) -> list[str]:
         """Compute hashes for a batch of records."""
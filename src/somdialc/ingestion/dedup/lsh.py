@@ -3,6 +3,7 @@
 import json
 import logging
 import pickle
+from collections.abc import Sequence
 from pathlib import Path
 from typing import Optional
 
@@ -19,6 +20,15 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+def word_shingles(text: str, shingle_size: int = 3) -> set[str]:
+    """Lowercased word n-grams of ``text``: the shingles every MinHash here is built from."""
+    words = text.lower().split()
+    return {
+        " ".join(words[index : index + shingle_size])
+        for index in range(len(words) - shingle_size + 1)
+    }
+
+
 class ShardedLSH:
     """Sharded LSH index for faster near-duplicate lookups."""
 
@@ -172,11 +182,7 @@ class MinHashDeduplicator:
             self._load_lsh_index()
 
     def _create_shingles(self, text: str) -> set[str]:
-        words = text.lower().split()
-        shingles = set()
-        for index in range(len(words) - self.shingle_size + 1):
-            shingles.add(" ".join(words[index : index + self.shingle_size]))
-        return shingles
+        return word_shingles(text, self.shingle_size)
 
     def compute_minhash(self, text: str) -> MinHash:
         shingles = self._create_shingles(text)
@@ -185,6 +191,13 @@ class MinHashDeduplicator:
             minhash.update(shingle.encode("utf-8"))
         return minhash
 
+    def compute_minhashes(self, texts: Sequence[str]) -> list[MinHash]:
+        """``compute_minhash`` for many texts in one vectorized datasketch call."""
+        shingle_sets = [
+            [shingle.encode("utf-8") for shingle in self._create_shingles(text)] for text in texts
+        ]
+        return MinHash.bulk(shingle_sets, num_perm=self.num_permutations, seed=self.seed)
+
     def compute_signature(self, text: str) -> str:
         minhash = self.compute_minhash(text)
         return ",".join(str(value) for value in minhash.hashvalues)
@@ -245,6 +258,45 @@ class MinHashDeduplicator:
             return similar[0]
         return None
 
+    def check_and_add_batch(
+        self, urls: Sequence[str], texts: Sequence[str], threshold: Optional[float] = None
+    ) -> list[Optional[tuple[str, float]]]:
+        """
+        Check a batch of documents against the index and add the new ones.
+
+        Signatures for the whole batch are computed in one ``compute_minhashes``
+        call. Documents are then resolved in order, so a document matching an
+        earlier one in the same batch is reported too. Texts too short to
+        produce a shingle are neither checked nor indexed.
+
+        Returns:
+            For each document, ``(url, similarity)`` of the best match at or
+            above the threshold, or None when the document was added.
+        """
+        threshold = self.similarity_threshold if threshold is None else threshold
+        results: list[Optional[tuple[str, float]]] = []
+        for url, minhash in zip(urls, self.compute_minhashes(texts)):
+            if minhash.is_empty():
+                results.append(None)
+                continue
+
+            best: Optional[tuple[str, float]] = None
+            for signature in self.lsh.query(minhash):
+                match_url = self.document_hashes.get(signature)
+                if match_url is None:
+                    continue
+                similarity = minhash.jaccard(self.signature_from_string(signature))
+                if similarity >= threshold and (best is None or similarity > best[1]):
+                    best = (match_url, similarity)
+
+            if best is None:
+                signature = ",".join(str(value) for value in minhash.hashvalues)
+                if signature not in self.document_hashes:
+                    self.lsh.insert(signature, minhash)
+                    self.document_hashes[signature] = url
+            results.append(best)
+        return results
+
     def _save_lsh_index(self) -> None:
         if not self.storage_path:
             logger.warning("No storage_path configured, skipping LSH index save")
@@ -0,0 +1,362 @@
+"""
+Shared dedup index served over a Unix domain socket.
+
+When several pipelines run at once (``run_all_pipelines``), each one would
+otherwise build its own DedupEngine: cross-source duplicates (BBC vs
+HuggingFace vs Wikipedia) go unnoticed at ingest time, and any persisted
+LSH index is loaded once per pipeline. DedupServer owns one DedupEngine
+and serves it to DedupClient instances, which implement the DedupEngine
+interface used by the processors.
+
+Protocol: every message is a 4-byte big-endian length followed by a UTF-8
+JSON object. A request carries one ``op`` and a batch of items; hashes are
+sent as 64-bit fingerprints. Known hashes registered with
+``add_known_hash`` are buffered by the client and sent along with its next
+request, and ``process_documents`` / ``are_duplicate_hashes`` check a whole
+batch in one round trip.
+
+Example:
+    >>> with shared_dedup_server(DedupConfig()) as socket_path:
+    ...     client = DedupClient(socket_path)
+    ...     client.process_documents([("Qoraal ...", "https://example.com/1")])
+"""
+
+import json
+import logging
+import multiprocessing
+import os
+import signal
+import socket
+import socketserver
+import struct
+import tempfile
+import threading
+import time
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from ...quality.record_utils import hash_fingerprint
+from .engine import DedupConfig, DedupEngine
+from .hash import TextHasher
+
+logger = logging.getLogger(__name__)
+
+_HEADER = struct.Struct(">I")
+MAX_MESSAGE_BYTES = 256 * 1024 * 1024
+
+# Socket of the server started by shared_dedup_server() in this process
+_active_socket: Optional[str] = None
+
+DocumentResult = tuple[bool, Optional[str], Optional[str], str, Optional[str]]
+
+
+class DedupServiceError(Exception):
+    """The dedup server could not be reached or rejected a request."""
+
+
+def _send(sock: socket.socket, message: dict[str, Any]) -> None:
+    body = json.dumps(message, ensure_ascii=False).encode("utf-8")
+    sock.sendall(_HEADER.pack(len(body)) + body)
+
+
+def _recv_exact(sock: socket.socket, size: int) -> Optional[bytes]:
+    chunks = []
+    while size:
+        chunk = sock.recv(min(size, 1 << 20))
+        if not chunk:
+            return None
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def _recv(sock: socket.socket) -> Optional[dict[str, Any]]:
+    """Read one message; None when the peer closed the connection."""
+    header = _recv_exact(sock, _HEADER.size)
+    if header is None:
+        return None
+    (size,) = _HEADER.unpack(header)
+    if size > MAX_MESSAGE_BYTES:
+        raise DedupServiceError(f"Message of {size} bytes exceeds {MAX_MESSAGE_BYTES}")
+    body = _recv_exact(sock, size)
+    if body is None:
+        return None
+    return json.loads(body)
+
+
+class DedupServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """
+    Serve one DedupEngine to any number of DedupClient connections.
+
+    Each connection is handled on its own thread; requests are applied to
+    the engine one at a time, so a batch is checked and indexed atomically.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: Union[str, Path], config: Optional[DedupConfig] = None):
+        self.socket_path = str(socket_path)
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        self.engine = DedupEngine(config)
+        self.engine_lock = threading.Lock()
+        self.requests_served = 0
+        super().__init__(self.socket_path, _DedupRequestHandler)
+
+    def handle(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Apply one request to the engine and build the response."""
+        op = request.get("op")
+        engine = self.engine
+        with self.engine_lock:
+            self.requests_served += 1
+            for fingerprint, url in request.get("add", ()):
+                engine.add_known_hash(fingerprint, url)
+
+            if op == "process":
+                return {
+                    "results": [
+                        list(
+                            engine.process_document(
+                                doc["text"], doc["url"], **doc.get("kwargs", {})
+                            )
+                        )
+                        for doc in request["docs"]
+                    ]
+                }
+            if op == "contains":
+                return {"results": [engine.is_duplicate_hash(h) for h in request["hashes"]]}
+            if op == "canonical":
+                return {"results": [engine.get_canonical_url(h) for h in request["hashes"]]}
+            if op == "add":
+                return {"ok": True}
+            if op == "stats":
+                return {"stats": {**engine.get_statistics(), "requests": self.requests_served}}
+            if op == "ping":
+                return {"ok": True, "pid": os.getpid()}
+        return {"error": f"Unknown op {op!r}"}
+
+    def server_close(self) -> None:
+        super().server_close()
+        if self.engine.minhash is not None and self.engine.config.storage_path:
+            self.engine.minhash.save()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+
+class _DedupRequestHandler(socketserver.BaseRequestHandler):
+    def handle(self) -> None:
+        server: DedupServer = self.server  # type: ignore[assignment]
+        while True:
+            try:
+                request = _recv(self.request)
+            except (OSError, ValueError, DedupServiceError) as e:
+                logger.warning(f"Dropping dedup client connection: {e}")
+                return
+            if request is None:
+                return
+            try:
+                response = server.handle(request)
+            except Exception as e:  # Report to the client; keep serving others
+                logger.error(f"Dedup request {request.get('op')!r} failed: {e}")
+                response = {"error": str(e)}
+            _send(self.request, response)
+
+
+class DedupClient:
+    """
+    DedupEngine interface backed by a DedupServer.
+
+    ``process_document``, ``is_duplicate_hash`` and ``get_canonical_url``
+    cost one round trip each; prefer the batch forms ``process_documents``
+    and ``are_duplicate_hashes`` in loops. ``add_known_hash`` is buffered
+    and sent with the next request (or every ``flush_size`` hashes).
+    ``hasher`` runs locally, so ``hasher.compute_hash`` needs no IPC.
+    """
+
+    def __init__(
+        self,
+        socket_path: Union[str, Path],
+        config: Optional[DedupConfig] = None,
+        timeout: float = 60.0,
+        flush_size: int = 1000,
+    ):
+        self.socket_path = str(socket_path)
+        self.config = config or DedupConfig()
+        self.hasher = TextHasher(
+            algorithm=self.config.hash_algorithm,
+            fields=self.config.hash_fields,
+            separator=self.config.field_separator,
+        )
+        self.flush_size = flush_size
+        self._pending: dict[int, Optional[str]] = {}
+        self._lock = threading.Lock()
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.settimeout(timeout)
+        try:
+            self._sock.connect(self.socket_path)
+        except OSError as e:
+            self._sock.close()
+            raise DedupServiceError(f"Cannot connect to dedup server at {socket_path}: {e}") from e
+
+    def _request(self, message: dict[str, Any]) -> dict[str, Any]:
+        with self._lock:
+            if self._pending:
+                message["add"] = list(self._pending.items())
+                self._pending = {}
+            try:
+                _send(self._sock, message)
+                response = _recv(self._sock)
+            except (OSError, ValueError) as e:
+                raise DedupServiceError(f"Dedup server request failed: {e}") from e
+        if response is None:
+            raise DedupServiceError("Dedup server closed the connection")
+        if "error" in response:
+            raise DedupServiceError(response["error"])
+        return response
+
+    def ping(self) -> dict[str, Any]:
+        return self._request({"op": "ping"})
+
+    def process_document(self, text: str, url: str, **kwargs: object) -> DocumentResult:
+        return self.process_documents([(text, url)], **kwargs)[0]
+
+    def process_documents(
+        self, documents: Sequence[tuple[str, str]], **kwargs: object
+    ) -> list[DocumentResult]:
+        """``process_document`` for each (text, url), in order, in one round trip."""
+        if not documents:
+            return []
+        docs = [{"text": text, "url": url} for text, url in documents]
+        if kwargs:
+            for doc in docs:
+                doc["kwargs"] = kwargs
+        response = self._request({"op": "process", "docs": docs})
+        return [tuple(result) for result in response["results"]]  # type: ignore[misc]
+
+    def is_duplicate_hash(self, text_hash: Union[str, int]) -> bool:
+        return self.are_duplicate_hashes([text_hash])[0]
+
+    def are_duplicate_hashes(self, text_hashes: Sequence[Union[str, int]]) -> list[bool]:
+        """``is_duplicate_hash`` for each hash in one round trip."""
+        fingerprints = [hash_fingerprint(h) for h in text_hashes]
+        with self._lock:
+            pending = [fp in self._pending for fp in fingerprints]
+        if all(pending):
+            return pending
+        response = self._request({"op": "contains", "hashes": fingerprints})
+        return [bool(hit or local) for hit, local in zip(response["results"], pending)]
+
+    def get_canonical_url(self, text_hash: Union[str, int]) -> Optional[str]:
+        fingerprint = hash_fingerprint(text_hash)
+        return self._request({"op": "canonical", "hashes": [fingerprint]})["results"][0]
+
+    def add_known_hash(self, text_hash: Union[str, int], url: Optional[str] = None) -> None:
+        with self._lock:
+            self._pending[hash_fingerprint(text_hash)] = url
+            full = len(self._pending) >= self.flush_size
+        if full:
+            self.flush()
+
+    def flush(self) -> None:
+        """Send buffered ``add_known_hash`` calls now."""
+        if self._pending:
+            self._request({"op": "add"})
+
+    def get_statistics(self) -> dict:
+        return self._request({"op": "stats"})["stats"]
+
+    def check_discovery_stage(self, url: str, ledger) -> bool:
+        return DedupEngine.check_discovery_stage(self, url, ledger)  # type: ignore[arg-type]
+
+    def check_file_duplicate(
+        self, filepath: Path, ledger, source: str
+    ) -> tuple[bool, Optional[str]]:
+        return DedupEngine.check_file_duplicate(self, filepath, ledger, source)  # type: ignore[arg-type]
+
+    def close(self) -> None:
+        try:
+            self.flush()
+        except DedupServiceError as e:
+            logger.warning(f"Could not flush known hashes to the dedup server: {e}")
+        finally:
+            self._sock.close()
+
+    def __enter__(self) -> "DedupClient":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+def serve(socket_path: Union[str, Path], config: Optional[DedupConfig] = None) -> None:
+    """Run a DedupServer in the foreground until interrupted."""
+    server = DedupServer(socket_path, config)
+    # SIGTERM (shared_dedup_server's shutdown) stops the loop so the index is saved
+    signal.signal(
+        signal.SIGTERM, lambda *_: threading.Thread(target=server.shutdown, daemon=True).start()
+    )
+    logger.info(f"Dedup server listening on {socket_path} (pid {os.getpid()})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def wait_for_server(socket_path: Union[str, Path], timeout: float = 30.0) -> None:
+    """Block until a dedup server answers on ``socket_path``."""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            with DedupClient(socket_path, timeout=timeout) as client:
+                client.ping()
+            return
+        except DedupServiceError:
+            if time.monotonic() >= deadline:
+                raise
+            time.sleep(0.05)
+
+
+def active_socket() -> Optional[str]:
+    """Socket of the server started by ``shared_dedup_server`` in this process, if any."""
+    return _active_socket
+
+
+@contextmanager
+def shared_dedup_server(
+    config: Optional[DedupConfig] = None, socket_path: Optional[Union[str, Path]] = None
+) -> Iterator[str]:
+    """
+    Run a DedupServer in a child process for the duration of the block.
+
+    While active, ``PipelineSetup.create_dedup_engine`` hands out clients of
+    this server instead of private engines. Yields the socket path.
+    """
+    global _active_socket
+
+    tmpdir = None
+    if socket_path is None:
+        tmpdir = tempfile.mkdtemp(prefix="sdc-dedup-")
+        socket_path = os.path.join(tmpdir, "dedup.sock")
+    socket_path = str(socket_path)
+
+    process = multiprocessing.get_context("spawn").Process(
+        target=serve, args=(socket_path, config), name="sdc-dedup-server", daemon=True
+    )
+    process.start()
+    try:
+        wait_for_server(socket_path)
+        logger.info(f"Shared dedup server started (pid {process.pid}, socket {socket_path})")
+        _active_socket = socket_path
+        yield socket_path
+    finally:
+        _active_socket = None
+        process.terminate()
+        process.join(timeout=10)
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        if tmpdir is not None:
+            os.rmdir(tmpdir)
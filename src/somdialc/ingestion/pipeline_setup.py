@@ -18,13 +18,23 @@ from ..schema.validation_service import ValidationService
 
 # Import dedup module for type hints
 try:
-    from .dedup import DedupConfig, DedupEngine
+    from .dedup import (
+        DATASKETCH_AVAILABLE,
+        DedupClient,
+        DedupConfig,
+        DedupEngine,
+        DedupServiceError,
+        MinHashDeduplicator,
+    )
+    from .dedup.service import active_socket
 
     DEDUP_AVAILABLE = True
 except ImportError:
     DEDUP_AVAILABLE = False
+    DATASKETCH_AVAILABLE = False
     DedupConfig = None
     DedupEngine = None
+    MinHashDeduplicator = None
 
 logger = logging.getLogger(__name__)
 
@@ -68,7 +78,15 @@ class PipelineSetup:
             Logger instance
         """
         log_file = Path("logs") / f"{run_id}.log"
-        structured_logger = StructuredLogger(name=source, log_file=log_file, json_format=True)
+        logging_config = get_config().logging
+        structured_logger = StructuredLogger(
+            name=source,
+            log_file=log_file,
+            json_format=True,
+            async_handlers=logging_config.async_handlers,
+            queue_size=logging_config.queue_size,
+            overflow=logging_config.queue_overflow,
+        )
         return structured_logger.get_logger()
 
     @staticmethod
@@ -109,7 +127,7 @@ class PipelineSetup:
         if filter_engine is not None:
             return filter_engine
 
-        return FilterEngine()
+        return FilterEngine(debug_sample_every=get_config().logging.debug_sample_every)
 
     @staticmethod
     def create_record_builder(
@@ -165,11 +183,16 @@ class PipelineSetup:
         """
         Create DedupEngine with centralized configuration.
 
+        When a shared dedup server is running (``shared_dedup_server`` in this
+        process, or SDC_DEDUP__SERVER_SOCKET), returns a DedupClient of that
+        server instead, so concurrent pipelines share one index. Falls back
+        to a private engine if the server cannot be reached.
+
         Args:
             dedup_engine: Optional injected DedupEngine
 
         Returns:
-            DedupEngine instance configured from central config, or None if dedup unavailable
+            DedupEngine (or DedupClient) configured from central config, or None if dedup unavailable
 
         Example:
             >>> engine = PipelineSetup.create_dedup_engine()
@@ -185,17 +208,53 @@ class PipelineSetup:
         # Load centralized dedup configuration
         config = get_config()
         dedup_settings = config.dedup
+        dedup_config = PipelineSetup.dedup_config_from_settings(dedup_settings)
+
+        socket_path = active_socket() or dedup_settings.server_socket
+        if socket_path:
+            try:
+                return DedupClient(socket_path, dedup_config)
+            except DedupServiceError as e:
+                logger.warning(f"{e}; using a private dedup index")
+
+        return DedupEngine(dedup_config)
 
-        # Create DedupConfig from centralized settings
-        dedup_config = DedupConfig(
+    @staticmethod
+    def create_near_deduplicator(source: str) -> Optional["MinHashDeduplicator"]:
+        """
+        Create the MinHash index for the processing-stage near-duplicate check.
+
+        Returns None unless SDC_DEDUP__PROCESSING_NEAR_DUP enables the check
+        for ``source``. The index is private to the run and only ever holds
+        cleaned texts, so it never matches a record against its own raw form
+        indexed during extraction.
+
+        Args:
+            source: Pipeline source id (e.g., 'bbc-somali')
+        """
+        dedup_settings = get_config().dedup
+        if not dedup_settings.near_dup_enabled(source):
+            return None
+        if not DATASKETCH_AVAILABLE:
+            logger.warning(
+                f"Near-duplicate check enabled for {source} but datasketch is not installed"
+            )
+            return None
+        return MinHashDeduplicator(
+            similarity_threshold=dedup_settings.similarity_threshold,
+            num_shards=dedup_settings.num_shards,
+        )
+
+    @staticmethod
+    def dedup_config_from_settings(dedup_settings) -> "DedupConfig":
+        """Build the DedupConfig for ``config.dedup`` (SDC_DEDUP__*)."""
+        return DedupConfig(
             hash_fields=dedup_settings.hash_fields,
             enable_minhash=dedup_settings.enable_minhash,
             similarity_threshold=dedup_settings.similarity_threshold,
             num_shards=dedup_settings.num_shards,
         )
 
-        return DedupEngine(dedup_config)
-
     @staticmethod
     def create_default_http_session(
         max_retries: int = 5,
@@ -2,6 +2,9 @@
 
 import asyncio
 import json
+from collections.abc import Iterator
+from contextlib import closing
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from http.client import RemoteDisconnected
 from pathlib import Path
@@ -12,10 +15,12 @@ from bs4 import BeautifulSoup
 from tqdm import tqdm
 from urllib3.exceptions import ProtocolError
 
+from ....infra.http_cache import CachingClientSession, get_http_cache, is_replay_miss
 from ....infra.logging_utils import set_context
 from ....infra.metrics import MetricsCollector, PipelineType, QualityReporter
 from ....infra.rate_limiter import TimedRequest
 from ....ingestion.pipeline_setup import PipelineSetup
+from ....ingestion.work_queue import claimed_batches
 
 try:
     import aiohttp
@@ -23,6 +28,7 @@ except ImportError:
     aiohttp = None
 
 _REQUEST_TIMEOUT = 30
+_MAX_RATE_LIMIT_RETRIES = 2
 
 
 def _extract_paragraphs_from_soup(soup: BeautifulSoup) -> str:
@@ -49,15 +55,28 @@ def compute_text_hash(processor, text: str, url: str) -> str:
 
 
 async def fetch_article_async(
-    processor, session: "aiohttp.ClientSession", url: str, semaphore: asyncio.Semaphore
+    processor, session: "aiohttp.ClientSession", url: str
 ) -> dict[str, Any]:
-    """Fetch a single article asynchronously."""
-    async with semaphore:
-        try:
-            conditional_headers = processor.ledger.get_conditional_headers(url)
-            headers = {**processor.headers, **conditional_headers}
+    """
+    Fetch a single article asynchronously.
+
+    Pacing, concurrency and Retry-After are enforced by the rate-limiter trace
+    config on ``session``; a 429 is retried after the limiter's back-off.
+    """
+    try:
+        conditional_headers = processor.ledger.get_conditional_headers(url)
+        headers = {**processor.headers, **conditional_headers}
+
+        for attempt in range(_MAX_RATE_LIMIT_RETRIES + 1):
+            async with session.get(url, headers=headers) as response:
+                if response.status == 429 and attempt < _MAX_RATE_LIMIT_RETRIES:
+                    processor.metrics.record_http_status(429)
+                    processor.metrics.increment("rate_limit_errors")
+                    continue
+
+                if is_replay_miss(response):
+                    return {"url": url, "status": response.status, "replay_miss": True}
 
-            async with session.get(url, headers=headers, timeout=_REQUEST_TIMEOUT) as response:
                 if response.status == 304:
                     processor.logger.info(f"Article not modified: {url}")
                     processor.metrics.increment("urls_not_modified")
@@ -71,27 +90,43 @@ async def fetch_article_async(
                     "etag": response.headers.get("ETag"),
                     "last_modified": response.headers.get("Last-Modified"),
                 }
-        except asyncio.TimeoutError:
-            processor.logger.warning(f"Timeout fetching {url}")
-            return {"url": url, "error": "timeout", "status": None}
-        except aiohttp.ClientError as err:
-            error_msg = str(err)
-            processor.logger.warning(f"Client error fetching {url}: {error_msg}")
-            return {"url": url, "error": error_msg, "status": getattr(err, "status", None)}
-        except Exception as err:
-            processor.logger.error(f"Unexpected error fetching {url}: {err}")
-            return {"url": url, "error": str(err), "status": None}
-
-
-async def fetch_all_articles_async(
-    processor, urls: list[str], max_concurrent: int = 10
-) -> list[dict]:
-    """Fetch multiple articles concurrently."""
-    semaphore = asyncio.Semaphore(max_concurrent)
-    timeout = aiohttp.ClientTimeout(total=60, connect=10, sock_read=30)
-
-    async with aiohttp.ClientSession(timeout=timeout) as session:
-        tasks = [fetch_article_async(processor, session, url, semaphore) for url in urls]
+    except asyncio.TimeoutError:
+        processor.logger.warning(f"Timeout fetching {url}")
+        return {"url": url, "error": "timeout", "status": None}
+    except aiohttp.ClientError as err:
+        error_msg = str(err)
+        processor.logger.warning(f"Client error fetching {url}: {error_msg}")
+        return {"url": url, "error": error_msg, "status": getattr(err, "status", None)}
+    except Exception as err:
+        processor.logger.error(f"Unexpected error fetching {url}: {err}")
+        return {"url": url, "error": str(err), "status": None}
+
+
+def _is_replay(processor) -> bool:
+    """True when extraction is served entirely from the HTTP response cache."""
+    return processor.config.http.cache_mode == "replay"
+
+
+def _mark_failed(processor, url: str, reason: str) -> None:
+    """Record a failed fetch in the ledger; offline replay leaves retry counts alone."""
+    if not _is_replay(processor):
+        processor.ledger.mark_failed(url, reason)
+
+
+async def fetch_all_articles_async(processor, urls: list[str]) -> list[dict]:
+    """Fetch multiple articles concurrently, paced by the processor's async rate limiter."""
+    limiter = processor.async_rate_limiter
+    # No ``total`` timeout: aiohttp starts it before trace hooks, so it would
+    # also count time spent waiting for a rate-limiter slot.
+    timeout = aiohttp.ClientTimeout(total=None, sock_connect=10, sock_read=_REQUEST_TIMEOUT)
+    cache_mode = processor.config.http.cache_mode
+
+    async with aiohttp.ClientSession(
+        timeout=timeout, trace_configs=[limiter.trace_config()]
+    ) as session:
+        if cache_mode in ("readwrite", "replay"):
+            session = CachingClientSession(session, get_http_cache(), cache_mode)
+        tasks = [fetch_article_async(processor, session, url) for url in urls]
         results = []
         for coro in tqdm(
             asyncio.as_completed(tasks),
@@ -100,7 +135,9 @@ async def fetch_all_articles_async(
             unit="article",
         ):
             results.append(await coro)
-        return results
+
+    processor.logger.info(f"Async rate limiter: {limiter.get_statistics()}")
+    return results
 
 
 def parse_article_from_html(processor, html: str, url: str) -> Optional[dict]:
@@ -140,6 +177,13 @@ def parse_article_from_html(processor, html: str, url: str) -> Optional[dict]:
 # ---------------------------------------------------------------------------
 
 
+def _ensure_metrics(processor) -> None:
+    if processor.metrics is None:
+        processor.metrics = MetricsCollector(
+            processor.run_id, "BBC-Somali", pipeline_type=PipelineType.WEB_SCRAPING
+        )
+
+
 def _load_links_with_quota(processor) -> tuple[list[str], Optional[int]]:
     """Load links, init metrics, apply quota. Returns (links, quota_limit); links=[] on exhaustion."""
     with open(processor.article_links_file, encoding="utf-8") as handle:
@@ -147,24 +191,32 @@ def _load_links_with_quota(processor) -> tuple[list[str], Optional[int]]:
         links = data["links"]
 
     quota_limit = processor.config.orchestration.get_quota("bbc")
-    has_quota, remaining = processor.ledger.check_quota_available("bbc", quota_limit)
 
-    if processor.metrics is None:
-        processor.metrics = MetricsCollector(
-            processor.run_id, "BBC-Somali", pipeline_type=PipelineType.WEB_SCRAPING
-        )
+    _ensure_metrics(processor)
 
-    if not has_quota:
-        processor.logger.warning(f"Daily quota already reached for BBC: {quota_limit} articles")
-        processor.metrics.increment("quota_hit")
-        return [], quota_limit
+    if _is_replay(processor):
+        # Replay never touches bbc.com, so it does not spend the daily quota
+        processor.logger.info(f"Replaying {len(links)} links from the HTTP response cache")
+        return links, None
 
-    if quota_limit is not None and remaining < len(links):
-        processor.logger.info(
-            f"Quota enforcement: processing {remaining} of {len(links)} links "
-            f"(quota: {quota_limit} articles/day)"
-        )
-        links = links[:remaining]
+    if quota_limit is not None:
+        # Reserve before fetching: the ledger grants atomically, so concurrent
+        # runs cannot all see the same "remaining" and over-fetch. Unused units
+        # are handed back by _release_unused_quota once extraction finishes; a
+        # crashed run keeps its reservation for the day (under- never over-fetch).
+        granted = processor.ledger.reserve_daily_quota("bbc", len(links), quota_limit)
+        if granted == 0:
+            processor.logger.warning(f"Daily quota already reached for BBC: {quota_limit} articles")
+            processor.metrics.increment("quota_hit")
+            return [], quota_limit
+        if granted < len(links):
+            processor.logger.info(
+                f"Quota enforcement: processing {granted} of {len(links)} links "
+                f"(quota: {quota_limit} articles/day)"
+            )
+            links = links[:granted]
+        else:
+            processor.logger.info(f"Processing {len(links)} links (quota: {quota_limit})")
     else:
         processor.logger.info(
             f"Processing {len(links)} links (quota: {quota_limit or 'unlimited'})"
@@ -173,6 +225,100 @@ def _load_links_with_quota(processor) -> tuple[list[str], Optional[int]]:
     return links, quota_limit
 
 
+def _worker_mode(processor) -> bool:
+    """True when links are claimed from the ledger frontier (``worker_id`` set)."""
+    return processor.worker_id is not None
+
+
+@dataclass
+class _LinkPlan:
+    """Link batches to extract, plus the quota reserved for them so far."""
+
+    batches: Iterator[list[str]]
+    quota_limit: Optional[int]
+    reserved: int = 0
+    links: Optional[list[str]] = None  # Links-file mode only
+
+
+def _link_plan(processor) -> Optional[_LinkPlan]:
+    """
+    Plan the links to extract, or None if the quota is already exhausted.
+
+    Without a worker id, the article links file is one batch reserved up
+    front. With one, batches are leased from the ledger frontier (see
+    ``work_queue.claimed_batches``), so several workers (processes, or hosts
+    sharing a PostgreSQL ledger) split the discovered URLs without overlap.
+    """
+    if not _worker_mode(processor):
+        links, quota_limit = _load_links_with_quota(processor)
+        if not links:
+            return None
+        return _LinkPlan(iter([links]), quota_limit, reserved=len(links), links=links)
+
+    _ensure_metrics(processor)
+    bbc_config = processor.config.scraping.bbc
+    quota_limit = None if _is_replay(processor) else processor.config.orchestration.get_quota("bbc")
+    plan = _LinkPlan(iter([]), quota_limit)
+    plan.batches = _claimed_link_batches(
+        processor,
+        plan,
+        batch_size=bbc_config.claim_batch_size,
+        lease_seconds=bbc_config.lease_seconds,
+    )
+    processor.logger.info(
+        f"Worker {processor.worker_id}: claiming links from the ledger "
+        f"(quota: {quota_limit or 'unlimited'})"
+    )
+    return plan
+
+
+def _claimed_link_batches(
+    processor, plan: _LinkPlan, batch_size: int, lease_seconds: float
+) -> Iterator[list[str]]:
+    """Lease link batches for this worker, reserving daily quota per batch."""
+    with closing(
+        claimed_batches(
+            processor.ledger,
+            processor.source,
+            processor.worker_id,
+            batch_size=batch_size,
+            lease_seconds=lease_seconds,
+            limit=processor.max_articles,
+        )
+    ) as batches:
+        for batch in batches:
+            if plan.quota_limit is not None:
+                granted = processor.ledger.reserve_daily_quota("bbc", len(batch), plan.quota_limit)
+                plan.reserved += granted
+                if granted == 0:
+                    processor.logger.warning(
+                        f"Daily quota reached for BBC: {plan.quota_limit} articles"
+                    )
+                    processor.metrics.increment("quota_hit")
+                    return
+                batch = batch[:granted]
+            yield batch
+
+
+def _prepare_extraction(processor) -> Optional[Path]:
+    """Check inputs and the staging file; returns the staging Path to skip extraction."""
+    if _worker_mode(processor):
+        # The ledger frontier, not the staging file, tracks what is left: an
+        # existing file (e.g. from a failed async attempt) is appended to
+        processor.staging_dir.mkdir(parents=True, exist_ok=True)
+        return None
+    if not processor.article_links_file.exists():
+        raise FileNotFoundError(f"Article links not found: {processor.article_links_file}")
+    return _handle_staging_guard(processor)
+
+
+def _finish_quota(processor, plan: _LinkPlan, written: int) -> None:
+    """Release unused quota and, for a links file, record links left for the next run."""
+    _release_unused_quota(processor, plan.reserved, written, plan.quota_limit)
+    if plan.links is not None:
+        _maybe_mark_quota_hit(processor, plan.links, plan.quota_limit)
+
+
 def _handle_staging_guard(processor) -> Optional[Path]:
     """Return existing staging Path to skip extraction, or None to proceed."""
     processor.staging_dir.mkdir(parents=True, exist_ok=True)
@@ -195,7 +341,6 @@ def _write_article_record(
     http_status: int,
     etag: Optional[str],
     last_modified: Optional[str],
-    quota_limit: Optional[int],
 ) -> bool:
     """Dedup-check, write to staging + raw dir, update ledger/metrics. Returns True if written."""
     is_dup, dup_type, similar_url, text_hash, minhash_sig = processor.dedup.process_document(
@@ -227,9 +372,6 @@ def _write_article_record(
     processor.metrics.record_text_length(len(article["text"]))
     staging_out.write(json.dumps(article, ensure_ascii=False) + "\n")
 
-    if quota_limit is not None:
-        processor.ledger.increment_daily_quota(source="bbc", count=1, quota_limit=quota_limit)
-
     individual_file = (
         processor.raw_dir / f"bbc-somali_{processor.run_id}_raw_article-{index:04d}.json"
     )
@@ -239,6 +381,15 @@ def _write_article_record(
     return True
 
 
+def _release_unused_quota(
+    processor, reserved: int, written: int, quota_limit: Optional[int]
+) -> None:
+    """Give back quota reserved for links that did not produce a written article."""
+    if quota_limit is None or written >= reserved:
+        return
+    processor.ledger.release_daily_quota("bbc", reserved - written)
+
+
 def _maybe_mark_quota_hit(processor, links: list, quota_limit: Optional[int]) -> None:
     """Record quota-hit event when fewer links were processed than available."""
     if quota_limit is None:
@@ -289,15 +440,12 @@ def _log_extraction_summary(
 
 def extract_async(processor) -> Path:
     """Scrape articles using async HTTP."""
-    if not processor.article_links_file.exists():
-        raise FileNotFoundError(f"Article links not found: {processor.article_links_file}")
-
-    early = _handle_staging_guard(processor)
+    early = _prepare_extraction(processor)
     if early is not None:
         return early
 
-    links, quota_limit = _load_links_with_quota(processor)
-    if not links:
+    plan = _link_plan(processor)
+    if plan is None:
         return processor.staging_file
 
     set_context(run_id=processor.run_id, source="bbc-somali", phase="fetch")
@@ -306,61 +454,33 @@ def extract_async(processor) -> Path:
     processor.logger.info("PHASE 2: Article Extraction (Async)")
     processor.logger.info("=" * 60)
 
-    urls_to_fetch = []
-    for url in links:
-        if processor.ledger.should_fetch_url(url, force=processor.force):
-            urls_to_fetch.append(url)
-        else:
-            processor.metrics.increment("urls_skipped")
-
-    processor.logger.info(f"Fetching {len(urls_to_fetch)} articles (async)...")
-    fetch_results = asyncio.run(fetch_all_articles_async(processor, urls_to_fetch))
-
+    replay = _is_replay(processor)
     articles_count = 0
     failed_count = 0
-
-    with open(processor.staging_file, "w", encoding="utf-8") as staging_out:
-        for index, result in enumerate(fetch_results, 1):
-            url = result["url"]
-            if result.get("not_modified"):
-                continue
-            if "error" in result:
-                processor.ledger.mark_failed(url, result["error"])
-                processor.metrics.increment("urls_failed")
-                processor.metrics.record_error(result["error"])
-                failed_count += 1
-                continue
-
-            html = result.get("html")
-            if not html:
-                processor.ledger.mark_failed(url, "Empty HTML")
-                processor.metrics.increment("urls_failed")
-                failed_count += 1
-                continue
-
-            article = parse_article_from_html(processor, html, url)
-            if not article or not article.get("text"):
-                processor.ledger.mark_failed(url, "Failed to parse or empty text")
-                processor.metrics.increment("urls_failed")
-                failed_count += 1
-                continue
-
-            written = _write_article_record(
-                processor,
-                staging_out,
-                article,
-                url=url,
-                index=index,
-                http_status=result["status"],
-                etag=result.get("etag"),
-                last_modified=result.get("last_modified"),
-                quota_limit=quota_limit,
-            )
-            if written:
-                articles_count += 1
-
-    _maybe_mark_quota_hit(processor, links, quota_limit)
-    _log_extraction_summary(processor, articles_count, len(urls_to_fetch), failed_count)
+    attempted = 0
+
+    with closing(plan.batches):
+        for links in plan.batches:
+            urls_to_fetch = []
+            for url in links:
+                if replay or processor.ledger.should_fetch_url(url, force=processor.force):
+                    urls_to_fetch.append(url)
+                else:
+                    processor.metrics.increment("urls_skipped")
+
+            processor.logger.info(f"Fetching {len(urls_to_fetch)} articles (async)...")
+            fetch_results = asyncio.run(fetch_all_articles_async(processor, urls_to_fetch))
+
+            with open(processor.staging_file, "a", encoding="utf-8") as staging_out:
+                written, failed = _write_fetch_results(
+                    processor, staging_out, fetch_results, first_index=attempted + 1
+                )
+            articles_count += written
+            failed_count += failed
+            attempted += len(urls_to_fetch)
+
+    _finish_quota(processor, plan, articles_count)
+    _log_extraction_summary(processor, articles_count, attempted, failed_count)
 
     metrics_path = Path("data/metrics") / f"{processor.run_id}_extraction.json"
     metrics_path.parent.mkdir(parents=True, exist_ok=True)
@@ -373,17 +493,74 @@ def extract_async(processor) -> Path:
     return processor.staging_file
 
 
+def _write_fetch_results(
+    processor, staging_out, fetch_results: list[dict], first_index: int = 1
+) -> tuple[int, int]:
+    """Record async fetch results in the ledger and staging file. Returns (written, failed)."""
+    articles_count = 0
+    failed_count = 0
+    for index, result in enumerate(fetch_results, first_index):
+        url = result["url"]
+        if result.get("not_modified"):
+            continue
+        if result.get("replay_miss"):
+            processor.metrics.increment("urls_skipped")
+            continue
+        if "error" in result:
+            _mark_failed(processor, url, result["error"])
+            processor.metrics.increment("urls_failed")
+            processor.metrics.record_error(result["error"])
+            failed_count += 1
+            continue
+
+        html = result.get("html")
+        if not html:
+            _mark_failed(processor, url, "Empty HTML")
+            processor.metrics.increment("urls_failed")
+            failed_count += 1
+            continue
+
+        article = parse_article_from_html(processor, html, url)
+        if not article or not article.get("text"):
+            _mark_failed(processor, url, "Failed to parse or empty text")
+            processor.metrics.increment("urls_failed")
+            failed_count += 1
+            continue
+
+        written = _write_article_record(
+            processor,
+            staging_out,
+            article,
+            url=url,
+            index=index,
+            http_status=result["status"],
+            etag=result.get("etag"),
+            last_modified=result.get("last_modified"),
+        )
+        if written:
+            articles_count += 1
+    return articles_count, failed_count
+
+
+@dataclass
+class _SyncScrapeTally:
+    """Running totals (and the current HTTP session) of a sync extraction."""
+
+    session: requests.Session
+    articles: int = 0
+    failed: int = 0
+    attempted: int = 0
+    connection_errors: int = 0
+
+
 def extract_sync(processor) -> Path:
     """Scrape articles synchronously."""
-    if not processor.article_links_file.exists():
-        raise FileNotFoundError(f"Article links not found: {processor.article_links_file}")
-
-    early = _handle_staging_guard(processor)
+    early = _prepare_extraction(processor)
     if early is not None:
         return early
 
-    links, quota_limit = _load_links_with_quota(processor)
-    if not links:
+    plan = _link_plan(processor)
+    if plan is None:
         return processor.staging_file
 
     set_context(run_id=processor.run_id, source="bbc-somali", phase="fetch")
@@ -392,109 +569,125 @@ def extract_sync(processor) -> Path:
     processor.logger.info("PHASE 2: Article Extraction (Sync)")
     processor.logger.info("=" * 60)
 
-    session = processor._get_http_session()
-    articles_count = 0
-    failed_count = 0
-    connection_errors = 0
-
-    with open(processor.staging_file, "w", encoding="utf-8") as staging_out:
-        with tqdm(total=len(links), desc="Scraping BBC articles", unit="article") as pbar:
-            for index, link in enumerate(links, 1):
-                with TimedRequest() as timer:
-                    try:
-                        if not processor.ledger.should_fetch_url(link, force=processor.force):
-                            processor.metrics.increment("urls_skipped")
-                            pbar.update(1)
-                            continue
-
-                        article = processor._scrape_article(session, link)
-                        if article and article.get("text"):
-                            written = _write_article_record(
-                                processor,
-                                staging_out,
-                                article,
-                                url=link,
-                                index=index,
-                                http_status=200,
-                                etag=None,
-                                last_modified=None,
-                                quota_limit=quota_limit,
-                            )
-                            if written:
-                                articles_count += 1
-                                if index == 1 or index % 10 == 0:
-                                    word_count = len(article["text"].split())
-                                    processor.logger.info(
-                                        f"Article {index}: {word_count} words extracted"
-                                    )
-                        else:
-                            processor.ledger.mark_failed(link, "Failed to scrape or empty text")
-                            processor.metrics.increment("urls_failed")
-                            processor.metrics.record_error("scrape_failed")
-                            failed_count += 1
-                    except (RemoteDisconnected, ProtocolError, ConnectionError) as err:
-                        error_type = type(err).__name__
-                        processor.logger.warning(
-                            f"Connection error on article {index}/{len(links)} ({link}): {error_type} - skipping and continuing"
-                        )
-                        processor.ledger.mark_failed(link, f"Connection error: {error_type}")
-                        processor.metrics.increment("urls_failed")
-                        processor.metrics.record_error("connection_error")
-                        failed_count += 1
-                        connection_errors += 1
-                        if connection_errors % 3 == 0:
-                            processor.logger.info(
-                                "Resetting HTTP session due to repeated connection errors"
-                            )
-                            session = processor._get_http_session()
+    tally = _SyncScrapeTally(session=processor._get_http_session())
+    mode = "a" if _worker_mode(processor) else "w"
+    with closing(plan.batches), open(processor.staging_file, mode, encoding="utf-8") as staging_out:
+        for links in plan.batches:
+            _scrape_links_sync(processor, staging_out, links, tally)
+
+    extra = (
+        [f"Connection errors encountered: {tally.connection_errors}"]
+        if tally.connection_errors > 0
+        else None
+    )
+    _finish_quota(processor, plan, tally.articles)
+    _log_extraction_summary(
+        processor, tally.articles, tally.attempted, tally.failed, extra_lines=extra
+    )
+    processor._export_stage_metrics("extraction")
+    processor._generate_quality_report("extraction")
+    return processor.staging_file
+
+
+def _scrape_links_sync(processor, staging_out, links: list[str], tally: _SyncScrapeTally) -> None:
+    """Scrape one list of links, updating ``tally``."""
+    replay = _is_replay(processor)
+    total = tally.attempted + len(links)
+
+    with tqdm(total=len(links), desc="Scraping BBC articles", unit="article") as pbar:
+        for index, link in enumerate(links, tally.attempted + 1):
+            tally.attempted = index
+            with TimedRequest(processor.rate_limiter) as timer:
+                try:
+                    if not replay and not processor.ledger.should_fetch_url(
+                        link, force=processor.force
+                    ):
+                        processor.metrics.increment("urls_skipped")
                         pbar.update(1)
                         continue
-                    except requests.HTTPError as err:
-                        if err.response.status_code == 429:
-                            retry_after = err.response.headers.get("Retry-After")
-                            processor.rate_limiter.handle_429(retry_after)
-                            processor.metrics.record_http_status(429)
-                            processor.metrics.increment("rate_limit_errors")
-                            pbar.update(1)
-                            continue
-                        processor.logger.warning(
-                            f"HTTP {err.response.status_code} on article {index}/{len(links)} ({link}) - skipping and continuing"
+
+                    article = processor._scrape_article(tally.session, link)
+                    if article and article.get("text"):
+                        written = _write_article_record(
+                            processor,
+                            staging_out,
+                            article,
+                            url=link,
+                            index=index,
+                            http_status=200,
+                            etag=None,
+                            last_modified=None,
                         )
-                        processor.ledger.mark_failed(link, f"HTTP {err.response.status_code}")
-                        processor.metrics.record_http_status(err.response.status_code)
+                        if written:
+                            tally.articles += 1
+                            if index == 1 or index % 10 == 0:
+                                word_count = len(article["text"].split())
+                                processor.logger.info(
+                                    f"Article {index}: {word_count} words extracted"
+                                )
+                    else:
+                        _mark_failed(processor, link, "Failed to scrape or empty text")
                         processor.metrics.increment("urls_failed")
-                        failed_count += 1
+                        processor.metrics.record_error("scrape_failed")
+                        tally.failed += 1
+                except (RemoteDisconnected, ProtocolError, ConnectionError) as err:
+                    error_type = type(err).__name__
+                    processor.logger.warning(
+                        f"Connection error on article {index}/{total} ({link}): {error_type} - skipping and continuing"
+                    )
+                    _mark_failed(processor, link, f"Connection error: {error_type}")
+                    processor.metrics.increment("urls_failed")
+                    processor.metrics.record_error("connection_error")
+                    tally.failed += 1
+                    tally.connection_errors += 1
+                    if tally.connection_errors % 3 == 0:
+                        processor.logger.info(
+                            "Resetting HTTP session due to repeated connection errors"
+                        )
+                        tally.session = processor._get_http_session()
+                    pbar.update(1)
+                    continue
+                except requests.HTTPError as err:
+                    if replay and is_replay_miss(err.response):
+                        processor.metrics.increment("urls_skipped")
                         pbar.update(1)
                         continue
-                    except requests.Timeout:
-                        processor.logger.warning(
-                            f"Timeout on article {index}/{len(links)} ({link}) - skipping and continuing"
-                        )
-                        processor.ledger.mark_failed(link, "Timeout")
-                        processor.metrics.increment("urls_failed")
-                        processor.metrics.record_error("timeout")
-                        failed_count += 1
+                    if err.response.status_code == 429:
+                        retry_after = err.response.headers.get("Retry-After")
+                        processor.rate_limiter.handle_429(retry_after)
+                        processor.metrics.record_http_status(429)
+                        processor.metrics.increment("rate_limit_errors")
                         pbar.update(1)
                         continue
-
-                    processor.metrics.record_fetch_duration(timer.get_elapsed_ms())
+                    processor.logger.warning(
+                        f"HTTP {err.response.status_code} on article {index}/{total} ({link}) - skipping and continuing"
+                    )
+                    _mark_failed(processor, link, f"HTTP {err.response.status_code}")
+                    processor.metrics.record_http_status(err.response.status_code)
+                    processor.metrics.increment("urls_failed")
+                    tally.failed += 1
                     pbar.update(1)
-                    pbar.set_postfix(
-                        {
-                            "extracted": articles_count,
-                            "failed": failed_count,
-                            "success_rate": f"{(articles_count / index) * 100:.1f}%",
-                        }
+                    continue
+                except requests.Timeout:
+                    processor.logger.warning(
+                        f"Timeout on article {index}/{total} ({link}) - skipping and continuing"
                     )
-
-    extra = (
-        [f"Connection errors encountered: {connection_errors}"] if connection_errors > 0 else None
-    )
-    _maybe_mark_quota_hit(processor, links, quota_limit)
-    _log_extraction_summary(processor, articles_count, len(links), failed_count, extra_lines=extra)
-    processor._export_stage_metrics("extraction")
-    processor._generate_quality_report("extraction")
-    return processor.staging_file
+                    _mark_failed(processor, link, "Timeout")
+                    processor.metrics.increment("urls_failed")
+                    processor.metrics.record_error("timeout")
+                    tally.failed += 1
+                    pbar.update(1)
+                    continue
+
+                processor.metrics.record_fetch_duration(timer.get_elapsed_ms())
+                pbar.update(1)
+                pbar.set_postfix(
+                    {
+                        "extracted": tally.articles,
+                        "failed": tally.failed,
+                        "success_rate": f"{(tally.articles / index) * 100:.1f}%",
+                    }
+                )
 
 
 def scrape_article(processor, session: requests.Session, url: str) -> Optional[dict]:
@@ -8,7 +8,6 @@ Ethically scrapes BBC Somali for news articles following best practices:
 - Inherits shared orchestration from BasePipeline
 """
 
-import asyncio
 import json
 from collections.abc import Iterator
 from pathlib import Path
@@ -17,7 +16,6 @@ from typing import Any, Optional
 import feedparser
 import requests
 from bs4 import BeautifulSoup
-from tqdm import tqdm
 
 try:
     import aiohttp
@@ -28,12 +26,18 @@ except ImportError:
     aiohttp = None
 
 from ...infra.config import get_config
-from ...infra.rate_limiter import AdaptiveRateLimiter, RateLimitConfig
+from ...infra.rate_limiter import (
+    AdaptiveRateLimiter,
+    AsyncAdaptiveRateLimiter,
+    LedgerTokenBucket,
+    RateLimitConfig,
+)
 from ...quality.text_cleaners import TextCleaningPipeline, create_html_cleaner
 from ..base_pipeline import BasePipeline, RawRecord
 from ..crawl_ledger import get_ledger
 from ..pipeline_setup import PipelineSetup
 from ..processor_registry import register_processor
+from ..staging_reader import read_lines, resume_offset, staging_position
 from .bbc.discovery import (
     discover_topic_sections,
     extract_article_links_from_soup,
@@ -47,6 +51,8 @@ from .bbc.extraction import (
     compute_text_hash,
     extract_async,
     extract_sync,
+    fetch_all_articles_async,
+    fetch_article_async,
     get_http_session,
     parse_article_from_html,
     scrape_article,
@@ -69,6 +75,7 @@ class BBCSomaliProcessor(BasePipeline):
         force: bool = False,
         run_seed: Optional[str] = None,
         ledger=None,
+        worker_id: Optional[str] = None,
     ):
         """
         Initialize BBC Somali processor.
@@ -77,6 +84,8 @@ class BBCSomaliProcessor(BasePipeline):
             max_articles: Maximum number of articles to scrape (None = unlimited, scrapes all discovered)
             delay_range: (min, max) seconds to wait between requests
             force: Force reprocessing even if output files exist (default: False)
+            worker_id: Claim URLs from the shared ledger frontier under this id instead of
+                reading the article links file, so several workers can split one crawl
         """
         # Load config FIRST (before super().__init__())
         config = get_config()
@@ -102,6 +111,7 @@ class BBCSomaliProcessor(BasePipeline):
         }
         self.max_articles = max_articles
         self.delay_range = delay_range
+        self.worker_id = worker_id
 
         # Configure adaptive rate limiter from config
         bbc_config = config.scraping.bbc
@@ -113,8 +123,20 @@ class BBCSomaliProcessor(BasePipeline):
             requests_per_hour=bbc_config.max_requests_per_hour,
             jitter=bbc_config.jitter,
             adaptive=True,
+            target_latency_ms=bbc_config.target_latency_ms,
+            max_concurrency=bbc_config.max_concurrent_requests,
+        )
+        # Hourly budget is global across concurrent runs/containers when sharing the ledger
+        shared_bucket = None
+        if bbc_config.shared_rate_limit and bbc_config.max_requests_per_hour:
+            shared_bucket = LedgerTokenBucket(
+                self.ledger, requests_per_hour=bbc_config.max_requests_per_hour
+            )
+        self.rate_limiter = AdaptiveRateLimiter(
+            rate_config, shared_bucket=shared_bucket, bucket_key="www.bbc.com"
         )
-        self.rate_limiter = AdaptiveRateLimiter(rate_config)
+        # Shared across all coroutines of the async extraction path (per-host pacing + AIMD)
+        self.async_rate_limiter = AsyncAdaptiveRateLimiter(rate_config, shared_bucket=shared_bucket)
 
         # File paths (BBC-specific naming)
         # Pattern: {source_slug}_{run_id}_{layer}_{descriptive_name}.{ext}
@@ -278,93 +300,36 @@ class BBCSomaliProcessor(BasePipeline):
         return download_bbc_articles(self)
 
     async def _fetch_article_async(
-        self, session: "aiohttp.ClientSession", url: str, semaphore: asyncio.Semaphore
+        self, session: "aiohttp.ClientSession", url: str
     ) -> dict[str, Any]:
         """
         Fetch single article asynchronously.
 
+        Pacing is applied by the session's rate-limiter trace config.
+
         Args:
             session: aiohttp ClientSession
             url: Article URL to fetch
-            semaphore: Semaphore to limit concurrent requests
 
         Returns:
             Dictionary with article data or error information
         """
-        async with semaphore:
-            try:
-                # Get conditional headers from ledger
-                conditional_headers = self.ledger.get_conditional_headers(url)
-                headers = {**self.headers, **conditional_headers}
-
-                async with session.get(url, headers=headers, timeout=30) as response:
-                    # Handle 304 Not Modified
-                    if response.status == 304:
-                        self.logger.info(f"Article not modified: {url}")
-                        self.metrics.increment("urls_not_modified")
-                        return {"url": url, "status": 304, "not_modified": True}
-
-                    response.raise_for_status()
-
-                    # Extract ETag and Last-Modified for future requests
-                    etag = response.headers.get("ETag")
-                    last_modified = response.headers.get("Last-Modified")
-
-                    html = await response.text()
-                    return {
-                        "url": url,
-                        "html": html,
-                        "status": response.status,
-                        "etag": etag,
-                        "last_modified": last_modified,
-                    }
-
-            except asyncio.TimeoutError:
-                self.logger.warning(f"Timeout fetching {url}")
-                return {"url": url, "error": "timeout", "status": None}
-
-            except aiohttp.ClientError as e:
-                error_msg = str(e)
-                self.logger.warning(f"Client error fetching {url}: {error_msg}")
-                return {"url": url, "error": error_msg, "status": getattr(e, "status", None)}
+        return await fetch_article_async(self, session, url)
 
-            except Exception as e:
-                self.logger.error(f"Unexpected error fetching {url}: {e}")
-                return {"url": url, "error": str(e), "status": None}
-
-    async def _fetch_all_articles_async(
-        self, urls: list[str], max_concurrent: int = 10
-    ) -> list[dict]:
+    async def _fetch_all_articles_async(self, urls: list[str]) -> list[dict]:
         """
         Fetch multiple articles concurrently using async HTTP.
 
+        Concurrency and request rate are governed by ``self.async_rate_limiter``
+        (per-host token bucket, AIMD concurrency window, Retry-After).
+
         Args:
             urls: List of article URLs to fetch
-            max_concurrent: Maximum number of concurrent requests (default: 10)
 
         Returns:
             List of article data dictionaries
         """
-        semaphore = asyncio.Semaphore(max_concurrent)
-
-        # Configure aiohttp session with timeout
-        timeout = aiohttp.ClientTimeout(total=60, connect=10, sock_read=30)
-
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            tasks = [self._fetch_article_async(session, url, semaphore) for url in urls]
-
-            # Use tqdm for progress tracking
-            results = []
-            for coro in tqdm(
-                asyncio.as_completed(tasks),
-                total=len(tasks),
-                desc="Fetching articles (async)",
-                unit="article",
-            ):
-                result = await coro
-                results.append(result)
-
-            return results
+        return await fetch_all_articles_async(self, urls)
 
     def _parse_article_from_html(self, html: str, url: str) -> Optional[dict]:
         """Parse article content from HTML."""
@@ -400,44 +365,49 @@ class BBCSomaliProcessor(BasePipeline):
         """Scrape articles from discovered links (synchronous version)."""
         return extract_sync(self)
 
-    def _extract_records(self) -> Iterator[RawRecord]:
+    def _extract_records(self, resume_from: Optional[dict[str, Any]] = None) -> Iterator[RawRecord]:
         """
         Extract records from staging file (JSONL format).
 
         Yields RawRecord objects for each BBC article.
         BasePipeline.process() handles the rest (cleaning, writing, logging).
+
+        Args:
+            resume_from: Checkpoint position to seek to (see ``staging_reader``)
         """
         # Stream articles from JSONL staging file
         import re as _re
 
         _bbc_slug_pattern = _re.compile(r"/articles/([a-z0-9]+)(?:[/?#]|$)", _re.IGNORECASE)
 
-        with open(self.staging_file, encoding="utf-8") as f:
-            for line in f:
-                if not line.strip():
-                    continue
-
-                article = json.loads(line)
-                url = article["url"]
-
-                # Extract BBC article slug (e.g. "c8d5dd4l0ryo") from URL as source_id
-                slug_match = _bbc_slug_pattern.search(url)
-                article_id = slug_match.group(1) if slug_match else ""
-
-                yield RawRecord(
-                    title=article["title"],
-                    text=article["text"],
-                    url=url,
-                    metadata={
-                        "date_published": article.get("date"),
-                        "category": article.get("category", "news"),
-                        "scraped_at": article.get("scraped_at"),
-                        "minhash_signature": article.get(
-                            "minhash_signature"
-                        ),  # Pass through for ledger
-                        "source_id": article_id,  # BBC article slug (TD-022)
-                    },
-                )
+        size = self.staging_file.stat().st_size
+        offset = resume_offset(self.staging_file, resume_from)
+        for line, _, end in read_lines(self.staging_file, offset):
+            if not line.strip():
+                continue
+
+            article = json.loads(line)
+            url = article["url"]
+
+            # Extract BBC article slug (e.g. "c8d5dd4l0ryo") from URL as source_id
+            slug_match = _bbc_slug_pattern.search(url)
+            article_id = slug_match.group(1) if slug_match else ""
+
+            yield RawRecord(
+                title=article["title"],
+                text=article["text"],
+                url=url,
+                metadata={
+                    "date_published": article.get("date"),
+                    "category": article.get("category", "news"),
+                    "scraped_at": article.get("scraped_at"),
+                    "minhash_signature": article.get(
+                        "minhash_signature"
+                    ),  # Pass through for ledger
+                    "source_id": article_id,  # BBC article slug (TD-022)
+                },
+                position=staging_position(self.staging_file, end, size),
+            )
 
     def _check_robots_txt(self):
         """
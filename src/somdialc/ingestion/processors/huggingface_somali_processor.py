@@ -15,6 +15,7 @@ Example sources:
 - allenai/gdelt
 """
 
+import importlib.util
 import json
 import logging
 from collections.abc import Iterator
@@ -22,14 +23,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Optional
 
-try:
-    from datasets import DownloadConfig, IterableDataset, load_dataset
-
-    DATASETS_AVAILABLE = True
-except ImportError:
-    DATASETS_AVAILABLE = False
-    IterableDataset = None
-    DownloadConfig = None
+# ``datasets`` costs ~0.5s to import; it is only needed once a dataset is loaded
+DATASETS_AVAILABLE = importlib.util.find_spec("datasets") is not None
 
 from ...infra.config import get_config
 from ...infra.logging_utils import Timer, set_context
@@ -40,10 +35,18 @@ from ..base_pipeline import BasePipeline, RawRecord
 from ..crawl_ledger import get_ledger
 from ..pipeline_setup import PipelineSetup
 from ..processor_registry import register_processor
+from ..staging_reader import read_lines, resume_offset, staging_position
 
 logger = logging.getLogger(__name__)
 
 
+def load_dataset(*args: Any, **kwargs: Any) -> Any:
+    """``datasets.load_dataset``, imported on first use."""
+    from datasets import load_dataset as _load_dataset
+
+    return _load_dataset(*args, **kwargs)
+
+
 @register_processor("huggingface")
 class HuggingFaceSomaliProcessor(BasePipeline):
     """
@@ -714,12 +717,19 @@ class HuggingFaceSomaliProcessor(BasePipeline):
         with open(manifest_path, "w", encoding="utf-8") as f:
             json.dump(manifest, f, indent=2, ensure_ascii=False)
 
-    def _extract_records(self) -> Iterator[RawRecord]:
+    def _extract_records(self, resume_from: Optional[dict[str, Any]] = None) -> Iterator[RawRecord]:
         """
         Replay staged JSONL batches and map to RawRecords.
 
+        Args:
+            resume_from: Checkpoint position (batch file and byte offset) to
+                seek to; earlier batch files are not opened
+
         Yields:
             RawRecord with fields mapped from HF dataset schema
+
+        Raises:
+            ValueError: If ``resume_from`` names a batch file that no longer exists
         """
         staging_dir = self.staging_dir
 
@@ -738,6 +748,12 @@ class HuggingFaceSomaliProcessor(BasePipeline):
             self.logger.warning(f"No batch files found in {staging_dir}")
             return
 
+        if resume_from is not None:
+            names = [batch_file.name for batch_file in batch_files]
+            if resume_from.get("file") not in names:
+                raise ValueError(f"batch file {resume_from.get('file')!r} not found")
+            batch_files = batch_files[names.index(resume_from["file"]) :]
+
         processed_urls = set()
         if not self.force and hasattr(self, "ledger") and self.ledger is not None:
             try:
@@ -751,17 +767,20 @@ class HuggingFaceSomaliProcessor(BasePipeline):
         self.logger.info(f"Replaying {len(batch_files)} JSONL batches")
 
         for batch_file in batch_files:
-            with open(batch_file, encoding="utf-8") as f:
-                for line in f:
-                    record = json.loads(line)
-                    raw_record = self._map_to_raw_record(record)
-
-                    if raw_record.url and raw_record.url in processed_urls:
-                        if hasattr(self, "metrics") and self.metrics is not None:
-                            self.metrics.increment("records_skipped_discovery_dedup")
-                        continue
+            size = batch_file.stat().st_size
+            offset = resume_offset(batch_file, resume_from) if resume_from is not None else 0
+            resume_from = None  # Only the first batch file is entered mid-way
+            for line, _, end in read_lines(batch_file, offset):
+                record = json.loads(line)
+                raw_record = self._map_to_raw_record(record)
+
+                if raw_record.url and raw_record.url in processed_urls:
+                    if hasattr(self, "metrics") and self.metrics is not None:
+                        self.metrics.increment("records_skipped_discovery_dedup")
+                    continue
 
-                    yield raw_record
+                raw_record.position = staging_position(batch_file, end, size)
+                yield raw_record
 
     def _map_to_raw_record(self, record: dict[str, Any]) -> RawRecord:
         """
@@ -24,8 +24,9 @@ Security:
 import bz2
 import json
 import logging
-import signal
-from collections.abc import Iterator
+import os
+import time
+from collections.abc import Callable, Iterator
 from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
@@ -37,6 +38,7 @@ from defusedxml import ElementTree as ET
 from tqdm import tqdm
 
 from ...infra.config import get_config
+from ...infra.download import DownloadError, RangedDownloader
 from ...infra.logging_utils import Timer, set_context
 from ...infra.metrics import MetricsCollector, PipelineType
 from ...quality.text_cleaners import TextCleaningPipeline, create_html_cleaner
@@ -44,6 +46,7 @@ from ..base_pipeline import BasePipeline, RawRecord
 from ..crawl_ledger import get_ledger
 from ..pipeline_setup import PipelineSetup
 from ..processor_registry import register_processor
+from ..staging_reader import read_lines, resume_offset, staging_position
 
 logger = logging.getLogger(__name__)
 
@@ -55,38 +58,36 @@ class XMLParseTimeoutError(Exception):
 
 
 @contextmanager
-def parsing_timeout(seconds: int, file_path: Path):
+def parsing_timeout(seconds: int, file_path: Path) -> Iterator[Callable[[], None]]:
     """
     Context manager for XML parsing timeout.
 
+    Yields a ``check`` callable to call between parse events; it raises once
+    ``seconds`` have passed. A deadline check rather than SIGALRM, which only
+    works on the main thread, while the local scheduler runs each source on
+    a worker thread.
+
     Args:
         seconds: Timeout duration in seconds
         file_path: Path to file being parsed (for error messages)
 
     Raises:
-        XMLParseTimeoutError: If parsing exceeds timeout
+        XMLParseTimeoutError: From ``check`` once parsing exceeds the timeout
 
     Example:
-        >>> with parsing_timeout(300, Path("corpus.xml.bz2")):
-        ...     tree = ET.parse(file_handle)
+        >>> with parsing_timeout(300, Path("corpus.xml.bz2")) as check:
+        ...     for event, elem in ET.iterparse(file_handle):
+        ...         check()
     """
+    deadline = time.monotonic() + seconds
 
-    def timeout_handler(signum, frame):
-        raise XMLParseTimeoutError(f"XML parsing exceeded {seconds}s timeout for file: {file_path}")
+    def check() -> None:
+        if time.monotonic() >= deadline:
+            raise XMLParseTimeoutError(
+                f"XML parsing exceeded {seconds}s timeout for file: {file_path}"
+            )
 
-    # Set alarm signal handler (Unix-only, gracefully degrades on Windows)
-    if hasattr(signal, "SIGALRM"):
-        original_handler = signal.signal(signal.SIGALRM, timeout_handler)
-        signal.alarm(seconds)
-        try:
-            yield
-        finally:
-            signal.alarm(0)  # Disable alarm
-            signal.signal(signal.SIGALRM, original_handler)
-    else:
-        # On Windows, no timeout protection (log warning)
-        logger.warning(f"Timeout protection unavailable on this platform (parsing {file_path})")
-        yield
+    yield check
 
 
 # Corpus metadata mapping - Complete 66 Somali corpora from Språkbanken
@@ -573,6 +574,10 @@ class SprakbankenSomaliProcessor(BasePipeline):
         }
 
         session = self._get_http_session()
+        # Resumable downloads; per-file progress bars would nest inside the corpus bar
+        downloader = RangedDownloader(
+            session, timeout=30, metrics=self.metrics, show_progress=False
+        )
 
         # Download only new corpora (not already in ledger)
         for corpus_id in tqdm(corpora_to_download, desc="Downloading corpora"):
@@ -586,19 +591,17 @@ class SprakbankenSomaliProcessor(BasePipeline):
             if not corpus_file.exists() or self.force:
                 try:
                     self.logger.info(f"Downloading {corpus_id}...")
-                    response = session.get(download_url, stream=True, timeout=30)
-                    response.raise_for_status()
-
-                    int(response.headers.get("Content-Length", 0))
-                    with open(corpus_file, "wb") as f:
-                        for chunk in response.iter_content(chunk_size=8192):
-                            if chunk:
-                                f.write(chunk)
+                    # Partial downloads live above the date_accessed partition, so a
+                    # restart on a later day resumes from the same .part file
+                    result = downloader.download(
+                        download_url, self.raw_dir.parent / corpus_file.name
+                    )
+                    os.replace(result.path, corpus_file)
 
                     self.logger.info(f"  ✓ Downloaded: {corpus_file.name}")
                     self.metrics.increment("files_processed")
 
-                except requests.RequestException as e:
+                except (requests.RequestException, DownloadError) as e:
                     self.logger.error(f"  ✗ Failed to download {corpus_id}: {e}")
                     self.metrics.increment("corpora_failed")
                     continue
@@ -806,7 +809,7 @@ class SprakbankenSomaliProcessor(BasePipeline):
             # Open compressed XML file
             with bz2.open(corpus_file, "rt", encoding="utf-8") as f:
                 # Apply timeout protection
-                with parsing_timeout(timeout_seconds, corpus_file):
+                with parsing_timeout(timeout_seconds, corpus_file) as check_timeout:
                     # Use iterparse for streaming (memory-efficient)
                     context = ET.iterparse(f, events=["start", "end"])
 
@@ -817,6 +820,8 @@ class SprakbankenSomaliProcessor(BasePipeline):
                     text_index = 0
 
                     for event, elem in context:
+                        check_timeout()
+
                         # Capture root element to extract corpus ID
                         if root_elem is None and event == "start" and elem.tag == "corpus":
                             root_elem = elem
@@ -880,6 +885,7 @@ class SprakbankenSomaliProcessor(BasePipeline):
                             text_metadata = self._extract_text_metadata(current_text)
 
                             for page_index, page in enumerate(pages, start=1):
+                                check_timeout()
                                 result = self._process_page_as_document(
                                     page,
                                     corpus_id,
@@ -1131,45 +1137,51 @@ class SprakbankenSomaliProcessor(BasePipeline):
                 tokens.append(word)
         return " ".join(tokens)
 
-    def _extract_records(self) -> Iterator[RawRecord]:
+    def _extract_records(self, resume_from: Optional[dict[str, Any]] = None) -> Iterator[RawRecord]:
         """
         Extract records from staging file.
 
         Yields RawRecord objects for each text in the corpora.
+
+        Args:
+            resume_from: Checkpoint position to seek to (see ``staging_reader``);
+                positions also name the corpus of the record they follow
         """
         if not self.staging_file.exists():
             raise FileNotFoundError(f"Staging file not found: {self.staging_file}")
 
-        with open(self.staging_file, encoding="utf-8") as f:
-            for line in f:
-                record = json.loads(line)
-
-                # Update current corpus metadata for _get_domain()
-                self.current_corpus_metadata = record["metadata"]
-
-                # Build URL
-                corpus_id = record["corpus_id"]
-                url = f"https://spraakbanken.gu.se/korp/?mode=somali#?corpus={corpus_id}"
-
-                # Store corpus_id in metadata to pass to source_id field
-                # Also include minhash_signature and text_hash for ledger tracking
-                metadata_with_corpus_id = {
-                    **record["metadata"],
-                    "corpus_id": corpus_id,  # Will be used to populate source_id
-                }
-
-                # Include dedup metadata if present (for ledger.mark_processed)
-                if "minhash_signature" in record:
-                    metadata_with_corpus_id["minhash_signature"] = record["minhash_signature"]
-                if "text_hash" in record:
-                    metadata_with_corpus_id["text_hash"] = record["text_hash"]
-
-                yield RawRecord(
-                    title=record["title"],
-                    text=record["text"],
-                    url=url,
-                    metadata=metadata_with_corpus_id,
-                )
+        size = self.staging_file.stat().st_size
+        offset = resume_offset(self.staging_file, resume_from)
+        for line, _, end in read_lines(self.staging_file, offset):
+            record = json.loads(line)
+
+            # Update current corpus metadata for _get_domain()
+            self.current_corpus_metadata = record["metadata"]
+
+            # Build URL
+            corpus_id = record["corpus_id"]
+            url = f"https://spraakbanken.gu.se/korp/?mode=somali#?corpus={corpus_id}"
+
+            # Store corpus_id in metadata to pass to source_id field
+            # Also include minhash_signature and text_hash for ledger tracking
+            metadata_with_corpus_id = {
+                **record["metadata"],
+                "corpus_id": corpus_id,  # Will be used to populate source_id
+            }
+
+            # Include dedup metadata if present (for ledger.mark_processed)
+            if "minhash_signature" in record:
+                metadata_with_corpus_id["minhash_signature"] = record["minhash_signature"]
+            if "text_hash" in record:
+                metadata_with_corpus_id["text_hash"] = record["text_hash"]
+
+            yield RawRecord(
+                title=record["title"],
+                text=record["text"],
+                url=url,
+                metadata=metadata_with_corpus_id,
+                position=staging_position(self.staging_file, end, size, corpus_id=corpus_id),
+            )
 
     def _get_http_session(self) -> requests.Session:
         """
@@ -8,6 +8,7 @@ This processor is designed to integrate with the existing pipeline architecture
 while handling the unique aspects of TikTok comment data (social media, informal text).
 """
 
+import hashlib
 import json
 from collections.abc import Iterator
 from pathlib import Path
@@ -19,6 +20,7 @@ from ...quality.text_cleaners import TextCleaningPipeline
 from ..apify_tiktok_client import ApifyTikTokClient
 from ..base_pipeline import BasePipeline, RawRecord
 from ..processor_registry import register_processor
+from ..staging_reader import read_lines, resume_offset, staging_position
 
 
 @register_processor("tiktok")
@@ -427,39 +429,38 @@ class TikTokSomaliProcessor(BasePipeline):
         # Fetch dataset items and write to staging
         dataset_id = scrape_result["dataset_id"]
 
-        # STEP 1: Save raw Apify JSON to local disk
+        # Save raw Apify JSON and transform to staging in one streaming pass
+        # (NO FILTERING!): pages are fetched concurrently and yielded in order,
+        # so each item is written as soon as its page arrives. The raw dump
+        # keeps items as Apify stored them; only the transform cleans them.
+        from somdialc.infra.config import get_config as _get_cfg
+
+        _tiktok_cfg = _get_cfg().scraping.tiktok
         raw_apify_file = self.raw_dir / f"tiktok-somali_{self.run_id}_raw_apify-dataset.jsonl"
         apify_items_count = 0
-
-        self.logger.info(f"Saving raw Apify data to: {raw_apify_file}")
-
-        with open(raw_apify_file, "w", encoding="utf-8") as raw_out:
-            for item in self.apify_client.iter_dataset_items(dataset_id, batch_size=1000):
-                raw_out.write(json.dumps(item, ensure_ascii=False) + "\n")
-                apify_items_count += 1
-
-        self.logger.info(f"Raw Apify data saved: {apify_items_count} items")
-
-        # STEP 2: Transform raw data to staging format (NO FILTERING!)
         comments_count = 0
         skipped_empty = 0
 
-        self.logger.info(f"Transforming {apify_items_count} items to staging format...")
+        self.logger.info(f"Saving raw Apify data to: {raw_apify_file}")
 
         with (
-            open(raw_apify_file, encoding="utf-8") as raw_in,
+            open(raw_apify_file, "w", encoding="utf-8") as raw_out,
             open(self.staging_file, "w", encoding="utf-8") as staging_out,
         ):
-            for line in raw_in:
-                item = json.loads(line)
+            for item in self.apify_client.iter_dataset_items(
+                dataset_id,
+                batch_size=_tiktok_cfg.batch_size,
+                max_concurrency=_tiktok_cfg.dataset_concurrency,
+                clean=_tiktok_cfg.dataset_clean,
+            ):
+                raw_out.write(json.dumps(item, ensure_ascii=False) + "\n")
+                apify_items_count += 1
 
                 # Transform to our format
                 comment_data = self._transform_apify_item(item)
 
                 if comment_data:
                     # Calculate hash for tracking (but DON'T skip duplicates)
-                    import hashlib
-
                     text_hash = hashlib.sha256(comment_data["text"].encode()).hexdigest()
                     comment_data["text_hash"] = text_hash
                     comment_data["minhash_signature"] = ""  # Not using fuzzy matching
@@ -533,6 +534,8 @@ class TikTokSomaliProcessor(BasePipeline):
         # }
 
         try:
+            # Same cleaning as Apify's clean=true: drop hidden fields and empty items
+            item = {key: value for key, value in item.items() if not key.startswith("#")}
             text = item.get("text", "").strip()
             if not text:
                 return None
@@ -606,50 +609,55 @@ class TikTokSomaliProcessor(BasePipeline):
             self.logger.warning(f"Failed to transform Apify item: {e}")
             return None
 
-    def _extract_records(self) -> Iterator[RawRecord]:
+    def _extract_records(self, resume_from: Optional[dict[str, Any]] = None) -> Iterator[RawRecord]:
         """
         Extract records from staging file (JSONL format).
 
         Yields RawRecord objects for each TikTok comment.
         BasePipeline.process() handles the rest.
+
+        Args:
+            resume_from: Checkpoint position to seek to (see ``staging_reader``)
         """
-        with open(self.staging_file, encoding="utf-8") as f:
-            for line in f:
-                if not line.strip():
-                    continue
-
-                comment = json.loads(line)
-
-                # Synthesize a non-identifying title from the comment ID and date.
-                # Never assign comment text to title (audit finding TD-TT-01).
-                # author is not used in the title because it is a direct user
-                # identifier and must not be persisted (PROJECT_CHARTER §9).
-                comment_id = str(comment.get("comment_id", "")).strip()
-                created_at = str(comment.get("created_at", ""))
-                # Guard against malformed or empty timestamps shorter than 10 chars.
-                date_part = created_at[:10] if len(created_at) >= 10 else (created_at or "undated")
-                title_id = comment_id if comment_id else "unknown"
-                title = f"comment-{title_id} ({date_part})"
-
-                # author and author_id are intentionally excluded from metadata.
-                # They are direct user identifiers (username string, numeric UID)
-                # that would propagate into source_metadata in the silver record,
-                # violating the project's no-PII policy (PROJECT_CHARTER §9).
-                # Engagement signals (likes, replies) are retained as non-identifying.
-                yield RawRecord(
-                    title=title,
-                    text=comment["text"],
-                    url=comment["url"],
-                    metadata={
-                        "video_url": str(comment.get("video_url", "")),
-                        "date_published": str(comment.get("created_at", "")),
-                        "likes": str(comment.get("likes", 0)),
-                        "replies": str(comment.get("replies", 0)),
-                        "comment_id": str(comment.get("comment_id", "")),
-                        "scraped_at": str(comment.get("scraped_at", "")),
-                        "minhash_signature": str(comment.get("minhash_signature", "")),
-                    },
-                )
+        size = self.staging_file.stat().st_size
+        offset = resume_offset(self.staging_file, resume_from)
+        for line, _, end in read_lines(self.staging_file, offset):
+            if not line.strip():
+                continue
+
+            comment = json.loads(line)
+
+            # Synthesize a non-identifying title from the comment ID and date.
+            # Never assign comment text to title (audit finding TD-TT-01).
+            # author is not used in the title because it is a direct user
+            # identifier and must not be persisted (PROJECT_CHARTER §9).
+            comment_id = str(comment.get("comment_id", "")).strip()
+            created_at = str(comment.get("created_at", ""))
+            # Guard against malformed or empty timestamps shorter than 10 chars.
+            date_part = created_at[:10] if len(created_at) >= 10 else (created_at or "undated")
+            title_id = comment_id if comment_id else "unknown"
+            title = f"comment-{title_id} ({date_part})"
+
+            # author and author_id are intentionally excluded from metadata.
+            # They are direct user identifiers (username string, numeric UID)
+            # that would propagate into source_metadata in the silver record,
+            # violating the project's no-PII policy (PROJECT_CHARTER §9).
+            # Engagement signals (likes, replies) are retained as non-identifying.
+            yield RawRecord(
+                title=title,
+                text=comment["text"],
+                url=comment["url"],
+                metadata={
+                    "video_url": str(comment.get("video_url", "")),
+                    "date_published": str(comment.get("created_at", "")),
+                    "likes": str(comment.get("likes", 0)),
+                    "replies": str(comment.get("replies", 0)),
+                    "comment_id": str(comment.get("comment_id", "")),
+                    "scraped_at": str(comment.get("scraped_at", "")),
+                    "minhash_signature": str(comment.get("minhash_signature", "")),
+                },
+                position=staging_position(self.staging_file, end, size),
+            )
 
     def process(self) -> Optional[Path]:
         """
@@ -10,16 +10,18 @@ Security:
 """
 
 import bz2
+import os
 import re
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
+from urllib.parse import urlparse
 
 import requests
-from tqdm import tqdm
 
 from ...infra.config import get_config
+from ...infra.download import RangedDownloader
 from ...infra.logging_utils import Timer, set_context
 from ...infra.metrics import MetricsCollector, PipelineType
 from ...quality.text_cleaners import TextCleaningPipeline, create_wikipedia_cleaner
@@ -27,6 +29,7 @@ from ..base_pipeline import BasePipeline, RawRecord
 from ..crawl_ledger import get_ledger
 from ..pipeline_setup import PipelineSetup
 from ..processor_registry import register_processor
+from ..staging_reader import read_lines, resume_offset, staging_position
 
 # Constants for buffer management
 # Rationale: Wikipedia pages are typically <1MB, but some heavily-formatted
@@ -296,48 +299,42 @@ class WikipediaSomaliProcessor(BasePipeline):
 
         self.logger.info(f"Downloading from: {self.dump_url}")
         session = self._get_http_session()
+        downloader = RangedDownloader(session, timeout=30, metrics=self.metrics)
 
-        # Track download timing and bytes
-        with Timer() as timer:
-            response = session.get(self.dump_url, stream=True, timeout=30)
-            if response.status_code == 404:
-                self.logger.warning(
-                    "Default dump URL returned 404. Resolving correct filename from index..."
-                )
-                self.current_code, self.dump_url = self._resolve_dump_url(session)
-                # Update base (but keep standard naming for dump_file)
-                self.dump_base = f"https://dumps.wikimedia.org/{self.current_code}/latest/"
-                # Keep standard naming pattern: wikipedia-somali_{run_id}_raw_dump.xml.bz2
-                # (self.dump_file already set in __init__)
-                response = session.get(self.dump_url, stream=True, timeout=30)
-            response.raise_for_status()
-
-            total_size = int(response.headers.get("Content-Length", 0))
-            etag = response.headers.get("ETag")
-            last_modified = response.headers.get("Last-Modified")
-
-            self.logger.info(
-                f"Download metadata - ETag: {etag}, Last-Modified: {last_modified}, Size: {total_size}"
+        # Resumable download: an interrupted run continues from the .part file
+        try:
+            result = downloader.download(self.dump_url, self._resumable_dump_path())
+        except requests.HTTPError as err:
+            if err.response is None or err.response.status_code != 404:
+                raise
+            self.logger.warning(
+                "Default dump URL returned 404. Resolving correct filename from index..."
             )
+            self.current_code, self.dump_url = self._resolve_dump_url(session)
+            # Update base (but keep standard naming for dump_file)
+            self.dump_base = f"https://dumps.wikimedia.org/{self.current_code}/latest/"
+            result = downloader.download(self.dump_url, self._resumable_dump_path())
 
-            # Track URL discovery and file discovery
-            self.ledger.discover_url(
-                self.dump_url,
-                self.source,
-                metadata={"wiki_code": self.current_code, "file_size": total_size},
-            )
-            self.metrics.increment("files_discovered")
-
-            with open(self.dump_file, "wb") as f:
-                with tqdm(total=total_size, unit="B", unit_scale=True, desc="Downloading") as pbar:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        if chunk:
-                            f.write(chunk)
-                            pbar.update(len(chunk))
-                            self.metrics.increment("bytes_downloaded", len(chunk))
-
-        # Record download metrics
-        self.metrics.record_fetch_duration(timer.get_elapsed_ms())
+        # Keep standard naming pattern: wikipedia-somali_{run_id}_raw_dump.xml.bz2
+        os.replace(result.path, self.dump_file)
+
+        total_size = result.bytes_total
+        etag = result.etag
+        last_modified = result.last_modified
+
+        self.logger.info(
+            f"Download metadata - ETag: {etag}, Last-Modified: {last_modified}, Size: {total_size}"
+        )
+
+        # Track URL discovery and file discovery
+        self.ledger.discover_url(
+            self.dump_url,
+            self.source,
+            metadata={"wiki_code": self.current_code, "file_size": total_size},
+        )
+        self.metrics.increment("files_discovered")
+
+        # Record download metrics (bytes and duration are recorded by the downloader)
         self.metrics.increment("files_processed")
         self.metrics.record_http_status(200)
 
@@ -360,6 +357,16 @@ class WikipediaSomaliProcessor(BasePipeline):
         self._dump_path_from_download = self.dump_file
         return self.dump_file
 
+    def _resumable_dump_path(self) -> Path:
+        """
+        Download target that survives restarts, keyed on the dump file name.
+
+        Kept above the date_accessed partition: a restart on a later day (new
+        run_id and raw_dir) still finds the previous run's .part file.
+        """
+        name = Path(urlparse(self.dump_url).path).name
+        return self.raw_dir.parent / f"wikipedia-somali_{name}"
+
     def extract(self) -> Optional[Path]:
         """
         Extract raw text from Wikipedia XML dump with article-level deduplication.
@@ -499,11 +506,13 @@ class WikipediaSomaliProcessor(BasePipeline):
                         metadata={"title": title, "timestamp": article.get("timestamp")},
                     )
 
-                    # Compute hash and check for duplicates
-                    text_hash = self._compute_text_hash(text, page_url)
+                    # Hash once; the dedup engine keys on the 64-bit fingerprint
+                    fingerprint = self.dedup.hasher.compute_digests(
+                        text=text, url=page_url
+                    ).fingerprint
 
                     # Check if exact duplicate
-                    if not self.dedup.is_duplicate_hash(text_hash):
+                    if not self.dedup.is_duplicate_hash(fingerprint):
                         # Not a duplicate - write and record
                         # Marker format: \x1e PAGE: <title>\t<page_id>\t<timestamp>
                         fout.write(
@@ -512,10 +521,10 @@ class WikipediaSomaliProcessor(BasePipeline):
                         page_count += 1
                         self.metrics.record_text_length(len(text))
                         # Store hash→URL mapping for future duplicate detection
-                        self.dedup.add_known_hash(text_hash, page_url)
+                        self.dedup.add_known_hash(fingerprint, page_url)
                     else:
                         # Duplicate found - get canonical URL
-                        canonical_url = self.dedup.get_canonical_url(text_hash)
+                        canonical_url = self.dedup.get_canonical_url(fingerprint)
                         self.logger.debug(
                             f"Duplicate page detected: {title} matches {canonical_url}"
                         )
@@ -546,7 +555,9 @@ class WikipediaSomaliProcessor(BasePipeline):
 
         return self.staging_file
 
-    def run(self) -> Optional[Path]:
+    def run(
+        self, stage_runner: Optional[Callable[[str, Callable[[], Any]], Any]] = None
+    ) -> Optional[Path]:
         """
         Run full pipeline with early exit if dump unchanged or no new articles.
 
@@ -554,12 +565,16 @@ class WikipediaSomaliProcessor(BasePipeline):
         - Level 1 (Dump): HTTP conditional requests (304 → skip everything)
         - Level 2 (Article): URL filtering (skip already-processed articles)
 
+        Args:
+            stage_runner: Optional ``(name, fn)`` wrapper around each phase call
+
         Returns:
             Path to silver parquet file, or None if nothing to process
         """
+        run_stage = stage_runner or (lambda name, fn: fn())
         try:
             # LEVEL 1: Dump-level deduplication check
-            dump_path = self.download()
+            dump_path = run_stage("download", self.download)
             if dump_path is None:
                 # 304 Not Modified - dump unchanged, skip all processing
                 self.logger.info("Dump unchanged (304) - pipeline complete (nothing to process)")
@@ -569,14 +584,14 @@ class WikipediaSomaliProcessor(BasePipeline):
             self._dump_path_from_download = dump_path
 
             # LEVEL 2: Article-level deduplication
-            staging_path = self.extract()
+            staging_path = run_stage("extract", self.extract)
             if staging_path is None:
                 # No new articles after filtering
                 self.logger.info("No new articles - pipeline complete")
                 return None
 
             # Process new articles
-            silver_path = self.process()
+            silver_path = run_stage("process", self.process)
 
             # Mark dump URL as successfully processed
             self.ledger.mark_processed(
@@ -593,7 +608,7 @@ class WikipediaSomaliProcessor(BasePipeline):
             self.logger.error(f"Pipeline failed: {e}")
             raise
 
-    def _extract_records(self) -> Iterator[RawRecord]:
+    def _extract_records(self, resume_from: Optional[dict[str, Any]] = None) -> Iterator[RawRecord]:
         """
         Extract records from staging file with size limits.
 
@@ -602,13 +617,21 @@ class WikipediaSomaliProcessor(BasePipeline):
 
         Implements M3 fix: Articles exceeding MAX_ARTICLE_LINES are truncated
         to prevent memory exhaustion from malformed staging files.
+
+        Args:
+            resume_from: Checkpoint position to seek to. A page's position is
+                the offset of the next page marker, so reading resumes on a
+                marker line.
         """
         current_title = None
         current_page_id = None
         current_timestamp = None
         current_lines = []
 
-        def _make_record(title, page_id, timestamp, lines, truncated):
+        size = self.staging_file.stat().st_size
+        offset = resume_offset(self.staging_file, resume_from)
+
+        def _make_record(title, page_id, timestamp, lines, truncated, end):
             """Build a RawRecord from accumulated page data."""
             date_published = None
             if timestamp:
@@ -624,70 +647,76 @@ class WikipediaSomaliProcessor(BasePipeline):
                     "date_published": date_published,
                     "source_id": page_id or "",
                 },
+                position=staging_position(self.staging_file, end, size),
             )
 
-        with open(self.staging_file, encoding="utf-8") as fin:
-            for line in fin:
-                if line.startswith(self.page_marker_prefix + " "):
-                    # Yield previous page if exists
-                    if current_title is not None:
-                        # Check for oversized articles and truncate
-                        truncated = False
-                        if len(current_lines) > MAX_ARTICLE_LINES:
-                            self.logger.warning(
-                                f"Article '{current_title}' exceeds max size "
-                                f"({len(current_lines)} lines), truncating to {MAX_ARTICLE_LINES}"
-                            )
-                            if hasattr(self, "metrics") and self.metrics is not None:
-                                self.metrics.increment("articles_truncated_size")
-                            current_lines = current_lines[:MAX_ARTICLE_LINES]
-                            truncated = True
-
-                        yield _make_record(
-                            current_title,
-                            current_page_id,
-                            current_timestamp,
-                            current_lines,
-                            truncated,
+        for line, start, _ in read_lines(self.staging_file, offset):
+            if line.startswith(self.page_marker_prefix + " "):
+                # Yield previous page if exists
+                if current_title is not None:
+                    # Check for oversized articles and truncate
+                    truncated = False
+                    if len(current_lines) > MAX_ARTICLE_LINES:
+                        self.logger.warning(
+                            f"Article '{current_title}' exceeds max size "
+                            f"({len(current_lines)} lines), truncating to {MAX_ARTICLE_LINES}"
                         )
-
-                    # Parse marker line: "\x1e PAGE: <title>\t<page_id>\t<timestamp>"
-                    raw_line = line.rstrip("\n")
-                    marker_payload = raw_line[len(self.page_marker_prefix) + 1 :]
-                    parts = marker_payload.split("\t", 2)
-                    current_title = parts[0].strip()
-                    current_page_id = parts[1].strip() if len(parts) > 1 else ""
-                    current_timestamp = parts[2].strip() if len(parts) > 2 else ""
-                    # Backward compat: old staging files without tabs have no metadata
-                    if not current_title:
-                        current_title = None
-                        current_page_id = None
-                        current_timestamp = None
-                        current_lines = []
-                        continue
-                    current_lines = []
-                else:
-                    # Add line only if under size limit
-                    if len(current_lines) < MAX_ARTICLE_LINES:
-                        current_lines.append(line)
-
-            # Yield last page
-            if current_title is not None:
-                # Check for oversized articles and truncate
-                truncated = False
-                if len(current_lines) > MAX_ARTICLE_LINES:
-                    self.logger.warning(
-                        f"Article '{current_title}' exceeds max size "
-                        f"({len(current_lines)} lines), truncating to {MAX_ARTICLE_LINES}"
+                        if hasattr(self, "metrics") and self.metrics is not None:
+                            self.metrics.increment("articles_truncated_size")
+                        current_lines = current_lines[:MAX_ARTICLE_LINES]
+                        truncated = True
+
+                    yield _make_record(
+                        current_title,
+                        current_page_id,
+                        current_timestamp,
+                        current_lines,
+                        truncated,
+                        start,
                     )
-                    if hasattr(self, "metrics") and self.metrics is not None:
-                        self.metrics.increment("articles_truncated_size")
-                    current_lines = current_lines[:MAX_ARTICLE_LINES]
-                    truncated = True
 
-                yield _make_record(
-                    current_title, current_page_id, current_timestamp, current_lines, truncated
+                # Parse marker line: "\x1e PAGE: <title>\t<page_id>\t<timestamp>"
+                raw_line = line.rstrip("\n")
+                marker_payload = raw_line[len(self.page_marker_prefix) + 1 :]
+                parts = marker_payload.split("\t", 2)
+                current_title = parts[0].strip()
+                current_page_id = parts[1].strip() if len(parts) > 1 else ""
+                current_timestamp = parts[2].strip() if len(parts) > 2 else ""
+                # Backward compat: old staging files without tabs have no metadata
+                if not current_title:
+                    current_title = None
+                    current_page_id = None
+                    current_timestamp = None
+                    current_lines = []
+                    continue
+                current_lines = []
+            else:
+                # Add line only if under size limit
+                if len(current_lines) < MAX_ARTICLE_LINES:
+                    current_lines.append(line)
+
+        # Yield last page
+        if current_title is not None:
+            # Check for oversized articles and truncate
+            truncated = False
+            if len(current_lines) > MAX_ARTICLE_LINES:
+                self.logger.warning(
+                    f"Article '{current_title}' exceeds max size "
+                    f"({len(current_lines)} lines), truncating to {MAX_ARTICLE_LINES}"
                 )
+                if hasattr(self, "metrics") and self.metrics is not None:
+                    self.metrics.increment("articles_truncated_size")
+                current_lines = current_lines[:MAX_ARTICLE_LINES]
+                truncated = True
+
+            yield _make_record(
+                current_title,
+                current_page_id,
+                current_timestamp,
+                current_lines,
+                truncated,
+                size,
+            )
 
     def _get_http_session(self) -> requests.Session:
         """
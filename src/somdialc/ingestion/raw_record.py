@@ -16,9 +16,16 @@ class RawRecord:
         text: str,
         url: str,
         metadata: Optional[dict[str, Any]] = None,
+        position: Optional[dict[str, Any]] = None,
     ):
-        """Initialize raw record with title, text, url, and optional metadata."""
+        """
+        Initialize raw record with title, text, url, and optional metadata.
+
+        ``position`` is where extraction resumes after this record (see
+        ``staging_reader``); it is stored in checkpoints, not in silver records.
+        """
         self.title = title
         self.text = text
         self.url = url
         self.metadata = metadata or {}
+        self.position = position
@@ -2,9 +2,12 @@
 
 import json
 import sqlite3
+import time
 from datetime import datetime, timezone
 from typing import Any, Optional
 
+from ..database.ledger_interfaces import CrawlState
+
 
 class SQLiteCampaignMixin:
     """Campaign lifecycle helpers for the SQLite ledger."""
@@ -172,6 +175,66 @@ class SQLiteQuotaMixin:
         remaining = quota_limit - used
         return remaining > 0, max(0, remaining)
 
+    def reserve_daily_quota(
+        self,
+        source: str,
+        count: int,
+        quota_limit: Optional[int] = None,
+        date: Optional[str] = None,
+    ) -> int:
+        if count <= 0:
+            return 0
+        if date is None:
+            date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        else:
+            from ..infra.logging_utils import validate_iso_date
+
+            date = validate_iso_date(date)
+
+        now = datetime.now(timezone.utc)
+        # BEGIN IMMEDIATE takes the write lock up front, so the read and the
+        # increment below cannot interleave with another process's reservation.
+        with self.transaction() as conn:
+            row = conn.execute(
+                "SELECT records_ingested FROM daily_quotas WHERE date = ? AND source = ?",
+                (date, source),
+            ).fetchone()
+            used = row["records_ingested"] if row else 0
+            granted = count if quota_limit is None else max(0, min(count, quota_limit - used))
+            conn.execute(
+                """
+                INSERT INTO daily_quotas (date, source, records_ingested, quota_limit, updated_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(date, source) DO UPDATE SET
+                    records_ingested = records_ingested + excluded.records_ingested,
+                    quota_limit = COALESCE(excluded.quota_limit, quota_limit),
+                    updated_at = excluded.updated_at
+                """,
+                (date, source, granted, quota_limit, now.isoformat()),
+            )
+        return granted
+
+    def release_daily_quota(self, source: str, count: int, date: Optional[str] = None) -> None:
+        if count <= 0:
+            return
+        if date is None:
+            date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        else:
+            from ..infra.logging_utils import validate_iso_date
+
+            date = validate_iso_date(date)
+
+        now = datetime.now(timezone.utc)
+        with self.transaction() as conn:
+            conn.execute(
+                """
+                UPDATE daily_quotas
+                SET records_ingested = MAX(0, records_ingested - ?), updated_at = ?
+                WHERE date = ? AND source = ?
+                """,
+                (count, now.isoformat(), date, source),
+            )
+
     def check_file_checksum(self, checksum: str, source: str) -> Optional[dict[str, Any]]:
         query = """
             SELECT url, source, state, created_at, metadata
@@ -192,6 +255,152 @@ class SQLiteQuotaMixin:
         return None
 
 
+class SQLiteRateLimitMixin:
+    """Cross-process token buckets stored in the SQLite ledger."""
+
+    @property
+    def connection(self) -> sqlite3.Connection:  # pragma: no cover
+        raise NotImplementedError
+
+    def transaction(self):  # pragma: no cover
+        raise NotImplementedError
+
+    def acquire_rate_tokens(
+        self, bucket_key: str, refill_rate: float, capacity: float, cost: float = 1.0
+    ) -> float:
+        if refill_rate <= 0 or cost > capacity:
+            raise ValueError(
+                f"Invalid token bucket: refill_rate={refill_rate}, capacity={capacity}, cost={cost}"
+            )
+
+        with self.transaction() as conn:
+            row = conn.execute(
+                "SELECT tokens, refilled_at FROM rate_limit_buckets WHERE bucket_key = ?",
+                (bucket_key,),
+            ).fetchone()
+            now = time.time()
+            if row is None:
+                tokens = capacity
+            else:
+                elapsed = max(0.0, now - row["refilled_at"])
+                tokens = min(capacity, row["tokens"] + elapsed * refill_rate)
+
+            if tokens >= cost:
+                tokens -= cost
+                wait_seconds = 0.0
+            else:
+                wait_seconds = (cost - tokens) / refill_rate
+
+            conn.execute(
+                """
+                INSERT INTO rate_limit_buckets (bucket_key, tokens, refilled_at)
+                VALUES (?, ?, ?)
+                ON CONFLICT(bucket_key) DO UPDATE SET
+                    tokens = excluded.tokens,
+                    refilled_at = excluded.refilled_at
+                """,
+                (bucket_key, tokens, now),
+            )
+        return wait_seconds
+
+
+class SQLiteWorkQueueMixin:
+    """
+    Lease-based URL claiming so several workers can drain one frontier.
+
+    A lease is ``lease_owner`` plus ``lease_expires_at`` (epoch seconds) on the
+    crawl_ledger row; the URL's state is untouched, so a lease that is never
+    released simply expires and the URL becomes claimable again.
+    """
+
+    @property
+    def connection(self) -> sqlite3.Connection:  # pragma: no cover
+        raise NotImplementedError
+
+    def transaction(self):  # pragma: no cover
+        raise NotImplementedError
+
+    def claim_urls(
+        self,
+        source: str,
+        n: int,
+        worker_id: str,
+        lease_seconds: float = 300,
+        state: CrawlState = CrawlState.DISCOVERED,
+    ) -> list[str]:
+        if n <= 0:
+            return []
+        now = time.time()
+        # BEGIN IMMEDIATE holds the write lock across the select and the update,
+        # so two workers can never lease the same row.
+        with self.transaction() as conn:
+            rows = conn.execute(
+                """
+                SELECT url FROM crawl_ledger
+                WHERE source = ? AND state = ?
+                  AND (lease_expires_at IS NULL OR lease_expires_at <= ?)
+                ORDER BY discovered_at ASC
+                LIMIT ?
+                """,
+                (source, state.value, now, n),
+            ).fetchall()
+            urls = [row["url"] for row in rows]
+            conn.executemany(
+                """
+                UPDATE crawl_ledger
+                SET lease_owner = ?, lease_expires_at = ?, updated_at = ?
+                WHERE url = ?
+                """,
+                [
+                    (worker_id, now + lease_seconds, datetime.now(timezone.utc).isoformat(), url)
+                    for url in urls
+                ],
+            )
+        return urls
+
+    def heartbeat_urls(
+        self, worker_id: str, lease_seconds: float = 300, urls: Optional[list[str]] = None
+    ) -> int:
+        now = time.time()
+        query = """
+            UPDATE crawl_ledger SET lease_expires_at = ?
+            WHERE lease_owner = ? AND lease_expires_at > ?
+        """
+        with self.transaction() as conn:
+            if urls is None:
+                return conn.execute(query, (now + lease_seconds, worker_id, now)).rowcount
+            return sum(
+                conn.execute(
+                    query + " AND url = ?", (now + lease_seconds, worker_id, now, url)
+                ).rowcount
+                for url in urls
+            )
+
+    def release_urls(self, worker_id: str, urls: Optional[list[str]] = None) -> int:
+        query = """
+            UPDATE crawl_ledger SET lease_owner = NULL, lease_expires_at = NULL
+            WHERE lease_owner = ?
+        """
+        with self.transaction() as conn:
+            if urls is None:
+                return conn.execute(query, (worker_id,)).rowcount
+            return sum(
+                conn.execute(query + " AND url = ?", (worker_id, url)).rowcount for url in urls
+            )
+
+    def expire_leases(self, source: Optional[str] = None) -> int:
+        query = """
+            UPDATE crawl_ledger SET lease_owner = NULL, lease_expires_at = NULL
+            WHERE lease_expires_at <= ?
+        """
+        params: tuple = (time.time(),)
+        if source is not None:
+            query += " AND source = ?"
+            params += (source,)
+        with self.transaction() as conn:
+            return conn.execute(query, params).rowcount
+
+
 class SQLitePipelineRunsMixin:
     """Pipeline run tracking helpers for the SQLite ledger."""
 
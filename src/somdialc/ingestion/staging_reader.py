@@ -0,0 +1,84 @@
+"""
+Seekable reading of staging files for checkpoint resume.
+
+Processors read staging files through ``read_lines`` and attach a
+``staging_position`` to every RawRecord they yield: the file, the byte
+offset just after the record, and the file size. BasePipeline stores the
+position of the last processed record in its checkpoint and hands it back
+as ``_extract_records(resume_from=...)``, so a resumed run seeks straight to
+the remaining records instead of re-reading and re-parsing everything
+before them.
+
+Lines are read in binary mode (byte offsets are exact and cheap) and
+decoded with the same newline handling as text-mode iteration.
+
+Example:
+    >>> size = path.stat().st_size
+    >>> for line, start, end in read_lines(path, resume_offset(path, resume_from)):
+    ...     yield RawRecord(..., position=staging_position(path, end, size))
+"""
+
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, Optional
+
+
+def staging_position(path: Path, offset: int, size: int, **extra: Any) -> dict[str, Any]:
+    """
+    Resume position within a staging file.
+
+    Args:
+        path: Staging file
+        offset: Byte offset where reading resumes
+        size: File size when the position was taken (detects a changed file)
+        **extra: Informational fields (e.g. corpus_id)
+    """
+    return {"file": path.name, "offset": offset, "size": size, **extra}
+
+
+def resume_offset(path: Path, resume_from: Optional[dict[str, Any]]) -> int:
+    """
+    Byte offset in ``path`` to resume reading at.
+
+    Args:
+        path: Staging file about to be read
+        resume_from: Position from a checkpoint, or None to read from the start
+
+    Returns:
+        0 without a position, else the checkpointed offset
+
+    Raises:
+        ValueError: If the position belongs to another file or the file has
+            changed size since the checkpoint
+    """
+    if resume_from is None:
+        return 0
+    if resume_from.get("file") != path.name:
+        raise ValueError(f"resume position is for {resume_from.get('file')!r}, not {path.name!r}")
+    size = path.stat().st_size
+    offset = resume_from.get("offset")
+    if resume_from.get("size") != size or not isinstance(offset, int) or not 0 <= offset <= size:
+        raise ValueError(f"{path.name} changed since the checkpoint was written")
+    return offset
+
+
+def read_lines(path: Path, offset: int = 0) -> Iterator[tuple[str, int, int]]:
+    """
+    Yield ``(line, start, end)`` from byte ``offset`` to the end of ``path``.
+
+    ``start``/``end`` are the byte offsets of the physical line. Like text
+    mode, ``\\r\\n`` and lone ``\\r`` are translated to ``\\n`` and a lone
+    ``\\r`` also ends a line (the resulting lines share the physical offsets).
+    """
+    with open(path, "rb") as f:
+        f.seek(offset)
+        start = offset
+        for raw in f:
+            end = start + len(raw)
+            line = raw.decode("utf-8")
+            if "\r" in line:
+                for part in line.replace("\r\n", "\n").replace("\r", "\n").splitlines(True):
+                    yield part, start, end
+            else:
+                yield line, start, end
+            start = end
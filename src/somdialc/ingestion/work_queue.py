@@ -0,0 +1,107 @@
+"""
+Lease-based work claiming on the crawl ledger.
+
+Several workers (processes on one host with SQLite, or hosts sharing a
+PostgreSQL ledger) drain one URL frontier by leasing batches with
+``CrawlLedger.claim_urls``. ``claimed_batches`` wraps the claim loop: it
+keeps the worker's leases alive from a heartbeat thread and releases each
+batch once the caller asks for the next one, i.e. after the caller has
+moved the batch's URLs out of the claimable state (fetched, failed,
+duplicate). URLs still pending when a worker dies become claimable again
+once their lease expires.
+
+Example:
+    >>> for batch in claimed_batches(ledger, "bbc-somali", default_worker_id()):
+    ...     for url in batch:
+    ...         fetch_and_mark(url)
+"""
+
+import logging
+import os
+import socket
+import threading
+from collections.abc import Iterator
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def default_worker_id() -> str:
+    """Worker id unique per process and host: ``<hostname>-<pid>``."""
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+class LeaseHeartbeat:
+    """
+    Background thread extending a worker's leases every ``lease_seconds / 3``.
+
+    Used as a context manager; the thread stops on exit.
+    """
+
+    def __init__(self, ledger: Any, worker_id: str, lease_seconds: float):
+        self.ledger = ledger
+        self.worker_id = worker_id
+        self.lease_seconds = lease_seconds
+        self.beats = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "LeaseHeartbeat":
+        self._thread = threading.Thread(target=self._run, name="lease-heartbeat", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.lease_seconds / 3):
+            try:
+                self.ledger.heartbeat_urls(self.worker_id, self.lease_seconds)
+                self.beats += 1
+            except Exception as e:  # Next beat retries; the lease outlives one miss
+                logger.warning(f"Lease heartbeat failed for {self.worker_id}: {e}")
+
+
+def claimed_batches(
+    ledger: Any,
+    source: str,
+    worker_id: str,
+    batch_size: int = 25,
+    lease_seconds: float = 300,
+    limit: Optional[int] = None,
+) -> Iterator[list[str]]:
+    """
+    Yield batches of URLs leased to ``worker_id`` until the frontier is drained.
+
+    A batch is released when the next one is requested (or the generator is
+    closed), so update every URL's state before moving on. Close the
+    generator (``contextlib.closing``) when stopping early.
+
+    Args:
+        ledger: CrawlLedger (or backend) shared by all workers
+        source: Source identifier the URLs were discovered under
+        worker_id: Identifier of this worker (see default_worker_id)
+        batch_size: URLs per claim
+        lease_seconds: Lease length; heartbeats extend it every third of that
+        limit: Stop after claiming this many URLs in total (None = no limit)
+    """
+    expired = ledger.expire_leases(source)
+    if expired:
+        logger.info(f"Reclaimed {expired} expired {source} leases")
+
+    claimed = 0
+    with LeaseHeartbeat(ledger, worker_id, lease_seconds):
+        while limit is None or claimed < limit:
+            wanted = batch_size if limit is None else min(batch_size, limit - claimed)
+            batch = ledger.claim_urls(source, wanted, worker_id, lease_seconds)
+            if not batch:
+                return
+            claimed += len(batch)
+            try:
+                yield batch
+            finally:
+                ledger.release_urls(worker_id, batch)
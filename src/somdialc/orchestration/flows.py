@@ -11,6 +11,8 @@ Provides coordinated execution of all four data sources with:
 import logging
 import subprocess
 import sys
+import time
+from contextlib import AbstractContextManager, nullcontext
 from datetime import datetime, timezone
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
@@ -18,6 +20,8 @@ from typing import Any, Callable, Optional, cast
 
 from pydantic import SecretStr
 
+from .scheduler import LocalScheduler, ScheduleReport, SourceJob, StageRunner
+
 try:
     from prefect import flow, task
     from prefect.task_runners import ConcurrentTaskRunner
@@ -122,6 +126,7 @@ def _run_locked_pipeline_task(
     source_name_factory: Callable[..., str],
     git_commit_resolver: Callable[[], Optional[str]] = _get_git_commit,
     config_snapshot: Optional[dict[str, Any]] = None,
+    stage_runner: Optional[StageRunner] = None,
 ) -> dict[str, Any]:
     """Run a pipeline task with consistent lock, registration, and provenance updates."""
     source_name_kwargs = source_name_kwargs or {}
@@ -161,7 +166,7 @@ def _run_locked_pipeline_task(
         )
         ledger.update_pipeline_run(run_id=registered_run_id, status="RUNNING")
 
-        silver_path = processor.run()
+        silver_path = processor.run(stage_runner) if stage_runner else processor.run()
         records_processed = _get_records_processed(ledger, processor_name)
 
         ledger.update_pipeline_run(
@@ -312,12 +317,17 @@ def _setup_orchestrator_logging() -> None:
 
 
 @task(retries=2, retry_delay_seconds=10)
-def run_wikipedia_task(force: bool = False, run_seed: Optional[str] = None) -> dict[str, Any]:
+def run_wikipedia_task(
+    force: bool = False,
+    run_seed: Optional[str] = None,
+    stage_runner: Optional[StageRunner] = None,
+) -> dict[str, Any]:
     """
     Task to run Wikipedia data collection pipeline.
 
     Args:
         force: Force reprocessing of existing data
+        stage_runner: Per-stage wrapper supplied by the local scheduler
 
     Returns:
         Dictionary with pipeline results and metrics
@@ -337,12 +347,16 @@ def run_wikipedia_task(force: bool = False, run_seed: Optional[str] = None) -> d
         processor_factory=ProcessorRegistry.create,
         source_name_factory=get_processor_source_name,
         config_snapshot=_build_pipeline_run_config("wikipedia"),
+        stage_runner=stage_runner,
     )
 
 
 @task(retries=2, retry_delay_seconds=10)
 def run_bbc_task(
-    max_articles: Optional[int] = None, force: bool = False, run_seed: Optional[str] = None
+    max_articles: Optional[int] = None,
+    force: bool = False,
+    run_seed: Optional[str] = None,
+    stage_runner: Optional[StageRunner] = None,
 ) -> dict[str, Any]:
     """
     Task to run BBC Somali data collection pipeline.
@@ -350,6 +364,7 @@ def run_bbc_task(
     Args:
         max_articles: Maximum articles to scrape (None = unlimited)
         force: Force reprocessing of existing data
+        stage_runner: Per-stage wrapper supplied by the local scheduler
 
     Returns:
         Dictionary with pipeline results and metrics
@@ -371,6 +386,7 @@ def run_bbc_task(
         processor_factory=ProcessorRegistry.create,
         source_name_factory=get_processor_source_name,
         config_snapshot=_build_pipeline_run_config("bbc", max_articles=max_articles),
+        stage_runner=stage_runner,
     )
 
 
@@ -381,6 +397,7 @@ def run_huggingface_task(
     max_records: Optional[int] = None,
     force: bool = False,
     run_seed: Optional[str] = None,
+    stage_runner: Optional[StageRunner] = None,
 ) -> dict[str, Any]:
     """
     Task to run HuggingFace datasets collection pipeline.
@@ -390,6 +407,7 @@ def run_huggingface_task(
         dataset_config: Dataset configuration (language code)
         max_records: Maximum records to process (None = unlimited)
         force: Force reprocessing of existing data
+        stage_runner: Per-stage wrapper supplied by the local scheduler
 
     Returns:
         Dictionary with pipeline results and metrics
@@ -422,12 +440,16 @@ def run_huggingface_task(
             dataset_config=dataset_config,
             max_records=max_records,
         ),
+        stage_runner=stage_runner,
     )
 
 
 @task(retries=2, retry_delay_seconds=10)
 def run_sprakbanken_task(
-    corpus_id: str = "all", force: bool = False, run_seed: Optional[str] = None
+    corpus_id: str = "all",
+    force: bool = False,
+    run_seed: Optional[str] = None,
+    stage_runner: Optional[StageRunner] = None,
 ) -> dict[str, Any]:
     """
     Task to run Språkbanken corpora collection pipeline.
@@ -435,6 +457,7 @@ def run_sprakbanken_task(
     Args:
         corpus_id: Specific corpus ID or "all" for all 23 corpora
         force: Force reprocessing of existing data
+        stage_runner: Per-stage wrapper supplied by the local scheduler
 
     Returns:
         Dictionary with pipeline results and metrics
@@ -457,6 +480,7 @@ def run_sprakbanken_task(
         processor_factory=ProcessorRegistry.create,
         source_name_factory=get_processor_source_name,
         config_snapshot=_build_pipeline_run_config("sprakbanken", corpus_id=corpus_id),
+        stage_runner=stage_runner,
     )
 
 
@@ -467,6 +491,7 @@ def run_tiktok_task(
     apify_user_id: Optional[str] = None,
     force: bool = False,
     run_seed: Optional[str] = None,
+    stage_runner: Optional[StageRunner] = None,
 ) -> dict[str, Any]:
     """
     Task to run TikTok comments collection pipeline.
@@ -476,6 +501,7 @@ def run_tiktok_task(
         apify_api_token: Apify API token for authentication
         apify_user_id: Apify user ID (optional, for reference)
         force: Force reprocessing of existing data
+        stage_runner: Per-stage wrapper supplied by the local scheduler
 
     Returns:
         Dictionary with pipeline results and metrics
@@ -506,6 +532,7 @@ def run_tiktok_task(
             num_videos=len(video_urls),
             has_user_id=bool(apify_user_id),
         ),
+        stage_runner=stage_runner,
     )
 
 
@@ -628,6 +655,75 @@ def run_tiktok_pipeline(
     )
 
 
+EXECUTORS = ("auto", "prefect", "local", "sequential")
+
+
+def _resolve_executor(executor: Optional[str] = None) -> str:
+    """Resolve "auto" (and a missing Prefect install) to a concrete executor."""
+    if executor is None:
+        from ..infra.config import get_config
+
+        executor = get_config().orchestration.executor
+    if executor not in EXECUTORS:
+        raise ValueError(f"Unknown executor {executor!r}; expected one of {EXECUTORS}")
+    if executor == "auto":
+        return "prefect" if PREFECT_AVAILABLE else "local"
+    if executor == "prefect" and not PREFECT_AVAILABLE:
+        logger.warning("Prefect not installed; using the local scheduler")
+        return "local"
+    return executor
+
+
+def _run_local_schedule(
+    planned: list[tuple[str, Callable[..., Any], dict[str, Any]]], sequential: bool = False
+) -> tuple[list[dict[str, Any]], ScheduleReport]:
+    """
+    Run planned source tasks on the LocalScheduler.
+
+    Tasks are called undecorated (Prefect's ``Task.fn``) with the scheduler's
+    stage runner, so each download/extract/process stage takes a network or
+    CPU slot while ``_run_locked_pipeline_task`` still owns the source lock.
+    """
+    from ..infra.config import get_config
+
+    orchestration = get_config().orchestration
+    scheduler = LocalScheduler(
+        cpu_slots=orchestration.cpu_slots,
+        network_slots=orchestration.network_slots,
+        max_concurrent_sources=1 if sequential else None,
+    )
+
+    def job(
+        task_fn: Callable[..., Any], task_kwargs: dict[str, Any]
+    ) -> Callable[[StageRunner], dict[str, Any]]:
+        fn = (getattr(task_fn, "fn", None) if PREFECT_AVAILABLE else None) or task_fn
+        return lambda stage_runner: fn(**task_kwargs, stage_runner=stage_runner)
+
+    return scheduler.run(
+        [SourceJob(source, job(task_fn, task_kwargs)) for source, task_fn, task_kwargs in planned]
+    )
+
+
+def _shared_dedup(source_count: int) -> AbstractContextManager[Any]:
+    """
+    Shared dedup server for the run when SDC_DEDUP__SHARED_SERVER is set.
+
+    Every processor created inside the block queries the one index (see
+    ``PipelineSetup.create_dedup_engine``), so duplicates across concurrently
+    running sources are caught at ingest time.
+    """
+    from ..infra.config import get_config
+
+    if not get_config().dedup.shared_server or source_count < 2:
+        return nullcontext()
+
+    from ..ingestion.dedup import shared_dedup_server
+    from ..ingestion.pipeline_setup import PipelineSetup
+
+    settings = get_config().dedup
+    return shared_dedup_server(PipelineSetup.dedup_config_from_settings(settings))
+
+
 @flow(
     name="Complete Data Collection Pipeline",
     description="Run all data collection pipelines in parallel",
@@ -647,6 +743,7 @@ def run_all_pipelines(
     tiktok_api_token: Optional[str] = None,
     tiktok_user_id: Optional[str] = None,
     auto_deploy: bool = False,
+    executor: Optional[str] = None,
 ) -> dict[str, Any]:
     """
     Flow to orchestrate all data collection pipelines in parallel.
@@ -668,6 +765,8 @@ def run_all_pipelines(
         tiktok_api_token: Apify API token for TikTok scraping
         tiktok_user_id: Apify user ID (optional)
         auto_deploy: Automatically deploy dashboard after pipeline completes
+        executor: "prefect", "local" (resource-aware LocalScheduler), "sequential"
+            or "auto" (default: config.orchestration.executor)
 
     Returns:
         Dictionary with results from all pipelines
@@ -697,157 +796,91 @@ def run_all_pipelines(
     else:
         logger.info("[REFRESH] Sources run per cadence schedule")
 
-    # Execute tasks either in parallel (with Prefect) or sequentially (without Prefect)
-    results = []
-    skipped_sources = []
+    # Plan every enabled source that is due, then hand the plan to the executor
+    candidates: list[tuple[str, str, str, Callable[..., Any], dict[str, Any]]] = []
+    if run_wikipedia:
+        candidates.append(
+            ("wikipedia", "Wikipedia", "Wikipedia-Somali", run_wikipedia_task, {"force": force})
+        )
+    if run_bbc:
+        candidates.append(
+            (
+                "bbc",
+                "BBC",
+                "BBC-Somali",
+                run_bbc_task,
+                {"max_articles": max_bbc_articles, "force": force},
+            )
+        )
+    if run_huggingface:
+        candidates.append(
+            (
+                "huggingface",
+                "HuggingFace",
+                "HuggingFace-Somali",
+                run_huggingface_task,
+                {
+                    "dataset_name": "allenai/c4",
+                    "dataset_config": "so",
+                    "max_records": max_hf_records,
+                    "force": force,
+                },
+            )
+        )
+    if run_sprakbanken:
+        candidates.append(
+            (
+                "sprakbanken",
+                "Sprakbanken",
+                "Sprakbanken-Somali",
+                run_sprakbanken_task,
+                {"corpus_id": sprakbanken_corpus, "force": force},
+            )
+        )
+    if run_tiktok and tiktok_video_urls and tiktok_api_token:
+        candidates.append(
+            (
+                "tiktok",
+                "TikTok",
+                "TikTok-Somali",
+                run_tiktok_task,
+                {
+                    "video_urls": tiktok_video_urls,
+                    "apify_api_token": tiktok_api_token,
+                    "apify_user_id": tiktok_user_id,
+                    "force": force,
+                },
+            )
+        )
+    elif run_tiktok and tiktok_video_urls:
+        logger.warning("TikTok pipeline skipped: API token not provided")
+    elif run_tiktok:
+        logger.warning("TikTok pipeline skipped: video URLs not provided")
 
-    if PREFECT_AVAILABLE:
-        # Submit all tasks in parallel (Prefect handles concurrency)
-        if run_wikipedia:
-            should_run, reason = should_run_source("wikipedia")
-            if should_run:
-                logger.info(f"[OK] Running Wikipedia: {reason}")
-                results.append(run_wikipedia_task.submit(force=force, run_seed=run_id))
-            else:
-                logger.info(f"[SKIP] Skipping Wikipedia: {reason}")
-                skipped_sources.append(("Wikipedia-Somali", reason))
-
-        if run_bbc:
-            should_run, reason = should_run_source("bbc")
-            if should_run:
-                logger.info(f"[OK] Running BBC: {reason}")
-                results.append(
-                    run_bbc_task.submit(max_articles=max_bbc_articles, force=force, run_seed=run_id)
-                )
-            else:
-                logger.info(f"[SKIP] Skipping BBC: {reason}")
-                skipped_sources.append(("BBC-Somali", reason))
-
-        if run_huggingface:
-            should_run, reason = should_run_source("huggingface")
-            if should_run:
-                logger.info(f"[OK] Running HuggingFace: {reason}")
-                results.append(
-                    run_huggingface_task.submit(
-                        dataset_name="allenai/c4",
-                        dataset_config="so",
-                        max_records=max_hf_records,
-                        force=force,
-                        run_seed=run_id,
-                    )
-                )
-            else:
-                logger.info(f"[SKIP] Skipping HuggingFace: {reason}")
-                skipped_sources.append(("HuggingFace-Somali", reason))
-
-        if run_sprakbanken:
-            should_run, reason = should_run_source("sprakbanken")
-            if should_run:
-                logger.info(f"[OK] Running Sprakbanken: {reason}")
-                results.append(
-                    run_sprakbanken_task.submit(
-                        corpus_id=sprakbanken_corpus, force=force, run_seed=run_id
-                    )
-                )
-            else:
-                logger.info(f"[SKIP] Skipping Sprakbanken: {reason}")
-                skipped_sources.append(("Sprakbanken-Somali", reason))
-
-        if run_tiktok and tiktok_video_urls and tiktok_api_token:
-            should_run, reason = should_run_source("tiktok")
-            if should_run:
-                logger.info(f"[OK] Running TikTok: {reason}")
-                results.append(
-                    run_tiktok_task.submit(
-                        video_urls=tiktok_video_urls,
-                        apify_api_token=tiktok_api_token,
-                        apify_user_id=tiktok_user_id,
-                        force=force,
-                        run_seed=run_id,
-                    )
-                )
-            else:
-                logger.info(f"[SKIP] Skipping TikTok: {reason}")
-                skipped_sources.append(("TikTok-Somali", reason))
-        elif run_tiktok and tiktok_video_urls:
-            logger.warning("TikTok pipeline skipped: API token not provided")
-        elif run_tiktok:
-            logger.warning("TikTok pipeline skipped: video URLs not provided")
-
-        # Wait for all results
-        completed_results = [result.result() for result in results]
-    else:
-        # Run tasks sequentially without Prefect
-        completed_results = []
-
-        if run_wikipedia:
-            should_run, reason = should_run_source("wikipedia")
-            if should_run:
-                logger.info(f"[OK] Running Wikipedia: {reason}")
-                completed_results.append(run_wikipedia_task(force=force, run_seed=run_id))
-            else:
-                logger.info(f"[SKIP] Skipping Wikipedia: {reason}")
-                skipped_sources.append(("Wikipedia-Somali", reason))
-
-        if run_bbc:
-            should_run, reason = should_run_source("bbc")
-            if should_run:
-                logger.info(f"[OK] Running BBC: {reason}")
-                completed_results.append(
-                    run_bbc_task(max_articles=max_bbc_articles, force=force, run_seed=run_id)
-                )
-            else:
-                logger.info(f"[SKIP] Skipping BBC: {reason}")
-                skipped_sources.append(("BBC-Somali", reason))
-
-        if run_huggingface:
-            should_run, reason = should_run_source("huggingface")
-            if should_run:
-                logger.info(f"[OK] Running HuggingFace: {reason}")
-                completed_results.append(
-                    run_huggingface_task(
-                        dataset_name="allenai/c4",
-                        dataset_config="so",
-                        max_records=max_hf_records,
-                        force=force,
-                        run_seed=run_id,
-                    )
-                )
-            else:
-                logger.info(f"[SKIP] Skipping HuggingFace: {reason}")
-                skipped_sources.append(("HuggingFace-Somali", reason))
-
-        if run_sprakbanken:
-            should_run, reason = should_run_source("sprakbanken")
-            if should_run:
-                logger.info(f"[OK] Running Sprakbanken: {reason}")
-                completed_results.append(
-                    run_sprakbanken_task(corpus_id=sprakbanken_corpus, force=force, run_seed=run_id)
-                )
-            else:
-                logger.info(f"[SKIP] Skipping Sprakbanken: {reason}")
-                skipped_sources.append(("Sprakbanken-Somali", reason))
-
-        if run_tiktok and tiktok_video_urls and tiktok_api_token:
-            should_run, reason = should_run_source("tiktok")
-            if should_run:
-                logger.info(f"[OK] Running TikTok: {reason}")
-                completed_results.append(
-                    run_tiktok_task(
-                        video_urls=tiktok_video_urls,
-                        apify_api_token=tiktok_api_token,
-                        apify_user_id=tiktok_user_id,
-                        force=force,
-                        run_seed=run_id,
-                    )
-                )
-            else:
-                logger.info(f"[SKIP] Skipping TikTok: {reason}")
-                skipped_sources.append(("TikTok-Somali", reason))
-        elif run_tiktok and tiktok_video_urls:
-            logger.warning("TikTok pipeline skipped: API token not provided")
-        elif run_tiktok:
-            logger.warning("TikTok pipeline skipped: video URLs not provided")
+    planned: list[tuple[str, Callable[..., Any], dict[str, Any]]] = []
+    skipped_sources = []
+    for source, label, source_name, task_fn, task_kwargs in candidates:
+        should_run, reason = should_run_source(source)
+        if should_run:
+            logger.info(f"[OK] Running {label}: {reason}")
+            planned.append((source, task_fn, {**task_kwargs, "run_seed": run_id}))
+        else:
+            logger.info(f"[SKIP] Skipping {label}: {reason}")
+            skipped_sources.append((source_name, reason))
+
+    executor = _resolve_executor(executor)
+    schedule: Optional[ScheduleReport] = None
+    started = time.monotonic()
+    with _shared_dedup(len(planned)):
+        if executor == "prefect":
+            # Prefect handles concurrency
+            futures = [task_fn.submit(**task_kwargs) for _, task_fn, task_kwargs in planned]
+            completed_results = [future.result() for future in futures]
+        else:
+            completed_results, schedule = _run_local_schedule(
+                planned, sequential=executor == "sequential"
+            )
+    makespan = schedule.makespan_seconds if schedule else time.monotonic() - started
 
     # Aggregate results
     successful = [r for r in completed_results if r["status"] == "success"]
@@ -902,6 +935,9 @@ def run_all_pipelines(
     logger.info(f"Successful: {len(successful)}/{len(completed_results)}")
     logger.info(f"Failed: {len(failed)}/{len(completed_results)}")
     logger.info(f"Skipped: {len(skipped_sources)}")
+    logger.info(f"Executor: {executor}, makespan: {makespan:.1f}s")
+    if schedule is not None:
+        schedule.log_summary(logger)
 
     if skipped_sources:
         logger.info("Skipped pipelines (cadence-based):")
@@ -948,6 +984,9 @@ def run_all_pipelines(
         "total": len(completed_results),
         "run_id": run_id,
         "manifest_path": str(manifest_path) if manifest_path else None,
+        "executor": executor,
+        "makespan_seconds": round(makespan, 3),
+        "schedule": schedule.to_dict() if schedule else None,
     }
 
 
@@ -998,12 +1037,17 @@ def main():
         type=str,
         help="Apify API token for TikTok scraping (overrides env var)",
     )
+    parser.add_argument(
+        "--executor",
+        choices=list(EXECUTORS),
+        help="How to run 'all' pipelines (default: SDC_ORCHESTRATION__EXECUTOR, 'auto')",
+    )
 
     args = parser.parse_args()
 
-    if not PREFECT_AVAILABLE:
+    if not PREFECT_AVAILABLE and args.executor in (None, "auto", "prefect"):
         logger.warning(
-            "Prefect not installed. Running pipelines sequentially. "
+            "Prefect not installed. Running pipelines on the local scheduler. "
             "Install with: pip install prefect"
         )
 
@@ -1087,6 +1131,7 @@ def main():
             tiktok_api_token=tiktok_api_token,
             tiktok_user_id=tiktok_user_id,
             auto_deploy=args.auto_deploy,
+            executor=args.executor,
         )
     elif args.pipeline == "wikipedia":
         result = run_wikipedia_pipeline(force=args.force)
@@ -0,0 +1,286 @@
+"""
+Resource-aware local scheduler for orchestration runs without Prefect.
+
+Each source runs its pipeline stages (download -> extract -> process) in
+order on its own thread, but every stage first takes a slot from the pool
+of its resource class:
+
+- ``network``: downloads, scraping and dataset streaming (BBC, TikTok,
+  HuggingFace), which mostly wait on remote servers
+- ``cpu``: dump/XML parsing, cleaning, filtering and Parquet writing
+  (Wikipedia/Språkbanken extract, every ``process`` stage)
+
+so network-bound stages of one source overlap CPU-bound stages of others.
+Stages are threads of one process, so CPU-bound stages share the GIL: the
+CPU pool defaults to one slot, as more slots add contention, not
+parallelism. Source locks are still taken by ``_run_locked_pipeline_task``
+around the whole source run.
+
+Every stage records when it became ready, started and ended, plus the stage
+whose slot it inherited if it had to wait. ``ScheduleReport`` derives the
+makespan and the critical path (the chain of stages, through same-source
+order and resource hand-offs, that ended last) from these timings.
+
+Example:
+    >>> scheduler = LocalScheduler(network_slots=3)
+    >>> results, report = scheduler.run(
+    ...     [SourceJob("bbc", lambda stage_runner: run_bbc_task(stage_runner=stage_runner))]
+    ... )
+    >>> report.makespan_seconds, report.critical_path_names()
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+NETWORK = "network"
+CPU = "cpu"
+
+# Resource class of each BasePipeline.run() stage, per source
+SOURCE_STAGE_RESOURCES: dict[str, dict[str, str]] = {
+    "wikipedia": {"download": NETWORK, "extract": CPU, "process": CPU},
+    "bbc": {"download": NETWORK, "extract": NETWORK, "process": CPU},
+    "huggingface": {"download": NETWORK, "extract": NETWORK, "process": CPU},
+    "sprakbanken": {"download": NETWORK, "extract": CPU, "process": CPU},
+    "tiktok": {"download": NETWORK, "extract": NETWORK, "process": CPU},
+}
+DEFAULT_STAGE_RESOURCES = {"download": NETWORK, "extract": CPU, "process": CPU}
+
+# stage_runner(stage_name, stage_fn) -> stage_fn()
+StageRunner = Callable[[str, Callable[[], Any]], Any]
+
+
+@dataclass
+class StageTiming:
+    """Timing of one stage; times are seconds since the scheduler started."""
+
+    source: str
+    stage: str
+    resource: str
+    ready: float
+    started: float = 0.0
+    ended: float = 0.0
+    previous: Optional["StageTiming"] = field(default=None, repr=False)
+    blocked_by: Optional["StageTiming"] = field(default=None, repr=False)
+    failed: bool = False
+
+    @property
+    def name(self) -> str:
+        return f"{self.source}:{self.stage}"
+
+    @property
+    def duration(self) -> float:
+        return self.ended - self.started
+
+    @property
+    def wait(self) -> float:
+        return self.started - self.ready
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "source": self.source,
+            "stage": self.stage,
+            "resource": self.resource,
+            "started": round(self.started, 3),
+            "ended": round(self.ended, 3),
+            "duration_seconds": round(self.duration, 3),
+            "wait_seconds": round(self.wait, 3),
+            "blocked_by": self.blocked_by.name if self.blocked_by else None,
+            "failed": self.failed,
+        }
+
+
+@dataclass
+class SourceJob:
+    """
+    One source to schedule.
+
+    Args:
+        source: Processor name (also the key into SOURCE_STAGE_RESOURCES)
+        run: Runs the source with the given stage runner and returns its result dict
+        resources: Stage -> resource class override
+    """
+
+    source: str
+    run: Callable[[StageRunner], dict[str, Any]]
+    resources: Optional[dict[str, str]] = None
+
+
+class ResourcePool:
+    """Counting semaphore that remembers which stage released the last slot."""
+
+    def __init__(self, name: str, capacity: int):
+        if capacity < 1:
+            raise ValueError(f"{name} pool needs at least one slot, got {capacity}")
+        self.name = name
+        self.capacity = capacity
+        self._free = capacity
+        self._last_release: Optional[StageTiming] = None
+        self._cond = threading.Condition()
+
+    def acquire(self) -> Optional[StageTiming]:
+        """Take a slot; returns the stage that freed it if we had to wait."""
+        with self._cond:
+            waited = False
+            while self._free == 0:
+                waited = True
+                self._cond.wait()
+            self._free -= 1
+            return self._last_release if waited else None
+
+    def release(self, stage: StageTiming) -> None:
+        with self._cond:
+            self._free += 1
+            self._last_release = stage
+            self._cond.notify()
+
+
+@dataclass
+class ScheduleReport:
+    """Stage timings of one orchestration run."""
+
+    stages: list[StageTiming]
+    makespan_seconds: float
+    cpu_slots: int
+    network_slots: int
+
+    @property
+    def critical_path(self) -> list[StageTiming]:
+        """
+        Chain of stages that determined the makespan.
+
+        Walks back from the last stage to end; each step goes to whichever
+        of its gates (previous stage of the same source, or the stage whose
+        resource slot it waited for) ended later.
+        """
+        if not self.stages:
+            return []
+        stage: Optional[StageTiming] = max(self.stages, key=lambda s: s.ended)
+        path = []
+        while stage is not None:
+            path.append(stage)
+            gates = [gate for gate in (stage.previous, stage.blocked_by) if gate is not None]
+            stage = max(gates, key=lambda s: s.ended) if gates else None
+        return path[::-1]
+
+    def critical_path_names(self) -> list[str]:
+        return [stage.name for stage in self.critical_path]
+
+    def to_dict(self) -> dict[str, Any]:
+        path = self.critical_path
+        return {
+            "makespan_seconds": round(self.makespan_seconds, 3),
+            "critical_path": [stage.name for stage in path],
+            "critical_path_seconds": round(sum(stage.duration for stage in path), 3),
+            "cpu_slots": self.cpu_slots,
+            "network_slots": self.network_slots,
+            "stages": [stage.to_dict() for stage in self.stages],
+        }
+
+    def log_summary(self, log: logging.Logger = logger) -> None:
+        log.info(f"[SCHEDULE] Makespan: {self.makespan_seconds:.1f}s")
+        for stage in self.critical_path:
+            log.info(
+                f"[SCHEDULE]   critical: {stage.name:<24} {stage.resource:<8} "
+                f"{stage.duration:8.1f}s (waited {stage.wait:.1f}s)"
+            )
+
+
+class LocalScheduler:
+    """
+    Run sources concurrently with stage-level CPU and network slot limits.
+
+    Args:
+        cpu_slots: Concurrent CPU-bound stages. Stages are threads sharing the
+            GIL, so more than one slot only helps stages that release it
+        network_slots: Concurrent network-bound stages
+        max_concurrent_sources: Sources in flight at once, started in job
+            order (default: all; 1 runs sources strictly sequentially)
+    """
+
+    def __init__(
+        self,
+        cpu_slots: int = 1,
+        network_slots: int = 4,
+        max_concurrent_sources: Optional[int] = None,
+    ):
+        self.pools = {
+            CPU: ResourcePool(CPU, cpu_slots),
+            NETWORK: ResourcePool(NETWORK, network_slots),
+        }
+        self.max_concurrent_sources = max_concurrent_sources
+        self._stages: list[StageTiming] = []
+        self._stages_lock = threading.Lock()
+        self._origin = 0.0
+
+    def run(self, jobs: list[SourceJob]) -> tuple[list[dict[str, Any]], ScheduleReport]:
+        """
+        Run every job and wait for all of them.
+
+        Returns:
+            Result dicts in job order, and the schedule report
+        """
+        sources = [job.source for job in jobs]
+        if len(set(sources)) != len(sources):
+            raise ValueError(f"Each source can only be scheduled once per run: {sources}")
+
+        self._stages = []
+        self._origin = time.monotonic()
+        results: list[dict[str, Any]] = []
+        if jobs:
+            workers = min(self.max_concurrent_sources or len(jobs), len(jobs))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sdc-source") as pool:
+                futures = [pool.submit(self._run_job, job) for job in jobs]
+                results = [future.result() for future in futures]
+
+        report = ScheduleReport(
+            stages=sorted(self._stages, key=lambda s: s.started),
+            makespan_seconds=time.monotonic() - self._origin,
+            cpu_slots=self.pools[CPU].capacity,
+            network_slots=self.pools[NETWORK].capacity,
+        )
+        return results, report
+
+    def _run_job(self, job: SourceJob) -> dict[str, Any]:
+        resources = job.resources or SOURCE_STAGE_RESOURCES.get(job.source, DEFAULT_STAGE_RESOURCES)
+        previous: Optional[StageTiming] = None
+
+        def stage_runner(stage: str, fn: Callable[[], Any]) -> Any:
+            nonlocal previous
+            resource = resources.get(stage, CPU)
+            pool = self.pools[resource]
+            timing = StageTiming(
+                source=job.source,
+                stage=stage,
+                resource=resource,
+                ready=self._now(),
+                previous=previous,
+            )
+            timing.blocked_by = pool.acquire()
+            timing.started = self._now()
+            try:
+                return fn()
+            except BaseException:
+                timing.failed = True
+                raise
+            finally:
+                timing.ended = self._now()
+                pool.release(timing)
+                previous = timing
+                with self._stages_lock:
+                    self._stages.append(timing)
+
+        try:
+            return job.run(stage_runner)
+        except Exception as e:
+            logger.error(f"{job.source} failed in the local scheduler: {e}")
+            return {"source": job.source, "status": "failed", "error": str(e)}
+
+    def _now(self) -> float:
+        return time.monotonic() - self._origin
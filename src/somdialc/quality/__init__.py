@@ -21,13 +21,27 @@ Entry Points:
 
 For filter catalog:
     from somdialc.quality.filters.catalog import FilterCatalog
+
+The package-level re-exports are resolved lazily (PEP 562), so importing
+``somdialc.quality.text_cleaners`` does not load pyarrow via ``silver_writer``.
 """
 
-from .filter_engine import FilterEngine
-from .record_builder import RecordBuilder
-from .silver_writer import SilverDatasetWriter
+from typing import TYPE_CHECKING
+
+from ..infra.lazy_imports import lazy_exports
 
-# Alias for backward compatibility
-SilverWriter = SilverDatasetWriter
+if TYPE_CHECKING:
+    from .filter_engine import FilterEngine
+    from .record_builder import RecordBuilder
+    from .silver_writer import SilverDatasetWriter, SilverWriter
+
+_LAZY_EXPORTS = {
+    "FilterEngine": ".filter_engine",
+    "RecordBuilder": ".record_builder",
+    "SilverDatasetWriter": ".silver_writer",
+    "SilverWriter": ".silver_writer",
+}
 
 __all__ = ["FilterEngine", "RecordBuilder", "SilverDatasetWriter", "SilverWriter"]
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS)
@@ -3,20 +3,50 @@ FilterEngine: Centralized filter execution and statistics tracking.
 
 Responsibilities:
 - Execute quality filters on records
-- Track filter execution statistics
+- Track filter execution statistics and per-filter wall time
 - Provide filter pass/fail reasons
 - Support extensible filter registration
+- Optionally reorder rejecting filters by measured cost and selectivity
 """
 
 import logging
+import math
+import time
 from collections import Counter
-from typing import Any, Callable, Optional
+from typing import Any, Callable, NamedTuple, Optional
 
+import numpy as np
+
+from ..infra.logging_utils import LogSampler
+from .filter_functions import TextBatch
 from .filters.catalog import get_filter_label
 
 logger = logging.getLogger(__name__)
 
 
+class BatchFilterResult(NamedTuple):
+    """
+    Result of ``FilterEngine.apply_filters_batch``, one entry per input text.
+
+    Attributes:
+        passed: Boolean pass mask
+        reasons: Object array with the failing filter name (None where passed)
+        metadata: Metadata updates per row, as ``apply_filters`` would return them
+    """
+
+    passed: np.ndarray
+    reasons: np.ndarray
+    metadata: list[dict[str, Any]]
+
+
+def _merge(updates: dict[int, dict[str, Any]]) -> dict[str, Any]:
+    """Merge per-filter metadata updates in registration order."""
+    merged: dict[str, Any] = {}
+    for index in sorted(updates):
+        merged.update(updates[index])
+    return merged
+
+
 class FilterEngine:
     """
     Execute and manage filters for data quality.
@@ -50,22 +80,65 @@ class FilterEngine:
     Attributes:
         filters (list): List of registered filter functions
         filter_reasons (dict): Count of records filtered by each reason
+        filter_time_ns (Counter): Nanoseconds spent in each filter function
+        filter_calls (Counter): Calls per filter function
+        timing_enabled (bool): Whether per-filter timing is recorded
+        adaptive (bool): Whether adaptive cost-based ordering is enabled
+
+    Adaptive ordering:
+        With ``enable_adaptive_ordering()``, the first ``warmup_records`` records
+        run *every* filter (no short-circuit) to measure each filter's mean cost
+        and unconditional rejection rate. Rejecting filters are then ordered by
+        ``cost / rejection_rate`` ascending, which minimises expected cost per
+        record when filters reject independently; enrichment filters (registered
+        with ``enrichment=True`` or ``enrich_only=True``) run last and only for
+        records that pass. Accepted records are unaffected: every filter still
+        runs and metadata is merged in registration order. A record that fails
+        several filters is attributed to the first failing one in the evaluated
+        order, so per-filter rejection counts can shift towards cheap filters.
     """
 
-    def __init__(self, strict_mode: bool = False):
+    def __init__(
+        self,
+        strict_mode: bool = False,
+        adaptive: bool = False,
+        warmup_records: int = 1000,
+        debug_sample_every: int = 100,
+    ):
         """
         Initialize filter engine with empty filter list.
 
         Args:
             strict_mode: If True, filter errors cause record rejection.
                         If False (default), filter errors pass records through.
+            adaptive: Enable adaptive cost-based filter ordering
+            warmup_records: Records measured before the order is chosen
+            debug_sample_every: Log the first 10 rejections per filter at DEBUG,
+                then every Nth
         """
         self.filters: list[tuple[Callable, dict[str, Any]]] = []
         self.filter_stats: Counter = Counter()
+        self.error_count = 0
         self.strict_mode = strict_mode
+        self.timing_enabled = True
+        self.filter_time_ns: Counter = Counter()
+        self.filter_calls: Counter = Counter()
+        self.rejection_log_sampler = LogSampler(every=debug_sample_every)
+
+        self.adaptive = adaptive
+        self.warmup_records = warmup_records
+        self._enrichment: set[int] = set()
+        self._warmup_seen = 0
+        self._warmup_cost_ns: list[int] = []
+        self._warmup_rejects: list[int] = []
+        self._order: Optional[list[int]] = None
+        self._ordering_stats: dict[str, Any] = {}
 
     def register_filter(
-        self, filter_func: Callable, kwargs: Optional[dict[str, Any]] = None
+        self,
+        filter_func: Callable,
+        kwargs: Optional[dict[str, Any]] = None,
+        enrichment: Optional[bool] = None,
     ) -> None:
         """
         Register a filter function to be applied.
@@ -73,6 +146,9 @@ class FilterEngine:
         Args:
             filter_func: Filter function from preprocessing.filters
             kwargs: Optional dict of filter parameters
+            enrichment: Filter only adds metadata and never rejects (default:
+                inferred from ``enrich_only=True`` in kwargs). Adaptive ordering
+                runs enrichment filters last.
 
         Example:
             ```python
@@ -81,7 +157,32 @@ class FilterEngine:
             engine.register_filter(min_length_filter, {'min_length': 10})
             ```
         """
-        self.filters.append((filter_func, kwargs or {}))
+        kwargs = kwargs or {}
+        if enrichment is None:
+            enrichment = kwargs.get("enrich_only") is True
+        if enrichment:
+            self._enrichment.add(len(self.filters))
+        self.filters.append((filter_func, kwargs))
+        self._reset_adaptive_state()
+
+    def enable_adaptive_ordering(self, warmup_records: Optional[int] = None) -> None:
+        """
+        Turn on adaptive cost-based ordering (see class docstring).
+
+        Args:
+            warmup_records: Records measured before the order is chosen
+        """
+        self.adaptive = True
+        if warmup_records is not None:
+            self.warmup_records = warmup_records
+        self._reset_adaptive_state()
+
+    def _reset_adaptive_state(self) -> None:
+        self._warmup_seen = 0
+        self._warmup_cost_ns = [0] * len(self.filters)
+        self._warmup_rejects = [0] * len(self.filters)
+        self._order = None
+        self._ordering_stats = {}
 
     def apply_filters(
         self, cleaned_text: str, record_title: str = ""
@@ -115,49 +216,373 @@ class FilterEngine:
             # Empty text should fail early (not reach filters)
             return False, "empty_after_cleaning", {}
 
+        if self.adaptive:
+            if self._order is not None:
+                return self._apply_ordered(cleaned_text, record_title)
+            return self._apply_warmup(cleaned_text, record_title)
+
         filter_metadata = {}
+        timing = self.timing_enabled
+        now = time.perf_counter_ns
 
         for filter_func, filter_kwargs in self.filters:
             try:
-                passes, metadata_updates = filter_func(cleaned_text, **filter_kwargs)
+                if timing:
+                    start = now()
+                    passes, metadata_updates = filter_func(cleaned_text, **filter_kwargs)
+                    self.filter_time_ns[filter_func.__name__] += now() - start
+                    self.filter_calls[filter_func.__name__] += 1
+                else:
+                    passes, metadata_updates = filter_func(cleaned_text, **filter_kwargs)
 
                 if not passes:
-                    # Record failed this filter
-                    filter_name = filter_func.__name__
-                    self.filter_stats[f"filtered_by_{filter_name}"] += 1
-
-                    # Debug log for filter rejections
-                    if record_title:
-                        logger.debug(f"Record '{record_title[:50]}...' filtered by {filter_name}")
-
-                    return False, filter_name, filter_metadata
+                    return self._reject(filter_func.__name__, record_title, filter_metadata)
 
                 # Merge metadata updates from filter
                 filter_metadata.update(metadata_updates)
 
             except Exception as e:
-                filter_name = filter_func.__name__
+                if self._filter_error(filter_func.__name__, e, record_title):
+                    return False, f"{filter_func.__name__}_error", filter_metadata
+                continue
+
+        return True, None, filter_metadata
 
-                # Log error with full traceback for debugging
-                logger.error(
-                    f"Filter {filter_name} raised error on '{record_title[:50] if record_title else 'record'}': {e}",
-                    exc_info=True,  # Include full traceback
+    def _reject(
+        self, filter_name: str, record_title: str, filter_metadata: dict[str, Any]
+    ) -> tuple[bool, Optional[str], dict[str, Any]]:
+        """Count a rejection by ``filter_name`` and build the apply_filters result."""
+        self.filter_stats[f"filtered_by_{filter_name}"] += 1
+        self._log_rejection(filter_name, record_title)
+        return False, filter_name, filter_metadata
+
+    def _log_rejection(self, filter_name: str, record_title: str) -> None:
+        """Sampled debug log of a rejection (no formatting unless DEBUG is on)."""
+        if record_title and logger.isEnabledFor(logging.DEBUG):
+            occurrence = self.rejection_log_sampler(filter_name)
+            if occurrence:
+                logger.debug(
+                    f"Record '{record_title[:50]}...' filtered by {filter_name} "
+                    f"(rejection #{occurrence}; sampled 1/{self.rejection_log_sampler.every})"
                 )
 
-                # Track filter failures for monitoring
-                self.filter_stats[f"filter_error_{filter_name}"] += 1
+    def record_rejection(self, filter_name: str) -> None:
+        """Count a rejection decided outside the engine (e.g. a cached verdict)."""
+        self.filter_stats[f"filtered_by_{filter_name}"] += 1
+
+    def _filter_error(self, filter_name: str, error: Exception, record_title: str) -> bool:
+        """
+        Log and count a filter exception.
+
+        Returns:
+            True if the record must be rejected (strict mode)
+        """
+        # Log error with full traceback for debugging
+        logger.error(
+            f"Filter {filter_name} raised error on '{record_title[:50] if record_title else 'record'}': {error}",
+            exc_info=True,  # Include full traceback
+        )
+
+        # Track filter failures for monitoring
+        self.filter_stats[f"filter_error_{filter_name}"] += 1
+        self.error_count += 1
+
+        # Default policy: Treat as pass to avoid data loss
+        # Configurable via FilterEngine.__init__(strict_mode=False)
+        if self.strict_mode:
+            # Strict mode: Filter errors cause rejection
+            return True
+        # Permissive mode: Filter errors are pass-through
+        logger.warning(f"Filter {filter_name} error treated as PASS (permissive mode)")
+        return False
+
+    def apply_filters_batch(
+        self, texts: list[str], titles: Optional[list[str]] = None
+    ) -> BatchFilterResult:
+        """
+        Apply all registered filters to a batch of cleaned texts.
+
+        Row for row the outcome matches ``apply_filters``: the first failing
+        filter (in the current evaluation order) is the reason, and metadata
+        is merged in registration order from the filters that passed before
+        it. Filters with a ``batch`` variant run once over the rows still
+        alive; the rest are called per row. While adaptive ordering is warming
+        up, every filter runs over every non-empty row and feeds the warm-up
+        measurements; the order is chosen after the batch that completes it.
 
-                # Default policy: Treat as pass to avoid data loss
-                # Configurable via FilterEngine.__init__(strict_mode=False)
-                if self.strict_mode:
-                    # Strict mode: Filter errors cause rejection
-                    return False, f"{filter_name}_error", filter_metadata
+        Args:
+            texts: Cleaned texts
+            titles: Optional record titles (debug logging), aligned with texts
+
+        Returns:
+            BatchFilterResult(passed, reasons, metadata)
+
+        Example:
+            >>> result = engine.apply_filters_batch(["Waa maxay", "A" * 80])
+            >>> result.passed.tolist(), result.reasons.tolist()
+            ([False, True], ['min_length_filter', None])
+        """
+        n = len(texts)
+        titles = titles if titles is not None else [""] * n
+        texts = [text if isinstance(text, str) else "" for text in texts]
+        reasons = np.full(n, None, dtype=object)
+        alive = np.fromiter((bool(text.strip()) for text in texts), dtype=bool, count=n)
+        reasons[~alive] = "empty_after_cleaning"
+
+        batch = TextBatch(texts)
+        updates: dict[int, tuple[np.ndarray, dict[str, Any]]] = {}
+        warmup = self.adaptive and self._order is None
+        order = self._order if self.adaptive and not warmup else range(len(self.filters))
+        warmup_rows = np.flatnonzero(alive)
+        timing = self.timing_enabled
+        now = time.perf_counter_ns
+        log_rejections = logger.isEnabledFor(logging.DEBUG)
+
+        for index in order:
+            rows = warmup_rows if warmup else np.flatnonzero(alive)
+            if rows.size == 0:
+                break
+            filter_func, filter_kwargs = self.filters[index]
+            filter_name = filter_func.__name__
+            start = now()
+            row_passes, columns, error_rows = self._run_batch_filter(
+                filter_func, filter_kwargs, batch, rows, titles
+            )
+            elapsed = now() - start
+            if timing:
+                self.filter_time_ns[filter_name] += elapsed
+                self.filter_calls[filter_name] += int(rows.size)
+            if warmup:
+                self._warmup_cost_ns[index] += elapsed
+                self._warmup_rejects[index] += int(rows.size - np.count_nonzero(row_passes))
+                # Only rows no earlier filter rejected take this filter's outcome
+                live = alive[rows]
+                rows, row_passes = rows[live], row_passes[live]
+                error_rows = [row for row in error_rows if alive[row]]
+
+            failed_rows = rows[~row_passes]
+            if failed_rows.size:
+                alive[failed_rows] = False
+                reasons[failed_rows] = filter_name
+                for row in error_rows:
+                    reasons[row] = f"{filter_name}_error"
+                rejected = failed_rows.size - len(error_rows)
+                if rejected:
+                    self.filter_stats[f"filtered_by_{filter_name}"] += rejected
+                if log_rejections:
+                    for row in failed_rows.tolist():
+                        if reasons[row] == filter_name:
+                            self._log_rejection(filter_name, titles[row])
+            updates[index] = (rows[row_passes], columns)
+
+        if warmup and warmup_rows.size:
+            self._warmup_seen += int(warmup_rows.size)
+            if self._warmup_seen >= self.warmup_records:
+                self._choose_order()
+
+        metadata: list[dict[str, Any]] = [{} for _ in range(n)]
+        for index in sorted(updates):
+            passed_rows, columns = updates[index]
+            for key, values in columns.items():
+                if isinstance(values, dict):  # Scalar fallback: {row: value} for passed rows
+                    for row in passed_rows.tolist():
+                        if row in values:
+                            metadata[row][key] = values[row]
                 else:
-                    # Permissive mode: Filter errors are pass-through
-                    logger.warning(f"Filter {filter_name} error treated as PASS (permissive mode)")
-                    continue
+                    for row in passed_rows:
+                        metadata[row][key] = values[row]
+        return BatchFilterResult(passed=alive, reasons=reasons, metadata=metadata)
+
+    def _run_batch_filter(
+        self,
+        filter_func: Callable,
+        filter_kwargs: dict[str, Any],
+        batch: TextBatch,
+        rows: np.ndarray,
+        titles: list[str],
+    ) -> tuple[np.ndarray, dict[str, Any], list[int]]:
+        """
+        Evaluate one filter on ``rows`` of ``batch``.
 
-        return True, None, filter_metadata
+        Returns:
+            (pass mask aligned with rows, metadata columns, rows rejected by a
+            filter error in strict mode). Columns are per-row sequences from a
+            batch variant, or ``{row: value}`` dicts from the scalar fallback.
+        """
+        batch_variant = getattr(filter_func, "batch", None)
+        if batch_variant is not None:
+            try:
+                mask, columns = batch_variant(batch, **filter_kwargs)
+                columns = {
+                    key: values.tolist() if isinstance(values, np.ndarray) else values
+                    for key, values in columns.items()
+                }
+                return np.asarray(mask, dtype=bool)[rows], columns, []
+            except Exception as e:
+                logger.warning(
+                    f"Batch variant of {filter_func.__name__} failed ({e}); using scalar filter"
+                )
+
+        passes = np.ones(rows.size, dtype=bool)
+        columns: dict[str, dict[int, Any]] = {}
+        error_rows = []
+        for position, row in enumerate(rows.tolist()):
+            try:
+                row_passes, metadata_updates = filter_func(batch.texts[row], **filter_kwargs)
+            except Exception as e:
+                if self._filter_error(filter_func.__name__, e, titles[row]):
+                    passes[position] = False
+                    error_rows.append(row)
+                continue
+            if not row_passes:
+                passes[position] = False
+                continue
+            for key, value in metadata_updates.items():
+                columns.setdefault(key, {})[row] = value
+        return passes, columns, error_rows
+
+    def _apply_warmup(
+        self, cleaned_text: str, record_title: str
+    ) -> tuple[bool, Optional[str], dict[str, Any]]:
+        """
+        Run every filter (no short-circuit) and record cost and rejections.
+
+        The outcome is the same as in registration order: the first failing
+        filter is reported, with the metadata of the filters before it.
+        """
+        filter_metadata = {}
+        failure: Optional[tuple[str, str]] = None
+        timing = self.timing_enabled
+        now = time.perf_counter_ns
+
+        for index, (filter_func, filter_kwargs) in enumerate(self.filters):
+            filter_name = filter_func.__name__
+            start = now()
+            try:
+                passes, metadata_updates = filter_func(cleaned_text, **filter_kwargs)
+            except Exception as e:
+                passes, metadata_updates = not self._filter_error(filter_name, e, record_title), {}
+                if not passes and failure is None:
+                    failure = (filter_name, f"{filter_name}_error")
+            elapsed = now() - start
+            self._warmup_cost_ns[index] += elapsed
+            if timing:
+                self.filter_time_ns[filter_name] += elapsed
+                self.filter_calls[filter_name] += 1
+
+            if not passes:
+                self._warmup_rejects[index] += 1
+                if failure is None:
+                    failure = (filter_name, filter_name)
+            elif failure is None:
+                filter_metadata.update(metadata_updates)
+
+        self._warmup_seen += 1
+        if self._warmup_seen >= self.warmup_records:
+            self._choose_order()
+
+        if failure is None:
+            return True, None, filter_metadata
+        filter_name, reason = failure
+        if reason != filter_name:
+            return False, reason, filter_metadata
+        return self._reject(filter_name, record_title, filter_metadata)
+
+    def _apply_ordered(
+        self, cleaned_text: str, record_title: str
+    ) -> tuple[bool, Optional[str], dict[str, Any]]:
+        """Short-circuit in the adaptive order; merge metadata in registration order."""
+        updates: dict[int, dict[str, Any]] = {}
+        timing = self.timing_enabled
+        now = time.perf_counter_ns
+
+        for index in self._order:
+            filter_func, filter_kwargs = self.filters[index]
+            try:
+                if timing:
+                    start = now()
+                    passes, metadata_updates = filter_func(cleaned_text, **filter_kwargs)
+                    self.filter_time_ns[filter_func.__name__] += now() - start
+                    self.filter_calls[filter_func.__name__] += 1
+                else:
+                    passes, metadata_updates = filter_func(cleaned_text, **filter_kwargs)
+
+                if not passes:
+                    return self._reject(filter_func.__name__, record_title, _merge(updates))
+
+                updates[index] = metadata_updates
+
+            except Exception as e:
+                if self._filter_error(filter_func.__name__, e, record_title):
+                    return False, f"{filter_func.__name__}_error", _merge(updates)
+                continue
+
+        return True, None, _merge(updates)
+
+    @staticmethod
+    def _expected_cost(order: list[int], costs: list[float], reject_rates: list[float]) -> float:
+        """Expected cost per record of short-circuiting in ``order`` (independent filters)."""
+        expected = 0.0
+        reach = 1.0
+        for index in order:
+            expected += reach * costs[index]
+            reach *= 1 - reject_rates[index]
+        return expected
+
+    def _choose_order(self) -> None:
+        """Pick the evaluation order from the warm-up measurements."""
+        n = max(self._warmup_seen, 1)
+        costs = [cost / n for cost in self._warmup_cost_ns]
+        reject_rates = [rejects / n for rejects in self._warmup_rejects]
+
+        def rank(index: int) -> float:
+            if reject_rates[index] == 0:
+                return math.inf
+            return costs[index] / reject_rates[index]
+
+        indices = range(len(self.filters))
+        rejecting = sorted(
+            (i for i in indices if i not in self._enrichment), key=lambda i: (rank(i), i)
+        )
+        enrichment = [i for i in indices if i in self._enrichment]
+        self._order = rejecting + enrichment
+
+        baseline = self._expected_cost(list(indices), costs, reject_rates)
+        adaptive = self._expected_cost(self._order, costs, reject_rates)
+        names = [self.filters[i][0].__name__ for i in self._order]
+        self._ordering_stats = {
+            "order": names,
+            "registered_order": [func.__name__ for func, _ in self.filters],
+            "warmup_records": self._warmup_seen,
+            "filters": {
+                self.filters[i][0].__name__: {
+                    "mean_cost_us": round(costs[i] / 1e3, 3),
+                    "rejection_rate": round(reject_rates[i], 4),
+                    "enrichment": i in self._enrichment,
+                }
+                for i in indices
+            },
+            "expected_cost_us_registered": round(baseline / 1e3, 3),
+            "expected_cost_us_adaptive": round(adaptive / 1e3, 3),
+            "estimated_savings_pct": round(100 * (1 - adaptive / baseline), 2) if baseline else 0.0,
+        }
+        logger.info(
+            f"Adaptive filter order after {self._warmup_seen} records: {' -> '.join(names)} "
+            f"(estimated savings {self._ordering_stats['estimated_savings_pct']:.1f}%)"
+        )
+
+    def get_ordering_stats(self) -> dict[str, Any]:
+        """
+        Get the adaptive ordering decision.
+
+        Returns:
+            Dict with the chosen ``order``, ``registered_order``,
+            ``warmup_records``, per-filter ``mean_cost_us``/``rejection_rate``,
+            expected cost per record under both orders and
+            ``estimated_savings_pct``; empty until warm-up completes or when
+            adaptive ordering is off
+        """
+        return dict(self._ordering_stats)
 
     def get_filter_stats(self) -> dict[str, int]:
         """
@@ -173,6 +598,18 @@ class FilterEngine:
         """
         return dict(self.filter_stats)
 
+    def get_filter_timings(self) -> dict[str, tuple[int, int]]:
+        """
+        Get per-filter wall time.
+
+        Returns:
+            Dictionary mapping filter_name -> (total_ns, calls)
+        """
+        return {
+            name: (elapsed, self.filter_calls[name])
+            for name, elapsed in self.filter_time_ns.items()
+        }
+
     def get_human_readable_stats(self) -> dict[str, tuple[str, int]]:
         """
         Get filter statistics with human-readable labels.
@@ -196,3 +633,7 @@ class FilterEngine:
     def reset_stats(self) -> None:
         """Reset filter statistics (useful for testing or batch processing)."""
         self.filter_stats.clear()
+        self.error_count = 0
+        self.filter_time_ns.clear()
+        self.filter_calls.clear()
+        self._reset_adaptive_state()
@@ -84,6 +84,11 @@ FILTER_CATALOG: dict[str, tuple[str, str, str]] = {
         "Record's text hash already seen earlier in this run (e.g., Wikipedia redirect targets and stub pages that share content with another article).",
         "dedup",
     ),
+    "near_duplicate": (
+        "Near duplicate",
+        "Cleaned text is a MinHash near-duplicate (Jaccard similarity at or above the dedup threshold) of a record accepted earlier in this run.",
+        "dedup",
+    ),
     # Placeholder filters for future enhancements
     "profanity_filter": (
         "Profanity detected",
@@ -12,7 +12,7 @@ import logging
 from typing import TYPE_CHECKING, Any, Optional, cast
 
 from ..version import __pipeline_version__
-from .record_utils import build_silver_record
+from .record_utils import RecordDigests, build_silver_record
 
 if TYPE_CHECKING:
     # String-only annotation breaks the circular path:
@@ -73,6 +73,7 @@ class RecordBuilder:
         pipeline_version: str = __pipeline_version__,
         language: str = "so",
         source_metadata: Optional[dict] = None,
+        digests: Optional[RecordDigests] = None,
     ) -> dict[str, Any]:
         """
         Build a standardized silver dataset record.
@@ -88,6 +89,8 @@ class RecordBuilder:
             pipeline_version: Version of processing pipeline (default: "2.1.0")
             language: ISO 639-1 language code (default: "so")
             source_metadata: Source-specific metadata (merged with raw_record.metadata)
+            digests: Precomputed ``RecordDigests.of(cleaned_text)``, reused for
+                text_hash and id instead of hashing the text again
 
         Returns:
             Dictionary with standardized schema including schema_version and run_id
@@ -154,6 +157,7 @@ class RecordBuilder:
             embedding=None,  # Placeholder for future embeddings
             register=register,
             source_id=source_id,
+            digests=digests,
         )
 
         # Add schema versioning fields
@@ -6,7 +6,8 @@ Pure functions with no side effects - easily testable and reusable.
 
 import hashlib
 import json
-from typing import Optional
+from dataclasses import dataclass
+from typing import Optional, Union
 
 from ..version import __pipeline_version__
 
@@ -46,6 +47,63 @@ def generate_record_id(*components: str) -> str:
     return hashlib.sha256(combined.encode("utf-8")).hexdigest()
 
 
+def hash_fingerprint(value: Union[str, int]) -> int:
+    """
+    64-bit fingerprint of a hash for in-memory sets.
+
+    A hex digest maps to its first 8 bytes, so it equals the
+    ``RecordDigests.fingerprint`` of the same digest; other strings are
+    hashed with BLAKE2b. Ints are returned unchanged.
+
+    Example:
+        >>> hash_fingerprint("b94d27b9934d3e08a52e52d7da7dabfac484efe37a5380ee9088f7ace2efcde9")
+        13352372148217134600
+    """
+    if isinstance(value, int):
+        return value
+    if len(value) >= 16:
+        try:
+            return int(value[:16], 16)
+        except ValueError:
+            pass
+    return int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+@dataclass(frozen=True)
+class RecordDigests:
+    """
+    Digests of one record's text, computed once and threaded through the pipeline.
+
+    Attributes:
+        text_hash: Hex digest (the public ``text_hash`` and input to ``id``)
+        fingerprint: First 8 bytes of the digest as an int, for in-memory dedup sets
+
+    Example:
+        >>> digests = RecordDigests.of("hello world")
+        >>> digests.text_hash == generate_text_hash("hello world")
+        True
+        >>> digests.fingerprint == hash_fingerprint(digests.text_hash)
+        True
+    """
+
+    text_hash: str
+    fingerprint: int
+
+    @classmethod
+    def from_digest(cls, digest: bytes) -> "RecordDigests":
+        """Build from a raw digest (at least 8 bytes)."""
+        return cls(text_hash=digest.hex(), fingerprint=int.from_bytes(digest[:8], "big"))
+
+    @classmethod
+    def of(cls, text: str) -> "RecordDigests":
+        """SHA-256 digests of ``text`` (UTF-8 encoded once)."""
+        return cls.from_digest(hashlib.sha256(text.encode("utf-8")).digest())
+
+    def record_id(self, *components: str) -> str:
+        """``generate_record_id(*components, text_hash)``."""
+        return generate_record_id(*components, self.text_hash)
+
+
 def count_tokens(text: str) -> int:
     """
     Simple whitespace-based token counting.
@@ -80,6 +138,7 @@ def build_silver_record(
     embedding: Optional[str] = None,
     register: Optional[str] = None,
     source_id: Optional[str] = None,
+    digests: Optional[RecordDigests] = None,
 ) -> dict:
     """
     Build a standardized silver dataset record.
@@ -107,6 +166,7 @@ def build_silver_record(
                   - social → "informal"
         source_id: Source-specific identifier (e.g., corpus_id for Språkbanken,
                    article_id for BBC, page_id for Wikipedia)
+        digests: Precomputed ``RecordDigests.of(text)`` (computed here if None)
 
     Returns:
         Dictionary with standardized schema
@@ -124,8 +184,10 @@ def build_silver_record(
         >>> record["id"]
         '...' # 64-character hex string
     """
-    text_hash = generate_text_hash(text)
-    record_id = generate_record_id(title, url, text_hash)
+    if digests is None:
+        digests = RecordDigests.of(text)
+    text_hash = digests.text_hash
+    record_id = digests.record_id(title, url)
     tokens = count_tokens(text)
 
     # JSON-serialize source_metadata to match schema and prevent schema drift
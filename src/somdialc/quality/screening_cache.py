@@ -0,0 +1,339 @@
+"""
+Cross-run cache of cleaning and filter verdicts, keyed by raw-content hash.
+
+A ``--force`` rerun or a Wikipedia refresh re-reads mostly unchanged raw
+text. ScreeningCache remembers, per raw text, what cleaning and filtering
+decided: whether the record passed, the failing filter, the filter metadata
+and the SHA-256 and length of the cleaned text. BasePipeline consults it
+before ``text_cleaner.clean`` / ``apply_filters``:
+
+- cached rejection: cleaning and filtering are skipped entirely
+- cached pass: the text is still cleaned (the silver record needs it), and
+  the cached verdict is reused when the cleaned text hashes the same
+- miss: cleaned and filtered as usual, and the outcome is stored
+
+Invalidation is automatic. Each key hashes the raw text together with a
+*screening fingerprint*: the source files defining the cleaners and filters,
+the cleaners' configuration, every filter's name and arguments, and the
+engine's strict mode. Editing a cleaner or filter, or changing a threshold,
+yields new keys; stale rows are simply never read again (``clear`` drops
+them).
+
+Example:
+    >>> cache = ScreeningCache(Path("data/cache/screening.db"))
+    >>> fingerprint = screening_fingerprint(text_cleaner, filter_engine)
+    >>> key = cache.key("Raw article text", fingerprint)
+    >>> cache.get(key) is None
+    True
+"""
+
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# Bump when the meaning of a stored verdict changes in a way the fingerprint cannot see
+CACHE_VERSION = 1
+
+_FLUSH_EVERY = 500
+
+
+@dataclass(frozen=True)
+class ScreeningResult:
+    """A stored cleaning and filtering outcome."""
+
+    passed: bool
+    failed_filter: Optional[str]
+    metadata: dict[str, Any]
+    cleaned_sha256: str
+    char_count: int
+    token_count: int
+
+
+@functools.cache
+def _file_digest(path: str) -> str:
+    try:
+        return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+    except OSError:
+        return "unreadable"
+
+
+def _source_digest(obj: Any) -> str:
+    """Digest of the source file defining ``obj`` (falls back to its bytecode)."""
+    try:
+        path = inspect.getsourcefile(obj)
+    except TypeError:
+        path = None
+    if path:
+        return _file_digest(path)
+    code = getattr(obj, "__code__", None)
+    return hashlib.sha256(code.co_code).hexdigest() if code is not None else "builtin"
+
+
+def _describe(value: Any, depth: int = 0) -> Any:
+    """A stable, JSON-able description of a cleaner attribute or filter argument."""
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    if depth > 8:
+        return type(value).__qualname__
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = [_describe(item, depth + 1) for item in value]
+        return sorted(items, key=repr) if isinstance(value, (set, frozenset)) else items
+    if isinstance(value, dict):
+        return {str(key): _describe(item, depth + 1) for key, item in sorted(value.items())}
+    pattern = getattr(value, "pattern", None)
+    if isinstance(pattern, (str, bytes)):  # Compiled regex
+        return ["re", repr(pattern), getattr(value, "flags", 0)]
+    if isinstance(value, functools.partial):
+        return [
+            "partial",
+            _describe(value.func, depth + 1),
+            _describe(value.args, depth + 1),
+            _describe(value.keywords, depth + 1),
+        ]
+    if inspect.isroutine(value) or inspect.isclass(value):
+        func = getattr(value, "__func__", value)
+        return [getattr(func, "__module__", ""), func.__qualname__, _source_digest(func)]
+    described = [type(value).__module__, type(value).__qualname__, _source_digest(type(value))]
+    if hasattr(value, "__dict__"):
+        described.append(_describe(vars(value), depth + 1))
+    return described
+
+
+def screening_fingerprint(text_cleaner: Any, filter_engine: Any) -> str:
+    """
+    Fingerprint the cleaning and filtering configuration.
+
+    Args:
+        text_cleaner: Object with a ``clean(text)`` method (usually a TextCleaningPipeline)
+        filter_engine: FilterEngine whose registered filters decide the verdict
+
+    Returns:
+        Hex digest that changes whenever cleaner or filter code or settings change
+    """
+    description = {
+        "version": CACHE_VERSION,
+        "cleaner": _describe(text_cleaner),
+        "filters": [[_describe(func), _describe(kwargs)] for func, kwargs in filter_engine.filters],
+        "strict_mode": bool(filter_engine.strict_mode),
+    }
+    return hashlib.sha256(json.dumps(description, sort_keys=True).encode()).hexdigest()
+
+
+class ScreeningCache:
+    """
+    SQLite store of screening verdicts.
+
+    Thread-safe in the same way as HTTPResponseCache: each thread gets its
+    own WAL-mode connection. Writes are buffered and committed in batches
+    of ``flush_every``; pending rows are visible to ``get``.
+    """
+
+    def __init__(self, db_path: Path, flush_every: int = _FLUSH_EVERY):
+        """
+        Initialize cache.
+
+        Args:
+            db_path: SQLite database file (parent directories are created)
+            flush_every: Buffered rows written per transaction
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.flush_every = max(flush_every, 1)
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._pending: dict[str, tuple] = {}
+        self.stats: Counter = Counter()
+
+        self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS verdicts (
+                cache_key TEXT PRIMARY KEY,
+                fingerprint TEXT NOT NULL,
+                passed INTEGER NOT NULL,
+                failed_filter TEXT,
+                metadata TEXT NOT NULL,
+                cleaned_sha256 TEXT NOT NULL,
+                char_count INTEGER NOT NULL,
+                token_count INTEGER NOT NULL,
+                stored_at REAL NOT NULL
+            )
+        """)
+        self.connection.execute(
+            "CREATE INDEX IF NOT EXISTS idx_verdicts_fingerprint ON verdicts(fingerprint)"
+        )
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Get thread-local connection."""
+        if not hasattr(self._local, "conn"):
+            conn = sqlite3.connect(str(self.db_path), timeout=60.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            self._local.conn = conn
+        return self._local.conn
+
+    @staticmethod
+    def key(raw_text: str, fingerprint: str) -> str:
+        """Cache key for a raw text under a screening fingerprint."""
+        digest = hashlib.sha256(fingerprint.encode())
+        digest.update(raw_text.encode("utf-8", "surrogatepass"))
+        return digest.hexdigest()
+
+    @staticmethod
+    def text_digest(text: str) -> str:
+        """SHA-256 of a cleaned text, as stored in ``cleaned_sha256``."""
+        return hashlib.sha256(text.encode("utf-8", "surrogatepass")).hexdigest()
+
+    def count(self, event: str) -> None:
+        with self._lock:
+            self.stats[event] += 1
+
+    def get(self, cache_key: str) -> Optional[ScreeningResult]:
+        """Look up a verdict (None on a miss)."""
+        with self._lock:
+            row = self._pending.get(cache_key)
+        if row is not None:
+            row = row[2:8]
+        else:
+            row = self.connection.execute(
+                "SELECT passed, failed_filter, metadata, cleaned_sha256, char_count, token_count "
+                "FROM verdicts WHERE cache_key = ?",
+                (cache_key,),
+            ).fetchone()
+            if row is None:
+                return None
+        passed, failed_filter, metadata, cleaned_sha256, char_count, token_count = row
+        return ScreeningResult(
+            passed=bool(passed),
+            failed_filter=failed_filter,
+            metadata=json.loads(metadata),
+            cleaned_sha256=cleaned_sha256,
+            char_count=char_count,
+            token_count=token_count,
+        )
+
+    def put(
+        self,
+        cache_key: str,
+        fingerprint: str,
+        cleaned: str,
+        passed: bool,
+        failed_filter: Optional[str],
+        metadata: dict[str, Any],
+    ) -> bool:
+        """
+        Buffer a verdict for storage.
+
+        Metadata that does not survive a JSON round trip unchanged (tuples,
+        numpy scalars, ...) is not cached, so a hit always reproduces the
+        original record exactly.
+
+        Returns:
+            True if the verdict was buffered
+        """
+        try:
+            encoded = json.dumps(metadata, sort_keys=True)
+            cacheable = json.loads(encoded) == metadata
+        except (TypeError, ValueError):
+            cacheable = False
+        if not cacheable:
+            self.count("uncacheable")
+            return False
+
+        row = (
+            cache_key,
+            fingerprint,
+            int(passed),
+            failed_filter,
+            encoded,
+            self.text_digest(cleaned),
+            len(cleaned),
+            len(cleaned.split()),
+            time.time(),
+        )
+        with self._lock:
+            self._pending[cache_key] = row
+            self.stats["stores"] += 1
+            full = len(self._pending) >= self.flush_every
+        if full:
+            self.flush()
+        return True
+
+    def flush(self) -> None:
+        """Write buffered verdicts in one transaction."""
+        with self._lock:
+            rows = list(self._pending.values())
+            self._pending.clear()
+        if not rows:
+            return
+        conn = self.connection
+        conn.execute("BEGIN")
+        try:
+            conn.executemany(
+                "INSERT OR REPLACE INTO verdicts VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def clear(self, keep_fingerprint: Optional[str] = None) -> int:
+        """
+        Delete stored verdicts.
+
+        Args:
+            keep_fingerprint: Keep rows written under this fingerprint
+
+        Returns:
+            Number of rows deleted
+        """
+        self.flush()
+        if keep_fingerprint is None:
+            cursor = self.connection.execute("DELETE FROM verdicts")
+        else:
+            cursor = self.connection.execute(
+                "DELETE FROM verdicts WHERE fingerprint != ?", (keep_fingerprint,)
+            )
+        return cursor.rowcount
+
+    def statistics(self) -> dict[str, Any]:
+        """Get cache statistics (entries, fingerprints, hit/miss counters)."""
+        self.flush()
+        entries, fingerprints = self.connection.execute(
+            "SELECT COUNT(*), COUNT(DISTINCT fingerprint) FROM verdicts"
+        ).fetchone()
+        with self._lock:
+            counters = dict(self.stats)
+        return {"entries": entries, "fingerprints": fingerprints, **counters}
+
+    def close(self) -> None:
+        """Flush and close this thread's connection."""
+        self.flush()
+        if hasattr(self._local, "conn"):
+            self._local.conn.close()
+            del self._local.conn
+
+
+def get_screening_cache(db_path: Optional[Path] = None) -> ScreeningCache:
+    """
+    Open the screening cache configured in ``config.filters``.
+
+    Args:
+        db_path: Override for ``config.filters.result_cache_path``
+    """
+    if db_path is None:
+        from ..infra.config import get_config
+
+        db_path = get_config().filters.result_cache_path
+    return ScreeningCache(db_path)
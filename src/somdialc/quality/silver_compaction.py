@@ -0,0 +1,412 @@
+"""
+Incremental compaction of silver partitions.
+
+Every ``SilverDatasetWriter.write`` batch adds one
+``{source}_{run_id}_silver_part-NNNN.parquet`` fragment, so each
+``source=/date_accessed=`` partition collects many small files.
+``SilverCompactor`` merges a partition's small fragments into files of about
+``target_file_bytes``, sorted by ``text_hash``, with ``row_group_rows`` rows
+per row group. The hash sort only makes byte-identical texts adjacent; it
+does not group similar ones. Its purpose is lookups: each row group gets a
+narrow ``text_hash`` min/max range, so a hash lookup reads one row group
+instead of the whole file. The size reduction comes from zstd and from
+fewer, larger row groups.
+
+Only partitions whose file set changed since their last compaction are
+touched. Partitions written to within ``settle_seconds`` are skipped: a
+pipeline may still be adding fragments to them. Each partition's state is
+recorded in the compaction log, ``_metadata/_compaction_log.jsonl``.
+
+Swap protocol, per partition:
+
+1. Write the merged files under ``.tmp`` names (ignored by readers) and
+   check their row counts.
+2. Append a ``pending`` log entry listing inputs, outputs and which output
+   each input was merged into.
+3. Rename the outputs into place and delete the merged fragments.
+4. Update the ``_metadata`` sidecars. The merged parts leave their run's
+   ``checksums``, and ``compacted_into`` records where they went. A new
+   sidecar holds the checksums of the compacted files.
+5. Append a ``done`` entry.
+
+A run interrupted after step 2 is rolled forward by the next one.
+
+Example:
+    >>> report = SilverCompactor(Path("data/processed/silver")).compact()
+    >>> report.files_merged, report.files_written
+    (412, 9)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from filelock import FileLock, Timeout
+
+from ..version import __pipeline_version__
+from .silver_writer import SilverDatasetWriter
+
+logger = logging.getLogger(__name__)
+
+COMPACTION_LOG = "_compaction_log.jsonl"
+SORT_KEY = "text_hash"
+_PART_MARKER = "_silver_part-"
+
+
+@dataclass
+class PartitionCompaction:
+    """What compaction did (or, in a dry run, would do) to one partition."""
+
+    partition: str
+    inputs: list[str]
+    outputs: list[str]
+    rows: int = 0
+    bytes_before: int = 0
+    bytes_after: int = 0
+
+
+@dataclass
+class CompactionReport:
+    """Totals of one SilverCompactor.compact() call."""
+
+    partitions_checked: int = 0
+    partitions_unchanged: int = 0
+    partitions_settling: int = 0
+    compacted: list[PartitionCompaction] = field(default_factory=list)
+    dry_run: bool = False
+
+    @property
+    def files_merged(self) -> int:
+        return sum(len(c.inputs) for c in self.compacted)
+
+    @property
+    def files_written(self) -> int:
+        return sum(len(c.outputs) for c in self.compacted)
+
+    @property
+    def bytes_saved(self) -> int:
+        return sum(c.bytes_before - c.bytes_after for c in self.compacted)
+
+
+def _fingerprint(files: list[Path]) -> str:
+    """Identity of a partition's file set (names and sizes)."""
+    listing = sorted((path.name, path.stat().st_size) for path in files)
+    return hashlib.sha256(json.dumps(listing).encode("utf-8")).hexdigest()
+
+
+class SilverCompactor:
+    """
+    Merge small silver fragments into sorted, target-sized files.
+
+    Args:
+        base_dir: Silver lake root (None = config default)
+        target_file_bytes: Approximate size of a compacted file
+        small_file_bytes: Fragments below this size are merged; larger files
+            are left alone
+        row_group_rows: Rows per Parquet row group in compacted files
+        compression: Parquet codec for compacted files
+        settle_seconds: Skip partitions with a fragment modified more recently
+    """
+
+    def __init__(
+        self,
+        base_dir: Optional[Path] = None,
+        target_file_bytes: int = 128 * 1024 * 1024,
+        small_file_bytes: int = 32 * 1024 * 1024,
+        row_group_rows: int = 50_000,
+        compression: str = "zstd",
+        settle_seconds: float = 600.0,
+    ):
+        self.writer = SilverDatasetWriter(base_dir)
+        self.base_dir = self.writer.base_dir
+        self.target_file_bytes = target_file_bytes
+        self.small_file_bytes = small_file_bytes
+        self.row_group_rows = row_group_rows
+        self.compression = compression
+        self.settle_seconds = settle_seconds
+
+    @property
+    def log_path(self) -> Path:
+        return self.base_dir / "_metadata" / COMPACTION_LOG
+
+    def _read_log(self) -> dict[str, dict[str, Any]]:
+        """Latest log entry per partition."""
+        latest: dict[str, dict[str, Any]] = {}
+        if self.log_path.exists():
+            with open(self.log_path, encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        latest[entry["partition"]] = entry
+        return latest
+
+    def _append_log(self, entry: dict[str, Any]) -> None:
+        entry = {**entry, "at": datetime.now(timezone.utc).isoformat()}
+        with open(self.log_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _partitions(self, sources: Optional[list[str]]) -> list[Path]:
+        return sorted(
+            path
+            for path in self.base_dir.glob("source=*/date_accessed=*")
+            if path.is_dir() and (not sources or path.parent.name.split("=", 1)[1] in sources)
+        )
+
+    def compact(
+        self, sources: Optional[list[str]] = None, dry_run: bool = False, force: bool = False
+    ) -> CompactionReport:
+        """
+        Compact every partition that changed since its last compaction.
+
+        Args:
+            sources: Only these ``source=`` partitions (None = all)
+            dry_run: Report what would be merged without writing anything
+            force: Re-check partitions the compaction log says are unchanged
+
+        Raises:
+            RuntimeError: If another compaction of this silver lake is running
+        """
+        (self.base_dir / "_metadata").mkdir(parents=True, exist_ok=True)
+        lock = FileLock(str(self.base_dir / "_metadata" / ".compaction.lock"))
+        try:
+            lock.acquire(timeout=0)
+        except Timeout as err:
+            raise RuntimeError(f"Another silver compaction holds {lock.lock_file}") from err
+
+        try:
+            log = self._read_log()
+            report = CompactionReport(dry_run=dry_run)
+            for partition_dir in self._partitions(sources):
+                partition = str(partition_dir.relative_to(self.base_dir))
+                entry = log.get(partition)
+                if entry is not None and entry["status"] == "pending" and not dry_run:
+                    self._roll_forward(partition_dir, entry)
+                    entry = self._read_log()[partition]
+
+                report.partitions_checked += 1
+                files = self.writer.list_parquet_files(partition_dir)
+                if (
+                    not force
+                    and entry is not None
+                    and entry.get("fingerprint") == _fingerprint(files)
+                ):
+                    report.partitions_unchanged += 1
+                    continue
+                newest = max((path.stat().st_mtime for path in files), default=0.0)
+                if time.time() - newest < self.settle_seconds:
+                    report.partitions_settling += 1
+                    continue
+
+                result = self._compact_partition(partition_dir, files, dry_run)
+                if result is not None:
+                    report.compacted.append(result)
+            return report
+        finally:
+            lock.release()
+
+    def _bins(self, files: list[Path]) -> list[list[Path]]:
+        """Group small fragments, in name order, into bins of about target_file_bytes."""
+        bins: list[list[Path]] = [[]]
+        size = 0
+        for path in files:
+            file_size = path.stat().st_size
+            if file_size >= self.small_file_bytes:
+                continue
+            if bins[-1] and size + file_size > self.target_file_bytes:
+                bins.append([])
+                size = 0
+            bins[-1].append(path)
+            size += file_size
+        return [group for group in bins if len(group) > 1]
+
+    def _compact_partition(
+        self, partition_dir: Path, files: list[Path], dry_run: bool
+    ) -> Optional[PartitionCompaction]:
+        partition = str(partition_dir.relative_to(self.base_dir))
+        for stale in partition_dir.glob("*.parquet.tmp"):
+            stale.unlink()  # Outputs of a run interrupted before its pending entry
+
+        bins = self._bins(files)
+        if not bins:
+            if not dry_run:
+                self._append_log(
+                    {
+                        "partition": partition,
+                        "status": "checked",
+                        "fingerprint": _fingerprint(files),
+                    }
+                )
+            return None
+
+        source = partition_dir.parent.name.split("=", 1)[1]
+        compaction_id = (
+            f"{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}_compaction_"
+            f"{uuid.uuid4().hex[:8]}"
+        )
+        slug = source.lower().replace("_", "-")
+        outputs = [
+            f"{slug}_{compaction_id}{_PART_MARKER}{index:04d}.parquet" for index in range(len(bins))
+        ]
+        inputs = [path for group in bins for path in group]
+        result = PartitionCompaction(
+            partition=partition,
+            inputs=[path.name for path in inputs],
+            outputs=outputs,
+            bytes_before=sum(path.stat().st_size for path in inputs),
+        )
+        if dry_run:
+            return result
+
+        try:
+            for group, name in zip(bins, outputs):
+                result.rows += self._write_merged(group, partition_dir / f"{name}.tmp")
+        except (pa.ArrowInvalid, pa.ArrowTypeError, ValueError) as e:
+            logger.warning(f"Skipping compaction of {partition}: {e}")
+            for name in outputs:
+                (partition_dir / f"{name}.tmp").unlink(missing_ok=True)
+            return None
+
+        pending = {
+            "partition": partition,
+            "status": "pending",
+            "compaction_id": compaction_id,
+            "inputs": result.inputs,
+            "outputs": outputs,
+            "merged_into": {
+                path.name: name for group, name in zip(bins, outputs) for path in group
+            },
+            "rows": result.rows,
+            "untouched": [path.name for path in files if path not in inputs],
+        }
+        self._append_log(pending)
+        self._roll_forward(partition_dir, pending)
+        result.bytes_after = sum((partition_dir / name).stat().st_size for name in outputs)
+        logger.info(
+            f"Compacted {partition}: {len(inputs)} fragments -> {len(outputs)} files "
+            f"({result.rows} rows, {result.bytes_before:,} -> {result.bytes_after:,} bytes)"
+        )
+        return result
+
+    def _write_merged(self, group: list[Path], tmp_path: Path) -> int:
+        """Write the sorted union of ``group`` to ``tmp_path``; return its row count."""
+        table = pa.concat_tables(pq.ParquetFile(path).read() for path in group)
+        if table.schema.names != SilverDatasetWriter.SCHEMA.names:
+            raise ValueError(f"{group[0].name} and its neighbours do not use the silver schema")
+        table = table.cast(SilverDatasetWriter.SCHEMA).sort_by(SORT_KEY)
+        pq.write_table(
+            table,
+            tmp_path,
+            row_group_size=self.row_group_rows,
+            compression=self.compression,
+            write_statistics=True,
+        )
+        written = pq.ParquetFile(tmp_path).metadata.num_rows
+        if written != table.num_rows:
+            raise ValueError(f"{tmp_path.name} holds {written} of {table.num_rows} rows")
+        return written
+
+    def _roll_forward(self, partition_dir: Path, pending: dict[str, Any]) -> None:
+        """Finish steps 3-5 of a pending compaction; safe to repeat."""
+        partition = pending["partition"]
+        for name in pending["outputs"]:
+            tmp_path = partition_dir / f"{name}.tmp"
+            if tmp_path.exists():
+                os.replace(tmp_path, partition_dir / name)
+            elif not (partition_dir / name).exists():
+                raise RuntimeError(
+                    f"Compaction {pending['compaction_id']} of {partition} lost output {name}; "
+                    "its inputs were kept"
+                )
+        for name in pending["inputs"]:
+            (partition_dir / name).unlink(missing_ok=True)
+
+        self._update_sidecars(partition_dir, pending)
+        remaining = [partition_dir / name for name in pending["untouched"] + pending["outputs"]]
+        self._append_log(
+            {
+                "partition": partition,
+                "status": "done",
+                "compaction_id": pending["compaction_id"],
+                "inputs": pending["inputs"],
+                "outputs": pending["outputs"],
+                "rows": pending["rows"],
+                "fingerprint": _fingerprint([path for path in remaining if path.exists()]),
+            }
+        )
+
+    def _update_sidecars(self, partition_dir: Path, pending: dict[str, Any]) -> None:
+        source = partition_dir.parent.name.split("=", 1)[1]
+        date_accessed = partition_dir.name.split("=", 1)[1]
+        metadata_dir = self.writer.get_metadata_dir(source, date_accessed)
+        metadata_dir.mkdir(parents=True, exist_ok=True)
+
+        # Merged parts leave their run's sidecar; compacted_into keeps the lineage
+        for name in pending["inputs"]:
+            prefix, _, part_num = Path(name).stem.rpartition(_PART_MARKER)
+            sidecar_path = metadata_dir / f"{prefix}_silver_metadata.json"
+            if not prefix or not sidecar_path.exists():
+                continue
+            metadata = json.loads(sidecar_path.read_text(encoding="utf-8"))
+            part = metadata.get("checksums", {}).pop(f"part-{part_num}", None)
+            if part is None:
+                continue  # Already updated by an interrupted run
+            metadata["total_records"] -= part.get("record_count", 0)
+            metadata["total_partitions"] -= 1
+            metadata["statistics"]["total_size_bytes"] -= part.get("size_bytes", 0)
+            metadata["statistics"]["avg_record_size_bytes"] = (
+                metadata["statistics"]["total_size_bytes"] / metadata["total_records"]
+                if metadata["total_records"]
+                else 0
+            )
+            compacted_into = metadata.setdefault("compacted_into", {})
+            compacted_into[f"part-{part_num}"] = pending["merged_into"][name]
+            self._write_json(sidecar_path, metadata)
+
+        checksums = {}
+        for name in pending["outputs"]:
+            path = partition_dir / name
+            checksums[f"part-{name.rpartition(_PART_MARKER)[2][:4]}"] = {
+                "sha256": self.writer.compute_checksum(path),
+                "size_bytes": path.stat().st_size,
+                "record_count": pq.ParquetFile(path).metadata.num_rows,
+            }
+        total_records = sum(part["record_count"] for part in checksums.values())
+        total_size = sum(part["size_bytes"] for part in checksums.values())
+        slug = pending["outputs"][0].split("_", 1)[0]
+        self._write_json(
+            metadata_dir / f"{slug}_{pending['compaction_id']}_silver_metadata.json",
+            {
+                "run_id": pending["compaction_id"],
+                "source": source,
+                "pipeline_version": __pipeline_version__,
+                "date_accessed": date_accessed,
+                "date_processed": datetime.now(timezone.utc).isoformat(),
+                "total_records": total_records,
+                "total_partitions": len(checksums),
+                "sidecar_format_version": "2.1",
+                "checksums": checksums,
+                "statistics": {
+                    "total_size_bytes": total_size,
+                    "avg_record_size_bytes": total_size / total_records if total_records else 0,
+                },
+                "compacted_from": pending["inputs"],
+                "sort_key": SORT_KEY,
+            },
+        )
+
+    @staticmethod
+    def _write_json(path: Path, data: dict[str, Any]) -> None:
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_path, path)
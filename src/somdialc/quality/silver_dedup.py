@@ -0,0 +1,636 @@
+"""
+Out-of-core near-duplicate pass over the whole silver lake.
+
+Near-duplicates are otherwise caught only inside one ingestion run, and the
+offline ``scripts/ops/deduplicate_silver_dataset.py`` only removes exact
+``text_hash`` duplicates, so a BBC article mirrored in MC4 or a Wikipedia
+page copied into a web crawl stays in silver twice. ``SilverNearDeduplicator``
+finds near-duplicates across every source and date. Everything that grows
+with the corpus (signatures, band buckets, union-find parents) lives on disk
+in ``work_dir``, so memory is bounded by fragment size, bucket partition size
+and the number of duplicates found.
+
+The pass runs in phases; a rerun skips completed phases, and the signature,
+bucket and pair phases also skip their completed units (fragment, chunk,
+partition).
+
+Phases:
+    plan        List silver fragments, oldest ``date_accessed`` first, and
+                number their rows (doc numbers) from the Parquet footers.
+    signatures  Word-shingle MinHash signatures per fragment in a process
+                pool, written into a memory-mapped (docs x num_perm) uint32
+                matrix; the fragment's record ids go to ``docs/``.
+    buckets     LSH band keys of every signature, routed to on-disk bucket
+                partitions by key.
+    pairs       Per partition: pair up documents sharing a band key and keep
+                pairs whose Jaccard similarity (estimated over the full
+                signature) reaches the threshold.
+    components  Union-find over the verified pairs on a memory-mapped parent
+                array; each component's root is its lowest doc number, i.e.
+                its earliest-accessed document.
+    decisions   ``near_duplicates.parquet``: one row per document in a
+                component of two or more, ``keep`` for the root and ``drop``
+                (with the root's ``canonical_id``) for the others.
+
+Silver files are never modified; consumers filter on the decisions table.
+
+Example:
+    >>> dedup = SilverNearDeduplicator(Path("data/processed/silver"), Path("data/cache/near"))
+    >>> result = dedup.run()
+    >>> result.duplicates
+    1523
+"""
+
+import json
+import logging
+import os
+import shutil
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from ..ingestion.dedup.lsh import DATASKETCH_AVAILABLE, MinHash, word_shingles
+
+logger = logging.getLogger(__name__)
+
+PHASES = ("plan", "signatures", "buckets", "pairs", "components", "decisions")
+STATE_FILE = "state.json"
+OUTPUT_FILE = "near_duplicates.parquet"
+
+# datasketch fills every slot of an empty MinHash (no shingles) with this value
+_EMPTY_SLOT = 0xFFFFFFFF
+_FNV_OFFSET = np.uint64(0xCBF29CE484222325)
+_FNV_PRIME = np.uint64(0x100000001B3)
+
+_BUCKET_SCHEMA = pa.schema([("band", pa.int16()), ("key", pa.uint64()), ("doc", pa.int64())])
+_PAIR_SCHEMA = pa.schema([("a", pa.int64()), ("b", pa.int64()), ("similarity", pa.float32())])
+DECISION_SCHEMA = pa.schema(
+    [
+        ("id", pa.string()),
+        ("source", pa.string()),
+        ("date_accessed", pa.string()),
+        ("fragment", pa.string()),
+        ("action", pa.string()),
+        ("canonical_id", pa.string()),
+    ]
+)
+
+
+@dataclass
+class NearDedupResult:
+    """Outcome of a SilverNearDeduplicator run."""
+
+    documents: int
+    candidate_pairs: int
+    verified_pairs: int
+    components: int
+    duplicates: int
+    output_path: Path
+
+    def to_dict(self) -> dict[str, Any]:
+        return {**asdict(self), "output_path": str(self.output_path)}
+
+
+def band_layout(threshold: float, num_perm: int) -> tuple[int, int]:
+    """
+    LSH (bands, rows per band) for a Jaccard threshold.
+
+    Minimizes the equally weighted false positive and false negative
+    probability mass, as datasketch's MinHashLSH does.
+    """
+    grid = np.linspace(0.0, 1.0, 1001)
+    below, above = grid[grid <= threshold], grid[grid > threshold]
+
+    def area(y: np.ndarray, x: np.ndarray) -> float:
+        return float(np.sum((y[1:] + y[:-1]) * np.diff(x)) / 2) if len(x) > 1 else 0.0
+
+    best, best_error = (1, num_perm), float("inf")
+    for bands in range(1, num_perm + 1):
+        for rows in range(1, num_perm // bands + 1):
+            false_positive = area(1 - (1 - below**rows) ** bands, below)
+            false_negative = area((1 - above**rows) ** bands, above)
+            if false_positive + false_negative < best_error:
+                best, best_error = (bands, rows), false_positive + false_negative
+    return best
+
+
+def band_keys(signatures: np.ndarray, bands: int, rows: int) -> np.ndarray:
+    """64-bit FNV-1a key of each band of each signature; shape (docs, bands)."""
+    keys = np.empty((len(signatures), bands), dtype=np.uint64)
+    for band in range(bands):
+        key = np.full(len(signatures), _FNV_OFFSET, dtype=np.uint64)
+        for column in signatures[:, band * rows : (band + 1) * rows].T:
+            key ^= column.astype(np.uint64)
+            key *= _FNV_PRIME
+        keys[:, band] = key
+    return keys
+
+
+def _write_table_atomic(table: pa.Table, path: Path) -> None:
+    tmp_path = path.with_name(path.name + ".tmp")
+    pq.write_table(table, tmp_path)
+    os.replace(tmp_path, path)
+
+
+def _sign_fragment(
+    fragment_path: str,
+    offset: int,
+    total_docs: int,
+    signature_path: str,
+    docs_path: str,
+    num_perm: int,
+    shingle_size: int,
+    seed: int,
+    batch_rows: int,
+) -> int:
+    """Process-pool task: sign one fragment into its rows of the signature matrix."""
+    signatures = np.memmap(signature_path, dtype=np.uint32, mode="r+", shape=(total_docs, num_perm))
+    ids: list[Optional[str]] = []
+    row = offset
+    for batch in pq.ParquetFile(fragment_path).iter_batches(
+        batch_size=batch_rows, columns=["id", "text"]
+    ):
+        shingle_sets = [
+            [shingle.encode("utf-8") for shingle in word_shingles(text or "", shingle_size)]
+            for text in batch.column("text").to_pylist()
+        ]
+        minhashes = MinHash.bulk(shingle_sets, num_perm=num_perm, seed=seed)
+        signatures[row : row + len(minhashes)] = np.vstack([m.hashvalues for m in minhashes])
+        ids.extend(batch.column("id").to_pylist())
+        row += len(minhashes)
+    signatures.flush()
+    del signatures
+    _write_table_atomic(pa.table({"id": pa.array(ids, pa.string())}), Path(docs_path))
+    return len(ids)
+
+
+def _pair_partition(
+    partition_dir: str,
+    pairs_path: str,
+    signature_path: str,
+    total_docs: int,
+    num_perm: int,
+    threshold: float,
+    max_bucket_size: int,
+) -> tuple[int, int]:
+    """
+    Process-pool task: verified near-duplicate pairs of one bucket partition.
+
+    Documents sharing a (band, key) bucket are paired exhaustively up to
+    ``max_bucket_size`` members; larger buckets (mostly many copies of one
+    text) pair each member with the first and with its neighbour instead.
+
+    Returns:
+        (candidate pairs, verified pairs)
+    """
+    files = sorted(Path(partition_dir).glob("*.parquet"))
+    if not files:
+        _write_table_atomic(_PAIR_SCHEMA.empty_table(), Path(pairs_path))
+        return 0, 0
+    table = pa.concat_tables(pq.read_table(path, schema=_BUCKET_SCHEMA) for path in files)
+    band = table.column("band").to_numpy()
+    key = table.column("key").to_numpy()
+    doc = table.column("doc").to_numpy()
+    order = np.lexsort((doc, key, band))
+    band, key, doc = band[order], key[order], doc[order]
+
+    starts = np.flatnonzero(np.r_[True, (band[1:] != band[:-1]) | (key[1:] != key[:-1])])
+    sizes = np.diff(np.r_[starts, len(doc)])
+    firsts: list[np.ndarray] = []
+    seconds: list[np.ndarray] = []
+    for start, size in zip(starts[sizes > 1], sizes[sizes > 1]):
+        members = doc[start : start + size]
+        if size <= max_bucket_size:
+            left, right = np.triu_indices(size, k=1)
+            firsts.append(members[left])
+            seconds.append(members[right])
+        else:
+            firsts.extend([np.repeat(members[0], size - 1), members[1:-1]])
+            seconds.extend([members[1:], members[2:]])
+
+    if not firsts:
+        _write_table_atomic(_PAIR_SCHEMA.empty_table(), Path(pairs_path))
+        return 0, 0
+    pairs = np.unique(np.column_stack([np.concatenate(firsts), np.concatenate(seconds)]), axis=0)
+
+    signatures = np.memmap(signature_path, dtype=np.uint32, mode="r", shape=(total_docs, num_perm))
+    similarity = np.empty(len(pairs), dtype=np.float32)
+    for start in range(0, len(pairs), 65_536):
+        chunk = pairs[start : start + 65_536]
+        similarity[start : start + len(chunk)] = np.mean(
+            signatures[chunk[:, 0]] == signatures[chunk[:, 1]], axis=1
+        )
+    del signatures
+
+    verified = similarity >= threshold
+    _write_table_atomic(
+        pa.table(
+            {"a": pairs[verified, 0], "b": pairs[verified, 1], "similarity": similarity[verified]},
+            schema=_PAIR_SCHEMA,
+        ),
+        Path(pairs_path),
+    )
+    return len(pairs), int(verified.sum())
+
+
+class SilverNearDeduplicator:
+    """
+    Resumable near-duplicate pass over all silver partitions.
+
+    Args:
+        silver_dir: Silver lake root (``source=*/date_accessed=*/*.parquet``)
+        work_dir: Directory for phase outputs, state and the decisions table
+        threshold: Jaccard similarity at which two documents are near-duplicates
+        num_perm: MinHash permutations per signature
+        shingle_size: Words per shingle
+        seed: MinHash seed
+        num_partitions: On-disk bucket partitions; raise it for larger lakes so
+            one partition's buckets fit in memory
+        workers: Process pool size for the signature and pair phases
+            (None = CPU count, 1 = run in this process)
+        sources: Only include these ``source=`` partitions (None = all)
+        max_bucket_size: Largest LSH bucket paired exhaustively
+        chunk_rows: Documents per bucket-phase chunk and per signing batch
+    """
+
+    def __init__(
+        self,
+        silver_dir: Path,
+        work_dir: Path,
+        threshold: float = 0.85,
+        num_perm: int = 128,
+        shingle_size: int = 3,
+        seed: int = 42,
+        num_partitions: int = 64,
+        workers: Optional[int] = None,
+        sources: Optional[list[str]] = None,
+        max_bucket_size: int = 100,
+        chunk_rows: int = 100_000,
+    ):
+        if not DATASKETCH_AVAILABLE:
+            raise ImportError(
+                "datasketch library is required for the silver near-duplicate pass. "
+                "Install it with: pip install datasketch"
+            )
+        self.silver_dir = Path(silver_dir)
+        self.work_dir = Path(work_dir)
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.seed = seed
+        self.num_partitions = num_partitions
+        self.workers = workers or os.cpu_count() or 1
+        self.sources = sorted(sources) if sources else None
+        self.max_bucket_size = max_bucket_size
+        self.chunk_rows = chunk_rows
+        self.bands, self.rows = band_layout(threshold, num_perm)
+        self.state: dict[str, Any] = {}
+
+    # ------------------------------------------------------------------ state
+
+    @property
+    def params(self) -> dict[str, Any]:
+        """Settings a resumed run must share with the run that produced the state."""
+        return {
+            "threshold": self.threshold,
+            "num_perm": self.num_perm,
+            "shingle_size": self.shingle_size,
+            "seed": self.seed,
+            "num_partitions": self.num_partitions,
+            "bands": self.bands,
+            "rows": self.rows,
+            "max_bucket_size": self.max_bucket_size,
+            "sources": self.sources,
+        }
+
+    @property
+    def state_path(self) -> Path:
+        return self.work_dir / STATE_FILE
+
+    @property
+    def signature_path(self) -> Path:
+        return self.work_dir / "signatures.u32"
+
+    @property
+    def output_path(self) -> Path:
+        return self.work_dir / OUTPUT_FILE
+
+    def _save_state(self) -> None:
+        tmp_path = self.state_path.with_name(STATE_FILE + ".tmp")
+        tmp_path.write_text(json.dumps(self.state, indent=2))
+        os.replace(tmp_path, self.state_path)
+
+    def _complete(self, phase: str, **details: Any) -> None:
+        self.state["completed"].append(phase)
+        self.state.setdefault("details", {})[phase] = details
+        self._save_state()
+        logger.info(f"Silver near-dedup phase '{phase}' complete: {details}")
+
+    def _list_fragments(self) -> list[dict[str, Any]]:
+        fragments = []
+        for path in self.silver_dir.glob("source=*/date_accessed=*/*.parquet"):
+            source = path.parent.parent.name.split("=", 1)[1]
+            if self.sources is not None and source not in self.sources:
+                continue
+            fragments.append(
+                {
+                    "path": str(path.relative_to(self.silver_dir)),
+                    "source": source,
+                    "date_accessed": path.parent.name.split("=", 1)[1],
+                    "size_bytes": path.stat().st_size,
+                }
+            )
+        fragments.sort(key=lambda f: (f["date_accessed"], f["source"], f["path"]))
+        return fragments
+
+    def _load_state(self, restart: bool) -> None:
+        if restart and self.work_dir.exists():
+            shutil.rmtree(self.work_dir)
+        self.work_dir.mkdir(parents=True, exist_ok=True)
+        if not self.state_path.exists():
+            self.state = {"params": self.params, "completed": []}
+            return
+
+        self.state = json.loads(self.state_path.read_text())
+        if self.state["params"] != self.params:
+            raise ValueError(
+                f"{self.work_dir} holds a near-dedup run with different settings "
+                f"({self.state['params']}); rerun with restart=True (--restart)"
+            )
+        planned = [
+            {k: f[k] for k in ("path", "source", "date_accessed", "size_bytes")}
+            for f in self.state.get("fragments", [])
+        ]
+        if "plan" in self.state["completed"] and planned != self._list_fragments():
+            raise ValueError(
+                f"Silver fragments under {self.silver_dir} changed since this near-dedup "
+                "run was planned; rerun with restart=True (--restart)"
+            )
+
+    # ----------------------------------------------------------------- phases
+
+    def run(self, restart: bool = False) -> NearDedupResult:
+        """
+        Run (or resume) every phase and return the result.
+
+        Args:
+            restart: Discard ``work_dir`` and start over
+
+        Raises:
+            ValueError: If ``work_dir`` holds a run with other settings, or the
+                silver fragments changed since it was planned
+        """
+        self._load_state(restart)
+        for phase in PHASES:
+            if phase in self.state["completed"]:
+                logger.info(f"Silver near-dedup phase '{phase}' already complete; skipping")
+                continue
+            getattr(self, f"_run_{phase}")()
+        return self.result()
+
+    def result(self) -> NearDedupResult:
+        details = self.state.get("details", {})
+        return NearDedupResult(
+            documents=self.state.get("total_docs", 0),
+            candidate_pairs=details.get("pairs", {}).get("candidate_pairs", 0),
+            verified_pairs=details.get("pairs", {}).get("verified_pairs", 0),
+            components=details.get("decisions", {}).get("components", 0),
+            duplicates=details.get("decisions", {}).get("duplicates", 0),
+            output_path=self.output_path,
+        )
+
+    def _run_plan(self) -> None:
+        fragments = self._list_fragments()
+        offset = 0
+        for fragment in fragments:
+            rows = pq.ParquetFile(self.silver_dir / fragment["path"]).metadata.num_rows
+            fragment.update(offset=offset, rows=rows)
+            offset += rows
+        self.state["fragments"] = fragments
+        self.state["total_docs"] = offset
+        if offset:
+            signatures = np.memmap(
+                self.signature_path, dtype=np.uint32, mode="w+", shape=(offset, self.num_perm)
+            )
+            del signatures
+        self._complete("plan", fragments=len(fragments), documents=offset)
+
+    def _map(self, fn, tasks: list[tuple]) -> Iterator[Any]:
+        """Yield task results in order, from the process pool or inline with one worker."""
+        if self.workers <= 1 or len(tasks) <= 1:
+            for task in tasks:
+                yield fn(*task)
+            return
+        with ProcessPoolExecutor(max_workers=min(self.workers, len(tasks))) as pool:
+            yield from pool.map(fn, *zip(*tasks))
+
+    def _run_signatures(self) -> None:
+        docs_dir = self.work_dir / "docs"
+        docs_dir.mkdir(exist_ok=True)
+        tasks = []
+        for index, fragment in enumerate(self.state["fragments"]):
+            docs_path = docs_dir / f"f{index:06d}.parquet"
+            if docs_path.exists() or not fragment["rows"]:
+                continue  # Signed by an interrupted run (ids are written last)
+            tasks.append(
+                (
+                    str(self.silver_dir / fragment["path"]),
+                    fragment["offset"],
+                    self.state["total_docs"],
+                    str(self.signature_path),
+                    str(docs_path),
+                    self.num_perm,
+                    self.shingle_size,
+                    self.seed,
+                    self.chunk_rows,
+                )
+            )
+        signed = sum(self._map(_sign_fragment, tasks))
+        self._complete("signatures", fragments_signed=len(tasks), documents_signed=signed)
+
+    def _run_buckets(self) -> None:
+        total_docs = self.state["total_docs"]
+        buckets_dir = self.work_dir / "buckets"
+        done_dir = self.work_dir / "buckets.done"
+        done_dir.mkdir(parents=True, exist_ok=True)
+        signatures = (
+            np.memmap(
+                self.signature_path, dtype=np.uint32, mode="r", shape=(total_docs, self.num_perm)
+            )
+            if total_docs
+            else np.empty((0, self.num_perm), dtype=np.uint32)
+        )
+        bands = np.arange(self.bands, dtype=np.int16)
+        skipped_empty = 0
+        for chunk, start in enumerate(range(0, total_docs, self.chunk_rows)):
+            marker = done_dir / f"c{chunk:06d}"
+            if marker.exists():
+                continue
+            block = np.asarray(signatures[start : start + self.chunk_rows])
+            docs = np.arange(start, start + len(block), dtype=np.int64)
+            signed = ~np.all(block == _EMPTY_SLOT, axis=1)  # No shingles: nothing to match
+            skipped_empty += int((~signed).sum())
+            if not signed.any():
+                marker.touch()
+                continue
+            keys = band_keys(block[signed], self.bands, self.rows).ravel()
+            band_col = np.tile(bands, int(signed.sum()))
+            doc_col = np.repeat(docs[signed], self.bands)
+            partition = keys % np.uint64(self.num_partitions)
+            order = np.argsort(partition, kind="stable")
+            partition, keys, band_col, doc_col = (
+                partition[order],
+                keys[order],
+                band_col[order],
+                doc_col[order],
+            )
+            bounds = np.flatnonzero(np.r_[True, partition[1:] != partition[:-1], True])
+            for lo, hi in zip(bounds[:-1], bounds[1:]):
+                partition_dir = buckets_dir / f"p{int(partition[lo]):04d}"
+                partition_dir.mkdir(parents=True, exist_ok=True)
+                _write_table_atomic(
+                    pa.table(
+                        {"band": band_col[lo:hi], "key": keys[lo:hi], "doc": doc_col[lo:hi]},
+                        schema=_BUCKET_SCHEMA,
+                    ),
+                    partition_dir / f"c{chunk:06d}.parquet",
+                )
+            marker.touch()
+        del signatures
+        self._complete("buckets", bands=self.bands, rows=self.rows, empty_documents=skipped_empty)
+
+    def _run_pairs(self) -> None:
+        pairs_dir = self.work_dir / "pairs"
+        pairs_dir.mkdir(exist_ok=True)
+        counts = self.state.setdefault("pair_counts", {})
+        tasks = []
+        for partition in range(self.num_partitions):
+            pairs_path = pairs_dir / f"p{partition:04d}.parquet"
+            if pairs_path.exists() and str(partition) in counts:
+                continue
+            tasks.append(
+                (
+                    str(self.work_dir / "buckets" / f"p{partition:04d}"),
+                    str(pairs_path),
+                    str(self.signature_path),
+                    self.state["total_docs"],
+                    self.num_perm,
+                    self.threshold,
+                    self.max_bucket_size,
+                )
+            )
+        for task, partition_counts in zip(tasks, self._map(_pair_partition, tasks)):
+            counts[str(int(Path(task[1]).stem[1:]))] = list(partition_counts)
+            self._save_state()
+        self._complete(
+            "pairs",
+            candidate_pairs=sum(c[0] for c in counts.values()),
+            verified_pairs=sum(c[1] for c in counts.values()),
+        )
+
+    def _run_components(self) -> None:
+        total_docs = self.state["total_docs"]
+        if not total_docs:
+            self._complete("components", unions=0)
+            return
+        parent = np.memmap(
+            self.work_dir / "parent.i64", dtype=np.int64, mode="w+", shape=(total_docs,)
+        )
+        for start in range(0, total_docs, self.chunk_rows):
+            end = min(start + self.chunk_rows, total_docs)
+            parent[start:end] = np.arange(start, end, dtype=np.int64)
+
+        unions = 0
+        for pairs_path in sorted((self.work_dir / "pairs").glob("p*.parquet")):
+            pairs = pq.read_table(pairs_path, columns=["a", "b"])
+            for a, b in zip(pairs.column("a").to_numpy(), pairs.column("b").to_numpy()):
+                root_a, root_b = _find(parent, int(a)), _find(parent, int(b))
+                if root_a != root_b:
+                    # Lower doc number (earlier date_accessed) stays the root
+                    parent[max(root_a, root_b)] = min(root_a, root_b)
+                    unions += 1
+        parent.flush()
+        del parent
+        self._complete("components", unions=unions)
+
+    def _run_decisions(self) -> None:
+        total_docs = self.state["total_docs"]
+        drops: list[np.ndarray] = []
+        roots: list[np.ndarray] = []
+        if total_docs:
+            parent = np.memmap(
+                self.work_dir / "parent.i64", dtype=np.int64, mode="r+", shape=(total_docs,)
+            )
+            for start in range(0, total_docs, self.chunk_rows):
+                block = np.asarray(parent[start : start + self.chunk_rows])
+                members = np.flatnonzero(block != np.arange(start, start + len(block))) + start
+                drops.append(members)
+                roots.append(np.array([_find(parent, int(m)) for m in members], dtype=np.int64))
+            del parent
+        drop_docs = np.concatenate(drops) if drops else np.empty(0, dtype=np.int64)
+        drop_roots = np.concatenate(roots) if roots else np.empty(0, dtype=np.int64)
+        root_docs = np.unique(drop_roots)
+
+        # Ids of the roots, gathered fragment by fragment
+        root_ids: dict[int, str] = {}
+        for index, fragment in self._fragments_containing(root_docs):
+            ids = self._fragment_ids(index)
+            for doc in root_docs[self._in_fragment(root_docs, fragment)]:
+                root_ids[int(doc)] = ids[int(doc) - fragment["offset"]]
+
+        tmp_path = self.output_path.with_name(OUTPUT_FILE + ".tmp")
+        with pq.ParquetWriter(tmp_path, DECISION_SCHEMA) as writer:
+            for index, fragment in enumerate(self.state["fragments"]):
+                keep = root_docs[self._in_fragment(root_docs, fragment)]
+                in_fragment = self._in_fragment(drop_docs, fragment)
+                drop, canonical = drop_docs[in_fragment], drop_roots[in_fragment]
+                if not len(keep) and not len(drop):
+                    continue
+                ids = self._fragment_ids(index)
+                docs = np.concatenate([keep, drop])
+                writer.write_table(
+                    pa.table(
+                        {
+                            "id": [ids[int(d) - fragment["offset"]] for d in docs],
+                            "source": [fragment["source"]] * len(docs),
+                            "date_accessed": [fragment["date_accessed"]] * len(docs),
+                            "fragment": [fragment["path"]] * len(docs),
+                            "action": ["keep"] * len(keep) + ["drop"] * len(drop),
+                            "canonical_id": [root_ids[int(r)] for r in keep]
+                            + [root_ids[int(r)] for r in canonical],
+                        },
+                        schema=DECISION_SCHEMA,
+                    )
+                )
+        os.replace(tmp_path, self.output_path)
+        self._complete("decisions", components=len(root_docs), duplicates=len(drop_docs))
+
+    # ---------------------------------------------------------------- helpers
+
+    @staticmethod
+    def _in_fragment(docs: np.ndarray, fragment: dict[str, Any]) -> np.ndarray:
+        return (docs >= fragment["offset"]) & (docs < fragment["offset"] + fragment["rows"])
+
+    def _fragments_containing(self, docs: np.ndarray) -> Iterator[tuple[int, dict[str, Any]]]:
+        for index, fragment in enumerate(self.state["fragments"]):
+            if self._in_fragment(docs, fragment).any():
+                yield index, fragment
+
+    def _fragment_ids(self, index: int) -> list[str]:
+        return (
+            pq.read_table(self.work_dir / "docs" / f"f{index:06d}.parquet").column("id").to_pylist()
+        )
+
+
+def _find(parent: np.ndarray, doc: int) -> int:
+    """Union-find root of ``doc``, halving the path on the way."""
+    while parent[doc] != doc:
+        parent[doc] = parent[parent[doc]]
+        doc = int(parent[doc])
+    return doc
@@ -4,10 +4,13 @@ Silver dataset writer with domain, embedding, and register fields.
 
 import json
 import logging
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Optional
 
 import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
 import pyarrow.parquet as pq
 
 from ..contracts.ingestion_output import VALID_REGISTERS as _VALID_REGISTERS
@@ -89,11 +92,11 @@ class SilverDatasetWriter:
         """Return the parquet partition directory for a source/date pair."""
         return self.base_dir / f"source={source}" / f"date_accessed={date_accessed}"
 
-    def _get_metadata_dir(self, source: str, date_accessed: str) -> Path:
+    def get_metadata_dir(self, source: str, date_accessed: str) -> Path:
         """Return the sidecar directory for a source/date pair."""
         return self.base_dir / "_metadata" / f"source={source}" / f"date_accessed={date_accessed}"
 
-    def _list_parquet_files(self, silver_dir: Path) -> list[Path]:
+    def list_parquet_files(self, silver_dir: Path) -> list[Path]:
         """Return all parquet fragments under a partition directory."""
         return sorted(path for path in silver_dir.rglob("*.parquet") if path.is_file())
 
@@ -343,7 +346,7 @@ class SilverDatasetWriter:
             size_bytes /= 1024.0
         return f"{size_bytes:.1f}TB"
 
-    def _compute_checksum(self, file_path: Path) -> str:
+    def compute_checksum(self, file_path: Path) -> str:
         """
         Compute SHA256 checksum of a file.
 
@@ -388,12 +391,12 @@ class SilverDatasetWriter:
         """
         from datetime import datetime, timezone
 
-        metadata_dir = self._get_metadata_dir(source, date_accessed)
+        metadata_dir = self.get_metadata_dir(source, date_accessed)
         metadata_dir.mkdir(parents=True, exist_ok=True)
         metadata_path = metadata_dir / f"{source_slug}_{run_id}_silver_metadata.json"
 
         # Compute checksum for this partition
-        checksum = self._compute_checksum(parquet_path)
+        checksum = self.compute_checksum(parquet_path)
 
         # Collect partition info
         partition_info = {
@@ -444,7 +447,9 @@ class SilverDatasetWriter:
 
         logger.debug(f"Metadata sidecar written: {metadata_path}")
 
-    def read(self, source: str, date_accessed: str) -> pa.Table:
+    def read(
+        self, source: str, date_accessed: str, columns: Optional[list[str]] = None
+    ) -> pa.Table:
         """
         Read silver dataset for a given source and date.
 
@@ -453,6 +458,7 @@ class SilverDatasetWriter:
         Args:
             source: Source name
             date_accessed: ISO date
+            columns: Only read these columns (None = all; the schema check is skipped)
 
         Returns:
             PyArrow table with all records
@@ -466,10 +472,15 @@ class SilverDatasetWriter:
         if not silver_dir.exists():
             raise FileNotFoundError(f"Silver dataset not found: {silver_dir}")
 
-        parquet_files = self._list_parquet_files(silver_dir)
+        parquet_files = self.list_parquet_files(silver_dir)
         if not parquet_files:
             raise FileNotFoundError(f"No Parquet files found in {silver_dir}")
 
+        if columns is not None:
+            return pa.concat_tables(
+                pq.ParquetFile(path).read(columns=columns) for path in parquet_files
+            )
+
         table = self._read_parquet_files(parquet_files)
 
         # STRICT VALIDATION: All required fields must be present
@@ -486,41 +497,143 @@ class SilverDatasetWriter:
 
         return table
 
+    def _select_partitions(
+        self,
+        sources: Optional[Iterable[str]] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+    ) -> list[Path]:
+        """Return partition directories matching source and date_accessed bounds."""
+        if sources is None:
+            candidates = self.base_dir.glob("source=*/date_accessed=*")
+        else:
+            candidates = (
+                date_dir
+                for source in set(sources)
+                for date_dir in (self.base_dir / f"source={source}").glob("date_accessed=*")
+            )
+        selected = []
+        for date_dir in sorted(candidates):
+            date_accessed = date_dir.name.split("=", 1)[1]
+            if (date_from and date_accessed < date_from) or (date_to and date_accessed > date_to):
+                continue
+            if date_dir.is_dir():
+                selected.append(date_dir)
+        return selected
+
+    def scan(
+        self,
+        columns: Optional[list[str]] = None,
+        sources: Optional[Iterable[str]] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        domains: Optional[Iterable[str]] = None,
+        registers: Optional[Iterable[str]] = None,
+        run_ids: Optional[Iterable[str]] = None,
+        min_tokens: Optional[int] = None,
+        max_tokens: Optional[int] = None,
+        batch_size: int = 65_536,
+        partitions: Optional[list[Path]] = None,
+    ) -> pa.RecordBatchReader:
+        """
+        Lazily read silver records across partitions.
+
+        Only the requested columns are decoded. Source and date bounds
+        (inclusive ISO dates) prune partition directories before any file is
+        opened. The other filters are pushed into the Parquet scan, which
+        skips row groups whose statistics cannot match.
+
+        Args:
+            columns: Columns to return (None = all)
+            sources: Only these sources
+            date_from: Earliest date_accessed
+            date_to: Latest date_accessed
+            domains: Only these domains
+            registers: Only these registers
+            run_ids: Only records written by these runs
+            min_tokens: Minimum token count
+            max_tokens: Maximum token count
+            batch_size: Maximum rows per record batch
+            partitions: Partition directories to read, already selected (the
+                source and date bounds are then ignored)
+
+        Returns:
+            RecordBatchReader over the matching records
+        """
+        conditions = []
+        for name, values in (("domain", domains), ("register", registers), ("run_id", run_ids)):
+            if values is not None:
+                conditions.append(ds.field(name).isin(list(values)))
+        if min_tokens is not None:
+            conditions.append(ds.field("tokens") >= min_tokens)
+        if max_tokens is not None:
+            conditions.append(ds.field("tokens") <= max_tokens)
+        predicate = None
+        for condition in conditions:
+            predicate = condition if predicate is None else predicate & condition
+
+        if partitions is None:
+            partitions = self._select_partitions(sources, date_from, date_to)
+        parquet_files = [
+            str(path) for date_dir in partitions for path in self.list_parquet_files(date_dir)
+        ]
+        # Explicit file list and schema: no hive inference, since the
+        # partition keys are also stored as columns.
+        dataset = ds.dataset(parquet_files, schema=self.SCHEMA, format="parquet")
+        return dataset.scanner(columns=columns, filter=predicate, batch_size=batch_size).to_reader()
+
+    def count_by(self, column: str, **filters) -> dict[Optional[str], int]:
+        """
+        Count matching records per value of ``column``.
+
+        Reads only ``column`` (plus filter columns), one batch at a time.
+
+        Args:
+            column: Column to group by, e.g. "domain" or "register"
+            **filters: Filters accepted by :meth:`scan`
+
+        Returns:
+            Dictionary mapping column value (None for nulls) to record count
+        """
+        counts: dict[Optional[str], int] = {}
+        for batch in self.scan(columns=[column], **filters):
+            for entry in pc.value_counts(batch.column(0)).to_pylist():
+                counts[entry["values"]] = counts.get(entry["values"], 0) + entry["counts"]
+        return counts
+
     def get_domain_statistics(self, source: Optional[str] = None) -> dict[str, int]:
         """
         Get domain distribution statistics across silver datasets.
 
+        Only the ``domain`` column is read, in one scan over all selected
+        partitions. If that scan fails, partitions are counted one by one and
+        unreadable ones are skipped with a warning.
+
         Args:
             source: Optional source filter (None = all sources)
 
         Returns:
             Dictionary mapping domain to document count
         """
-        stats: dict[str, int] = {}
+        partitions = self._select_partitions([source] if source else None)
+        try:
+            counts = self.count_by("domain", partitions=partitions)
+        except Exception as e:
+            logger.warning(
+                f"Domain scan over {len(partitions)} partitions failed ({e}); retrying each"
+            )
+            counts = {}
+            for date_dir in partitions:
+                try:
+                    partition_counts = self.count_by("domain", partitions=[date_dir])
+                except Exception as partition_error:
+                    logger.warning(f"Error reading {date_dir}: {partition_error}")
+                    continue
+                for domain, count in partition_counts.items():
+                    counts[domain] = counts.get(domain, 0) + count
 
-        # Iterate through all source directories
-        if source:
-            source_dirs = [self.base_dir / f"source={source}"]
-        else:
-            source_dirs = [d for d in self.base_dir.glob("source=*") if d.is_dir()]
+        return {domain: count for domain, count in counts.items() if domain}
 
-        for source_dir in source_dirs:
-            # Iterate through all date partitions
-            for date_dir in source_dir.glob("date_accessed=*"):
-                try:
-                    parquet_files = self._list_parquet_files(date_dir)
-                    if not parquet_files:
-                        continue
-                    table = self._read_parquet_files(parquet_files)
-
-                    # Count domains if field exists
-                    if "domain" in table.column_names:
-                        domains = table.column("domain").to_pylist()
-                        for domain in domains:
-                            if domain:
-                                stats[domain] = stats.get(domain, 0) + 1
-
-                except Exception as e:
-                    logger.warning(f"Error reading {date_dir}: {e}")
-
-        return stats
+
+# Alias for backward compatibility (re-exported by somdialc.quality)
+SilverWriter = SilverDatasetWriter
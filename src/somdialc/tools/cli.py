@@ -8,7 +8,7 @@ of the Stage 1.2 restructuring.
 
 Architecture:
     - Click-based CLI framework (consistent with existing lock_status.py)
-    - Four main command groups: metrics, ledger, data, dashboard
+    - Five main command groups: metrics, ledger, data, silver, dashboard
     - Comprehensive help text for all commands
     - POSIX-style options (short/long forms)
     - Extensible structure for future commands
@@ -23,6 +23,7 @@ Usage:
     somali-tools metrics consolidate
     somali-tools ledger status
     somali-tools data validate-silver
+    somali-tools silver dedup --near
     somali-tools dashboard build
 """
 
@@ -50,6 +51,7 @@ def cli(ctx):
       metrics     Metrics consolidation and analysis
       ledger      Ledger database management
       data        Dataset validation and quality checks
+      silver      Silver lake maintenance (near-duplicate pass)
       dashboard   Dashboard build and deployment
 
     \b
@@ -93,6 +95,7 @@ def metrics():
       validate         Validate metrics against Phase 3 schema
       check-anomalies  Check for metric anomalies and outliers
       export           Export metrics to various formats
+      resources        Show CPU/RSS/I/O telemetry for one run
 
     \b
     Examples:
@@ -452,6 +455,85 @@ def export(metrics_dir: Path, format: str, output: Path):
         sys.exit(2)
 
 
+def _format_mib(value: float | None) -> str:
+    return "-" if value is None else f"{value / (1024**2):.1f}"
+
+
+@metrics.command()
+@click.argument("run_id")
+@click.option(
+    "--metrics-dir",
+    "-d",
+    default="data/metrics",
+    type=click.Path(file_okay=False, path_type=Path),
+    help="Directory containing metrics JSON files",
+)
+@click.option("--json", "as_json", is_flag=True, help="Print the raw summary and samples as JSON")
+def resources(run_id: str, metrics_dir: Path, as_json: bool):
+    """
+    Show resource usage (RSS, CPU, I/O bytes, fds, WAL size) for one run.
+
+    Reads the ``resources`` block that every pipeline run writes to
+    ``<run_id>_processing.json``.
+
+    \b
+    Examples:
+      # Summary and time series for a run
+      somali-tools metrics resources 20251018_101500_bbc_ab12cd34
+
+      # Machine-readable output
+      somali-tools metrics resources 20251018_101500_bbc_ab12cd34 --json
+    """
+    import json
+
+    from .metrics_commands import resource_report
+
+    try:
+        report = resource_report(run_id=run_id, metrics_dir=metrics_dir)
+    except (FileNotFoundError, ValueError) as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+    if as_json:
+        click.echo(json.dumps(report, indent=2))
+        return
+
+    summary = report["summary"]
+    click.echo(f"\nResource Usage: {report['run_id']} ({report['source']})")
+    click.echo(f"  Duration: {summary.get('duration_seconds', 0):.1f} s")
+    click.echo(f"  Peak RSS: {_format_mib(summary.get('peak_rss_bytes'))} MiB")
+    click.echo(f"  CPU Time: {summary.get('cpu_seconds', 0):.1f} s")
+    if summary.get("mean_cpu_percent") is not None:
+        click.echo(
+            f"  CPU Utilisation: {summary['mean_cpu_percent']:.0f}% mean, "
+            f"{summary.get('max_cpu_percent') or 0:.0f}% max"
+        )
+    click.echo(
+        f"  Disk Read/Written: {_format_mib(summary.get('read_bytes'))} / "
+        f"{_format_mib(summary.get('write_bytes'))} MiB"
+    )
+    click.echo(f"  Max Open FDs: {summary.get('max_open_fds', '-')}")
+    click.echo(f"  Peak WAL: {_format_mib(summary.get('max_wal_bytes'))} MiB")
+
+    samples = report["samples"]
+    if samples:
+        click.echo(f"\nSamples ({len(samples)}, every {report['interval_seconds']:g} s):")
+        click.echo(
+            f"  {'t (s)':>8}  {'RSS MiB':>9}  {'CPU %':>6}  {'read MiB':>9}  "
+            f"{'write MiB':>9}  {'fds':>5}"
+        )
+        for sample in samples:
+            cpu = sample.get("cpu_percent")
+            fds = sample.get("open_fds")
+            click.echo(
+                f"  {sample['t']:>8.1f}  {_format_mib(sample.get('rss_bytes')):>9}  "
+                f"{'-' if cpu is None else f'{cpu:.0f}':>6}  "
+                f"{_format_mib(sample.get('read_bytes')):>9}  "
+                f"{_format_mib(sample.get('write_bytes')):>9}  "
+                f"{'-' if fds is None else fds:>5}"
+            )
+
+
 # ============================================================================
 # LEDGER COMMAND GROUP
 # ============================================================================
@@ -728,6 +810,7 @@ def data():
       validate-silver  Validate silver dataset integrity
       export-sample    Export sample records for inspection
       check-quality    Run quality checks on datasets
+      dedup-server     Serve one shared dedup index to concurrent pipelines
 
     \b
     Examples:
@@ -886,6 +969,265 @@ def check_quality(silver_path: Path, output: Path | None):
     )
 
 
+@data.command("dedup-server")
+@click.option(
+    "--socket",
+    "socket_path",
+    required=True,
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Unix socket to listen on (set SDC_DEDUP__SERVER_SOCKET to the same path)",
+)
+def dedup_server(socket_path: Path):
+    """
+    Serve one shared dedup index to concurrent pipelines.
+
+    Owns the exact-hash set and MinHash LSH index (configured from
+    SDC_DEDUP__*) so pipelines running at the same time detect duplicates
+    across sources. Pipelines use it when SDC_DEDUP__SERVER_SOCKET points
+    at the socket; stop with Ctrl+C.
+
+    \b
+    Examples:
+      somali-tools data dedup-server --socket /tmp/sdc-dedup.sock &
+      SDC_DEDUP__SERVER_SOCKET=/tmp/sdc-dedup.sock bbcsom-download
+    """
+    from somdialc.infra.config import get_config
+    from somdialc.ingestion.dedup.service import serve
+    from somdialc.ingestion.pipeline_setup import PipelineSetup
+
+    click.echo(f"Dedup server listening on {socket_path} (Ctrl+C to stop)")
+    serve(socket_path, PipelineSetup.dedup_config_from_settings(get_config().dedup))
+
+
+# ============================================================================
+# SILVER COMMAND GROUP
+# ============================================================================
+
+
+@cli.group()
+def silver():
+    """
+    Silver lake maintenance commands.
+
+    This command group handles whole-lake jobs over the silver Parquet
+    partitions written by the pipelines.
+
+    \b
+    Commands:
+      dedup    Find near-duplicates across every source and date
+      compact  Merge small Parquet fragments into sorted, larger files
+
+    \b
+    Examples:
+      # Near-duplicate pass over the whole silver lake
+      somali-tools silver dedup --near
+
+      # Compact partitions changed since the last compaction
+      somali-tools silver compact
+    """
+    pass
+
+
+@silver.command("dedup")
+@click.option(
+    "--near",
+    is_flag=True,
+    help="Find near-duplicates (MinHash LSH) across all silver partitions",
+)
+@click.option(
+    "--silver-path",
+    "-p",
+    default="data/processed/silver",
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    help="Path to silver dataset directory",
+)
+@click.option(
+    "--work-dir",
+    "-w",
+    default="data/cache/silver_near_dedup",
+    type=click.Path(file_okay=False, path_type=Path),
+    help="Phase outputs, resume state and near_duplicates.parquet",
+)
+@click.option("--source", "-s", multiple=True, help="Only include specific source(s)")
+@click.option(
+    "--threshold",
+    type=click.FloatRange(0.0, 1.0),
+    default=None,
+    help="Jaccard similarity threshold (default: SDC_DEDUP__SIMILARITY_THRESHOLD)",
+)
+@click.option("--workers", type=int, default=None, help="Process pool size (default: CPU count)")
+@click.option(
+    "--partitions",
+    type=click.IntRange(min=1),
+    default=64,
+    help="On-disk LSH bucket partitions; raise for larger lakes (default: 64)",
+)
+@click.option("--restart", is_flag=True, help="Discard previous progress in --work-dir")
+def silver_dedup(
+    near: bool,
+    silver_path: Path,
+    work_dir: Path,
+    source: tuple[str, ...],
+    threshold: float | None,
+    workers: int | None,
+    partitions: int,
+    restart: bool,
+):
+    """
+    Find near-duplicates across the whole silver lake.
+
+    Streams every silver fragment, computes MinHash signatures in a process
+    pool, buckets them by LSH band on disk, verifies candidate pairs and
+    groups near-duplicates with a union-find. Memory stays bounded by
+    fragment and partition size. An interrupted run resumes from the last
+    completed phase. Silver files are not modified; the result is a
+    keep/drop table with canonical ids in WORK_DIR/near_duplicates.parquet.
+
+    Exact text_hash duplicates are removed by
+    scripts/ops/deduplicate_silver_dataset.py.
+
+    \b
+    Examples:
+      # Near-duplicate pass over all sources
+      somali-tools silver dedup --near
+
+      # Two sources, stricter threshold, start over
+      somali-tools silver dedup --near -s BBC-Somali -s HuggingFace-Somali_c4-so \\
+          --threshold 0.9 --restart
+    """
+    if not near:
+        raise click.UsageError(
+            "Only --near is supported; exact text_hash dedup is "
+            "scripts/ops/deduplicate_silver_dataset.py"
+        )
+
+    from somdialc.infra.config import get_config
+    from somdialc.quality.silver_dedup import SilverNearDeduplicator
+
+    dedup = SilverNearDeduplicator(
+        silver_path,
+        work_dir,
+        threshold=threshold if threshold is not None else get_config().dedup.similarity_threshold,
+        num_partitions=partitions,
+        workers=workers,
+        sources=list(source) or None,
+    )
+    try:
+        result = dedup.run(restart=restart)
+    except ValueError as e:
+        raise click.ClickException(str(e)) from e
+
+    click.echo(f"Documents:       {result.documents:,}")
+    click.echo(f"Verified pairs:  {result.verified_pairs:,}")
+    click.echo(f"Components:      {result.components:,}")
+    click.echo(f"Near-duplicates: {result.duplicates:,} (action=drop)")
+    click.echo(f"Decisions:       {result.output_path}")
+
+
+@silver.command("compact")
+@click.option(
+    "--silver-path",
+    "-p",
+    default="data/processed/silver",
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    help="Path to silver dataset directory",
+)
+@click.option("--source", "-s", multiple=True, help="Only compact specific source(s)")
+@click.option(
+    "--target-file-mb",
+    type=click.IntRange(min=1),
+    default=128,
+    help="Approximate size of compacted files in MB (default: 128)",
+)
+@click.option(
+    "--small-file-mb",
+    type=click.IntRange(min=1),
+    default=32,
+    help="Only fragments smaller than this are merged (default: 32)",
+)
+@click.option(
+    "--row-group-rows",
+    type=click.IntRange(min=1),
+    default=50_000,
+    help="Rows per Parquet row group in compacted files (default: 50000)",
+)
+@click.option(
+    "--compression",
+    type=click.Choice(["zstd", "snappy", "gzip", "none"]),
+    default="zstd",
+    help="Parquet codec for compacted files (default: zstd)",
+)
+@click.option(
+    "--settle-minutes",
+    type=click.FloatRange(min=0),
+    default=10.0,
+    help="Skip partitions written to more recently than this (default: 10)",
+)
+@click.option("--dry-run", is_flag=True, help="Show what would be merged without writing")
+@click.option(
+    "--force", is_flag=True, help="Re-check partitions the compaction log marks unchanged"
+)
+def silver_compact(
+    silver_path: Path,
+    source: tuple[str, ...],
+    target_file_mb: int,
+    small_file_mb: int,
+    row_group_rows: int,
+    compression: str,
+    settle_minutes: float,
+    dry_run: bool,
+    force: bool,
+):
+    """
+    Merge small silver fragments into sorted, target-sized files.
+
+    Each pipeline batch writes one small *_silver_part-NNNN.parquet file.
+    Compaction merges a partition's small fragments into files of about
+    --target-file-mb, sorted by text_hash with --row-group-rows rows per
+    row group. It swaps them in atomically and updates the _metadata
+    sidecar checksums. Only partitions whose files changed since their
+    last compaction are touched; the state of each partition is kept in
+    _metadata/_compaction_log.jsonl. An interrupted compaction is finished
+    by the next run.
+
+    \b
+    Examples:
+      # Compact everything that changed since the last run
+      somali-tools silver compact
+
+      # Preview one source with 256 MB files
+      somali-tools silver compact -s BBC-Somali --target-file-mb 256 --dry-run
+    """
+    from somdialc.quality.silver_compaction import SilverCompactor
+
+    compactor = SilverCompactor(
+        silver_path,
+        target_file_bytes=target_file_mb * 1024 * 1024,
+        small_file_bytes=small_file_mb * 1024 * 1024,
+        row_group_rows=row_group_rows,
+        compression=compression,
+        settle_seconds=settle_minutes * 60,
+    )
+    try:
+        report = compactor.compact(sources=list(source) or None, dry_run=dry_run, force=force)
+    except RuntimeError as e:
+        raise click.ClickException(str(e)) from e
+
+    for result in report.compacted:
+        click.echo(
+            f"{result.partition}: {len(result.inputs)} fragments -> {len(result.outputs)} files"
+        )
+    click.echo(f"Partitions checked:   {report.partitions_checked}")
+    click.echo(f"Unchanged (skipped):  {report.partitions_unchanged}")
+    click.echo(f"Still being written:  {report.partitions_settling}")
+    click.echo(
+        f"{'Would merge' if dry_run else 'Merged'} fragments: "
+        f"{report.files_merged} -> {report.files_written} files"
+    )
+    if not dry_run:
+        click.echo(f"Bytes saved:          {report.bytes_saved:,}")
+
+
 # ============================================================================
 # DASHBOARD COMMAND GROUP
 # ============================================================================
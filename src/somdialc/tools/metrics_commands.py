@@ -587,3 +587,49 @@ def export_metrics(metrics_dir: Path, output_path: Path, format: str = "json") -
 
     logger.info(f"Exported {len(metrics)} metrics to {output_path} ({format})")
     return output_path
+
+
+# ============================================================================
+# RESOURCE USAGE
+# ============================================================================
+
+
+def resource_report(run_id: str, metrics_dir: Path) -> dict[str, Any]:
+    """
+    Load the resource telemetry recorded for one run.
+
+    Args:
+        run_id: Run identifier (exact, or a unique substring of the file name)
+        metrics_dir: Directory containing *_processing.json files
+
+    Returns:
+        Dict with run_id, source, interval_seconds, summary and samples
+
+    Raises:
+        FileNotFoundError: If no processing metrics exist for run_id
+        ValueError: If run_id is ambiguous or the run has no resource data
+    """
+    metrics_file = metrics_dir / f"{run_id}_processing.json"
+    if not metrics_file.exists():
+        candidates = sorted(metrics_dir.glob(f"*{run_id}*_processing.json"))
+        if not candidates:
+            raise FileNotFoundError(f"No processing metrics for run {run_id} in {metrics_dir}")
+        if len(candidates) > 1:
+            names = ", ".join(c.name for c in candidates)
+            raise ValueError(f"Run id {run_id!r} is ambiguous: {names}")
+        metrics_file = candidates[0]
+
+    with open(metrics_file, encoding="utf-8") as f:
+        data = json.load(f)
+
+    resources = data.get("resources")
+    if not resources:
+        raise ValueError(f"No resource samples recorded in {metrics_file.name}")
+
+    return {
+        "run_id": data.get("_run_id", run_id),
+        "source": data.get("_source", "unknown"),
+        "interval_seconds": resources.get("interval_seconds"),
+        "summary": resources.get("summary", {}),
+        "samples": resources.get("samples", []),
+    }
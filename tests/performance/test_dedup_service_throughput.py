@@ -0,0 +1,63 @@
+"""
+Throughput benchmark for the shared dedup server.
+
+Compares documents per second of an in-process DedupEngine with a
+DedupClient calling the server once per document and in batches.
+
+Run with: pytest tests/performance/test_dedup_service_throughput.py -m perf -s
+"""
+
+import random
+import time
+
+import pytest
+
+from somdialc.ingestion.dedup import DedupClient, DedupConfig, DedupEngine, shared_dedup_server
+
+WORDS = (
+    "dowladda federaalka soomaaliya ayaa maanta ku dhawaaqday qorshe cusub oo lagu "
+    "horumarinayo waxbarashada iyo caafimaadka gobollada dalka wasiirka arrimaha "
+    "gudaha shir jaraa'id muqdisho magaalada dadka deegaanka roobab xilli beereed"
+).split()
+DOCUMENTS = 2000
+BATCH_SIZE = 256
+
+
+def _documents(prefix: str) -> list[tuple[str, str]]:
+    """Distinct ~80-word documents (few shared word 3-grams, so no near-duplicates)."""
+    rng = random.Random(prefix)
+    return [
+        (" ".join(rng.choice(WORDS) for _ in range(80)), f"https://example.com/{prefix}/{i}")
+        for i in range(DOCUMENTS)
+    ]
+
+
+def _rate(fn) -> float:
+    started = time.perf_counter()
+    fn()
+    return DOCUMENTS / (time.perf_counter() - started)
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("enable_minhash", [False, True], ids=["exact", "exact+minhash"])
+def test_batched_calls_amortize_ipc(enable_minhash):
+    config = DedupConfig(enable_minhash=enable_minhash)
+    engine = DedupEngine(config)
+    local = _rate(lambda: [engine.process_document(t, u) for t, u in _documents("local")])
+
+    with shared_dedup_server(config) as socket_path, DedupClient(socket_path, config) as client:
+        per_doc = _rate(lambda: [client.process_document(t, u) for t, u in _documents("single")])
+        docs = _documents("batch")
+        batched = _rate(
+            lambda: [
+                client.process_documents(docs[i : i + BATCH_SIZE])
+                for i in range(0, DOCUMENTS, BATCH_SIZE)
+            ]
+        )
+
+    print(
+        f"\n{'exact+minhash' if enable_minhash else 'exact'}: in-process {local:,.0f} docs/s, "
+        f"server per-document {per_doc:,.0f} docs/s, "
+        f"server batched ({BATCH_SIZE}) {batched:,.0f} docs/s"
+    )
+    assert batched > per_doc
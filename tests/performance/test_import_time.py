@@ -0,0 +1,82 @@
+"""
+Cold-start import budget for the console entry points.
+
+Lightweight commands (``--help``, ``somali-lock-status``, ``somali-tools``)
+must not import the pipeline stack. The module check runs in the default
+suite; the ``-X importtime`` timing budget is hardware-sensitive and only
+runs with ``-m perf``.
+
+Run with: pytest tests/performance/test_import_time.py -m perf -v
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+ENTRY_POINT_MODULES = [
+    "somdialc.cli.lock_status",
+    "somdialc.tools.cli",
+    "somdialc.cli.download_wikisom",
+    "somdialc.cli.download_bbcsom",
+    "somdialc.cli.download_hfsom",
+    "somdialc.cli.download_sprakbankensom",
+    "somdialc.cli.download_tiktoksom",
+    "somdialc.cli.validate_silver",
+    "somdialc.infra.config",
+]
+
+HEAVY_MODULES = [
+    "pyarrow",
+    "pandas",
+    "datasketch",
+    "bs4",
+    "aiohttp",
+    "mlflow",
+    "datasets",
+    "prefect",
+    "somdialc.ingestion.base_pipeline",
+]
+
+# Cumulative import time of the entry module (ms); currently ~30-220 ms
+IMPORT_BUDGET_MS = 400
+
+
+def _run(code: str, *flags: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code], capture_output=True, text=True, check=True
+    )
+
+
+@pytest.mark.parametrize("module", ENTRY_POINT_MODULES)
+def test_entry_point_does_not_import_pipeline_stack(module):
+    code = (
+        f"import sys, {module}; print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+
+    loaded = _run(code).stdout.strip()
+
+    assert loaded == "", f"importing {module} loaded {loaded}"
+
+
+def test_lazy_package_exports_resolve():
+    code = (
+        "import somdialc.ingestion as i, somdialc.infra as f, somdialc.quality as q; "
+        "print(i.BasePipeline.__name__, f.DataManager.__name__, q.SilverWriter.__name__)"
+    )
+
+    assert _run(code).stdout.split() == ["BasePipeline", "DataManager", "SilverDatasetWriter"]
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("module", ENTRY_POINT_MODULES)
+def test_entry_point_import_time_budget(module):
+    # Best of three cold interpreters; -X importtime reports cumulative microseconds
+    timings = []
+    for _ in range(3):
+        report = _run(f"import {module}", "-X", "importtime").stderr.splitlines()
+        line = next(line for line in reversed(report) if line.rstrip().endswith(f"| {module}"))
+        timings.append(int(line.split("|")[1]) / 1000)
+
+    print(f"\n{module}: {min(timings):.0f} ms")
+    assert min(timings) < IMPORT_BUDGET_MS
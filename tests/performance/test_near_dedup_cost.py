@@ -0,0 +1,78 @@
+"""
+Cost benchmark for the processing-stage near-duplicate check.
+
+Measures the ``near_dedup`` stage time per 10k records of the record loop
+(batched signatures + LSH lookups), and compares the batch API with
+per-document ``is_duplicate`` + ``add_document`` calls.
+
+Run with: pytest tests/performance/test_near_dedup_cost.py -m perf -s
+"""
+
+import random
+import time
+from unittest.mock import patch
+
+import pytest
+
+from somdialc.infra.metrics import MetricsCollector
+from somdialc.ingestion.dedup import DATASKETCH_AVAILABLE
+from somdialc.ingestion.raw_record import RawRecord
+from tests.pipeline_helpers import MockPipeline
+
+WORDS = (
+    "dowladda federaalka soomaaliya ayaa maanta ku dhawaaqday qorshe cusub oo lagu "
+    "horumarinayo waxbarashada iyo caafimaadka gobollada dalka wasiirka arrimaha "
+    "gudaha shir jaraa'id muqdisho magaalada dadka deegaanka roobab xilli beereed"
+).split()
+RECORDS = 10_000
+
+
+def _texts() -> list[str]:
+    """~120-word articles; every tenth repeats an earlier one with a word appended."""
+    rng = random.Random(0)
+    texts: list[str] = []
+    for i in range(RECORDS):
+        if i % 10 == 9:
+            texts.append(texts[rng.randrange(i)] + " shalay")
+        else:
+            texts.append(" ".join(rng.choice(WORDS) for _ in range(120)))
+    return texts
+
+
+@pytest.mark.perf
+@pytest.mark.skipif(not DATASKETCH_AVAILABLE, reason="datasketch not installed")
+def test_near_dedup_cost_per_10k_records(temp_work_dir):
+    from somdialc.ingestion.dedup import MinHashDeduplicator
+
+    texts = _texts()
+    records = [
+        RawRecord(title=f"Maqaal {i}", text=text, url=f"https://example.com/{i}")
+        for i, text in enumerate(texts)
+    ]
+    processor = MockPipeline(test_records=records)
+    processor.metrics = MetricsCollector(processor.run_id, processor.source)
+    processor.near_dedup = MinHashDeduplicator()
+    processor.extract()
+
+    with patch.object(processor.silver_writer, "write", return_value=None):
+        processor.process()
+
+    timer = processor.metrics.stage_timer.summary()
+    stage_ms = timer["stages"]["near_dedup"]["total_ms"]
+    per_10k = stage_ms * 10_000 / RECORDS
+
+    baseline = MinHashDeduplicator()
+    started = time.perf_counter()
+    for i, text in enumerate(texts):
+        if baseline.is_duplicate(text) is None:
+            baseline.add_document(f"https://example.com/{i}", text)
+    per_doc_ms = (time.perf_counter() - started) * 1000 * 10_000 / RECORDS
+
+    print(
+        f"\nnear_dedup: {per_10k:,.0f} ms per 10k records batched "
+        f"({100 * stage_ms / timer['total_ms']:.1f}% of the loop), "
+        f"{per_doc_ms:,.0f} ms per 10k per-document; "
+        f"{processor.metrics.near_duplicate_count} near-duplicates"
+    )
+    assert processor.metrics.near_duplicate_count >= RECORDS // 10 * 0.9
+    assert per_10k < per_doc_ms
@@ -0,0 +1,101 @@
+"""
+Memory and time benchmark for domain statistics over the whole silver lake.
+
+Compares get_domain_statistics (reads only the ``domain`` column through
+pyarrow.dataset) with the previous approach of loading every partition's
+full table. Each strategy runs in a fresh interpreter so its peak Arrow
+allocation and peak RSS are its own (RSS includes ~200 MB of imports).
+
+Run with: pytest tests/performance/test_silver_domain_stats.py -m perf -s
+"""
+
+import json
+import random
+import subprocess
+import sys
+
+import pytest
+
+from somdialc.quality.record_utils import build_silver_record
+from somdialc.quality.silver_writer import SilverDatasetWriter
+
+WORDS = (
+    "dowladda federaalka soomaaliya ayaa maanta ku dhawaaqday qorshe cusub oo lagu "
+    "horumarinayo waxbarashada iyo caafimaadka gobollada dalka wasiirka arrimaha"
+).split()
+SOURCES = ("BBC-Somali", "Wikipedia-Somali", "HuggingFace-Somali_c4-so")
+DATES = 8
+RECORDS_PER_PARTITION = 4_000
+
+MEASURE = """
+import json, resource, sys, time
+from pathlib import Path
+import pyarrow as pa
+from somdialc.quality.silver_writer import SilverDatasetWriter
+
+writer = SilverDatasetWriter(Path(sys.argv[1]))
+started = time.perf_counter()
+if sys.argv[2] == "full_tables":
+    stats = {}
+    for date_dir in sorted(writer.base_dir.glob("source=*/date_accessed=*")):
+        source = date_dir.parent.name.split("=", 1)[1]
+        table = writer.read(source, date_dir.name.split("=", 1)[1])
+        for domain in table.column("domain").to_pylist():
+            stats[domain] = stats.get(domain, 0) + 1
+else:
+    stats = writer.get_domain_statistics()
+print(json.dumps({
+    "seconds": time.perf_counter() - started,
+    "peak_arrow_mb": pa.default_memory_pool().max_memory() / 2**20,
+    "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    "stats": stats,
+}))
+"""
+
+
+def _measure(silver_dir, strategy: str) -> dict:
+    output = subprocess.run(
+        [sys.executable, "-c", MEASURE, str(silver_dir), strategy],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+@pytest.mark.perf
+def test_domain_statistics_read_one_column(tmp_path):
+    rng = random.Random(0)
+    writer = SilverDatasetWriter(tmp_path)
+    for source in SOURCES:
+        for day in range(1, DATES + 1):
+            date_accessed = f"2025-01-{day:02d}"
+            run_id = f"202501{day:02d}_000000_bench"
+            records = []
+            for i in range(RECORDS_PER_PARTITION):
+                record = build_silver_record(
+                    text=" ".join(rng.choice(WORDS) for _ in range(300)),
+                    title=f"Maqaal {i}",
+                    source=source,
+                    url=f"https://example.com/{source}/{day}/{i}",
+                    date_accessed=date_accessed,
+                    domain=rng.choice(["news", "encyclopedia", "web"]),
+                )
+                record["run_id"] = run_id
+                record["schema_version"] = "1.0"
+                records.append(record)
+            writer.write(records, source, date_accessed, run_id)
+
+    full = _measure(tmp_path, "full_tables")
+    pushdown = _measure(tmp_path, "domain_column")
+    records = len(SOURCES) * DATES * RECORDS_PER_PARTITION
+
+    print(
+        f"\ndomain stats over {records:,} records: "
+        f"full tables {full['seconds']:.2f} s / {full['peak_arrow_mb']:.1f} MB peak Arrow / "
+        f"{full['peak_rss_mb']:.0f} MB peak RSS, domain column {pushdown['seconds']:.2f} s / "
+        f"{pushdown['peak_arrow_mb']:.1f} MB peak Arrow / {pushdown['peak_rss_mb']:.0f} MB peak RSS"
+    )
+    assert pushdown["stats"] == full["stats"]
+    assert pushdown["seconds"] < full["seconds"]
+    assert pushdown["peak_arrow_mb"] < full["peak_arrow_mb"]
@@ -0,0 +1,42 @@
+"""
+Overhead benchmark for processing-loop stage timers.
+
+Runs the record loop with realistic Somali text and checks that the timer
+cost (calibrated per lap) stays under 2% of the measured loop time.
+
+Run with: pytest tests/performance/test_stage_timing_overhead.py -m perf -v
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from somdialc.infra.metrics import MetricsCollector
+from somdialc.ingestion.raw_record import RawRecord
+from tests.pipeline_helpers import MockPipeline
+
+PARAGRAPH = (
+    "Dowladda Federaalka Soomaaliya ayaa maanta ku dhawaaqday qorshe cusub oo lagu "
+    "horumarinayo waxbarashada iyo caafimaadka gobollada dalka. "
+)
+
+
+@pytest.mark.perf
+def test_stage_timer_overhead_under_two_percent(temp_work_dir):
+    records = [
+        RawRecord(title=f"Maqaal {i}", text=PARAGRAPH * 20, url=f"https://example.com/{i}")
+        for i in range(2000)
+    ]
+    processor = MockPipeline(test_records=records)
+    processor.metrics = MetricsCollector(processor.run_id, processor.source)
+    processor.extract()
+
+    with patch.object(processor.silver_writer, "write", return_value=None):
+        processor.process()
+
+    summary = processor.metrics.stage_timer.summary()
+    print(
+        f"\nloop {summary['total_ms']:.0f} ms, timer overhead "
+        f"{summary['timer_overhead_ms']:.2f} ms ({summary['timer_overhead_pct']:.3f}%)"
+    )
+    assert summary["timer_overhead_pct"] < 2.0
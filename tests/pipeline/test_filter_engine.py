@@ -4,9 +4,15 @@ Tests for FilterEngine service.
 Verifies filter execution and statistics tracking.
 """
 
+import time
+
 import pytest
 
 from somdialc.quality.filter_engine import FilterEngine
+from somdialc.quality.filter_functions import min_length_filter as builtin_min_length_filter
+from somdialc.quality.filter_functions import (
+    min_token_floor_filter as builtin_min_token_floor_filter,
+)
 
 
 def sample_filter_pass(cleaned_text: str, **kwargs) -> tuple[bool, dict]:
@@ -117,5 +123,166 @@ class TestFilterEngine:
         assert "sample_metadata" in metadata
 
 
+def expensive_lenient_filter(cleaned_text: str, **kwargs) -> tuple[bool, dict]:
+    """Slow filter that rejects only texts containing 'spam'."""
+    end = time.perf_counter() + 0.0005
+    while time.perf_counter() < end:
+        pass
+    return "spam" not in cleaned_text, {"source_tag": "expensive"}
+
+
+def cheap_selective_filter(cleaned_text: str, **kwargs) -> tuple[bool, dict]:
+    """Fast filter that rejects short texts."""
+    return len(cleaned_text) >= 20, {"source_tag": "cheap", "length": len(cleaned_text)}
+
+
+def topic_enrichment(cleaned_text: str, enrich_only: bool = True) -> tuple[bool, dict]:
+    """Enrichment filter that only adds metadata."""
+    return True, {"topic": "news"}
+
+
+class TestAdaptiveOrdering:
+    """Adaptive cost-based filter ordering."""
+
+    def _engine(self):
+        engine = FilterEngine(adaptive=True, warmup_records=20)
+        engine.register_filter(expensive_lenient_filter)
+        engine.register_filter(topic_enrichment, {"enrich_only": True})
+        engine.register_filter(cheap_selective_filter)
+        return engine
+
+    def _texts(self):
+        return ["short"] * 10 + ["a long enough sentence for the filter"] * 10
+
+    def test_reorders_after_warmup(self):
+        engine = self._engine()
+        for text in self._texts():
+            engine.apply_filters(text)
+
+        ordering = engine.get_ordering_stats()
+        assert ordering["order"] == [
+            "cheap_selective_filter",
+            "expensive_lenient_filter",
+            "topic_enrichment",
+        ]
+        assert ordering["warmup_records"] == 20
+        assert ordering["filters"]["cheap_selective_filter"]["rejection_rate"] == 0.5
+        assert ordering["filters"]["topic_enrichment"]["enrichment"] is True
+        assert ordering["estimated_savings_pct"] > 30
+
+        calls_before = engine.filter_calls["expensive_lenient_filter"]
+        assert engine.apply_filters("short") == (False, "cheap_selective_filter", {})
+        assert engine.filter_calls["expensive_lenient_filter"] == calls_before
+
+    def test_results_match_registration_order(self):
+        adaptive = self._engine()
+        static = FilterEngine()
+        static.register_filter(expensive_lenient_filter)
+        static.register_filter(topic_enrichment, {"enrich_only": True})
+        static.register_filter(cheap_selective_filter)
+        for text in self._texts():
+            adaptive.apply_filters(text)
+
+        text = "a long enough sentence for the filter"
+        passed, reason, metadata = adaptive.apply_filters(text)
+
+        # Metadata is merged in registration order, so later filters still win
+        assert (passed, reason, metadata) == static.apply_filters(text)
+        assert metadata["source_tag"] == "cheap"
+        assert metadata["topic"] == "news"
+
+    def test_warmup_attributes_first_registered_failure(self):
+        engine = FilterEngine(adaptive=True, warmup_records=100)
+        engine.register_filter(expensive_lenient_filter)
+        engine.register_filter(cheap_selective_filter)
+
+        assert engine.apply_filters("spam")[1] == "expensive_lenient_filter"
+        # Both filters still ran during warm-up
+        assert engine.filter_calls["cheap_selective_filter"] == 1
+        assert engine.get_filter_stats() == {"filtered_by_expensive_lenient_filter": 1}
+        assert engine.get_ordering_stats() == {}
+
+    def test_batch_warmup_chooses_order(self):
+        engine = self._engine()
+        static = FilterEngine()
+        static.register_filter(expensive_lenient_filter)
+        static.register_filter(topic_enrichment, {"enrich_only": True})
+        static.register_filter(cheap_selective_filter)
+
+        result = engine.apply_filters_batch(self._texts())
+        expected = [static.apply_filters(text) for text in self._texts()]
+
+        assert result.passed.tolist() == [passed for passed, _, _ in expected]
+        assert result.reasons.tolist() == [reason for _, reason, _ in expected]
+        assert result.metadata == [metadata for _, _, metadata in expected]
+        assert engine.get_filter_stats() == static.get_filter_stats()
+
+        ordering = engine.get_ordering_stats()
+        assert ordering["order"][0] == "cheap_selective_filter"
+        assert ordering["warmup_records"] == 20
+        assert ordering["filters"]["cheap_selective_filter"]["rejection_rate"] == 0.5
+
+        calls_before = engine.filter_calls["expensive_lenient_filter"]
+        assert (
+            engine.apply_filters_batch(["short"] * 5).reasons.tolist()
+            == ["cheap_selective_filter"] * 5
+        )
+        assert engine.filter_calls["expensive_lenient_filter"] == calls_before
+
+    def test_non_adaptive_engine_reports_no_ordering(self):
+        engine = FilterEngine()
+        engine.register_filter(cheap_selective_filter)
+        engine.apply_filters("short")
+        assert engine.get_ordering_stats() == {}
+
+
+class TestApplyFiltersBatch:
+    """Batch filtering with vectorised and scalar filters."""
+
+    TEXTS = [
+        "Waa maxay",
+        "   ",
+        "Waxaan waa maqaal cusub oo ku saabsan xaalada wadanka Soomaaliya.",
+        "spam spam spam spam spam spam spam",
+        "",
+    ]
+
+    def _register(self, engine):
+        engine.register_filter(builtin_min_length_filter, {"threshold": 20})
+        engine.register_filter(expensive_lenient_filter)
+        engine.register_filter(builtin_min_token_floor_filter, {"min_tokens": 5})
+
+    def test_matches_scalar_results(self):
+        batch_engine, scalar_engine = FilterEngine(), FilterEngine()
+        self._register(batch_engine)
+        self._register(scalar_engine)
+
+        result = batch_engine.apply_filters_batch(self.TEXTS)
+        expected = [scalar_engine.apply_filters(text) for text in self.TEXTS]
+
+        assert result.passed.tolist() == [passed for passed, _, _ in expected]
+        assert result.reasons.tolist() == [reason for _, reason, _ in expected]
+        assert result.metadata[2] == expected[2][2]
+        assert result.metadata[2]["token_count"] == 10
+        assert type(result.metadata[2]["token_count"]) is int
+        assert batch_engine.get_filter_stats() == scalar_engine.get_filter_stats()
+        # Rows rejected by the vectorised length filter never reach the scalar one
+        assert batch_engine.filter_calls["expensive_lenient_filter"] == 2
+
+    def test_scalar_fallback_errors(self):
+        def buggy_filter(cleaned_text: str, **kwargs) -> tuple[bool, dict]:
+            raise ValueError("Simulated filter error")
+
+        permissive, strict = FilterEngine(), FilterEngine(strict_mode=True)
+        for engine in (permissive, strict):
+            engine.register_filter(buggy_filter)
+            engine.register_filter(sample_filter_pass)
+
+        assert permissive.apply_filters_batch(["qoraal"]).passed.tolist() == [True]
+        result = strict.apply_filters_batch(["qoraal"])
+        assert result.reasons.tolist() == ["buggy_filter_error"]
+        assert "filtered_by_buggy_filter" not in strict.get_filter_stats()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,61 @@
+"""
+Shared helpers for pipeline-level tests.
+
+MockPipeline is a minimal BasePipeline: it yields the records it was
+constructed with and cleans them with an identity cleaner. Pair it with the
+``temp_work_dir`` fixture from conftest so its data directories and ledger
+live under the test's tmp_path.
+"""
+
+import json
+
+from somdialc.ingestion.base_pipeline import BasePipeline
+from somdialc.quality.text_cleaners import TextCleaningPipeline
+
+
+class MockPipeline(BasePipeline):
+    """Mock pipeline for testing checkpoint functionality."""
+
+    def __init__(self, test_records=None, **kwargs):
+        """Initialize with test records."""
+        self.test_records = test_records or []
+        # Use a valid source name (wikipedia-somali)
+        super().__init__(source="wikipedia-somali", **kwargs)
+
+    def download(self):
+        """Mock download - no-op."""
+        pass
+
+    def extract(self):
+        """Mock extract - create staging file."""
+        self.staging_dir.mkdir(parents=True, exist_ok=True)
+        self.staging_file = self.staging_dir / "test_staging.json"
+        self.staging_file.write_text(json.dumps([]))
+
+        self.processed_file = self.processed_dir / "test_processed.txt"
+
+    def _extract_records(self):
+        """Return test records."""
+        yield from self.test_records
+
+    def _create_cleaner(self):
+        """Return identity cleaner (no-op)."""
+        return TextCleaningPipeline([])
+
+    def _get_source_type(self):
+        return "wiki"
+
+    def _get_license(self):
+        return "CC-BY-SA-3.0"
+
+    def _get_language(self):
+        return "so"
+
+    def _get_source_metadata(self):
+        return {}
+
+    def _get_domain(self):
+        return "test"
+
+    def _get_register(self):
+        return "formal"
@@ -18,6 +18,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 
+from somdialc.infra.config import get_config
 from somdialc.ingestion.processors.tiktok_somali_processor import (
     TikTokSomaliProcessor,
 )
@@ -47,6 +48,7 @@ class TestTikTokFilterInstrumentation:
             config.data.staging_dir = tmp_path / "staging"
             config.data.processed_dir = tmp_path / "processed"
             config.data.silver_dir = tmp_path / "silver"
+            config.tracking = get_config().tracking  # Read by MLFlowTracker.from_config
             mock_config.return_value = config
 
             # Create processor with test API token
@@ -559,6 +561,7 @@ class TestTikTokProcessorIntegration:
             config.data.staging_dir = tmp_path / "staging"
             config.data.processed_dir = tmp_path / "processed"
             config.data.silver_dir = tmp_path / "silver"
+            config.tracking = get_config().tracking  # Read by MLFlowTracker.from_config
             mock_config.return_value = config
 
             processor = TikTokSomaliProcessor(
@@ -685,6 +688,7 @@ class TestTikTokTitleSynthesis:
             config.data.staging_dir = tmp_path / "staging"
             config.data.processed_dir = tmp_path / "processed"
             config.data.silver_dir = tmp_path / "silver"
+            config.tracking = get_config().tracking  # Read by MLFlowTracker.from_config
             mock_config.return_value = config
 
             from somdialc.ingestion.processors.tiktok_somali_processor import (
@@ -851,3 +855,51 @@ class TestTikTokTitleSynthesis:
         # Non-identifying engagement fields must be preserved.
         assert "likes" in meta
         assert "comment_id" in meta
+
+
+class TestTikTokRawDatasetDump:
+    """extract() keeps the raw Apify dump verbatim and cleans only staging items."""
+
+    ITEMS = [
+        {
+            "text": "Waxaan filaanaya filimkan cusub",
+            "cid": "7564909554666193680",
+            "createTime": 1761342789,
+            "videoWebUrl": "https://www.tiktok.com/@user/video/123456",
+            "#debug": {"requestId": "abc"},
+        },
+        {"#error": "Comment could not be loaded"},
+    ]
+
+    def test_raw_dump_is_not_cleaned(self, temp_work_dir):
+        import json
+
+        from somdialc.infra.metrics import MetricsCollector
+
+        processor = TikTokSomaliProcessor(
+            apify_api_token="test_token_12345",
+            video_urls=["https://www.tiktok.com/@user/video/123456"],
+            force=True,
+        )
+        processor.raw_dir.mkdir(parents=True, exist_ok=True)
+        processor.video_urls_file.write_text(
+            json.dumps({"video_urls": processor.video_urls}), encoding="utf-8"
+        )
+        processor.metrics = MetricsCollector(processor.run_id, processor.source)
+        processor.apify_client = Mock()
+        processor.apify_client.scrape_comments.return_value = {
+            "run_id": "run1",
+            "dataset_id": "ds1",
+            "stats": {"items_count": 2, "compute_units": 0.1},
+        }
+        processor.apify_client.iter_dataset_items.return_value = iter(self.ITEMS)
+
+        processor.extract()
+
+        assert processor.apify_client.iter_dataset_items.call_args.kwargs["clean"] is False
+        raw_file = processor.raw_dir / f"tiktok-somali_{processor.run_id}_raw_apify-dataset.jsonl"
+        raw_items = [json.loads(line) for line in raw_file.read_text().splitlines()]
+        assert raw_items == self.ITEMS
+        staged = [json.loads(line) for line in processor.staging_file.read_text().splitlines()]
+        assert [item["text"] for item in staged] == ["Waxaan filaanaya filimkan cusub"]
+        assert not any(key.startswith("#") for key in staged[0])
@@ -508,7 +508,7 @@ class TestDumpLevelDeduplication:
         mock_get_response.headers = {
             "ETag": "new-etag-67890",
             "Last-Modified": "Sun, 02 Nov 2025 01:00:00 GMT",
-            "Content-Length": "2000000",
+            "Content-Length": "15",  # len(b"test data chunk")
         }
         mock_get_response.iter_content = Mock(return_value=[b"test data chunk"])
         mock_session.get.return_value = mock_get_response
@@ -534,7 +534,7 @@ class TestDumpLevelDeduplication:
         mock_response.headers = {
             "ETag": "first-etag-abcdef",
             "Last-Modified": "Mon, 03 Nov 2025 10:00:00 GMT",
-            "Content-Length": "1500000",
+            "Content-Length": "19",  # len(b"first download data")
         }
         mock_response.iter_content = Mock(return_value=[b"first download data"])
         mock_session.get.return_value = mock_response
@@ -602,7 +602,7 @@ class TestDumpLevelDeduplication:
         # Mock GET for fallback download
         mock_get_response = Mock()
         mock_get_response.status_code = 200
-        mock_get_response.headers = {"Content-Length": "1000000", "ETag": "new-etag"}
+        mock_get_response.headers = {"Content-Length": "13", "ETag": "new-etag"}
         mock_get_response.iter_content = Mock(return_value=[b"fallback data"])
         mock_session.get.return_value = mock_get_response
 
@@ -647,7 +647,7 @@ class TestDumpLevelDeduplication:
         mock_response.headers = {
             "ETag": "new-etag-xyz",
             "Last-Modified": "Thu, 06 Nov 2025 09:00:00 GMT",
-            "Content-Length": "3000000",
+            "Content-Length": "13",  # len(b"new dump data")
         }
         mock_response.iter_content = Mock(return_value=[b"new dump data"])
         mock_session.get.return_value = mock_response
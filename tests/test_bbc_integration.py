@@ -351,3 +351,73 @@ class TestBBCIntegration:
                 and "BBC may have changed" in record.message
                 for record in caplog.records
             ), "Expected warning about empty text extraction, but none found"
+
+
+class TestBBCReplayMisses:
+    """Offline replay: URLs missing from the HTTP cache are skipped, not failed."""
+
+    MISSING_URL = "https://www.bbc.com/somali/articles/not-cached"
+
+    @pytest.fixture
+    def replay_processor(self, temp_data_dir, monkeypatch):
+        from somdialc.infra.http_cache import HTTPResponseCache
+        from somdialc.ingestion.processors.bbc import extraction
+
+        monkeypatch.chdir(temp_data_dir.parent)
+        processor = BBCSomaliProcessor(max_articles=1)
+        monkeypatch.setattr(processor.config.http, "cache_mode", "replay")
+        cache = HTTPResponseCache(temp_data_dir / "http-cache")
+        monkeypatch.setattr(extraction, "get_http_cache", lambda: cache)
+        extraction._ensure_metrics(processor)
+        return processor, cache, temp_data_dir / "staging.jsonl"
+
+    def test_async_replay_miss_is_skipped(self, replay_processor):
+        """A replay miss neither aborts the batch nor writes a ledger failure."""
+        import asyncio
+        from unittest.mock import patch
+
+        from somdialc.ingestion.processors.bbc.extraction import (
+            _write_fetch_results,
+            fetch_all_articles_async,
+        )
+
+        pytest.importorskip("aiohttp")
+        processor, _, staging_path = replay_processor
+
+        results = asyncio.run(fetch_all_articles_async(processor, [self.MISSING_URL]))
+        assert results == [{"url": self.MISSING_URL, "status": 504, "replay_miss": True}]
+
+        with (
+            patch.object(processor.ledger, "mark_failed") as mark_failed,
+            open(staging_path, "w", encoding="utf-8") as staging_out,
+        ):
+            assert _write_fetch_results(processor, staging_out, results) == (0, 0)
+
+        mark_failed.assert_not_called()
+        assert processor.metrics.counters["urls_skipped"] == 1
+        assert processor.metrics.counters["urls_failed"] == 0
+
+    def test_sync_replay_miss_is_skipped(self, replay_processor):
+        """The sync scraper counts a replay miss as skipped, leaving retry counts alone."""
+        from unittest.mock import patch
+
+        from somdialc.infra.http import HTTPSessionFactory
+        from somdialc.ingestion.processors.bbc.extraction import (
+            _scrape_links_sync,
+            _SyncScrapeTally,
+        )
+
+        processor, cache, staging_path = replay_processor
+        session = HTTPSessionFactory.create_session(cache=cache, cache_mode="replay")
+        tally = _SyncScrapeTally(session=session)
+
+        with (
+            patch.object(processor.ledger, "mark_failed") as mark_failed,
+            open(staging_path, "w", encoding="utf-8") as staging_out,
+        ):
+            _scrape_links_sync(processor, staging_out, [self.MISSING_URL], tally)
+
+        mark_failed.assert_not_called()
+        assert (tally.articles, tally.failed) == (0, 0)
+        assert processor.metrics.counters["urls_skipped"] == 1
+        assert processor.metrics.counters["urls_failed"] == 0
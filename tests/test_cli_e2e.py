@@ -132,7 +132,10 @@ class TestWikipediaCLI:
                 "(would trigger a real network download)"
             )
 
-        monkeypatch.setattr(download_wikisom, "WikipediaSomaliProcessor", _fail_if_constructed)
+        monkeypatch.setattr(
+            "somdialc.ingestion.processors.wikipedia_somali_processor.WikipediaSomaliProcessor",
+            _fail_if_constructed,
+        )
         monkeypatch.setattr(sys, "argv", ["wikisom-download", "--help"])
 
         with pytest.raises(SystemExit) as exc_info:
@@ -175,7 +178,10 @@ class TestBBCCLI:
                 "(would trigger a real network scrape)"
             )
 
-        monkeypatch.setattr(download_bbcsom, "BBCSomaliProcessor", _fail_if_constructed)
+        monkeypatch.setattr(
+            "somdialc.ingestion.processors.bbc_somali_processor.BBCSomaliProcessor",
+            _fail_if_constructed,
+        )
         monkeypatch.setattr(sys, "argv", ["bbcsom-download", "--help"])
 
         with pytest.raises(SystemExit) as exc_info:
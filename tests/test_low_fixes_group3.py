@@ -21,6 +21,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from somdialc.infra.config import get_config
 from somdialc.infra.logging_utils import validate_iso_date
 from somdialc.ingestion.crawl_ledger import CrawlLedger, SQLiteLedger
 
@@ -203,6 +204,12 @@ class TestConfigurationLogging:
         mock_cfg.logging.level = "INFO"
         mock_cfg.logging.format = "json"
 
+        # Settings BasePipeline reads for its hot path: real defaults
+        config = get_config()
+        mock_cfg.profiling = config.profiling
+        mock_cfg.filters = config.filters
+        mock_cfg.dedup = config.dedup
+
         return mock_cfg
 
     def test_configuration_logging_at_startup(self, mock_config, caplog):
@@ -340,6 +347,9 @@ class TestConfigurationLogging:
         bad_config.data = mock_config.data
         bad_config.scraping = mock_config.scraping
         bad_config.database = mock_config.database
+        bad_config.profiling = mock_config.profiling
+        bad_config.filters = mock_config.filters
+        bad_config.dedup = mock_config.dedup
 
         # Make logging attribute raise an exception
         bad_config.logging = MagicMock(side_effect=Exception("Logging config error"))
@@ -1,3 +1,5 @@
+from unittest.mock import MagicMock
+
 from somdialc.orchestration.flows import _run_locked_pipeline_task
 
 
@@ -100,3 +102,28 @@ def test_run_locked_pipeline_task_marks_registered_run_failed():
     assert updates[-1]["status"] == "FAILED"
     assert "processor boom" in updates[-1]["errors"]
     assert ledger.actions[-1] == ("release", "huggingface")
+
+
+def test_run_locked_pipeline_task_passes_stage_runner_to_processor():
+    ledger = FakeLedger()
+    processor = MagicMock(run_id="run-1")
+    processor.run.return_value = "data/out.parquet"
+
+    def stage_runner(name, fn):
+        return fn()
+
+    result = _run_locked_pipeline_task(
+        processor_name="bbc",
+        display_source="BBC",
+        pipeline_type="web",
+        processor_kwargs={},
+        start_message="Starting BBC pipeline...",
+        ledger_factory=lambda: ledger,
+        processor_factory=lambda name, **kwargs: processor,
+        source_name_factory=lambda name, **kwargs: "BBC-Somali",
+        git_commit_resolver=lambda: None,
+        stage_runner=stage_runner,
+    )
+
+    assert result["status"] == "success"
+    processor.run.assert_called_once_with(stage_runner)
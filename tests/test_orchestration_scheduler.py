@@ -0,0 +1,232 @@
+"""Tests for the resource-aware local orchestration scheduler."""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from somdialc.orchestration import flows
+from somdialc.orchestration.scheduler import CPU, NETWORK, LocalScheduler, SourceJob
+from tests.pipeline_helpers import MockPipeline
+
+
+def _pipeline_job(source, durations, log=None, fail_stage=None, delay=0.0):
+    """SourceJob that runs download/extract/process stages sleeping ``durations``."""
+
+    def run(stage_runner):
+        time.sleep(delay)
+        for stage, seconds in zip(("download", "extract", "process"), durations):
+
+            def work(stage=stage, seconds=seconds):
+                if log is not None:
+                    log.append((source, stage))
+                time.sleep(seconds)
+                if stage == fail_stage:
+                    raise RuntimeError(f"{stage} boom")
+                return stage
+
+            stage_runner(stage, work)
+        return {"source": source, "status": "success"}
+
+    return SourceJob(source, run)
+
+
+def _overlaps(a, b):
+    return a.started < b.ended and b.started < a.ended
+
+
+def test_network_stages_overlap_cpu_stages_of_other_sources():
+    scheduler = LocalScheduler(cpu_slots=1, network_slots=2)
+
+    results, report = scheduler.run(
+        [
+            _pipeline_job("wikipedia", (0.01, 0.15, 0.01)),
+            _pipeline_job("bbc", (0.05, 0.15, 0.01)),
+        ]
+    )
+
+    assert [r["status"] for r in results] == ["success", "success"]
+    stages = {stage.name: stage for stage in report.stages}
+    assert stages["wikipedia:extract"].resource == CPU
+    assert stages["bbc:extract"].resource == NETWORK
+    assert _overlaps(stages["wikipedia:extract"], stages["bbc:extract"])
+    assert report.makespan_seconds < 0.15 + 0.15 + 0.05
+
+
+def test_cpu_stages_are_capped():
+    # One CPU slot by default: stages are threads and share the GIL
+    scheduler = LocalScheduler(network_slots=4)
+    assert scheduler.pools[CPU].capacity == 1
+
+    _, report = scheduler.run(
+        [_pipeline_job(source, (0.0, 0.05, 0.05)) for source in ("wikipedia", "sprakbanken")]
+    )
+
+    cpu_stages = [stage for stage in report.stages if stage.resource == CPU]
+    assert len(cpu_stages) == 4
+    for i, a in enumerate(cpu_stages):
+        for b in cpu_stages[i + 1 :]:
+            assert not _overlaps(a, b), (a.name, b.name)
+    assert any(stage.blocked_by is not None for stage in cpu_stages)
+
+
+def test_critical_path_follows_resource_hand_offs():
+    scheduler = LocalScheduler(cpu_slots=1, network_slots=1)
+
+    # bbc's long scrape holds the only network slot, so wikipedia's download waits on it
+    _, report = scheduler.run(
+        [
+            _pipeline_job("bbc", (0.0, 0.15, 0.0)),
+            _pipeline_job("wikipedia", (0.01, 0.05, 0.05), delay=0.03),
+        ]
+    )
+
+    path = report.critical_path_names()
+    assert path[-1] == "wikipedia:process"
+    assert "bbc:extract" in path and "wikipedia:download" in path
+    summary = report.to_dict()
+    assert summary["critical_path"] == path
+    assert summary["makespan_seconds"] >= summary["critical_path_seconds"]
+
+
+def test_sequential_mode_runs_sources_in_order():
+    log = []
+    scheduler = LocalScheduler(max_concurrent_sources=1)
+
+    scheduler.run([_pipeline_job(s, (0.0, 0.01, 0.0), log) for s in ("bbc", "wikipedia")])
+
+    assert [source for source, _ in log] == ["bbc"] * 3 + ["wikipedia"] * 3
+
+
+def test_failed_stage_releases_its_slot():
+    scheduler = LocalScheduler(cpu_slots=1, network_slots=1)
+    job = _pipeline_job("bbc", (0.0, 0.0, 0.0), fail_stage="extract")
+
+    results, report = scheduler.run([job, _pipeline_job("wikipedia", (0.0, 0.0, 0.0))])
+
+    assert results[0] == {"source": "bbc", "status": "failed", "error": "extract boom"}
+    assert results[1]["status"] == "success"
+    assert [s.name for s in report.stages if s.failed] == ["bbc:extract"]
+
+
+def test_duplicate_sources_rejected():
+    job = _pipeline_job("bbc", (0.0, 0.0, 0.0))
+
+    with pytest.raises(ValueError):
+        LocalScheduler().run([job, job])
+
+
+def test_pipeline_run_wraps_each_stage(temp_work_dir):
+    processor = MockPipeline(force=True)
+    stages = []
+
+    def stage_runner(name, fn):
+        stages.append(name)
+        return fn()
+
+    with (
+        patch.object(processor, "download", return_value=processor.raw_dir),
+        patch.object(processor, "extract", return_value=processor.staging_dir),
+        patch.object(processor, "process", return_value=processor.processed_dir) as process,
+    ):
+        assert processor.run(stage_runner) == processor.processed_dir
+
+    assert stages == ["download", "extract", "process"]
+    process.assert_called_once_with()
+
+
+def test_run_all_pipelines_uses_local_scheduler():
+    calls = []
+    lock = threading.Lock()
+
+    def fake_task(source):
+        def task(stage_runner=None, **kwargs):
+            with lock:
+                calls.append((source, kwargs))
+            stage_runner("download", lambda: None)
+            return {"source": f"{source}-Somali", "status": "success"}
+
+        return task
+
+    with (
+        patch.object(flows, "run_wikipedia_task", fake_task("wikipedia")),
+        patch.object(flows, "run_bbc_task", fake_task("bbc")),
+        patch.object(flows, "should_run_source", return_value=(True, "due")),
+        patch.object(flows, "is_initial_collection_phase", return_value=False),
+        patch("somdialc.infra.manifest_writer.ManifestWriter", MagicMock()),
+    ):
+        result = flows.run_all_pipelines(
+            run_huggingface=False,
+            run_sprakbanken=False,
+            run_tiktok=False,
+            max_bbc_articles=5,
+            executor="local",
+        )
+
+    assert result["executor"] == "local"
+    assert len(result["successful"]) == 2
+    assert dict(calls)["bbc"]["max_articles"] == 5
+    assert all(kwargs["run_seed"] == result["run_id"] for _, kwargs in calls)
+    assert sorted(stage["source"] for stage in result["schedule"]["stages"]) == [
+        "bbc",
+        "wikipedia",
+    ]
+    assert result["schedule"]["critical_path"]
+
+
+def test_auto_executor_falls_back_to_local_without_prefect():
+    with patch.object(flows, "PREFECT_AVAILABLE", False):
+        assert flows._resolve_executor("auto") == "local"
+        assert flows._resolve_executor("prefect") == "local"
+        assert flows._resolve_executor("sequential") == "sequential"
+    with pytest.raises(ValueError):
+        flows._resolve_executor("threads")
+
+
+SPRAKBANKEN_XML = """<?xml version='1.0' encoding='UTF-8'?>
+<corpus id="test-corpus">
+  <text title="Qoraal 1"><page n="1"><sentence id="s1">
+    <token>Waxaan</token><token>baran</token><token>doonaa</token><token>cilmi</token>
+  </sentence></page></text>
+  <text title="Qoraal 2"><page n="1"><sentence id="s2">
+    <token>Wararka</token><token>maanta</token><token>waa</token><token>muhiim</token>
+  </sentence></page></text>
+</corpus>"""
+
+
+def test_sprakbanken_parse_timeout_runs_on_worker_threads(temp_work_dir, tmp_path):
+    import bz2
+
+    from somdialc.infra.metrics import MetricsCollector
+    from somdialc.ingestion.processors.sprakbanken_somali_processor import (
+        SprakbankenSomaliProcessor,
+        XMLParseTimeoutError,
+        parsing_timeout,
+    )
+
+    corpus_file = tmp_path / "corpus.xml.bz2"
+    with bz2.open(corpus_file, "wt", encoding="utf-8") as f:
+        f.write(SPRAKBANKEN_XML)
+
+    def job(stage_runner):
+        processor = SprakbankenSomaliProcessor(corpus_id="somali-cilmi", force=True)
+        processor.metrics = MetricsCollector(processor.run_id, processor.source)
+
+        def extract():
+            with open(tmp_path / "staging.jsonl", "w", encoding="utf-8") as out:
+                return processor._extract_corpus(corpus_file, {"id": "test"}, out)
+
+        counts = stage_runner("extract", extract)
+        errors = processor.metrics.counters["extraction_error"]
+        return {"source": "sprakbanken", "status": "success", "counts": counts, "errors": errors}
+
+    # Default (one worker per source) and sequential schedules both use worker threads
+    for scheduler in (LocalScheduler(), LocalScheduler(max_concurrent_sources=1)):
+        results, _ = scheduler.run([SourceJob("sprakbanken", job)])
+
+        assert (results[0]["counts"], results[0]["errors"]) == ((2, 2), 0)
+
+    with parsing_timeout(0, corpus_file) as check:
+        with pytest.raises(XMLParseTimeoutError):
+            check()
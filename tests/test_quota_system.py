@@ -294,3 +294,63 @@ def test_quota_with_partial_processing(ledger):
     has_quota, remaining = ledger.check_quota_available("bbc", quota_limit)
     assert has_quota is False
     assert remaining == 0
+
+
+# =============================================================================
+# Atomic Reservation Tests
+# =============================================================================
+
+
+def test_reserve_daily_quota_grants_partial_at_limit(ledger):
+    """Verify reservation grants only what is left under the limit."""
+    assert ledger.reserve_daily_quota("bbc", 300, quota_limit=350) == 300
+    assert ledger.reserve_daily_quota("bbc", 100, quota_limit=350) == 50
+    assert ledger.reserve_daily_quota("bbc", 10, quota_limit=350) == 0
+
+    usage = ledger.get_daily_quota_usage("bbc")
+    assert usage["records_ingested"] == 350
+    assert usage["quota_limit"] == 350
+
+
+def test_reserve_daily_quota_unlimited(ledger):
+    """Verify unlimited quota grants everything and still tracks usage."""
+    assert ledger.reserve_daily_quota("wikipedia", 1000, quota_limit=None) == 1000
+    assert ledger.get_daily_quota_usage("wikipedia")["records_ingested"] == 1000
+
+
+def test_release_daily_quota_returns_unused(ledger):
+    """Verify unused reservations can be handed back, never below zero."""
+    ledger.reserve_daily_quota("bbc", 100, quota_limit=350)
+    ledger.release_daily_quota("bbc", 40)
+    assert ledger.get_daily_quota_usage("bbc")["records_ingested"] == 60
+
+    ledger.release_daily_quota("bbc", 500)
+    assert ledger.get_daily_quota_usage("bbc")["records_ingested"] == 0
+
+
+def test_concurrent_reservations_never_exceed_quota(temp_db):
+    """Verify workers with separate connections cannot jointly over-reserve."""
+    quota_limit = 50
+    granted = []
+    lock = threading.Lock()
+
+    def worker():
+        # Separate ledger instance per worker, like separate pipeline processes
+        worker_ledger = CrawlLedger(backend=SQLiteLedger(temp_db))
+        for _ in range(10):
+            got = worker_ledger.reserve_daily_quota("bbc", 3, quota_limit=quota_limit)
+            with lock:
+                granted.append(got)
+        worker_ledger.close()
+
+    SQLiteLedger(temp_db).close()
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sum(granted) == quota_limit
+    check_ledger = CrawlLedger(backend=SQLiteLedger(temp_db))
+    assert check_ledger.get_daily_quota_usage("bbc")["records_ingested"] == quota_limit
+    check_ledger.close()
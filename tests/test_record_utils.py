@@ -7,10 +7,12 @@ Pure functions are trivial to test without mocks.
 import json
 
 from somdialc.quality.record_utils import (
+    RecordDigests,
     build_silver_record,
     count_tokens,
     generate_record_id,
     generate_text_hash,
+    hash_fingerprint,
 )
 
 
@@ -48,6 +50,40 @@ class TestHashGeneration:
         assert id1 != id2
 
 
+class TestRecordDigests:
+    """Test the once-per-record digest bundle."""
+
+    def test_matches_standalone_functions(self):
+        digests = RecordDigests.of("Muqdisho waa caasimadda")
+
+        assert digests.text_hash == generate_text_hash("Muqdisho waa caasimadda")
+        assert digests.record_id("title", "url") == generate_record_id(
+            "title", "url", digests.text_hash
+        )
+
+    def test_fingerprint_is_hex_prefix(self):
+        digests = RecordDigests.of("hello")
+
+        assert digests.fingerprint == int(digests.text_hash[:16], 16)
+        assert hash_fingerprint(digests.text_hash) == digests.fingerprint
+        assert hash_fingerprint(digests.fingerprint) == digests.fingerprint
+        assert 0 <= hash_fingerprint("not-a-hex-digest") < 2**64
+
+    def test_build_silver_record_reuses_digests(self):
+        digests = RecordDigests.of("Hello world")
+        record = build_silver_record(
+            text="Hello world",
+            title="Test",
+            source="Test-Source",
+            url="https://example.com",
+            date_accessed="2025-01-01",
+            digests=digests,
+        )
+
+        assert record["text_hash"] == digests.text_hash
+        assert record["id"] == generate_record_id("Test", "https://example.com", digests.text_hash)
+
+
 class TestTokenCounting:
     """Test token counting."""
 
@@ -0,0 +1,175 @@
+"""
+Tests for incremental silver compaction.
+
+Covers merging and sorting small fragments, sidecar checksum updates,
+incremental skips via the compaction log, roll-forward of an interrupted
+swap, dry runs, and the somali-tools command.
+"""
+
+import json
+from unittest.mock import patch
+
+import pyarrow.parquet as pq
+import pytest
+from click.testing import CliRunner
+
+from somdialc.quality.record_utils import build_silver_record
+from somdialc.quality.silver_compaction import COMPACTION_LOG, SilverCompactor
+from somdialc.quality.silver_writer import SilverDatasetWriter
+
+SOURCE = "BBC-Somali"
+DATE = "2025-01-01"
+
+
+def _write_runs(base_dir, runs: int = 4, per_run: int = 5) -> SilverDatasetWriter:
+    """Write ``runs`` one-fragment runs of ``per_run`` records each."""
+    writer = SilverDatasetWriter(base_dir=base_dir)
+    for run in range(runs):
+        run_id = f"20250101_00000{run}_bbc-somali_abc{run}"
+        records = []
+        for i in range(per_run):
+            record = build_silver_record(
+                text=f"Qoraal {run}-{i} oo ku saabsan wararka maanta",
+                title=f"Maqaal {run}-{i}",
+                source=SOURCE,
+                url=f"https://bbc.com/somali/{run}/{i}",
+                date_accessed=DATE,
+                source_type="news",
+                license_str="BBC Terms of Use",
+                domain="news",
+                register="formal",
+            )
+            record["run_id"] = run_id
+            record["schema_version"] = "1.0"
+            records.append(record)
+        writer.write(records=records, source=SOURCE, date_accessed=DATE, run_id=run_id)
+    return writer
+
+
+@pytest.fixture
+def compactor(tmp_path):
+    _write_runs(tmp_path)
+    return SilverCompactor(tmp_path, settle_seconds=0)
+
+
+def _partition(base_dir):
+    return base_dir / f"source={SOURCE}" / f"date_accessed={DATE}"
+
+
+def _sidecars(base_dir) -> dict[str, dict]:
+    metadata_dir = base_dir / "_metadata" / f"source={SOURCE}" / f"date_accessed={DATE}"
+    return {
+        path.name: json.loads(path.read_text()) for path in metadata_dir.glob("*_metadata.json")
+    }
+
+
+def test_compaction_merges_fragments_sorted_by_text_hash(compactor, tmp_path):
+    before = compactor.writer.read(SOURCE, DATE)
+
+    report = compactor.compact()
+
+    assert (report.files_merged, report.files_written) == (4, 1)
+    files = list(_partition(tmp_path).glob("*.parquet"))
+    assert len(files) == 1 and "_compaction_" in files[0].name
+    table = compactor.writer.read(SOURCE, DATE)
+    assert sorted(table.column("id").to_pylist()) == sorted(before.column("id").to_pylist())
+    hashes = table.column("text_hash").to_pylist()
+    assert hashes == sorted(hashes)
+    assert table.schema == SilverDatasetWriter.SCHEMA
+
+
+def test_sidecars_follow_the_compacted_files(compactor, tmp_path):
+    report = compactor.compact()
+    output = _partition(tmp_path) / report.compacted[0].outputs[0]
+
+    sidecars = _sidecars(tmp_path)
+    compacted = next(meta for name, meta in sidecars.items() if "_compaction_" in name)
+    assert compacted["total_records"] == 20
+    assert compacted["checksums"]["part-0000"]["sha256"] == compactor.writer.compute_checksum(
+        output
+    )
+    assert compacted["sort_key"] == "text_hash"
+    assert len(compacted["compacted_from"]) == 4
+    for name, meta in sidecars.items():
+        if "_compaction_" not in name:
+            assert meta["checksums"] == {} and meta["total_records"] == 0
+            assert meta["compacted_into"] == {"part-0000": output.name}
+
+
+def test_sidecars_map_each_part_to_its_own_bin(tmp_path):
+    _write_runs(tmp_path)
+    fragments = sorted(path.name for path in _partition(tmp_path).glob("*.parquet"))
+    compactor = SilverCompactor(tmp_path, target_file_bytes=14_000, settle_seconds=0)
+
+    report = compactor.compact()
+
+    outputs = report.compacted[0].outputs
+    assert len(outputs) == 2
+    compacted_into = {}
+    for name, meta in _sidecars(tmp_path).items():
+        if "_compaction_" not in name:
+            compacted_into[name.split("_bbc-somali")[0]] = meta["compacted_into"]["part-0000"]
+    assert [compacted_into[fragment.split("_bbc-somali")[0]] for fragment in fragments] == [
+        outputs[0],
+        outputs[0],
+        outputs[1],
+        outputs[1],
+    ]
+
+
+def test_unchanged_partitions_are_skipped(compactor, tmp_path):
+    compactor.compact()
+
+    assert compactor.compact().partitions_unchanged == 1
+
+    _write_runs(tmp_path / "new", runs=1)
+    new_fragment = next(_partition(tmp_path / "new").glob("*.parquet"))
+    new_fragment.rename(_partition(tmp_path) / new_fragment.name)
+    report = compactor.compact()
+    assert (report.partitions_unchanged, report.files_merged) == (0, 2)
+
+
+def test_large_files_and_settling_partitions_are_left_alone(tmp_path):
+    _write_runs(tmp_path)
+    names = sorted(path.name for path in _partition(tmp_path).glob("*.parquet"))
+
+    assert SilverCompactor(tmp_path, small_file_bytes=1, settle_seconds=0).compact().compacted == []
+    assert SilverCompactor(tmp_path).compact(force=True).partitions_settling == 1
+    assert sorted(path.name for path in _partition(tmp_path).glob("*.parquet")) == names
+
+
+def test_interrupted_swap_is_rolled_forward(compactor, tmp_path):
+    with patch.object(compactor, "_roll_forward", side_effect=KeyboardInterrupt):
+        with pytest.raises(KeyboardInterrupt):
+            compactor.compact()
+    assert len(list(_partition(tmp_path).glob("*.parquet.tmp"))) == 1
+    assert len(list(_partition(tmp_path).glob("*.parquet"))) == 4
+
+    report = SilverCompactor(tmp_path, settle_seconds=0).compact()
+
+    assert report.partitions_unchanged == 1
+    assert len(list(_partition(tmp_path).glob("*.parquet"))) == 1
+    assert compactor.writer.read(SOURCE, DATE).num_rows == 20
+    log = (tmp_path / "_metadata" / COMPACTION_LOG).read_text().splitlines()
+    assert [json.loads(line)["status"] for line in log] == ["pending", "done"]
+
+
+def test_dry_run_writes_nothing(compactor, tmp_path):
+    report = compactor.compact(dry_run=True)
+
+    assert (report.files_merged, report.files_written) == (4, 1)
+    assert len(list(_partition(tmp_path).glob("*.parquet"))) == 4
+    assert not (tmp_path / "_metadata" / COMPACTION_LOG).exists()
+
+
+def test_cli_silver_compact(tmp_path):
+    from somdialc.tools.cli import cli
+
+    _write_runs(tmp_path)
+    result = CliRunner().invoke(
+        cli, ["silver", "compact", "-p", str(tmp_path), "--settle-minutes", "0"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "4 fragments -> 1 files" in result.output
+    assert pq.ParquetFile(next(_partition(tmp_path).glob("*.parquet"))).metadata.num_rows == 20
@@ -0,0 +1,155 @@
+"""
+Tests for the out-of-core near-duplicate pass over the silver lake.
+
+Covers cross-source near-duplicates and exact copies, canonical choice
+(earliest date_accessed), per-phase resume, guards against resuming with
+changed settings or silver files, and the somali-tools command.
+"""
+
+import random
+from pathlib import Path
+from unittest.mock import patch
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from click.testing import CliRunner
+
+from somdialc.ingestion.dedup import DATASKETCH_AVAILABLE
+from somdialc.quality.silver_writer import SilverDatasetWriter
+
+pytestmark = pytest.mark.skipif(not DATASKETCH_AVAILABLE, reason="datasketch not installed")
+
+WORDS = (
+    "dowladda federaalka soomaaliya ayaa maanta ku dhawaaqday qorshe cusub oo lagu "
+    "horumarinayo waxbarashada iyo caafimaadka gobollada dalka wasiirka arrimaha"
+).split()
+
+
+def _article(seed: int) -> str:
+    """80 random words; different seeds share few word 3-grams."""
+    rng = random.Random(seed)
+    return " ".join(rng.choice(WORDS) for _ in range(80))
+
+
+def _write_fragment(silver_dir: Path, source: str, date: str, texts: list[str]) -> None:
+    partition = silver_dir / f"source={source}" / f"date_accessed={date}"
+    partition.mkdir(parents=True, exist_ok=True)
+    records = [
+        {"id": f"{source}-{date}-{i}", "text": text, "source": source, "date_accessed": date}
+        for i, text in enumerate(texts)
+    ]
+    index = len(list(partition.glob("*.parquet")))
+    pq.write_table(
+        pa.Table.from_pylist(records, schema=SilverDatasetWriter.SCHEMA),
+        partition / f"{source.lower()}_run_silver_part-{index:04d}.parquet",
+    )
+
+
+@pytest.fixture
+def silver_dir(tmp_path):
+    """BBC (older) and MC4 (newer) partitions sharing one near-dup and one exact copy."""
+    silver = tmp_path / "silver"
+    _write_fragment(silver, "BBC-Somali", "2025-01-01", [_article(1), _article(2), _article(3)])
+    _write_fragment(
+        silver,
+        "HuggingFace-Somali_c4-so",
+        "2025-02-01",
+        [_article(1) + " shalay", _article(4), _article(2), "laba eray"],
+    )
+    return silver
+
+
+def _decisions(result) -> dict[str, tuple[str, str]]:
+    rows = pq.read_table(result.output_path).to_pylist()
+    return {row["id"]: (row["action"], row["canonical_id"]) for row in rows}
+
+
+def test_cross_source_near_duplicates_point_to_earliest_copy(silver_dir, tmp_path):
+    from somdialc.quality.silver_dedup import SilverNearDeduplicator
+
+    result = SilverNearDeduplicator(
+        silver_dir, tmp_path / "work", num_partitions=4, workers=1
+    ).run()
+
+    assert result.documents == 7
+    assert (result.components, result.duplicates) == (2, 2)
+    assert _decisions(result) == {
+        "BBC-Somali-2025-01-01-0": ("keep", "BBC-Somali-2025-01-01-0"),
+        "BBC-Somali-2025-01-01-1": ("keep", "BBC-Somali-2025-01-01-1"),
+        "HuggingFace-Somali_c4-so-2025-02-01-0": ("drop", "BBC-Somali-2025-01-01-0"),
+        "HuggingFace-Somali_c4-so-2025-02-01-2": ("drop", "BBC-Somali-2025-01-01-1"),
+    }
+
+
+def test_process_pool_matches_inline_run(silver_dir, tmp_path):
+    from somdialc.quality.silver_dedup import SilverNearDeduplicator
+
+    inline = SilverNearDeduplicator(silver_dir, tmp_path / "a", num_partitions=4, workers=1)
+    pooled = SilverNearDeduplicator(silver_dir, tmp_path / "b", num_partitions=4, workers=2)
+
+    assert _decisions(pooled.run()) == _decisions(inline.run())
+
+
+def test_resume_skips_completed_phases(silver_dir, tmp_path):
+    from somdialc.quality import silver_dedup
+
+    dedup = silver_dedup.SilverNearDeduplicator(
+        silver_dir, tmp_path / "work", num_partitions=4, workers=1
+    )
+    with patch.object(dedup, "_run_components", side_effect=KeyboardInterrupt):
+        with pytest.raises(KeyboardInterrupt):
+            dedup.run()
+    assert dedup.state["completed"] == ["plan", "signatures", "buckets", "pairs"]
+
+    resumed = silver_dedup.SilverNearDeduplicator(
+        silver_dir, tmp_path / "work", num_partitions=4, workers=1
+    )
+    with patch.object(silver_dedup, "_sign_fragment", side_effect=AssertionError("re-signed")):
+        result = resumed.run()
+
+    assert result.duplicates == 2
+    assert resumed.state["completed"] == list(silver_dedup.PHASES)
+
+
+def test_resume_refuses_changed_settings_or_silver(silver_dir, tmp_path):
+    from somdialc.quality.silver_dedup import SilverNearDeduplicator
+
+    work_dir = tmp_path / "work"
+    SilverNearDeduplicator(silver_dir, work_dir, num_partitions=4, workers=1).run()
+
+    with pytest.raises(ValueError, match="different settings"):
+        SilverNearDeduplicator(silver_dir, work_dir, threshold=0.9, num_partitions=4).run()
+
+    _write_fragment(silver_dir, "BBC-Somali", "2025-03-01", [_article(1)])
+    with pytest.raises(ValueError, match="changed"):
+        SilverNearDeduplicator(silver_dir, work_dir, num_partitions=4, workers=1).run()
+
+    result = SilverNearDeduplicator(silver_dir, work_dir, num_partitions=4, workers=1).run(
+        restart=True
+    )
+    assert (result.documents, result.duplicates) == (8, 3)
+
+
+def test_band_layout_matches_datasketch():
+    from datasketch import MinHashLSH
+
+    from somdialc.quality.silver_dedup import band_layout
+
+    for threshold in (0.7, 0.85, 0.9):
+        lsh = MinHashLSH(threshold=threshold, num_perm=128)
+        assert band_layout(threshold, 128) == (lsh.b, lsh.r)
+
+
+def test_cli_silver_dedup_near(silver_dir, tmp_path):
+    from somdialc.tools.cli import cli
+
+    runner = CliRunner()
+    args = ["silver", "dedup", "-p", str(silver_dir), "-w", str(tmp_path / "work")]
+
+    result = runner.invoke(cli, [*args, "--near", "--workers", "1", "--partitions", "4"])
+    assert result.exit_code == 0, result.output
+    assert "Near-duplicates: 2" in result.output
+    assert (tmp_path / "work" / "near_duplicates.parquet").exists()
+
+    assert runner.invoke(cli, args).exit_code == 2  # --near is required
@@ -5,7 +5,9 @@ Tests schema enforcement, sidecar placement, and round-trip consistency.
 """
 
 import json
+from unittest.mock import patch
 
+import pyarrow as pa
 import pyarrow.parquet as pq
 import pytest
 
@@ -277,3 +279,80 @@ class TestSilverDatasetWriter:
             )
 
         assert record["schema_version"] == "2.0"
+
+
+class TestSilverDatasetScan:
+    """Test column projection and filter pushdown across partitions."""
+
+    @pytest.fixture
+    def writer(self, tmp_path):
+        writer = SilverDatasetWriter(base_dir=tmp_path)
+        partitions = [
+            ("Source-1", "2025-01-01", "news", "formal", "scan_run_001"),
+            ("Source-1", "2025-02-01", "literature", "informal", "scan_run_002"),
+            ("Source-2", "2025-01-15", "news", "colloquial", "scan_run_003"),
+        ]
+        for source, date_accessed, domain, register, run_id in partitions:
+            records = [
+                _build_test_record(
+                    source=source,
+                    url=f"https://example.com/{run_id}/{i}",
+                    date_accessed=date_accessed,
+                    run_id=run_id,
+                    text=" ".join(["eray"] * (i + 1)),
+                    domain=domain,
+                    register=register,
+                )
+                for i in range(3)
+            ]
+            writer.write(records, source, date_accessed, run_id)
+        return writer
+
+    def test_scan_returns_lazy_reader_with_projected_columns(self, writer):
+        reader = writer.scan(columns=["id", "domain"])
+
+        assert isinstance(reader, pa.RecordBatchReader)
+        table = reader.read_all()
+        assert table.column_names == ["id", "domain"]
+        assert table.num_rows == 9
+
+    def test_scan_filters(self, writer):
+        def ids(**filters):
+            return writer.scan(columns=["run_id"], **filters).read_all().column(0).to_pylist()
+
+        assert set(ids(sources=["Source-2"])) == {"scan_run_003"}
+        assert set(ids(date_from="2025-01-10", date_to="2025-01-31")) == {"scan_run_003"}
+        assert set(ids(domains=["literature"])) == {"scan_run_002"}
+        assert set(ids(registers=["formal", "colloquial"])) == {"scan_run_001", "scan_run_003"}
+        assert len(ids(run_ids=["scan_run_001"], min_tokens=2, max_tokens=2)) == 1
+        assert ids(sources=["Missing-Source"]) == []
+
+    def test_count_by_aggregates_one_column(self, writer):
+        assert writer.count_by("register", sources=["Source-1"]) == {"formal": 3, "informal": 3}
+
+    def test_domain_statistics_read_only_the_domain_column(self, writer):
+        with (
+            patch.object(writer, "scan", wraps=writer.scan) as scan,
+            patch.object(writer, "_select_partitions", wraps=writer._select_partitions) as select,
+        ):
+            stats = writer.get_domain_statistics()
+
+        assert stats == {"news": 6, "literature": 3}
+        # One partition listing and one scan over the whole lake
+        assert select.call_count == 1
+        (call,) = scan.call_args_list
+        assert call.kwargs["columns"] == ["domain"]
+        assert len(call.kwargs["partitions"]) == 3
+        assert writer.get_domain_statistics(source="Source-2") == {"news": 3}
+
+    def test_domain_statistics_skip_unreadable_partitions(self, writer, tmp_path):
+        broken = tmp_path / "source=Source-2" / "date_accessed=2025-01-15"
+        (broken / "broken_silver_part-0000.parquet").write_bytes(b"not parquet")
+
+        assert writer.get_domain_statistics() == {"news": 3, "literature": 3}
+
+    def test_read_with_columns(self, writer):
+        table = writer.read("Source-1", "2025-01-01", columns=["id", "tokens"])
+
+        assert table.column_names == ["id", "tokens"]
+        assert table.num_rows == 3
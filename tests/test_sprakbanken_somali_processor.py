@@ -9,6 +9,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 
+from somdialc.infra.config import get_config
 from somdialc.ingestion.base_pipeline import RawRecord
 from somdialc.ingestion.processors.sprakbanken_somali_processor import (
     CORPUS_INFO,
@@ -31,6 +32,7 @@ class TestSprakbankenSomaliProcessor:
             config.data.staging_dir = tmp_path / "staging"
             config.data.processed_dir = tmp_path / "processed"
             config.data.silver_dir = tmp_path / "silver"
+            config.tracking = get_config().tracking  # Read by MLFlowTracker.from_config
             mock_config.return_value = config
 
             processor = SprakbankenSomaliProcessor(corpus_id="somali-cilmi", force=True)
@@ -52,6 +54,7 @@ class TestSprakbankenSomaliProcessor:
             config.data.staging_dir = tmp_path / "staging"
             config.data.processed_dir = tmp_path / "processed"
             config.data.silver_dir = tmp_path / "silver"
+            config.tracking = get_config().tracking  # Read by MLFlowTracker.from_config
             mock_config.return_value = config
 
             processor = SprakbankenSomaliProcessor(corpus_id="all")
@@ -70,6 +73,7 @@ class TestSprakbankenSomaliProcessor:
             config.data.staging_dir = tmp_path / "staging"
             config.data.processed_dir = tmp_path / "processed"
             config.data.silver_dir = tmp_path / "silver"
+            config.tracking = get_config().tracking  # Read by MLFlowTracker.from_config
             mock_config.return_value = config
 
             with pytest.raises(ValueError, match="Unknown corpus_id"):
@@ -125,7 +129,7 @@ class TestSprakbankenSomaliProcessor:
         mock_session = Mock()
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.headers = {"Content-Length": "1000"}
+        mock_response.headers = {"Content-Length": "9"}  # len(b"test_data")
         mock_response.iter_content = Mock(return_value=[b"test_data"])
         mock_session.get.return_value = mock_response
 
@@ -9,8 +9,12 @@ Tests the full pipeline with offline fixture data to ensure:
 """
 
 import bz2
+import re
 import shutil
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
+from unittest.mock import patch
 
 import pyarrow.parquet as pq
 import pytest
@@ -261,3 +265,84 @@ class TestWikipediaIntegration:
         # Results should be identical
         assert len(df1) == len(df2)
         assert set(df1["id"]) == set(df2["id"])
+
+
+DUMP_PAYLOAD = bytes(range(256)) * 16384  # 4 MiB, several 1 MiB download chunks
+
+
+class _DumpHandler(BaseHTTPRequestHandler):
+    """Serves DUMP_PAYLOAD with Range support; the first response is cut off halfway."""
+
+    protocol_version = "HTTP/1.1"
+    ranges: list = []
+    truncate_first = True
+
+    def do_GET(self):
+        cls = type(self)
+        cls.ranges.append(self.headers.get("Range"))
+        start = 0
+        match = re.match(r"bytes=(\d+)-", self.headers.get("Range") or "")
+        if match and self.headers.get("If-Range") == '"dump-v1"':
+            start = int(match.group(1))
+        body = DUMP_PAYLOAD[start:]
+
+        self.send_response(206 if start else 200)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("ETag", '"dump-v1"')
+        if start:
+            self.send_header(
+                "Content-Range", f"bytes {start}-{len(DUMP_PAYLOAD) - 1}/{len(DUMP_PAYLOAD)}"
+            )
+        self.end_headers()
+        if cls.truncate_first:
+            cls.truncate_first = False
+            self.wfile.write(body[: len(body) // 2])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def dump_server():
+    _DumpHandler.ranges = []
+    _DumpHandler.truncate_first = True
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _DumpHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}/sowiki-latest-pages-articles.xml.bz2"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+class TestWikipediaDumpResume:
+    """An interrupted dump download resumes in a later run with a new run_id."""
+
+    def test_new_run_resumes_previous_part_file(self, dump_server, temp_data_dir, monkeypatch):
+        monkeypatch.chdir(temp_data_dir.parent)
+
+        first = WikipediaSomaliProcessor(run_seed="first-run")
+        first.dump_url = dump_server
+        # Connection drops halfway; the process is killed while backing off to retry
+        with patch("somdialc.infra.download.time.sleep", side_effect=KeyboardInterrupt):
+            with pytest.raises(KeyboardInterrupt):
+                first.download()
+        assert not first.dump_file.exists()
+
+        second = WikipediaSomaliProcessor(run_seed="second-run")
+        second.raw_dir = first.raw_dir.parent / "date_accessed=2099-01-01"  # A later day
+        second.dump_file = second.raw_dir / f"wikipedia-somali_{second.run_id}_raw_dump.xml.bz2"
+        second.dump_url = dump_server
+        assert second.run_id != first.run_id
+
+        dump_path = second.download()
+
+        assert dump_path == second.dump_file
+        assert dump_path.read_bytes() == DUMP_PAYLOAD
+        assert _DumpHandler.ranges[0] is None
+        assert _DumpHandler.ranges[1] == f"bytes={len(DUMP_PAYLOAD) // 2}-{len(DUMP_PAYLOAD) - 1}"
+        assert not list(temp_data_dir.rglob("*.part*"))
@@ -0,0 +1,161 @@
+"""
+Tests for lease-based URL claiming on the crawl ledger.
+
+Covers claim/heartbeat/release/expiry on the SQLite backend, concurrent
+workers draining one frontier, and the claimed_batches helper used by the
+BBC worker mode.
+"""
+
+import os
+import tempfile
+import threading
+import time
+from contextlib import closing
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from somdialc.ingestion.crawl_ledger import CrawlLedger, SQLiteLedger
+from somdialc.ingestion.processors.bbc.extraction import _claimed_link_batches, _LinkPlan
+from somdialc.ingestion.work_queue import LeaseHeartbeat, claimed_batches, default_worker_id
+
+SOURCE = "bbc-somali"
+
+
+@pytest.fixture
+def temp_db():
+    """Create temporary database for testing."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir) / "test_ledger.db"
+
+
+@pytest.fixture
+def ledger(temp_db):
+    """Ledger with 10 discovered URLs."""
+    ledger = CrawlLedger(backend=SQLiteLedger(temp_db))
+    for i in range(10):
+        ledger.discover_url(f"https://www.bbc.com/somali/articles/{i}", SOURCE)
+    yield ledger
+    ledger.close()
+
+
+def test_claims_are_exclusive_until_released(ledger):
+    first = ledger.claim_urls(SOURCE, 4, "worker-a")
+    second = ledger.claim_urls(SOURCE, 10, "worker-b")
+
+    assert len(first) == 4 and len(second) == 6
+    assert not set(first) & set(second)
+    assert ledger.claim_urls(SOURCE, 10, "worker-c") == []
+
+    assert ledger.release_urls("worker-a", first[:2]) == 2
+    assert sorted(ledger.claim_urls(SOURCE, 10, "worker-c")) == sorted(first[:2])
+
+
+def test_claim_skips_urls_no_longer_discovered(ledger):
+    urls = ledger.claim_urls(SOURCE, 3, "worker-a")
+    ledger.mark_fetched(urls[0], http_status=200, source=SOURCE)
+    ledger.release_urls("worker-a")
+
+    reclaimed = ledger.claim_urls(SOURCE, 10, "worker-b")
+
+    assert urls[0] not in reclaimed
+    assert len(reclaimed) == 9
+
+
+def test_expired_leases_are_reclaimable(ledger):
+    urls = ledger.claim_urls(SOURCE, 10, "crashed", lease_seconds=0.05)
+    time.sleep(0.1)
+
+    assert ledger.expire_leases(SOURCE) == 10
+    assert sorted(ledger.claim_urls(SOURCE, 10, "worker-b")) == sorted(urls)
+
+
+def test_heartbeat_keeps_leases_alive(ledger):
+    urls = ledger.claim_urls(SOURCE, 5, "worker-a", lease_seconds=0.1)
+
+    assert ledger.heartbeat_urls("worker-a", lease_seconds=60) == 5
+    time.sleep(0.15)
+
+    assert ledger.expire_leases() == 0
+    assert not set(ledger.claim_urls(SOURCE, 10, "worker-b")) & set(urls)
+
+
+def test_concurrent_workers_split_frontier(temp_db):
+    """Workers with separate connections never claim the same URL."""
+    setup = CrawlLedger(backend=SQLiteLedger(temp_db))
+    for i in range(200):
+        setup.discover_url(f"https://www.bbc.com/somali/articles/{i}", SOURCE)
+    setup.close()
+
+    claimed: dict[str, list[str]] = {}
+    lock = threading.Lock()
+
+    def worker(worker_id):
+        worker_ledger = CrawlLedger(backend=SQLiteLedger(temp_db))
+        mine = []
+        for batch in claimed_batches(worker_ledger, SOURCE, worker_id, batch_size=7):
+            for url in batch:
+                worker_ledger.mark_fetched(url, http_status=200, source=SOURCE)
+            mine.extend(batch)
+        worker_ledger.close()
+        with lock:
+            claimed[worker_id] = mine
+
+    threads = [threading.Thread(target=worker, args=(f"w{i}",)) for i in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    everything = [url for urls in claimed.values() for url in urls]
+    assert len(everything) == 200
+    assert len(set(everything)) == 200
+
+
+def test_claimed_batches_respects_limit_and_releases(ledger):
+    batches = claimed_batches(ledger, SOURCE, "worker-a", batch_size=3, limit=5)
+    with closing(batches):
+        first = next(batches)
+        ledger.mark_fetched(first[0], http_status=200, source=SOURCE)
+        second = next(batches)
+        assert [len(first), len(second)] == [3, 2]
+        assert next(batches, None) is None
+
+    # Everything is released; only the fetched URL has left the frontier
+    assert len(ledger.claim_urls(SOURCE, 10, "worker-b")) == 9
+
+
+def test_lease_heartbeat_thread_beats():
+    ledger = MagicMock()
+
+    with LeaseHeartbeat(ledger, "worker-a", lease_seconds=0.03) as heartbeat:
+        time.sleep(0.1)
+
+    assert heartbeat.beats >= 2
+    ledger.heartbeat_urls.assert_called_with("worker-a", 0.03)
+
+
+def test_default_worker_id_is_unique_per_process():
+    assert default_worker_id().endswith(f"-{os.getpid()}")
+
+
+def test_bbc_claimed_batches_reserve_quota(ledger):
+    processor = SimpleNamespace(
+        ledger=ledger,
+        source=SOURCE,
+        worker_id="worker-a",
+        max_articles=None,
+        metrics=MagicMock(),
+        logger=MagicMock(),
+    )
+    plan = _LinkPlan(iter([]), quota_limit=5)
+
+    batches = list(_claimed_link_batches(processor, plan, batch_size=4, lease_seconds=60))
+
+    assert [len(batch) for batch in batches] == [4, 1]
+    assert plan.reserved == 5
+    processor.metrics.increment.assert_called_once_with("quota_hit")
+    # Links past the quota were released for other workers or the next day
+    assert len(ledger.claim_urls(SOURCE, 10, "worker-b")) == 10
@@ -0,0 +1,124 @@
+"""Tests for ApifyTikTokClient dataset pagination against a local Apify stub."""
+
+import gzip
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from somdialc.ingestion.apify_tiktok_client import ApifyTikTokClient
+
+
+class _ApifyStub(BaseHTTPRequestHandler):
+    """Minimal Apify dataset API: GET /v2/datasets/{id} and /v2/datasets/{id}/items."""
+
+    items: list = []
+    reported_count = None
+    delay = 0.05
+    lock = threading.Lock()
+    in_flight = 0
+    peak_in_flight = 0
+    requests_seen: list = []
+
+    def do_GET(self):
+        cls = type(self)
+        parts = urlsplit(self.path)
+        query = {k: v[0] for k, v in parse_qs(parts.query).items()}
+
+        if re.fullmatch(r"/v2/datasets/[^/]+", parts.path):
+            count = cls.reported_count if cls.reported_count is not None else len(cls.items)
+            return self._send({"data": {"id": "ds", "itemCount": count}})
+
+        with cls.lock:
+            cls.in_flight += 1
+            cls.peak_in_flight = max(cls.peak_in_flight, cls.in_flight)
+            cls.requests_seen.append(
+                {**query, "accept_encoding": self.headers.get("Accept-Encoding", "")}
+            )
+        try:
+            time.sleep(cls.delay)
+            offset, limit = int(query["offset"]), int(query["limit"])
+            page = cls.items[offset : offset + limit]
+            if query.get("clean") == "true":
+                page = [{k: v for k, v in item.items() if not k.startswith("#")} for item in page]
+            self._send(page, gzip_ok="gzip" in self.headers.get("Accept-Encoding", ""))
+        finally:
+            with cls.lock:
+                cls.in_flight -= 1
+
+    def _send(self, payload, gzip_ok=False):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        if gzip_ok:
+            body = gzip.compress(body)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def client():
+    _ApifyStub.items = [{"cid": str(i), "text": f"faallo {i}", "#debug": "x"} for i in range(45)]
+    _ApifyStub.reported_count = None
+    _ApifyStub.in_flight = 0
+    _ApifyStub.peak_in_flight = 0
+    _ApifyStub.requests_seen = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _ApifyStub)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+
+    apify = ApifyTikTokClient(api_token="test-token", timeout=10)
+    apify.BASE_URL = f"http://127.0.0.1:{httpd.server_address[1]}/v2"
+    yield apify
+
+    httpd.shutdown()
+    httpd.server_close()
+
+
+class TestIterDatasetItems:
+    """Test cases for ApifyTikTokClient.iter_dataset_items."""
+
+    def test_sequential_pagination(self, client):
+        items = list(client.iter_dataset_items("ds", batch_size=10))
+
+        assert [item["cid"] for item in items] == [str(i) for i in range(45)]
+        assert _ApifyStub.peak_in_flight == 1
+
+    def test_concurrent_pages_are_yielded_in_order(self, client):
+        items = list(client.iter_dataset_items("ds", batch_size=10, max_concurrency=3))
+
+        assert [item["cid"] for item in items] == [str(i) for i in range(45)]
+        assert 1 < _ApifyStub.peak_in_flight <= 3
+        # 5 pages cover 45 items; the short last page ends iteration
+        assert len(_ApifyStub.requests_seen) == 5
+
+    def test_clean_and_gzip_options(self, client):
+        items = list(client.iter_dataset_items("ds", batch_size=20, max_concurrency=2, clean=True))
+
+        assert all("#debug" not in item for item in items)
+        assert all(req["clean"] == "true" for req in _ApifyStub.requests_seen)
+        assert all("gzip" in req["accept_encoding"] for req in _ApifyStub.requests_seen)
+
+    def test_understated_item_count_is_completed_sequentially(self, client):
+        _ApifyStub.reported_count = 20
+
+        items = list(client.iter_dataset_items("ds", batch_size=10, max_concurrency=4))
+
+        assert [item["cid"] for item in items] == [str(i) for i in range(45)]
+
+    def test_small_dataset_skips_concurrency(self, client):
+        _ApifyStub.items = _ApifyStub.items[:5]
+
+        items = list(client.iter_dataset_items("ds", batch_size=10, max_concurrency=4))
+
+        assert len(items) == 5
+        assert len(_ApifyStub.requests_seen) == 1
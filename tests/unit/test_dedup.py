@@ -252,6 +252,21 @@ class TestDedupEngineWithLRU:
         assert checksum is not None
         mock_ledger.check_file_checksum.assert_called_once_with(checksum, "test-source")
 
+    def test_exact_state_keyed_by_fingerprint(self):
+        """Hex hashes and RecordDigests fingerprints address the same 8-byte int entries."""
+        from somdialc.ingestion.dedup import DedupConfig, DedupEngine
+        from somdialc.quality.record_utils import RecordDigests
+
+        engine = DedupEngine(config=DedupConfig(enable_minhash=False, hash_fields=["text"]))
+        _, _, _, text_hash, _ = engine.process_document("Qoraal tijaabo ah", "https://a")
+        digests = RecordDigests.of("Qoraal tijaabo ah")
+
+        assert text_hash == digests.text_hash
+        assert engine.is_duplicate_hash(digests.fingerprint)
+        assert engine.get_canonical_url(text_hash) == "https://a"
+        assert all(isinstance(key, int) for key in engine.seen_hashes._store)
+        assert all(isinstance(key, int) for key in engine.hash_to_url)
+
     def test_dedup_engine_uses_lru_cache(self):
         """Verify DedupEngine initializes with LRUHashSet."""
         from somdialc.ingestion.dedup import DedupConfig, DedupEngine, LRUHashSet
@@ -653,4 +668,137 @@ class TestBasePipelineDedupGuard:
         assert n_filtered == 0, f"Expected 0 filtered records, got {n_filtered}"
 
 
+NEAR_DUP_WORDS = (
+    "dowladda federaalka soomaaliya ayaa maanta ku dhawaaqday qorshe cusub oo lagu "
+    "horumarinayo waxbarashada iyo caafimaadka gobollada dalka wasiirka arrimaha"
+).split()
+
+
+def _near_dup_article(seed: int) -> str:
+    """60 random words; different seeds share few word 3-grams."""
+    import random
+
+    rng = random.Random(seed)
+    return " ".join(rng.choice(NEAR_DUP_WORDS) for _ in range(60))
+
+
+class TestMinHashBatch:
+    """MinHashDeduplicator batch API used by the processing-stage near-dup check."""
+
+    def test_bulk_signatures_match_per_document(self):
+        pytest.importorskip("datasketch")
+        from somdialc.ingestion.dedup.lsh import MinHashDeduplicator
+
+        dedup = MinHashDeduplicator(enable_sharding=False)
+        texts = [_near_dup_article(i) for i in range(3)]
+
+        bulk = dedup.compute_minhashes(texts)
+
+        assert [list(m.hashvalues) for m in bulk] == [
+            list(dedup.compute_minhash(text).hashvalues) for text in texts
+        ]
+
+    def test_check_and_add_batch_catches_in_batch_and_indexed_duplicates(self):
+        pytest.importorskip("datasketch")
+        from somdialc.ingestion.dedup.lsh import MinHashDeduplicator
+
+        dedup = MinHashDeduplicator(num_shards=2)
+        first = _near_dup_article(1)
+        dedup.check_and_add_batch(["https://example.com/0"], [_near_dup_article(0)])
+
+        results = dedup.check_and_add_batch(
+            ["https://example.com/1", "https://example.com/2", "https://example.com/3", "x"],
+            [first, first + " shalay", _near_dup_article(0) + " shalay", "laba eray"],
+        )
+
+        assert results[0] is None
+        assert results[1][0] == "https://example.com/1" and results[1][1] >= 0.85
+        assert results[2][0] == "https://example.com/0"
+        assert results[3] is None  # Too short to shingle: never checked or indexed
+        assert len(dedup.document_hashes) == 2
+
+
+class TestNearDupSettings:
+    def test_per_source_switch_with_default(self):
+        from somdialc.infra.config import DedupSettings
+
+        settings = DedupSettings(processing_near_dup={"bbc": True, "wikipedia": False})
+
+        assert settings.near_dup_enabled("bbc-somali") is True
+        assert settings.near_dup_enabled("Wikipedia-Somali") is False
+        assert settings.near_dup_enabled("huggingface-somali_c4-so") is False
+        assert DedupSettings(processing_near_dup_default=True).near_dup_enabled("tiktok-somali")
+
+
+class TestBasePipelineNearDedup:
+    """_process_record_stream drops near-duplicates of cleaned text in batches."""
+
+    def test_near_duplicates_dropped_in_order(self, tmp_path):
+        pytest.importorskip("datasketch")
+        from unittest.mock import patch
+
+        from somdialc.infra.metrics import MetricsCollector
+        from somdialc.infra.profiling import StageTimer
+        from somdialc.ingestion.base_pipeline import RawRecord
+        from somdialc.ingestion.dedup.lsh import MinHashDeduplicator
+
+        builder = TestBasePipelineDedupGuard()
+        minimal_processor_cls, dedup, staging = builder._build_processor(tmp_path)
+        staging.touch()
+        texts = [
+            _near_dup_article(0),
+            _near_dup_article(1),
+            _near_dup_article(0) + " shalay",  # Near-dup of record 0
+            _near_dup_article(2),
+            _near_dup_article(2) + " berri",  # Near-dup of record 3, same batch
+        ]
+        records = [
+            RawRecord(title=f"Maqaal {i}", text=text, url=f"https://example.com/{i}")
+            for i, text in enumerate(texts)
+        ]
+
+        with patch("somdialc.infra.tracking.MLFlowTracker"):
+            proc = minimal_processor_cls(records=records, dedup_engine=dedup)
+        proc.metrics = MetricsCollector(proc.run_id, proc.source)
+        proc.ledger = MagicMock()
+        proc.ledger.get_pipeline_run.return_value = None
+        proc.near_dedup = MinHashDeduplicator(num_shards=2)
+        proc.near_dup_batch_size = 3
+        proc.stage_timer = StageTimer()
+
+        with open(tmp_path / "processed.txt", "w") as fout:
+            n_processed, n_filtered, written = proc._process_record_stream(
+                last_processed_index=0, checkpoint_path=tmp_path / "ckpt.json", fout=fout
+            )
+
+        assert (n_processed, n_filtered) == (3, 2)
+        assert [r["url"] for r in written] == [
+            "https://example.com/0",
+            "https://example.com/1",
+            "https://example.com/3",
+        ]
+        assert proc.metrics.near_duplicate_count == 2
+        # One ledger_mark interval per accepted record, none per near-dup batch
+        assert proc.stage_timer.calls["ledger_mark"] == 3
+        assert proc.stage_timer.calls["near_dedup"] == 2
+        assert proc.metrics.get_snapshot().filter_reasons == {"near_duplicate": 2}
+        proc.ledger.mark_duplicate.assert_any_call(
+            "https://example.com/2", "https://example.com/0", source=proc.source
+        )
+        proc.ledger.mark_duplicate.assert_any_call(
+            "https://example.com/4", "https://example.com/3", source=proc.source
+        )
+
+    def test_disabled_by_default(self, tmp_path):
+        from unittest.mock import patch
+
+        builder = TestBasePipelineDedupGuard()
+        minimal_processor_cls, dedup, _ = builder._build_processor(tmp_path)
+
+        with patch("somdialc.infra.tracking.MLFlowTracker"):
+            proc = minimal_processor_cls(records=[], dedup_engine=dedup)
+
+        assert proc.near_dedup is None
+
+
 # Run with: pytest tests/unit/test_dedup.py -v -s
@@ -0,0 +1,149 @@
+"""
+Unit tests for the shared dedup server and its client.
+
+Clients of one DedupServer must see each other's documents and hashes, so
+concurrently running pipelines catch cross-source duplicates.
+"""
+
+import os
+import random
+import tempfile
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from somdialc.ingestion.dedup import (
+    DATASKETCH_AVAILABLE,
+    DedupClient,
+    DedupConfig,
+    DedupServer,
+    DedupServiceError,
+    deduplicate_batch,
+    service,
+    shared_dedup_server,
+)
+from somdialc.ingestion.pipeline_setup import PipelineSetup
+
+WORDS = (
+    "dowladda federaalka soomaaliya ayaa maanta ku dhawaaqday qorshe cusub oo lagu "
+    "horumarinayo waxbarashada iyo caafimaadka gobollada dalka wasiirka arrimaha "
+    "gudaha shir jaraa'id muqdisho magaalada dadka deegaanka roobab xilli beereed"
+).split()
+
+
+def _article(seed: int, words: int = 60) -> str:
+    """Distinct pseudo-article: different seeds share few word 3-grams."""
+    rng = random.Random(seed)
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+TEXT = _article(0)
+
+
+@pytest.fixture
+def server():
+    """DedupServer running on a thread; yields its socket path."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        socket_path = os.path.join(tmpdir, "dedup.sock")
+        dedup_server = DedupServer(socket_path, DedupConfig(num_shards=2))
+        thread = threading.Thread(target=dedup_server.serve_forever, daemon=True)
+        thread.start()
+        yield socket_path
+        dedup_server.shutdown()
+        dedup_server.server_close()
+        thread.join()
+
+
+class TestDedupClient:
+    def test_exact_duplicates_across_clients(self, server):
+        with DedupClient(server) as bbc, DedupClient(server) as hf:
+            (first,) = bbc.process_documents([(TEXT, "https://bbc.com/1")])
+            (second,) = hf.process_documents([(TEXT, "https://bbc.com/1")])
+
+        assert first[0] is False
+        assert second[:3] == (True, "exact", "https://bbc.com/1")
+        assert second[3] == first[3]
+
+    @pytest.mark.skipif(not DATASKETCH_AVAILABLE, reason="datasketch not installed")
+    def test_near_duplicates_across_clients(self, server):
+        with DedupClient(server) as bbc, DedupClient(server) as hf:
+            bbc.process_document(TEXT, "https://bbc.com/1")
+            is_dup, dup_type, similar_url, _, _ = hf.process_document(
+                TEXT + " shalay", "https://hf.co/7"
+            )
+
+        assert (is_dup, dup_type, similar_url) == (True, "near", "https://bbc.com/1")
+
+    def test_batch_matches_per_document_results(self, server):
+        docs = [(_article(i), f"https://example.com/{i}") for i in range(5)]
+        docs.append(docs[0])
+        with DedupClient(server) as client:
+            results = client.process_documents(docs)
+
+        assert [r[0] for r in results] == [False] * 5 + [True]
+        assert results[5][1] == "exact"
+
+    def test_known_hashes_are_buffered_until_next_request(self, server):
+        with DedupClient(server) as writer, DedupClient(server) as reader:
+            writer.add_known_hash("ab" * 32, "https://example.com/a")
+            assert writer.is_duplicate_hash("ab" * 32)  # Own buffer, no round trip
+            assert not reader.is_duplicate_hash("ab" * 32)
+
+            writer.flush()
+            assert reader.are_duplicate_hashes(["ab" * 32, "cd" * 32]) == [True, False]
+            assert reader.get_canonical_url("ab" * 32) == "https://example.com/a"
+            assert reader.get_statistics()["total_hashes"] == 1
+
+    def test_close_flushes_buffer(self, server):
+        writer = DedupClient(server)
+        writer.add_known_hash(12345, "https://example.com/a")
+        writer.close()
+
+        with DedupClient(server) as reader:
+            assert reader.is_duplicate_hash(12345)
+
+    def test_deduplicate_batch_uses_one_round_trip(self, server):
+        records = [{"text": TEXT, "url": "https://example.com/1"}] * 3
+        with DedupClient(server) as client:
+            unique, duplicates = deduplicate_batch([dict(r) for r in records], client)
+            requests = client.get_statistics()["requests"]
+
+        assert len(unique) == 1 and len(duplicates) == 2
+        assert requests == 2  # process + stats
+
+    def test_server_errors_raise(self, server):
+        with DedupClient(server) as client:
+            with pytest.raises(DedupServiceError, match="Unknown op"):
+                client._request({"op": "explode"})
+            assert client.ping()["ok"] is True
+
+    def test_unreachable_server_raises(self, tmp_path):
+        with pytest.raises(DedupServiceError):
+            DedupClient(tmp_path / "missing.sock")
+
+
+class TestPipelineSetup:
+    def test_creates_client_for_active_server(self, server):
+        with patch.object(service, "_active_socket", server):
+            engine = PipelineSetup.create_dedup_engine()
+        assert isinstance(engine, DedupClient)
+        engine.close()
+
+    def test_falls_back_to_private_engine(self, tmp_path):
+        with patch.object(service, "_active_socket", str(tmp_path / "gone.sock")):
+            engine = PipelineSetup.create_dedup_engine()
+        assert not isinstance(engine, DedupClient)
+        assert engine.process_document(TEXT, "https://example.com/1")[0] is False
+
+
+def test_shared_dedup_server_runs_in_child_process():
+    with shared_dedup_server(DedupConfig(enable_minhash=False)) as socket_path:
+        assert service.active_socket() == socket_path
+        with DedupClient(socket_path) as client:
+            assert client.ping()["pid"] != os.getpid()
+            client.process_document(TEXT, "https://example.com/1")
+            assert client.process_document(TEXT, "https://example.com/1")[0] is True
+
+    assert service.active_socket() is None
+    assert not os.path.exists(socket_path)
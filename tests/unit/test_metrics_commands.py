@@ -123,3 +123,64 @@ class TestCheckAnomaliesCLIMissingDir:
         assert report["error_count"] == 0
         assert report["warning_count"] == 0
         assert report["sources_affected"] == []
+
+
+class TestMetricsResourcesCLI:
+    """`somali-tools metrics resources <run_id>`."""
+
+    def _write_metrics(self, metrics_dir, run_id, resources=None):
+        data = {"_run_id": run_id, "_source": "BBC-Somali"}
+        if resources is not None:
+            data["resources"] = resources
+        (metrics_dir / f"{run_id}_processing.json").write_text(json.dumps(data))
+
+    def test_shows_summary_and_samples(self, tmp_path):
+        self._write_metrics(
+            tmp_path,
+            "20251018_101500_bbc_ab12cd34",
+            {
+                "interval_seconds": 5.0,
+                "summary": {
+                    "duration_seconds": 5.0,
+                    "samples": 2,
+                    "peak_rss_bytes": 200 * 1024**2,
+                    "cpu_seconds": 4.0,
+                    "mean_cpu_percent": 80.0,
+                    "max_cpu_percent": 95.0,
+                    "read_bytes": 0,
+                    "write_bytes": 1024**2,
+                    "max_open_fds": 12,
+                    "max_wal_bytes": None,
+                },
+                "samples": [
+                    {"t": 0.0, "rss_bytes": 100 * 1024**2, "cpu_percent": None, "open_fds": 10},
+                    {"t": 5.0, "rss_bytes": 200 * 1024**2, "cpu_percent": 95.0, "open_fds": 12},
+                ],
+            },
+        )
+
+        runner = CliRunner()
+        result = runner.invoke(cli, ["metrics", "resources", "bbc_ab12", "-d", str(tmp_path)])
+
+        assert result.exit_code == 0, result.output
+        assert "Peak RSS: 200.0 MiB" in result.output
+        assert "80% mean, 95% max" in result.output
+        assert "Samples (2, every 5 s)" in result.output
+
+        as_json = runner.invoke(
+            cli,
+            ["metrics", "resources", "20251018_101500_bbc_ab12cd34", "-d", str(tmp_path), "--json"],
+        )
+        assert json.loads(as_json.output)["summary"]["max_open_fds"] == 12
+
+    def test_missing_run_or_resources(self, tmp_path):
+        self._write_metrics(tmp_path, "old_run")
+        runner = CliRunner()
+
+        missing = runner.invoke(cli, ["metrics", "resources", "nope", "-d", str(tmp_path)])
+        no_data = runner.invoke(cli, ["metrics", "resources", "old_run", "-d", str(tmp_path)])
+
+        assert missing.exit_code == 1
+        assert "No processing metrics" in missing.output
+        assert no_data.exit_code == 1
+        assert "No resource samples" in no_data.output
@@ -0,0 +1,202 @@
+"""Tests for the resumable ranged downloader against a local range-capable server."""
+
+import hashlib
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from somdialc.infra.download import DownloadError, RangedDownloader
+from somdialc.infra.metrics import MetricsCollector, PipelineType
+
+PAYLOAD = bytes(range(256)) * 40  # 10,240 bytes
+
+
+class _RangeHandler(BaseHTTPRequestHandler):
+    """Serves PAYLOAD with Range/If-Range support and optional failure injection."""
+
+    protocol_version = "HTTP/1.1"
+    etag = '"v1"'
+    truncate_first = False
+    ignore_ranges = False
+    seen: list = []
+
+    def do_GET(self):
+        cls = type(self)
+        if self.path != "/corpus.xml.bz2":
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        cls.seen.append(
+            {"range": self.headers.get("Range"), "if_range": self.headers.get("If-Range")}
+        )
+
+        start, end = 0, len(PAYLOAD) - 1
+        partial = False
+        match = re.match(r"bytes=(\d+)-(\d*)", self.headers.get("Range") or "")
+        if_range = self.headers.get("If-Range")
+        if match and not cls.ignore_ranges and (if_range is None or if_range == cls.etag):
+            start = int(match.group(1))
+            end = int(match.group(2)) if match.group(2) else end
+            partial = True
+
+        body = PAYLOAD[start : end + 1]
+        self.send_response(206 if partial else 200)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("ETag", cls.etag)
+        if partial:
+            self.send_header("Content-Range", f"bytes {start}-{end}/{len(PAYLOAD)}")
+        self.end_headers()
+
+        if cls.truncate_first:
+            cls.truncate_first = False
+            self.wfile.write(body[: len(body) // 3])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    _RangeHandler.seen = []
+    _RangeHandler.etag = '"v1"'
+    _RangeHandler.truncate_first = False
+    _RangeHandler.ignore_ranges = False
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _RangeHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}/corpus.xml.bz2"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _downloader(**overrides) -> RangedDownloader:
+    options = {"backoff_factor": 0.0, "show_progress": False, "max_retries": 3}
+    options.update(overrides)
+    return RangedDownloader(requests.Session(), **options)
+
+
+class TestRangedDownloader:
+    """Test cases for RangedDownloader."""
+
+    def test_single_stream_download_verifies_checksum(self, server, tmp_path):
+        dest = tmp_path / "corpus.xml.bz2"
+        metrics = MetricsCollector("run", "test", pipeline_type=PipelineType.FILE_PROCESSING)
+
+        result = _downloader(metrics=metrics).download(
+            server, dest, expected_size=len(PAYLOAD), sha256=hashlib.sha256(PAYLOAD).hexdigest()
+        )
+
+        assert dest.read_bytes() == PAYLOAD
+        assert result.segments == 1
+        assert result.etag == '"v1"'
+        assert not (tmp_path / "corpus.xml.bz2.part").exists()
+        assert not (tmp_path / "corpus.xml.bz2.part.json").exists()
+        assert metrics.counters["bytes_downloaded"] == len(PAYLOAD)
+        (entry,) = metrics.custom_metrics["downloads"]
+        assert entry["bytes_total"] == len(PAYLOAD)
+        assert entry["throughput_bytes_per_sec"] > 0
+
+    def test_parallel_ranges(self, server, tmp_path):
+        dest = tmp_path / "corpus.xml.bz2"
+
+        result = _downloader(max_workers=4, min_segment_size=2048).download(server, dest)
+
+        assert dest.read_bytes() == PAYLOAD
+        assert result.segments == 4
+        ranges = sorted(r["range"] for r in _RangeHandler.seen if r["range"])
+        assert len(ranges) == 4
+        assert all(r["if_range"] == '"v1"' for r in _RangeHandler.seen if r["range"])
+
+    def test_resumes_partial_file(self, server, tmp_path):
+        dest = tmp_path / "corpus.xml.bz2"
+        (tmp_path / "corpus.xml.bz2.part").write_bytes(PAYLOAD[:4000])
+        (tmp_path / "corpus.xml.bz2.part.json").write_text(
+            json.dumps(
+                {
+                    "url": server,
+                    "total": len(PAYLOAD),
+                    "etag": '"v1"',
+                    "last_modified": None,
+                    "segments": [[0, len(PAYLOAD) - 1, 4000]],
+                }
+            )
+        )
+
+        result = _downloader().download(server, dest)
+
+        assert dest.read_bytes() == PAYLOAD
+        assert result.resumed_from == 4000
+        assert result.bytes_downloaded == len(PAYLOAD) - 4000
+        assert _RangeHandler.seen == [{"range": "bytes=4000-10239", "if_range": '"v1"'}]
+
+    def test_interrupted_transfer_is_retried_from_last_byte(self, server, tmp_path):
+        _RangeHandler.truncate_first = True
+        dest = tmp_path / "corpus.xml.bz2"
+
+        # Small chunks so bytes received before the drop are written, not buffered
+        _downloader(chunk_size=1024).download(server, dest)
+
+        assert dest.read_bytes() == PAYLOAD
+        assert _RangeHandler.seen[0]["range"] is None
+        assert _RangeHandler.seen[1]["range"].startswith("bytes=")
+        assert _RangeHandler.seen[1]["range"] != "bytes=0-10239"
+
+    def test_changed_resource_restarts_from_zero(self, server, tmp_path):
+        dest = tmp_path / "corpus.xml.bz2"
+        (tmp_path / "corpus.xml.bz2.part").write_bytes(b"x" * 4000)
+        (tmp_path / "corpus.xml.bz2.part.json").write_text(
+            json.dumps(
+                {
+                    "url": server,
+                    "total": len(PAYLOAD),
+                    "etag": '"v0"',
+                    "last_modified": None,
+                    "segments": [[0, len(PAYLOAD) - 1, 4000]],
+                }
+            )
+        )
+
+        result = _downloader().download(server, dest)
+
+        # If-Range mismatch -> 200 -> fresh download, never a spliced file
+        assert dest.read_bytes() == PAYLOAD
+        assert result.resumed_from == 0
+
+    def test_part_without_state_is_discarded(self, server, tmp_path):
+        dest = tmp_path / "corpus.xml.bz2"
+        (tmp_path / "corpus.xml.bz2.part").write_bytes(b"stale")
+
+        _downloader().download(server, dest)
+        assert dest.read_bytes() == PAYLOAD
+
+    def test_checksum_mismatch_raises(self, server, tmp_path):
+        dest = tmp_path / "corpus.xml.bz2"
+
+        with pytest.raises(DownloadError, match="Checksum mismatch"):
+            _downloader().download(server, dest, sha256="0" * 64)
+
+        assert not dest.exists()
+        assert not (tmp_path / "corpus.xml.bz2.part").exists()
+
+    def test_server_ignoring_ranges_falls_back_to_single_stream(self, server, tmp_path):
+        _RangeHandler.ignore_ranges = True
+        dest = tmp_path / "corpus.xml.bz2"
+
+        result = _downloader(max_workers=4, min_segment_size=2048).download(server, dest)
+
+        assert dest.read_bytes() == PAYLOAD
+        assert result.segments == 1
+
+    def test_http_error_propagates(self, server, tmp_path):
+        with pytest.raises(requests.HTTPError):
+            _downloader().download(server.replace("corpus", "missing"), tmp_path / "x")
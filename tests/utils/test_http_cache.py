@@ -0,0 +1,183 @@
+"""Tests for the content-addressed HTTP response cache."""
+
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from somdialc.infra.http import HTTPSessionFactory
+from somdialc.infra.http_cache import (
+    CachingClientSession,
+    CachingHTTPAdapter,
+    HTTPResponseCache,
+)
+
+PAGE = "<html><body><p>Maqaal Soomaali ah</p></body></html>"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Serves PAGE with an ETag and answers If-None-Match with 304."""
+
+    requests_seen: list = []
+
+    def do_GET(self):
+        type(self).requests_seen.append(dict(self.headers))
+        if self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.send_header("ETag", '"v1"')
+            self.end_headers()
+            return
+        body = PAGE.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("ETag", '"v1"')
+        self.send_header("Last-Modified", "Wed, 01 Oct 2025 10:00:00 GMT")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    _Handler.requests_seen = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return HTTPResponseCache(tmp_path / "http")
+
+
+class TestHTTPResponseCache:
+    """Test cases for the cache store."""
+
+    def test_put_get_roundtrip_strips_transfer_headers(self, cache):
+        cache.put(
+            "https://example.org/a",
+            200,
+            {"ETag": '"x"', "Content-Encoding": "gzip", "Content-Type": "text/html"},
+            b"hello",
+        )
+        cached = cache.get("https://example.org/a")
+
+        assert cached.body == b"hello"
+        assert cached.etag == '"x"'
+        assert "Content-Encoding" not in cached.headers
+        assert cached.validator_headers() == {"If-None-Match": '"x"'}
+        assert cache.get("https://example.org/other") is None
+
+    def test_identical_bodies_share_one_blob(self, cache):
+        cache.put("https://example.org/a", 200, {}, b"same body")
+        cache.put("https://example.org/b", 200, {}, b"same body")
+
+        stats = cache.statistics()
+        assert stats["entries"] == 2
+        assert len([p for p in cache.blob_dir.rglob("*") if p.is_file()]) == 1
+
+    def test_gzip_fallback_compression(self, tmp_path):
+        cache = HTTPResponseCache(tmp_path / "gz", compression="gzip")
+        body = b"a" * 10_000
+        cache.put("https://example.org/a", 200, {}, body)
+
+        assert cache.get("https://example.org/a").body == body
+        assert cache.statistics()["blob_bytes"] < len(body)
+
+    def test_unknown_compression_rejected(self, tmp_path):
+        with pytest.raises(ValueError):
+            HTTPResponseCache(tmp_path, compression="brotli")
+
+
+class TestCachingHTTPAdapter:
+    """Test requests integration against a local server."""
+
+    def test_readwrite_stores_then_revalidates(self, server, cache):
+        session = HTTPSessionFactory.create_session(cache=cache, cache_mode="readwrite")
+        assert isinstance(session.adapters["http://"], CachingHTTPAdapter)
+
+        first = session.get(f"{server}/article")
+        second = session.get(f"{server}/article")
+
+        assert first.status_code == 200
+        assert "X-Cache" not in first.headers
+        # The server answered 304; the adapter served the cached body
+        assert second.status_code == 200
+        assert second.headers["X-Cache"] == "HIT"
+        assert second.text == PAGE
+        assert _Handler.requests_seen[1]["If-None-Match"] == '"v1"'
+        assert cache.statistics()["revalidated"] == 1
+
+    def test_caller_conditional_headers_pass_304_through(self, server, cache):
+        session = HTTPSessionFactory.create_session(cache=cache, cache_mode="readwrite")
+        session.get(f"{server}/article")
+
+        response = session.get(f"{server}/article", headers={"If-None-Match": '"v1"'})
+        assert response.status_code == 304
+
+    def test_replay_never_touches_network(self, server, cache):
+        HTTPSessionFactory.create_session(cache=cache, cache_mode="readwrite").get(
+            f"{server}/article"
+        )
+        seen = len(_Handler.requests_seen)
+
+        replay = HTTPSessionFactory.create_session(cache=cache, cache_mode="replay")
+        hit = replay.get(f"{server}/article", headers={"If-None-Match": '"v1"'})
+        miss = replay.get(f"{server}/missing")
+
+        assert hit.status_code == 200
+        assert hit.text == PAGE
+        assert miss.status_code == 504
+        assert miss.headers["X-Cache"] == "MISS"
+        assert len(_Handler.requests_seen) == seen
+
+    def test_off_mounts_plain_adapter(self, cache):
+        session = HTTPSessionFactory.create_session(cache=cache, cache_mode="off")
+        assert not isinstance(session.adapters["http://"], CachingHTTPAdapter)
+
+
+class TestCachingClientSession:
+    """Test aiohttp integration."""
+
+    def test_readwrite_then_replay(self, server, cache):
+        aiohttp = pytest.importorskip("aiohttp")
+
+        async def fetch(mode, path):
+            async with aiohttp.ClientSession() as raw:
+                session = CachingClientSession(raw, cache, mode)
+                async with session.get(f"{server}{path}") as response:
+                    return response.status, await response.text(), response.headers
+
+        status, text, _ = asyncio.run(fetch("readwrite", "/article"))
+        assert (status, text) == (200, PAGE)
+
+        status, text, headers = asyncio.run(fetch("readwrite", "/article"))
+        assert (status, text, headers["X-Cache"]) == (200, PAGE, "HIT")
+
+        seen = len(_Handler.requests_seen)
+        status, text, _ = asyncio.run(fetch("replay", "/article"))
+        assert (status, text) == (200, PAGE)
+        status, _, _ = asyncio.run(fetch("replay", "/missing"))
+        assert status == 504
+        assert len(_Handler.requests_seen) == seen
+
+    def test_replay_miss_raises_client_response_error(self, cache):
+        aiohttp = pytest.importorskip("aiohttp")
+
+        async def main():
+            async with aiohttp.ClientSession() as raw:
+                session = CachingClientSession(raw, cache, "replay")
+                async with session.get("https://example.org/missing") as response:
+                    response.raise_for_status()
+
+        with pytest.raises(aiohttp.ClientResponseError) as excinfo:
+            asyncio.run(main())
+        assert excinfo.value.status == 504
+        assert "https://example.org/missing" in str(excinfo.value)
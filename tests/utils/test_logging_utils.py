@@ -2,14 +2,18 @@
 
 import json
 import logging
+import queue
 import sys
+import threading
 import time
 
 import pytest
 
 from somdialc.infra.logging_utils import (
     ColoredFormatter,
+    ContextQueueHandler,
     LogEvent,
+    LogSampler,
     StructuredFormatter,
     StructuredLogger,
     Timer,
@@ -299,6 +303,99 @@ class TestStructuredLogger:
         assert file_handlers[0].backupCount == 5
 
 
+class TestAsyncLogging:
+    """Queue-based (non-blocking) handlers."""
+
+    def test_listener_writes_json_with_caller_context(self, tmp_path):
+        log_file = tmp_path / "async.log"
+        logger = StructuredLogger(
+            name="test_async", log_file=log_file, console=False, async_handlers=True
+        )
+        assert logger.logger.handlers == [logger.queue_handler]
+
+        emitted_on = {}
+
+        def work():
+            set_context(run_id="run_async", api_key="sk-secret-value-1234567890")
+            logger.get_logger().info("Processed %d records", 5)
+            emitted_on["thread"] = threading.current_thread().name
+            clear_context()
+
+        thread = threading.Thread(target=work)
+        thread.start()
+        thread.join()
+        logger.stop()
+
+        entry = json.loads(log_file.read_text().strip())
+        assert entry["message"] == "Processed 5 records"
+        # Context is captured on the emitting thread, then redacted on the listener
+        assert entry["run_id"] == "run_async"
+        assert "sk-secret-value" not in log_file.read_text()
+
+    def test_full_queue_drops_debug_but_keeps_warnings(self):
+        log_queue = queue.Queue(maxsize=1)
+        handler = ContextQueueHandler(log_queue, overflow="drop")
+        logger = logging.getLogger("test_async_drop")
+        logger.handlers = [handler]
+        logger.setLevel(logging.DEBUG)
+        logger.propagate = False
+
+        logger.debug("first")
+        logger.debug("second")
+
+        assert handler.dropped == 1
+        assert log_queue.get_nowait().getMessage() == "first"
+        logger.warning("kept")
+        assert log_queue.get_nowait().getMessage() == "kept"
+
+    def test_invalid_overflow_policy(self):
+        with pytest.raises(ValueError):
+            ContextQueueHandler(queue.Queue(), overflow="spill")
+
+
+class TestLogSampler:
+    """Test cases for LogSampler."""
+
+    def test_first_then_every_nth(self):
+        sampler = LogSampler(every=5, first=2)
+
+        emitted = [n for n in (sampler("min_length") for _ in range(12)) if n]
+
+        assert emitted == [1, 2, 5, 10]
+        assert sampler("other") == 1
+
+    def test_filter_engine_samples_rejection_debug_logs(self, caplog):
+        from somdialc.quality.filter_engine import FilterEngine
+
+        def failing_filter(text, **kwargs):
+            return False, {}
+
+        engine = FilterEngine(debug_sample_every=10)
+        engine.register_filter(failing_filter)
+
+        with caplog.at_level("DEBUG", logger="somdialc.quality.filter_engine"):
+            for i in range(30):
+                engine.apply_filters("qoraal", f"Record {i}")
+
+        rejections = [r for r in caplog.records if "filtered by" in r.message]
+        assert len(rejections) == 12  # first 10, then the 20th and 30th
+        assert engine.get_filter_stats()["filtered_by_failing_filter"] == 30
+
+    def test_filter_engine_samples_batch_rejection_debug_logs(self, caplog):
+        from somdialc.quality.filter_engine import FilterEngine
+        from somdialc.quality.filter_functions import min_length_filter
+
+        engine = FilterEngine(debug_sample_every=10)
+        engine.register_filter(min_length_filter, {"threshold": 20})
+
+        with caplog.at_level("DEBUG", logger="somdialc.quality.filter_engine"):
+            engine.apply_filters_batch(["qoraal"] * 30, [f"Record {i}" for i in range(30)])
+
+        rejections = [r for r in caplog.records if "filtered by" in r.message]
+        assert len(rejections) == 12
+        assert "Record 29" in rejections[-1].message
+
+
 class TestContextManagement:
     """Test context management functions."""
 
@@ -339,3 +339,48 @@ class TestCalculateMetricStatistics:
         assert stats["median"] == 2.5
         assert stats["sum"] == 7.5
         assert stats["count"] == 3
+
+
+class TestTextLengthHistograms:
+    """Ingest-time length histograms flow from the collector to the Ridge plot."""
+
+    def test_exported_histograms_drive_ridge_distribution(self, tmp_path):
+        from somdialc.infra.metrics import MetricsCollector, PipelineType
+        from somdialc.infra.visualization_aggregator import calculate_text_length_distribution
+
+        collector = MetricsCollector("run-hist", "test-source", PipelineType.FILE_PROCESSING)
+        for _ in range(30):
+            collector.record_length_outcome(50, 8, "passed")
+        for _ in range(10):
+            collector.record_length_outcome(5000, 800, "passed")
+        collector.record_length_outcome(3, 1, "filtered")
+        path = tmp_path / "run-hist_processing.json"
+        collector.export_json(path)
+
+        data = json.loads(path.read_text())
+        assert set(data["text_length_histograms"]["chars"]) == {"filtered", "passed"}
+        assert sum(b["count"] for b in data["text_length_histograms"]["tokens"]["passed"]) == 40
+
+        metric = extract_consolidated_metric(data, path.name)
+        ridge = calculate_text_length_distribution([metric], num_bins=10)
+
+        source = ridge["sources"]["test-source"]
+        assert source["total_records"] == 40
+        # 50 chars falls in [31, 100), 5000 chars in [3162, 10000)
+        assert source["counts"][1] == 30
+        assert source["counts"][5] == 10
+        assert source["median"] == pytest.approx(50, rel=0.2)
+
+    def test_stats_fallback_without_histograms(self):
+        from somdialc.infra.visualization_aggregator import calculate_text_length_distribution
+
+        metric = {
+            "source": "test-source",
+            "records_written": 80,
+            "text_length_stats": {"mean": 625.0, "median": 600.0},
+        }
+        ridge = calculate_text_length_distribution([metric], num_bins=10)
+
+        source = ridge["sources"]["test-source"]
+        assert source["counts"][3] == 80  # mean 625 lies in [316, 1000)
+        assert source["mean"] == pytest.approx(612.5)
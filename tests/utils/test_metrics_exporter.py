@@ -0,0 +1,139 @@
+"""Tests for the live Prometheus exporter."""
+
+import re
+import urllib.error
+import urllib.request
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from somdialc.infra.metrics import MetricsCollector
+from somdialc.infra.metrics_exporter import LiveMetricsExporter
+from somdialc.infra.profiling import StageTimer
+from somdialc.ingestion.raw_record import RawRecord
+from tests.pipeline_helpers import MockPipeline
+
+
+def _scrape(exporter):
+    with urllib.request.urlopen(exporter.url, timeout=5) as response:
+        assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+        return response.read().decode("utf-8")
+
+
+class TestLiveMetricsExporter:
+    """Test cases for LiveMetricsExporter."""
+
+    def test_render_scalar_and_labelled_metrics(self):
+        exporter = LiveMetricsExporter(port=0, labels={"source": "mc4", "run_id": 'a"b'})
+        exporter.add_metric("pipeline_records_read_total", "counter", "Records read", lambda: 42)
+        exporter.add_metric(
+            "pipeline_stage_calls_total", "counter", "Calls", lambda: {"clean": 3}, label="stage"
+        )
+        exporter.add_metric("missing_gauge", "gauge", "Not available", lambda: None)
+        exporter.add_metric("broken_gauge", "gauge", "Raises", lambda: 1 / 0)
+
+        text = exporter.render()
+
+        assert "# TYPE pipeline_records_read_total counter" in text
+        assert 'pipeline_records_read_total{source="mc4",run_id="a\\"b"} 42' in text
+        assert 'pipeline_stage_calls_total{source="mc4",run_id="a\\"b",stage="clean"} 3' in text
+        assert "missing_gauge" not in text
+        assert "broken_gauge" not in text
+
+    def test_rate_ewma_follows_time_weighted_rate(self):
+        count = [0]
+        clock = [1000.0]
+        with patch("somdialc.infra.metrics_exporter.time.monotonic", lambda: clock[0]):
+            exporter = LiveMetricsExporter(port=0, ewma_window_seconds=10.0)
+            exporter.track_rate(lambda: count[0])
+
+            count[0], clock[0] = 100, 1010.0  # 10 rec/s
+            assert exporter._update_rate() == pytest.approx((10.0, 10.0))
+
+            count[0], clock[0] = 500, 1020.0  # 40 rec/s for one time constant
+            average, ewma = exporter._update_rate()
+
+        assert average == pytest.approx(25.0)
+        assert ewma == pytest.approx(10.0 + (1 - 2.718281828**-1) * 30.0, rel=1e-6)
+
+    def test_serves_metrics_over_http(self):
+        exporter = LiveMetricsExporter(port=0)
+        exporter.add_metric("pipeline_records_read_total", "counter", "Records read", lambda: 7)
+        exporter.track_rate(lambda: 7)
+        exporter.start()
+        try:
+            text = _scrape(exporter)
+            with pytest.raises(urllib.error.HTTPError):
+                urllib.request.urlopen(exporter.url.replace("/metrics", "/other"), timeout=5)
+        finally:
+            exporter.stop()
+
+        assert "pipeline_records_read_total 7" in text
+        assert "pipeline_records_per_second_ewma" in text
+
+
+class TestPipelineLiveMetrics:
+    """BasePipeline exposes its loop state through the exporter."""
+
+    def test_scrape_during_run(self, temp_work_dir):
+        records = [
+            RawRecord(
+                title=f"Maqaal {i}",
+                text="Waxaan waa maqaal cusub oo ku saabsan xaalada wadanka Soomaaliya.",
+                url=f"https://example.com/{i}",
+            )
+            for i in range(3)
+        ]
+        processor = MockPipeline(test_records=records)
+        processor.metrics = MetricsCollector(processor.run_id, processor.source)
+        processor.metrics_port = 0
+        processor.extract()
+
+        assert processor._start_run_telemetry() is True
+        try:
+            with patch.object(processor.silver_writer, "write", return_value=None):
+                processor.process()
+            # process() joined the running telemetry instead of restarting it
+            text = _scrape(processor.metrics_exporter)
+        finally:
+            processor._stop_run_telemetry()
+
+        assert processor.metrics_exporter is None
+        assert re.search(r"pipeline_records_read_total\{[^}]*\} 3\n", text)
+        assert re.search(r"pipeline_records_accepted_total\{[^}]*\} 3\n", text)
+        assert 'stage="clean"' in text
+        assert 'filter="min_token_floor_filter"' in text
+        assert "pipeline_write_buffer_records" in text
+        assert "process_resident_memory_bytes" in text
+
+    def test_counters_do_not_depend_on_stage_timing(self, temp_work_dir):
+        records = [
+            RawRecord(
+                title=f"Maqaal {i}",
+                text="Waxaan waa maqaal cusub oo ku saabsan xaalada wadanka Soomaaliya.",
+                url=f"https://example.com/{i}",
+            )
+            for i in range(4)
+        ]
+        processor = MockPipeline(test_records=records)
+        processor.metrics = MetricsCollector(processor.run_id, processor.source)
+        processor.stage_timer = StageTimer(enabled=False)  # SDC_PROFILING__STAGE_TIMING=false
+        processor.mlflow = MagicMock()
+        processor._start_step_metrics()
+        (read_step_metrics, _), _ = processor.mlflow.start_step_metrics.call_args
+        exporter = processor._create_metrics_exporter(port=0, host="127.0.0.1")
+        processor.extract()
+
+        with patch.object(processor.silver_writer, "write", return_value=None):
+            processor.process()
+        exporter.start()
+        try:
+            text = _scrape(exporter)
+        finally:
+            exporter.stop()
+
+        assert re.search(r"pipeline_records_read_total\{[^}]*\} 4\n", text)
+        assert re.search(r"pipeline_records_accepted_total\{[^}]*\} 4\n", text)
+        step_metrics = read_step_metrics()
+        assert step_metrics["records_per_second"] > 0
+        assert step_metrics["filter_pass_rate"] == 1.0
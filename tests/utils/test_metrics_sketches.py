@@ -0,0 +1,179 @@
+"""Tests for the fixed-memory metric sketches and their MetricsCollector wiring."""
+
+import json
+import random
+
+import pytest
+
+from somdialc.infra.metrics import MetricsCollector, PipelineType
+from somdialc.infra.metrics_sketches import HyperLogLog, LogHistogram, QuantileSketch
+
+
+def _exact_quantile(values, q):
+    ordered = sorted(values)
+    return ordered[int(q * (len(ordered) - 1))]
+
+
+class TestQuantileSketch:
+    """Test cases for QuantileSketch."""
+
+    def test_quantiles_within_relative_accuracy(self):
+        rng = random.Random(7)
+        values = [rng.lognormvariate(5, 1.2) for _ in range(50_000)]
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        for value in values:
+            sketch.add(value)
+
+        for q in (0.5, 0.95, 0.99):
+            exact = _exact_quantile(values, q)
+            assert abs(sketch.quantile(q) - exact) / exact <= 0.011
+        assert sketch.count == len(values)
+        assert sketch.min == min(values)
+        assert sketch.max == max(values)
+        assert len(sketch.buckets) < 2048
+
+    def test_constant_and_zero_values(self):
+        sketch = QuantileSketch()
+        for _ in range(10):
+            sketch.add(500.0)
+        assert sketch.summary()["p95"] == 500.0
+
+        zeros = QuantileSketch()
+        zeros.add(0.0)
+        zeros.add(0.0)
+        zeros.add(4.0)
+        assert zeros.quantile(0.5) == 0.0
+        assert zeros.quantile(1.0) == 4.0
+
+    def test_merge_equals_single_sketch(self):
+        left, right, combined = QuantileSketch(), QuantileSketch(), QuantileSketch()
+        for value in range(1, 2001):
+            (left if value % 2 else right).add(value)
+            combined.add(value)
+
+        left.merge(right)
+
+        assert left.buckets == combined.buckets
+        assert left.summary() == combined.summary()
+
+    def test_roundtrip_and_incompatible_merge(self):
+        sketch = QuantileSketch()
+        for value in (3.0, 9.0, 27.0):
+            sketch.add(value)
+
+        restored = QuantileSketch.from_dict(json.loads(json.dumps(sketch.to_dict())))
+
+        assert restored.summary() == sketch.summary()
+        with pytest.raises(ValueError):
+            sketch.merge(QuantileSketch(relative_accuracy=0.05))
+
+
+class TestHyperLogLog:
+    """Test cases for HyperLogLog."""
+
+    def test_exact_while_sparse(self):
+        hll = HyperLogLog(sparse_limit=100)
+        assert hll.add("a") is True
+        assert hll.add("a") is False
+        assert hll.cardinality() == 1
+        assert hll.is_exact
+
+    def test_estimate_after_densify(self):
+        hll = HyperLogLog(sparse_limit=1000)
+        for i in range(100_000):
+            hll.add(f"doc-{i}")
+
+        assert not hll.is_exact
+        assert abs(hll.cardinality() - 100_000) / 100_000 < 0.03
+
+    def test_merge_is_union(self):
+        left, right = HyperLogLog(sparse_limit=500), HyperLogLog(sparse_limit=500)
+        for i in range(3000):
+            left.add(f"doc-{i}")
+        for i in range(2000, 5000):
+            right.add(f"doc-{i}")
+
+        left.merge(HyperLogLog.from_dict(json.loads(json.dumps(right.to_dict()))))
+
+        assert abs(left.cardinality() - 5000) / 5000 < 0.03
+
+
+class TestLogHistogram:
+    """Test cases for LogHistogram."""
+
+    def test_bins_cover_values(self):
+        histogram = LogHistogram(bins_per_octave=1)
+        for value in (0, 1, 3, 4, 1000):
+            histogram.add(value)
+
+        bins = histogram.bins()
+        assert [b["count"] for b in bins] == [1, 1, 1, 1, 1]
+        assert bins[0] == {"lower": 0.0, "upper": 1.0, "count": 1}
+        assert all(b["lower"] <= v < b["upper"] for b, v in zip(bins, (0, 1, 3, 4, 1000)))
+        assert histogram.total == 5
+
+    def test_merge_and_roundtrip(self):
+        left, right = LogHistogram(), LogHistogram()
+        left.add(10)
+        right.add(10)
+        right.add(5000)
+
+        left.merge(LogHistogram.from_dict(right.to_dict()))
+
+        assert left.total == 3
+        assert max(b["count"] for b in left.bins()) == 2
+
+
+class TestCollectorSketches:
+    """Test MetricsCollector on top of the sketches."""
+
+    def test_whole_run_stats_beyond_recent_window(self):
+        collector = MetricsCollector("run", "test", PipelineType.FILE_PROCESSING)
+        for i in range(5000):
+            collector.record_fetch_duration(1.0 if i < 4000 else 100.0)
+            collector.record_text_length(100)
+
+        snapshot = collector.get_snapshot()
+        stats = snapshot.calculate_statistics()
+
+        assert len(snapshot.fetch_durations_ms) == 1000
+        # The last 1000 samples alone would give a median of 100ms
+        assert stats["fetch_duration_stats"]["median"] == pytest.approx(1.0, rel=0.01)
+        assert stats["text_length_stats"]["total_chars"] == 500_000
+        assert collector.get_layered_metrics()["volume"]["total_chars"] == 500_000
+        assert collector.get_layered_metrics()["connectivity"]["connection_duration_ms"] == 1.0
+
+    def test_merge_collectors(self):
+        workers = [MetricsCollector("run", "test") for _ in range(3)]
+        for index, worker in enumerate(workers):
+            worker.increment("records_written", 10)
+            worker.record_filter_reason("min_length_filter")
+            worker.record_process_duration(float(index + 1))
+            worker.record_hash("shared")
+            worker.record_hash(f"own-{index}")
+
+        merged = MetricsCollector("run", "test")
+        merged.merge(workers[0])
+        merged.merge(workers[1])
+        merged.merge_sketch_state(json.loads(json.dumps(workers[2].get_sketch_state())))
+        merged.counters["records_written"] += workers[2].counters["records_written"]
+
+        snapshot = merged.get_snapshot()
+        assert snapshot.records_written == 30
+        assert snapshot.filter_reasons == {"min_length_filter": 2}
+        assert snapshot.unique_hashes == 4
+        assert snapshot.duplicate_hashes == 2
+        assert snapshot.calculate_statistics()["process_duration_stats"]["max"] == 3.0
+
+    def test_dense_hashes_are_not_counted_as_duplicates(self):
+        collector = MetricsCollector("run", "test")
+        for i in range(100_000):
+            collector.record_hash(f"doc-{i}")
+        for i in range(1_000):
+            collector.record_hash(f"doc-{i}")
+
+        snapshot = collector.get_snapshot()
+        assert not collector.unique_hashes.is_exact
+        assert abs(snapshot.duplicate_hashes - 1_000) < 0.03 * 100_000
+        assert snapshot.urls_deduplicated == snapshot.duplicate_hashes
+        assert "duplicate_hashes" not in collector.counters
@@ -0,0 +1,205 @@
+"""Tests for processing-loop stage timers and the profiling hook."""
+
+import json
+import pstats
+import time
+from unittest.mock import patch
+
+import pytest
+
+from somdialc.infra.metrics import MetricsCollector, PipelineType
+from somdialc.infra.profiling import StageTimer, profile_run
+from somdialc.ingestion.raw_record import RawRecord
+from somdialc.quality.filter_engine import FilterEngine
+from tests.pipeline_helpers import MockPipeline
+
+
+def _busy(ms: float) -> None:
+    end = time.perf_counter() + ms / 1000
+    while time.perf_counter() < end:
+        pass
+
+
+def slow_filter(text):
+    _busy(2)
+    return True, {}
+
+
+def rejecting_filter(text):
+    return False, {}
+
+
+class TestStageTimer:
+    """Test cases for StageTimer."""
+
+    def test_lap_and_summary(self):
+        timer = StageTimer()
+        mark = time.perf_counter_ns()
+        _busy(5)
+        mark = timer.lap("clean", mark)
+        _busy(1)
+        timer.lap("filter", mark)
+        timer.add("filter.min_length_filter", 500_000)
+
+        summary = timer.summary()
+
+        assert list(summary["stages"])[:2] == ["clean", "filter"]
+        assert summary["stages"]["clean"]["total_ms"] >= 5
+        assert summary["stages"]["clean"]["calls"] == 1
+        # Sub-stages are reported but do not count towards the total
+        assert summary["total_ms"] == pytest.approx(
+            summary["stages"]["clean"]["total_ms"] + summary["stages"]["filter"]["total_ms"],
+            abs=0.01,
+        )
+        assert summary["timer_overhead_pct"] < 1
+
+    def test_disabled_timer_records_nothing(self):
+        timer = StageTimer(enabled=False)
+        mark = timer.lap("clean", time.perf_counter_ns())
+        list(timer.timed_iter([1, 2], "extract"))
+
+        assert mark > 0
+        assert timer.summary() == {}
+
+    def test_timed_iter_and_merge(self):
+        def produce():
+            for i in range(3):
+                _busy(1)
+                yield i
+
+        worker = StageTimer()
+        assert list(worker.timed_iter(produce(), "extract")) == [0, 1, 2]
+
+        merged = StageTimer()
+        merged.merge(worker)
+        merged.merge(worker)
+        assert merged.calls["extract"] == 6
+        assert merged.total_ns["extract"] >= 6_000_000
+
+
+class TestFilterEngineTimings:
+    """Per-filter timing in FilterEngine."""
+
+    def test_timings_per_filter_name(self):
+        engine = FilterEngine()
+        engine.register_filter(slow_filter)
+        engine.register_filter(rejecting_filter)
+
+        engine.apply_filters("qoraal")
+        engine.apply_filters("qoraal")
+        timings = engine.get_filter_timings()
+
+        assert timings["slow_filter"][1] == 2
+        assert timings["slow_filter"][0] >= 4_000_000
+        assert timings["rejecting_filter"][1] == 2
+
+        engine.reset_stats()
+        assert engine.get_filter_timings() == {}
+
+    def test_timing_can_be_disabled(self):
+        engine = FilterEngine()
+        engine.timing_enabled = False
+        engine.register_filter(slow_filter)
+
+        assert engine.apply_filters("qoraal")[0] is True
+        assert engine.get_filter_timings() == {}
+
+
+class TestExport:
+    """Stage timings in metrics exports."""
+
+    def test_json_and_prometheus(self, tmp_path):
+        collector = MetricsCollector("run-t", "test", PipelineType.FILE_PROCESSING)
+        collector.stage_timer.add("clean", 3_000_000, calls=3)
+        collector.stage_timer.add("filter.slow_filter", 1_000_000, calls=3)
+
+        collector.export_json(tmp_path / "m.json")
+        collector.export_prometheus(tmp_path / "m.prom")
+
+        data = json.loads((tmp_path / "m.json").read_text())
+        assert data["stage_timings"]["stages"]["clean"]["total_ms"] == 3.0
+        prom = (tmp_path / "m.prom").read_text()
+        assert 'stage="filter.slow_filter"} 0.001' in prom
+        assert 'pipeline_stage_calls_total{source="test"' in prom
+
+
+class TestProfileRun:
+    """Test the profiler context manager."""
+
+    def test_cprofile_writes_pstats(self, tmp_path):
+        with profile_run("cprofile", tmp_path, "run-p") as output_path:
+            _busy(5)
+
+        stats = pstats.Stats(str(output_path))
+        assert output_path.name == "run-p.pstats"
+        assert any(func[2] == "_busy" for func in stats.stats)
+
+    def test_sampler_writes_collapsed_stacks(self, tmp_path):
+        with profile_run("sample", tmp_path, "run-s", sample_interval_ms=1) as output_path:
+            _busy(50)
+
+        lines = output_path.read_text().splitlines()
+        assert lines
+        assert any("test_profiling.py:_busy" in line for line in lines)
+        stack, count = lines[0].rsplit(" ", 1)
+        assert int(count) >= 1
+
+    def test_unknown_mode_rejected(self, tmp_path):
+        with pytest.raises(ValueError):
+            with profile_run("perf", tmp_path, "run-x"):
+                pass
+
+
+class TestPipelineStageTimings:
+    """BasePipeline charges the record loop to named stages."""
+
+    def test_process_records_stage_and_filter_timings(self, temp_work_dir):
+        records = [
+            RawRecord(
+                title=f"Maqaal {i}",
+                text="Waxaan waa maqaal cusub oo ku saabsan xaalada wadanka Soomaaliya.",
+                url=f"https://example.com/{i}",
+            )
+            for i in range(3)
+        ]
+        processor = MockPipeline(test_records=records)
+        processor.metrics = MetricsCollector(processor.run_id, processor.source)
+        processor.profile_mode = "cprofile"
+        processor.extract()
+
+        with patch.object(processor.silver_writer, "write", return_value=None):
+            processor.process()
+
+        stages = processor.metrics.stage_timer.summary()["stages"]
+        for stage in ("extract", "clean", "filter", "record_build", "validation", "write"):
+            assert stage in stages
+        assert stages["clean"]["calls"] == 3
+        assert "filter.min_token_floor_filter" in stages
+        assert (temp_work_dir / "data" / "profiles" / f"{processor.run_id}.pstats").exists()
+
+    def test_batched_filtering_matches_per_record(self, temp_work_dir):
+        texts = [
+            "Waxaan waa maqaal cusub oo ku saabsan xaalada wadanka Soomaaliya.",
+            "Gaaban",
+            "Wararka maanta waxay ka hadlayaan doorashada dalka iyo dhaqaalaha.",
+        ]
+        records = [
+            RawRecord(title=f"Maqaal {i}", text=text, url=f"https://example.com/{i}")
+            for i, text in enumerate(texts)
+        ]
+        written = {}
+        for batch_size in (0, 2):
+            processor = MockPipeline(test_records=records, force=True)
+            processor.metrics = MetricsCollector(processor.run_id, processor.source)
+            processor.filter_batch_size = batch_size
+            processor.extract()
+            with patch.object(processor.silver_writer, "write", return_value=None) as write:
+                processor.process()
+            written[batch_size] = [
+                (record["title"], record["text"]) for record in write.call_args.kwargs["records"]
+            ]
+            assert processor.metrics.stage_timer.calls["clean"] == 3
+            assert processor.metrics.get_snapshot().filter_reasons
+
+        assert written[2] == written[0]
+        assert len(written[0]) == 2
@@ -0,0 +1,293 @@
+"""Tests for the asyncio-native and ledger-backed rate limiters."""
+
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from somdialc.infra.rate_limiter import (
+    AdaptiveRateLimiter,
+    AsyncAdaptiveRateLimiter,
+    LedgerTokenBucket,
+    RateLimitConfig,
+    parse_retry_after,
+)
+
+
+def _config(**overrides) -> RateLimitConfig:
+    defaults = {
+        "min_delay": 0.0,
+        "jitter": False,
+        "target_latency_ms": 100.0,
+        "min_concurrency": 1,
+        "max_concurrency": 4,
+    }
+    defaults.update(overrides)
+    return RateLimitConfig(**defaults)
+
+
+class TestParseRetryAfter:
+    """Test cases for Retry-After parsing."""
+
+    def test_seconds(self):
+        assert parse_retry_after("5") == 5.0
+
+    def test_http_date(self):
+        future = datetime.now(timezone.utc) + timedelta(seconds=30)
+        seconds = parse_retry_after(format_datetime(future, usegmt=True))
+        assert 25 <= seconds <= 31
+
+    def test_past_date_clamps_to_zero(self):
+        past = datetime.now(timezone.utc) - timedelta(minutes=5)
+        assert parse_retry_after(format_datetime(past, usegmt=True)) == 0.0
+
+    def test_missing_or_invalid(self):
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("not-a-date") is None
+
+
+class TestAsyncAdaptiveRateLimiter:
+    """Test cases for AsyncAdaptiveRateLimiter."""
+
+    def test_host_key(self):
+        assert AsyncAdaptiveRateLimiter.host_key("https://WWW.bbc.com/somali/x") == "www.bbc.com"
+        assert AsyncAdaptiveRateLimiter.host_key("www.bbc.com") == "www.bbc.com"
+
+    def test_concurrency_never_exceeds_window(self):
+        limiter = AsyncAdaptiveRateLimiter(_config(adaptive=False, min_concurrency=2))
+        peak = 0
+        active = 0
+
+        async def worker():
+            nonlocal peak, active
+            async with limiter.limit("https://example.org/a"):
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        async def main():
+            await asyncio.gather(*(worker() for _ in range(10)))
+
+        asyncio.run(main())
+        assert peak == 2
+        assert limiter.get_statistics()["hosts"]["example.org"]["total_requests"] == 10
+
+    def test_min_delay_spaces_requests_per_host(self):
+        limiter = AsyncAdaptiveRateLimiter(_config(min_delay=0.05, max_concurrency=10))
+        starts = []
+
+        async def worker(url):
+            async with limiter.limit(url):
+                starts.append((url, time.monotonic()))
+
+        async def main():
+            await asyncio.gather(
+                *(worker("https://a.example/x") for _ in range(3)),
+                worker("https://b.example/x"),
+            )
+
+        asyncio.run(main())
+        a_starts = sorted(t for url, t in starts if "a.example" in url)
+        gaps = [b - a for a, b in zip(a_starts, a_starts[1:])]
+        assert all(gap >= 0.045 for gap in gaps)
+        # Another host is not delayed by a.example's spacing
+        b_start = next(t for url, t in starts if "b.example" in url)
+        assert b_start - a_starts[0] < 0.04
+
+    def test_token_bucket_limits_rate(self):
+        limiter = AsyncAdaptiveRateLimiter(_config(requests_per_minute=600, max_concurrency=10))
+
+        async def main():
+            start = time.monotonic()
+            for _ in range(3):
+                async with limiter.limit("https://example.org"):
+                    pass
+            return time.monotonic() - start
+
+        # 10 req/s: bucket starts with one token, so 3 requests need ~0.2s
+        assert asyncio.run(main()) >= 0.18
+
+    def test_aimd_additive_increase_and_multiplicative_decrease(self):
+        limiter = AsyncAdaptiveRateLimiter(_config(max_concurrency=8))
+        host = "example.org"
+
+        for _ in range(20):
+            limiter.record_success(host, 10.0)
+        grown = limiter.get_statistics()["hosts"][host]["concurrency_limit"]
+        assert 1.0 < grown <= 8.0
+
+        limiter.record_success(host, 500.0)
+        shrunk = limiter.get_statistics()["hosts"][host]["concurrency_limit"]
+        assert shrunk == pytest.approx(grown * 0.5, abs=0.01)
+
+        # Only one decrease per latency window
+        limiter.record_success(host, 500.0)
+        assert limiter.get_statistics()["hosts"][host]["concurrency_limit"] == shrunk
+
+    def test_concurrency_bounded_by_config(self):
+        limiter = AsyncAdaptiveRateLimiter(_config(max_concurrency=3))
+        for _ in range(200):
+            limiter.record_success("example.org", 1.0)
+        assert limiter.get_statistics()["hosts"]["example.org"]["concurrency_limit"] == 3.0
+
+    def test_retry_after_blocks_host(self):
+        limiter = AsyncAdaptiveRateLimiter(_config())
+
+        async def main():
+            limiter.record_response("example.org", 429, 5.0, retry_after="0.2")
+            start = time.monotonic()
+            async with limiter.limit("https://example.org/next"):
+                pass
+            return time.monotonic() - start
+
+        assert asyncio.run(main()) >= 0.15
+        stats = limiter.get_statistics()["hosts"]["example.org"]
+        assert stats["total_errors"] == 1
+        assert stats["consecutive_errors"] == 0
+
+    def test_exception_in_block_records_error_and_releases(self):
+        limiter = AsyncAdaptiveRateLimiter(_config())
+
+        async def main():
+            with pytest.raises(RuntimeError):
+                async with limiter.limit("https://example.org"):
+                    raise RuntimeError("boom")
+
+        asyncio.run(main())
+        stats = limiter.get_statistics()["hosts"]["example.org"]
+        assert stats["in_flight"] == 0
+        assert stats["total_errors"] == 1
+
+    def test_reusable_across_event_loops(self):
+        limiter = AsyncAdaptiveRateLimiter(_config(adaptive=False))
+
+        async def main():
+            await limiter.acquire("example.org")
+            limiter.release("example.org")
+
+        asyncio.run(main())
+        asyncio.run(main())
+        assert limiter.get_statistics()["hosts"]["example.org"]["total_requests"] == 2
+
+
+class TestTraceConfig:
+    """Test aiohttp trace-config integration against a local server."""
+
+    def test_trace_config_paces_and_times_requests(self):
+        aiohttp = pytest.importorskip("aiohttp")
+        from aiohttp import web
+        from aiohttp.test_utils import TestServer
+
+        hits = {"count": 0}
+
+        async def handler(request):
+            hits["count"] += 1
+            if request.path == "/limited" and hits["count"] == 1:
+                return web.Response(status=429, headers={"Retry-After": "0.2"})
+            return web.Response(text="ok")
+
+        limiter = AsyncAdaptiveRateLimiter(_config())
+
+        async def main():
+            app = web.Application()
+            app.router.add_get("/{name}", handler)
+            async with TestServer(app) as server:
+                async with aiohttp.ClientSession(trace_configs=[limiter.trace_config()]) as session:
+                    async with session.get(server.make_url("/limited")) as resp:
+                        assert resp.status == 429
+                    start = time.monotonic()
+                    async with session.get(server.make_url("/ok")) as resp:
+                        assert resp.status == 200
+                    return time.monotonic() - start
+
+        waited = asyncio.run(main())
+        assert waited >= 0.15
+        stats = limiter.get_statistics()["hosts"]
+        (host_stats,) = stats.values()
+        assert host_stats["total_requests"] == 2
+        assert host_stats["total_errors"] == 1
+        assert host_stats["in_flight"] == 0
+        assert "avg_latency_ms" in host_stats
+
+
+class TestLedgerTokenBucket:
+    """Test the ledger-backed cross-process token bucket."""
+
+    @pytest.fixture
+    def db_path(self, tmp_path):
+        return tmp_path / "ledger.db"
+
+    def _ledger(self, db_path):
+        from somdialc.ingestion.crawl_ledger import CrawlLedger, SQLiteLedger
+
+        return CrawlLedger(backend=SQLiteLedger(db_path))
+
+    def test_requires_a_rate(self, db_path):
+        with pytest.raises(ValueError):
+            LedgerTokenBucket(self._ledger(db_path))
+
+    def test_budget_shared_between_ledger_instances(self, db_path):
+        first = LedgerTokenBucket(self._ledger(db_path), requests_per_minute=2)
+        second = LedgerTokenBucket(self._ledger(db_path), requests_per_minute=2)
+
+        # Capacity 2 is shared: the second "process" sees the first one's spend
+        assert first.try_acquire("www.bbc.com") == 0.0
+        assert second.try_acquire("www.bbc.com") == 0.0
+        wait = first.try_acquire("www.bbc.com")
+        assert 0 < wait <= 30.0
+
+        # Keys are independent
+        assert second.try_acquire("so.wikipedia.org") == 0.0
+
+    def test_wait_blocks_until_refill(self, db_path):
+        bucket = LedgerTokenBucket(self._ledger(db_path), requests_per_minute=600)
+        for _ in range(600):
+            bucket.try_acquire("example.org")
+
+        start = time.monotonic()
+        bucket.wait("example.org")
+        assert time.monotonic() - start >= 0.05
+
+    def test_async_limiter_uses_shared_bucket(self, db_path):
+        bucket = LedgerTokenBucket(self._ledger(db_path), requests_per_minute=600)
+        limiter = AsyncAdaptiveRateLimiter(_config(), shared_bucket=bucket)
+        assert limiter.refill_rate is None
+
+        for _ in range(600):
+            bucket.try_acquire("example.org")
+
+        async def main():
+            start = time.monotonic()
+            async with limiter.limit("https://example.org/a"):
+                pass
+            return time.monotonic() - start
+
+        assert asyncio.run(main()) >= 0.05
+
+    def test_wait_async_keeps_ledger_calls_off_the_event_loop(self, db_path):
+        bucket = LedgerTokenBucket(self._ledger(db_path), requests_per_minute=600)
+        acquire = bucket.try_acquire
+        threads = []
+
+        def try_acquire(key):
+            threads.append(threading.get_ident())
+            return acquire(key)
+
+        bucket.try_acquire = try_acquire
+
+        async def main():
+            await bucket.wait_async("example.org")
+            return threading.get_ident()
+
+        loop_thread = asyncio.run(main())
+        assert threads and loop_thread not in threads
+
+    def test_sync_limiter_uses_shared_bucket(self, db_path):
+        bucket = LedgerTokenBucket(self._ledger(db_path), requests_per_minute=60)
+        limiter = AdaptiveRateLimiter(_config(), shared_bucket=bucket, bucket_key="example.org")
+        limiter.wait()
+        assert bucket.try_acquire("example.org") == 0.0
@@ -0,0 +1,110 @@
+"""Tests for the background resource sampler and its metrics/report wiring."""
+
+import json
+import time
+from unittest.mock import patch
+
+from somdialc.infra.metrics import MetricsCollector, PipelineType, QualityReporter
+from somdialc.infra.resource_sampler import ResourceSampler, read_resource_usage
+from somdialc.ingestion.raw_record import RawRecord
+from tests.pipeline_helpers import MockPipeline
+
+
+class TestResourceSampler:
+    """Test cases for ResourceSampler."""
+
+    def test_read_resource_usage(self, tmp_path):
+        wal = tmp_path / "ledger.db-wal"
+        wal.write_bytes(b"x" * 4096)
+
+        usage = read_resource_usage((wal, tmp_path / "missing.db-wal"))
+
+        assert usage["rss_bytes"] is None or usage["rss_bytes"] > 0
+        assert usage["peak_rss_bytes"] > 0
+        assert usage["cpu_seconds"] >= 0
+        assert usage["wal_bytes"] == 4096
+        assert read_resource_usage()["wal_bytes"] is None
+
+    def test_samples_and_summary(self):
+        sampler = ResourceSampler(interval=0.01)
+        sampler.start()
+        end = time.perf_counter() + 0.1
+        while time.perf_counter() < end:
+            pass
+        sampler.stop()
+
+        exported = sampler.export()
+        summary = exported["summary"]
+        assert not sampler.running
+        assert len(exported["samples"]) >= 3
+        assert summary["samples"] == len(exported["samples"])
+        assert summary["cpu_seconds"] > 0.05
+        assert summary["peak_rss_bytes"] > 0
+        assert summary["duration_seconds"] >= 0.1
+        times = [sample["t"] for sample in exported["samples"]]
+        assert times == sorted(times)
+
+    def test_sample_count_is_bounded(self):
+        sampler = ResourceSampler(interval=1.0, max_samples=10)
+        sampler._start_wall = time.monotonic()
+        for _ in range(100):
+            sampler.sample_now()
+
+        exported = sampler.export()
+        assert len(exported["samples"]) < 10
+        assert exported["interval_seconds"] > 1.0
+        assert exported["samples"][0]["t"] == 0.0
+
+
+class TestResourceExport:
+    """Resource usage in the processing JSON and quality report."""
+
+    def test_json_and_report(self, tmp_path):
+        sampler = ResourceSampler()
+        sampler.start()
+        sampler.stop()
+        collector = MetricsCollector("run-r", "test", PipelineType.FILE_PROCESSING)
+        collector.resource_usage = sampler.export()
+
+        collector.export_json(tmp_path / "m.json")
+        QualityReporter(collector).generate_markdown_report(tmp_path / "report.md")
+
+        data = json.loads((tmp_path / "m.json").read_text())
+        assert data["resources"]["summary"]["peak_rss_bytes"] > 0
+        assert len(data["resources"]["samples"]) == 2
+        report = (tmp_path / "report.md").read_text()
+        assert "## Resource Usage" in report
+        assert "**Peak RSS:**" in report
+
+    def test_report_omits_section_without_samples(self, tmp_path):
+        collector = MetricsCollector("run-r", "test", PipelineType.FILE_PROCESSING)
+        QualityReporter(collector).generate_markdown_report(tmp_path / "report.md")
+        assert "Resource Usage" not in (tmp_path / "report.md").read_text()
+
+
+class TestPipelineResourceSampling:
+    """BasePipeline samples resources for the duration of a run."""
+
+    def test_process_exports_resources(self, temp_work_dir):
+        records = [
+            RawRecord(
+                title=f"Maqaal {i}",
+                text="Waxaan waa maqaal cusub oo ku saabsan xaalada wadanka Soomaaliya.",
+                url=f"https://example.com/{i}",
+            )
+            for i in range(3)
+        ]
+        processor = MockPipeline(test_records=records)
+        processor.metrics = MetricsCollector(processor.run_id, processor.source)
+        processor.extract()
+
+        with patch.object(processor.silver_writer, "write", return_value=None):
+            processor.process()
+
+        assert not processor.resource_sampler.running
+        metrics_path = temp_work_dir / "data" / "metrics" / f"{processor.run_id}_processing.json"
+        resources = json.loads(metrics_path.read_text())["resources"]
+        assert resources["summary"]["samples"] >= 2
+        assert (
+            resources["samples"][0]["open_fds"] is None or resources["samples"][0]["open_fds"] > 0
+        )
@@ -0,0 +1,141 @@
+"""Tests for the cross-run screening (cleaning + filter verdict) cache."""
+
+from unittest.mock import patch
+
+import pytest
+
+from somdialc.infra.metrics import MetricsCollector
+from somdialc.ingestion.raw_record import RawRecord
+from somdialc.quality.filter_engine import FilterEngine
+from somdialc.quality.filter_functions import min_length_filter
+from somdialc.quality.screening_cache import ScreeningCache, screening_fingerprint
+from somdialc.quality.text_cleaners import (
+    TextCleaningPipeline,
+    WhitespaceCleaner,
+    WikiMarkupCleaner,
+)
+from tests.pipeline_helpers import MockPipeline
+
+
+def _engine(threshold: int = 50, strict_mode: bool = False) -> FilterEngine:
+    engine = FilterEngine(strict_mode=strict_mode)
+    engine.register_filter(min_length_filter, {"threshold": threshold})
+    return engine
+
+
+class TestScreeningFingerprint:
+    """The fingerprint changes with anything that can change a verdict."""
+
+    def test_stable_for_identical_configuration(self):
+        cleaner = TextCleaningPipeline([WikiMarkupCleaner(), WhitespaceCleaner()])
+        other = TextCleaningPipeline([WikiMarkupCleaner(), WhitespaceCleaner()])
+
+        assert screening_fingerprint(cleaner, _engine()) == screening_fingerprint(other, _engine())
+
+    def test_changes_with_filters_and_cleaners(self):
+        cleaner = TextCleaningPipeline([WhitespaceCleaner()])
+        base = screening_fingerprint(cleaner, _engine())
+
+        assert screening_fingerprint(cleaner, _engine(threshold=60)) != base
+        assert screening_fingerprint(cleaner, _engine(strict_mode=True)) != base
+        assert screening_fingerprint(TextCleaningPipeline([]), _engine()) != base
+        assert (
+            screening_fingerprint(
+                TextCleaningPipeline([WikiMarkupCleaner(), WhitespaceCleaner()]), _engine()
+            )
+            != base
+        )
+
+
+class TestScreeningCache:
+    """Test cases for ScreeningCache."""
+
+    def test_put_get_across_instances(self, tmp_path):
+        db_path = tmp_path / "screening.db"
+        cache = ScreeningCache(db_path, flush_every=2)
+        key = cache.key("Raw text", "fp")
+
+        assert cache.get(key) is None
+        assert cache.put(key, "fp", "raw text", True, None, {"token_count": 2})
+        # Buffered rows are visible before they are flushed
+        assert cache.get(key).metadata == {"token_count": 2}
+        cache.close()
+
+        reopened = ScreeningCache(db_path)
+        result = reopened.get(key)
+        assert result.passed is True
+        assert (result.char_count, result.token_count) == (8, 2)
+        assert result.cleaned_sha256 == ScreeningCache.text_digest("raw text")
+        assert reopened.get(ScreeningCache.key("Raw text", "other-fp")) is None
+        assert reopened.statistics()["entries"] == 1
+
+    def test_metadata_that_does_not_round_trip_is_not_cached(self, tmp_path):
+        cache = ScreeningCache(tmp_path / "screening.db")
+        key = cache.key("Raw text", "fp")
+
+        assert not cache.put(key, "fp", "text", True, None, {"scripts": ("latin",)})
+        assert cache.get(key) is None
+        assert cache.stats["uncacheable"] == 1
+
+    def test_clear_keeps_current_fingerprint(self, tmp_path):
+        cache = ScreeningCache(tmp_path / "screening.db")
+        cache.put(cache.key("a", "old"), "old", "a", False, "min_length_filter", {})
+        cache.put(cache.key("a", "new"), "new", "a", False, "min_length_filter", {})
+
+        assert cache.clear(keep_fingerprint="new") == 1
+        assert cache.statistics()["fingerprints"] == 1
+
+
+class TestPipelineScreeningCache:
+    """BasePipeline reuses cached verdicts on reruns."""
+
+    TEXTS = [
+        "Waxaan waa maqaal cusub oo ku saabsan xaalada wadanka Soomaaliya.",
+        "Gaaban",
+        "Wararka maanta waxay ka hadlayaan doorashada dalka iyo dhaqaalaha.",
+    ]
+
+    def _run(self, cache, batch_size):
+        records = [
+            RawRecord(title=f"Maqaal {i}", text=text, url=f"https://example.com/{i}")
+            for i, text in enumerate(self.TEXTS)
+        ]
+        processor = MockPipeline(test_records=records, force=True)
+        processor.metrics = MetricsCollector(processor.run_id, processor.source)
+        processor.screening_cache = cache
+        processor.filter_batch_size = batch_size
+        processor.extract()
+        with patch.object(processor.silver_writer, "write", return_value=None) as write:
+            processor.process()
+        written = [(r["title"], r["text"]) for r in write.call_args.kwargs["records"]]
+        return processor, written
+
+    @pytest.mark.parametrize("batch_size", [0, 2])
+    def test_rerun_skips_filters(self, temp_work_dir, batch_size):
+        cache = ScreeningCache(temp_work_dir / "data" / "cache" / "screening.db")
+
+        first, written_first = self._run(cache, batch_size)
+        second, written_second = self._run(cache, batch_size)
+
+        assert written_second == written_first
+        assert len(written_first) == 2
+        assert first.metrics.stage_timer.calls["filter"] > 0
+        assert second.metrics.stage_timer.calls["filter"] == 0
+        # Rejected records are not even cleaned on the rerun
+        assert second.metrics.stage_timer.calls["clean"] == 2
+        assert (
+            second.metrics.get_snapshot().filter_reasons
+            == first.metrics.get_snapshot().filter_reasons
+        )
+        stats = second.metrics.custom_metrics["screening_cache"]
+        assert stats["rejections_reused"] == 1
+        assert stats["passes_reused"] == 2
+
+    def test_changed_filter_configuration_misses(self, temp_work_dir):
+        cache = ScreeningCache(temp_work_dir / "data" / "cache" / "screening.db")
+        self._run(cache, 0)
+
+        with patch("somdialc.ingestion.base_pipeline.screening_fingerprint", return_value="edited"):
+            processor, _ = self._run(cache, 0)
+
+        assert processor.metrics.stage_timer.calls["filter"] > 0
@@ -0,0 +1,159 @@
+"""Tests for byte-offset checkpoint positions and seek-based resume."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from somdialc.ingestion.processors.wikipedia_somali_processor import WikipediaSomaliProcessor
+from somdialc.ingestion.raw_record import RawRecord
+from somdialc.ingestion.staging_reader import read_lines, resume_offset, staging_position
+from tests.pipeline_helpers import MockPipeline
+
+
+class TestReadLines:
+    """Test cases for read_lines."""
+
+    def test_offsets_and_seek(self, tmp_path):
+        path = tmp_path / "staging.jsonl"
+        path.write_bytes("a\nbää\nc".encode())
+
+        lines = list(read_lines(path))
+
+        assert lines == [("a\n", 0, 2), ("bää\n", 2, 8), ("c", 8, 9)]
+        assert list(read_lines(path, 2)) == lines[1:]
+
+    def test_carriage_returns_match_text_mode(self, tmp_path):
+        path = tmp_path / "staging.txt"
+        path.write_bytes(b"one\r\ntwo\rthree\n")
+
+        with open(path, encoding="utf-8") as f:
+            expected = list(f)
+
+        assert [line for line, _, _ in read_lines(path)] == expected
+
+
+class TestResumeOffset:
+    """Test cases for resume_offset."""
+
+    def test_valid_position(self, tmp_path):
+        path = tmp_path / "staging.jsonl"
+        path.write_text("a\nb\n")
+
+        assert resume_offset(path, None) == 0
+        assert resume_offset(path, staging_position(path, 2, 4)) == 2
+
+    @pytest.mark.parametrize(
+        "position",
+        [
+            {"file": "other.jsonl", "offset": 2, "size": 4},
+            {"file": "staging.jsonl", "offset": 2, "size": 10},
+            {"file": "staging.jsonl", "offset": 7, "size": 4},
+        ],
+    )
+    def test_stale_position_rejected(self, tmp_path, position):
+        path = tmp_path / "staging.jsonl"
+        path.write_text("a\nb\n")
+
+        with pytest.raises(ValueError):
+            resume_offset(path, position)
+
+
+class JsonlPipeline(MockPipeline):
+    """MockPipeline that stages its records as JSONL and reads them back by offset."""
+
+    def extract(self):
+        super().extract()
+        self.staging_file = self.staging_dir / "test_staging.jsonl"
+        with open(self.staging_file, "w", encoding="utf-8") as f:
+            for record in self.test_records:
+                f.write(json.dumps({"title": record.title, "text": record.text, "url": record.url}))
+                f.write("\n")
+        self.lines_parsed = 0
+
+    def _extract_records(self, resume_from=None):
+        size = self.staging_file.stat().st_size
+        offset = resume_offset(self.staging_file, resume_from)
+        for line, _, end in read_lines(self.staging_file, offset):
+            self.lines_parsed += 1
+            yield RawRecord(
+                **json.loads(line), position=staging_position(self.staging_file, end, size)
+            )
+
+
+class TestPipelineSeekResume:
+    """BasePipeline resumes from the checkpointed byte offset."""
+
+    def _records(self, count):
+        return [
+            RawRecord(
+                title=f"Maqaal {i}",
+                text=f"Waxaan waa maqaal cusub oo ku saabsan xaalada wadanka Soomaaliya {i}.",
+                url=f"https://example.com/{i}",
+            )
+            for i in range(count)
+        ]
+
+    def _resume(self, processor, index, position):
+        checkpoint_path = processor.processed_dir / f"{processor.run_id}_checkpoint.json"
+        processor._save_checkpoint(checkpoint_path, index, position)
+        with patch.object(processor.silver_writer, "write", return_value=None) as write:
+            processor.process()
+        return [record["title"] for record in write.call_args.kwargs["records"]]
+
+    def test_checkpoint_stores_position(self, temp_work_dir):
+        processor = JsonlPipeline(test_records=self._records(2))
+        processor.extract()
+        checkpoint_path = processor.processed_dir / f"{processor.run_id}_checkpoint.json"
+        position = staging_position(processor.staging_file, 10, 20)
+
+        processor._save_checkpoint(checkpoint_path, 1, position)
+
+        assert processor._load_checkpoint_state(checkpoint_path) == (1, position)
+        assert processor._load_checkpoint(checkpoint_path) == 1
+
+    def test_resume_reads_only_remaining_records(self, temp_work_dir):
+        processor = JsonlPipeline(test_records=self._records(6))
+        processor.extract()
+        positions = [record.position for record in processor._extract_records()]
+        processor.lines_parsed = 0
+
+        titles = self._resume(processor, 4, positions[3])
+
+        assert titles == ["Maqaal 4", "Maqaal 5"]
+        assert processor.lines_parsed == 2
+
+    def test_stale_position_falls_back_to_skipping(self, temp_work_dir):
+        processor = JsonlPipeline(test_records=self._records(6))
+        processor.extract()
+        stale = staging_position(processor.staging_file, 3, 1)
+        processor.lines_parsed = 0
+
+        titles = self._resume(processor, 4, stale)
+
+        assert titles == ["Maqaal 4", "Maqaal 5"]
+        assert processor.lines_parsed == 6
+
+
+class TestWikipediaPositions:
+    """Wikipedia pages span several lines; positions land on the next page marker."""
+
+    def test_resume_starts_at_next_page(self, tmp_path):
+        staging_file = tmp_path / "staging.txt"
+        staging_file.write_text(
+            "\x1e PAGE: Muqdisho\t1\t2025-01-01T00:00:00Z\nMagaalo.\n"
+            "\x1e PAGE: Hargeysa\t2\t2025-01-02T00:00:00Z\nMagaalo kale.\n"
+            "\x1e PAGE: Kismaayo\t3\t2025-01-03T00:00:00Z\nMagaalo koonfureed.\n",
+            encoding="utf-8",
+        )
+        with patch("somdialc.ingestion.processors.wikipedia_somali_processor.get_ledger"):
+            processor = WikipediaSomaliProcessor(force=True, run_seed="test_run")
+            processor.staging_file = staging_file
+            processor.metrics = MagicMock()
+
+        records = list(processor._extract_records())
+        resumed = list(processor._extract_records(resume_from=records[0].position))
+
+        assert [record.title for record in resumed] == ["Hargeysa", "Kismaayo"]
+        assert [record.text for record in resumed] == [r.text for r in records[1:]]
+        assert records[-1].position["offset"] == staging_file.stat().st_size
@@ -0,0 +1,144 @@
+"""Tests for the batched, asynchronous MLFlowTracker."""
+
+import sys
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from somdialc.infra.tracking import MLFlowTracker
+
+
+@pytest.fixture
+def fake_mlflow():
+    """Stand-in mlflow module: entities are plain tuples, the client is a mock."""
+    module = MagicMock()
+    module.start_run.return_value = SimpleNamespace(info=SimpleNamespace(run_id="run-1"))
+    module.entities.Metric = lambda key, value, timestamp, step: ("metric", key, value, step)
+    module.entities.Param = lambda key, value: ("param", key, value)
+    module.entities.RunTag = lambda key, value: ("tag", key, value)
+    client = module.tracking.MlflowClient.return_value
+    with (
+        patch("somdialc.infra.tracking.mlflow", module),
+        patch.dict(sys.modules, {"mlflow": module, "mlflow.entities": module.entities}),
+    ):
+        yield module, client
+
+
+def _batches(client):
+    return [call.kwargs for call in client.log_batch.call_args_list]
+
+
+class TestMLFlowTracker:
+    """Test cases for MLFlowTracker."""
+
+    def test_disabled_tracker_is_a_no_op(self, fake_mlflow):
+        module, _ = fake_mlflow
+        tracker = MLFlowTracker(enabled=False)
+
+        tracker.start_run("run")
+        tracker.log_metrics({"a": 1})
+        tracker.set_tag("status", "success")
+        tracker.start_step_metrics(lambda: {"a": 1.0}, interval=0.01)
+        tracker.end_run()
+
+        assert module.mock_calls == []
+        assert tracker._worker is None and tracker._step_thread is None
+
+    def test_calls_are_coalesced_into_log_batch(self, fake_mlflow):
+        module, client = fake_mlflow
+        tracker = MLFlowTracker(flush_interval=60)
+        tracker.start_run("run")
+
+        tracker.log_params({"source": "wikipedia", "force": False})
+        tracker.log_metrics({"records_processed": 10})
+        tracker.log_metrics({"records_processed": 12})
+        tracker.log_metric("records_per_second", 5.0, step=1)
+        tracker.set_tags({"status": "running"})
+        tracker.set_tag("status", "success")
+        assert tracker.flush(timeout=5)
+
+        module.log_metrics.assert_not_called()
+        module.set_tags.assert_not_called()
+        (batch,) = _batches(client)
+        assert sorted(batch["metrics"]) == [
+            ("metric", "records_per_second", 5.0, 1),
+            ("metric", "records_processed", 12.0, 0),
+        ]
+        assert sorted(batch["params"]) == [
+            ("param", "force", "False"),
+            ("param", "source", "wikipedia"),
+        ]
+        assert batch["tags"] == [("tag", "status", "success")]
+        tracker.end_run()
+
+    def test_end_run_flushes_artifacts_and_metrics(self, fake_mlflow, tmp_path):
+        module, client = fake_mlflow
+        artifact = tmp_path / "metrics.json"
+        artifact.write_text("{}")
+        tracker = MLFlowTracker(flush_interval=60)
+        tracker.start_run("run")
+
+        tracker.log_metrics({"records_written": 3})
+        tracker.log_artifact(str(artifact))
+        tracker.log_artifact(str(tmp_path / "missing.json"))
+        tracker.end_run(status="FINISHED")
+
+        assert len(_batches(client)) == 1
+        client.log_artifact.assert_called_once_with("run-1", str(artifact), None)
+        module.end_run.assert_called_once_with(status="FINISHED")
+        assert tracker.stats["artifacts"] == 1
+
+    def test_continuous_calls_still_flush_every_interval(self, fake_mlflow):
+        _, client = fake_mlflow
+        tracker = MLFlowTracker(flush_interval=0.05)
+        tracker.start_run("run")
+
+        # The same key coalesces, so the batch never fills and the queue is never idle
+        flushed_before_end = False
+        stop = time.monotonic() + 2
+        value = 0
+        while time.monotonic() < stop and not flushed_before_end:
+            for _ in range(1000):
+                value += 1
+                tracker.log_metric("records_processed", value)
+            flushed_before_end = client.log_batch.called
+
+        assert flushed_before_end
+        tracker.end_run()
+
+    def test_step_metrics_logged_with_steps(self, fake_mlflow):
+        _, client = fake_mlflow
+        tracker = MLFlowTracker(flush_interval=60)
+        tracker.start_run("run")
+
+        tracker.start_step_metrics(lambda: {"records_per_second": 100.0}, interval=0.01)
+        time.sleep(0.1)
+        tracker.end_run()
+
+        steps = sorted(metric[3] for batch in _batches(client) for metric in batch["metrics"])
+        assert len(steps) >= 2
+        assert steps[:2] == [1, 2]
+
+    def test_synchronous_mode_calls_mlflow_directly(self, fake_mlflow):
+        module, client = fake_mlflow
+        tracker = MLFlowTracker(async_logging=False)
+        tracker.start_run("run")
+
+        tracker.log_metrics({"a": 1}, step=2)
+        tracker.end_run()
+
+        module.log_metrics.assert_called_once_with({"a": 1}, step=2)
+        client.log_batch.assert_not_called()
+
+    def test_batch_failures_do_not_raise(self, fake_mlflow):
+        _, client = fake_mlflow
+        client.log_batch.side_effect = RuntimeError("store unavailable")
+        tracker = MLFlowTracker(flush_interval=60)
+        tracker.start_run("run")
+
+        tracker.log_metrics({"a": 1})
+        tracker.end_run()
+
+        assert tracker.errors == 1